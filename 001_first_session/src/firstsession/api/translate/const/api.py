@@ -1,5 +1,5 @@
 # 목적: API 경로 접두어와 태그 상수를 정의한다.
-# 설명: 전역 prefix와 translate 경로를 한 곳에서 관리한다.
+# 설명: 전역 prefix와 translate 하위 경로를 한 곳에서 관리한다.
 # 디자인 패턴: 상수 모듈 패턴
 # 참조: firstsession/api/translate/router/translate_router.py
 
@@ -7,4 +7,13 @@
 
 API_V1_PREFIX = "/api/v1"
 TRANSLATE_PREFIX = "/translate"
+TRANSLATE_BATCH_PATH = "/batch"
+TRANSLATE_MULTI_PATH = "/multi"
+TRANSLATE_STREAM_PATH = "/stream"
+TRANSLATE_DOCUMENT_PATH = "/document"
+TRANSLATE_CACHE_STATS_PATH = "/cache/stats"
+TRANSLATE_JOBS_PATH = "/jobs"
+TRANSLATE_JOB_PATH = "/{job_id}"
+TRANSLATE_JOB_RESULT_PATH = "/{job_id}/result"
+TRANSLATE_JOB_CANCEL_PATH = "/{job_id}/cancel"
 TRANSLATE_TAG = "translate"
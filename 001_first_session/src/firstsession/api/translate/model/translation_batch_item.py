@@ -0,0 +1,18 @@
+# 목적: 배치 번역의 개별 결과 DTO를 정의한다.
+# 설명: 입력 순서(index)와 번역 결과/오류를 항목 단위로 반환한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/model/translation_batch_response.py
+
+"""배치 번역 항목 결과 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+
+class TranslationBatchItem(BaseModel):
+    """배치 번역 항목 결과 데이터 모델."""
+
+    index: int = Field(..., description="입력 목록에서의 위치")
+    source_language: str = Field(..., description="원문 언어 코드")
+    target_language: str = Field(..., description="목표 언어 코드")
+    translated_text: str = Field(default="", description="번역된 텍스트")
+    error: str | None = Field(default=None, description="항목 처리 오류 메시지")
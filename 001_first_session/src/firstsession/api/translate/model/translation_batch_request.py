@@ -0,0 +1,16 @@
+# 목적: 배치 번역 요청 DTO를 정의한다.
+# 설명: 여러 개의 단건 번역 요청을 한 번에 전달한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_router.py
+
+"""배치 번역 요청 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+from firstsession.api.translate.model.translation_request import TranslationRequest
+
+
+class TranslationBatchRequest(BaseModel):
+    """배치 번역 요청 데이터 모델."""
+
+    items: list[TranslationRequest] = Field(..., min_length=1, description="번역 요청 목록")
@@ -0,0 +1,16 @@
+# 목적: 배치 번역 응답 DTO를 정의한다.
+# 설명: 항목별 결과를 입력 순서대로 반환한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_router.py
+
+"""배치 번역 응답 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+from firstsession.api.translate.model.translation_batch_item import TranslationBatchItem
+
+
+class TranslationBatchResponse(BaseModel):
+    """배치 번역 응답 데이터 모델."""
+
+    results: list[TranslationBatchItem] = Field(..., description="입력 순서의 항목별 결과")
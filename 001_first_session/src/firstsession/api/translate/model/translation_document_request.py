@@ -0,0 +1,22 @@
+# 목적: 긴 문서 번역 요청 DTO를 정의한다.
+# 설명: 단건 입력 길이 제한을 넘는 문서를 청크 단위로 번역하기 위한 입력을 관리한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_router.py
+
+"""문서 번역 요청 모델 모듈."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class TranslationDocumentRequest(BaseModel):
+    """문서 번역 요청 데이터 모델."""
+
+    source_language: str = Field(..., description="원문 언어 코드")
+    target_language: str = Field(..., description="목표 언어 코드")
+    text: str = Field(..., min_length=1, description="번역할 문서(문단은 빈 줄로 구분)")
+    format: Literal["text", "markdown", "html"] = Field(
+        "text",
+        description="문서 서식(text: 문단 청크 번역, markdown/html: 코드/태그/URL을 보존하고 텍스트만 번역)",
+    )
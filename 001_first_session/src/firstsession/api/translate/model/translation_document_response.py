@@ -0,0 +1,25 @@
+# 목적: 긴 문서 번역 응답 DTO를 정의한다.
+# 설명: 순서대로 재조립한 번역문과 실패한 청크 정보를 반환한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_router.py
+
+"""문서 번역 응답 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+from firstsession.api.translate.model.translation_batch_item import TranslationBatchItem
+
+
+class TranslationDocumentResponse(BaseModel):
+    """문서 번역 응답 데이터 모델."""
+
+    source_language: str = Field(..., description="원문 언어 코드")
+    target_language: str = Field(..., description="목표 언어 코드")
+    translated_text: str = Field(..., description="청크 순서대로 재조립한 번역 문서")
+    chunk_count: int = Field(..., description="분할된 청크 수(서식 보존 모드에서는 텍스트 조각 묶음 수)")
+    failed_chunks: list[TranslationBatchItem] = Field(
+        default_factory=list,
+        description="차단되었거나 재번역 후에도 QC를 통과하지 못한 청크(index는 청크 순번, 서식 보존 모드에서는 고유 텍스트 조각 순번)",
+    )
+    segment_count: int = Field(0, description="서식 보존 모드에서 번역한 텍스트 조각 수(중복 포함)")
+    unique_segment_count: int = Field(0, description="서식 보존 모드에서 중복을 제거한 텍스트 조각 수")
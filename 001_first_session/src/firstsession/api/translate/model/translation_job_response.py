@@ -0,0 +1,23 @@
+# 목적: 번역 작업(job) 상태 응답 DTO를 정의한다.
+# 설명: 작업 ID, 상태, 청크 단위 진행률과 시각 정보를 반환한다. 번역 결과는 result 엔드포인트로 따로 받는다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_job_router.py
+
+"""번역 작업 응답 모델 모듈."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class TranslationJobResponse(BaseModel):
+    """번역 작업 상태 데이터 모델."""
+
+    job_id: str = Field(..., description="작업 ID")
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"] = Field(..., description="작업 상태")
+    completed_chunks: int = Field(0, description="완료한 청크 수(서식 보존 모드에서는 텍스트 조각 묶음 수)")
+    total_chunks: int = Field(0, description="전체 청크 수(실행 전에는 0)")
+    error: str = Field("", description="실패 사유")
+    created_at: float = Field(..., description="작업 생성 시각(Unix time)")
+    started_at: float | None = Field(None, description="실행 시작 시각(Unix time)")
+    finished_at: float | None = Field(None, description="종료 시각(Unix time)")
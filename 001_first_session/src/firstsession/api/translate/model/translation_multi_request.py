@@ -0,0 +1,16 @@
+# 목적: 다중 목표 언어 번역 요청 DTO를 정의한다.
+# 설명: 하나의 원문을 여러 목표 언어로 번역하기 위한 입력을 관리한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_router.py
+
+"""다중 목표 언어 번역 요청 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+
+class TranslationMultiRequest(BaseModel):
+    """다중 목표 언어 번역 요청 데이터 모델."""
+
+    source_language: str = Field("", description="원문 언어 코드(비우거나 auto면 자동 감지)")
+    target_languages: list[str] = Field(..., min_length=1, description="목표 언어 코드 목록")
+    text: str = Field(..., description="번역할 텍스트")
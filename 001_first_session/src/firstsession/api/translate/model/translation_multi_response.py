@@ -0,0 +1,17 @@
+# 목적: 다중 목표 언어 번역 응답 DTO를 정의한다.
+# 설명: 목표 언어 코드를 키로 언어별 결과를 반환한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/router/translate_router.py
+
+"""다중 목표 언어 번역 응답 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+from firstsession.api.translate.model.translation_target_result import TranslationTargetResult
+
+
+class TranslationMultiResponse(BaseModel):
+    """다중 목표 언어 번역 응답 데이터 모델."""
+
+    source_language: str = Field(..., description="원문 언어 코드")
+    results: dict[str, TranslationTargetResult] = Field(..., description="목표 언어 코드별 결과")
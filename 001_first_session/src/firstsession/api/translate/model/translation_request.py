@@ -11,6 +11,6 @@ from pydantic import BaseModel, Field
 class TranslationRequest(BaseModel):
     """번역 요청 데이터 모델."""
 
-    source_language: str = Field(..., description="원문 언어 코드")
+    source_language: str = Field("", description="원문 언어 코드(비우거나 auto면 자동 감지)")
     target_language: str = Field(..., description="목표 언어 코드")
     text: str = Field(..., description="번역할 텍스트")
@@ -0,0 +1,17 @@
+# 목적: 다중 목표 언어 번역의 언어별 결과 DTO를 정의한다.
+# 설명: 목표 언어 하나의 번역 결과와 QC 통과 여부/오류를 반환한다.
+# 디자인 패턴: DTO
+# 참조: firstsession/api/translate/model/translation_multi_response.py
+
+"""목표 언어별 번역 결과 모델 모듈."""
+
+from pydantic import BaseModel, Field
+
+
+class TranslationTargetResult(BaseModel):
+    """목표 언어별 번역 결과 데이터 모델."""
+
+    translated_text: str = Field(default="", description="번역된 텍스트")
+    qc_passed: bool = Field(default=False, description="품질 검사 통과 여부")
+    retry_count: int = Field(default=0, description="재번역 횟수")
+    error: str | None = Field(default=None, description="차단/품질 검사 실패 사유")
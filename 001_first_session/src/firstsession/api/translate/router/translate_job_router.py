@@ -0,0 +1,146 @@
+# 목적: 비동기 번역 작업(job) API 라우터를 제공한다.
+# 설명: /api/v1/translate/jobs 경로에 작업 생성/상태 조회/결과 조회/취소 엔드포인트를 등록한다.
+# 디자인 패턴: 라우터 팩토리 패턴
+# 참조: firstsession/api/translate/const/api.py, firstsession/api/translate/service/translation_job_manager.py
+
+"""번역 작업 API 라우터 모듈."""
+
+from fastapi import APIRouter, HTTPException, status
+from firstsession.api.translate.const.api import (
+    API_V1_PREFIX,
+    TRANSLATE_JOB_CANCEL_PATH,
+    TRANSLATE_JOB_PATH,
+    TRANSLATE_JOB_RESULT_PATH,
+    TRANSLATE_JOBS_PATH,
+    TRANSLATE_PREFIX,
+    TRANSLATE_TAG,
+)
+from firstsession.api.translate.model.translation_document_request import TranslationDocumentRequest
+from firstsession.api.translate.model.translation_document_response import TranslationDocumentResponse
+from firstsession.api.translate.model.translation_job_response import TranslationJobResponse
+from firstsession.api.translate.service.translation_job_manager import (
+    JobQueueFullError,
+    JobStatus,
+    TranslationJob,
+    TranslationJobManager,
+)
+
+
+class TranslateJobRouter:
+    """번역 작업 API 라우터를 구성한다."""
+
+    def __init__(self, job_manager: TranslationJobManager) -> None:
+        """라우터와 의존성을 초기화한다.
+
+        Args:
+            job_manager: 번역 작업 관리자.
+        """
+        self.job_manager = job_manager
+        self.router = APIRouter(
+            prefix = f"{API_V1_PREFIX}{TRANSLATE_PREFIX}{TRANSLATE_JOBS_PATH}",
+            tags = [TRANSLATE_TAG],
+        )
+        self.router.add_api_route(
+            path = "",
+            endpoint = self.create_job,
+            methods = ["POST"],
+            response_model = TranslationJobResponse,
+            status_code = status.HTTP_202_ACCEPTED,
+            summary = "Create a document translation job",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_JOB_PATH,
+            endpoint = self.get_job,
+            methods = ["GET"],
+            response_model = TranslationJobResponse,
+            summary = "Get translation job status and progress",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_JOB_RESULT_PATH,
+            endpoint = self.get_result,
+            methods = ["GET"],
+            response_model = TranslationDocumentResponse,
+            summary = "Get the result of a finished translation job",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_JOB_CANCEL_PATH,
+            endpoint = self.cancel_job,
+            methods = ["POST"],
+            response_model = TranslationJobResponse,
+            summary = "Cancel a translation job",
+        )
+
+    def _to_response(self, job: TranslationJob) -> TranslationJobResponse:
+        return TranslationJobResponse(
+            job_id=job.job_id,
+            status=job.status.value,
+            completed_chunks=job.completed_chunks,
+            total_chunks=job.total_chunks,
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+    def _find(self, job_id: str) -> TranslationJob:
+        job = self.job_manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+        return job
+
+    async def create_job(self, request: TranslationDocumentRequest) -> TranslationJobResponse:
+        """문서 번역 작업을 만들고 바로 job_id를 반환한다.
+
+        Args:
+            request: 문서 번역 요청 데이터.
+
+        Returns:
+            TranslationJobResponse: 생성된 작업(상태 queued).
+        """
+        try:
+            job = self.job_manager.submit(request)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+        except JobQueueFullError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)) from e
+        return self._to_response(job)
+
+    async def get_job(self, job_id: str) -> TranslationJobResponse:
+        """작업 상태와 청크 단위 진행률을 반환한다.
+
+        Args:
+            job_id: 작업 ID.
+
+        Returns:
+            TranslationJobResponse: 작업 상태.
+        """
+        return self._to_response(self._find(job_id))
+
+    async def get_result(self, job_id: str) -> TranslationDocumentResponse:
+        """성공한 작업의 번역 결과를 반환한다. 끝나지 않았거나 실패/취소된 작업은 409로 응답한다.
+
+        Args:
+            job_id: 작업 ID.
+
+        Returns:
+            TranslationDocumentResponse: 문서 번역 결과.
+        """
+        job = self._find(job_id)
+        if job.status != JobStatus.SUCCEEDED or job.result is None:
+            detail = job.error or f"작업 상태가 {job.status.value}입니다."
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+        return job.result
+
+    async def cancel_job(self, job_id: str) -> TranslationJobResponse:
+        """작업을 취소한다. 이미 끝난 작업은 상태만 반환한다.
+
+        Args:
+            job_id: 작업 ID.
+
+        Returns:
+            TranslationJobResponse: 취소 후 작업 상태.
+        """
+        job = self.job_manager.cancel(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+        return self._to_response(job)
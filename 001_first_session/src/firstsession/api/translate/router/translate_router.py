@@ -1,18 +1,33 @@
 # 목적: 번역 API 라우터를 제공한다.
-# 설명: /api/v1/translate 경로에 번역 엔드포인트를 등록한다.
+# 설명: /api/v1/translate 경로에 단건/다중 언어/스트리밍/배치/문서 번역 엔드포인트를 등록한다.
 # 디자인 패턴: 라우터 팩토리 패턴
 # 참조: firstsession/api/translate/const/api.py
 
 """번역 API 라우터 모듈."""
 
+import json
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 from firstsession.api.translate.const.api import (
     API_V1_PREFIX,
+    TRANSLATE_BATCH_PATH,
+    TRANSLATE_CACHE_STATS_PATH,
+    TRANSLATE_DOCUMENT_PATH,
+    TRANSLATE_MULTI_PATH,
     TRANSLATE_PREFIX,
+    TRANSLATE_STREAM_PATH,
     TRANSLATE_TAG,
 )
 from firstsession.api.translate.model.translation_request import TranslationRequest
 from firstsession.api.translate.model.translation_response import TranslationResponse
+from firstsession.api.translate.model.translation_batch_request import TranslationBatchRequest
+from firstsession.api.translate.model.translation_batch_response import TranslationBatchResponse
+from firstsession.api.translate.model.translation_multi_request import TranslationMultiRequest
+from firstsession.api.translate.model.translation_multi_response import TranslationMultiResponse
+from firstsession.api.translate.model.translation_document_request import TranslationDocumentRequest
+from firstsession.api.translate.model.translation_document_response import TranslationDocumentResponse
 from firstsession.api.translate.service.translation_service import TranslationService
 
 
@@ -32,14 +47,58 @@ class TranslateRouter:
         )
         self.router.add_api_route(
             path = "",
-            endpoint = self.translate,
+            endpoint = self.atranslate,
             methods = ["POST"],
             response_model =  TranslationResponse,
             summary = "Translate text",
         )
+        self.router.add_api_route(
+            path = TRANSLATE_MULTI_PATH,
+            endpoint = self.atranslate_multi,
+            methods = ["POST"],
+            response_model = TranslationMultiResponse,
+            summary = "Translate text into multiple target languages",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_STREAM_PATH,
+            endpoint = self.astream_translate,
+            methods = ["POST"],
+            response_class = StreamingResponse,
+            summary = "Translate text as a server-sent event stream",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_BATCH_PATH,
+            endpoint = self.atranslate_batch,
+            methods = ["POST"],
+            response_model = TranslationBatchResponse,
+            summary = "Translate texts in batch",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_DOCUMENT_PATH,
+            endpoint = self.atranslate_document,
+            methods = ["POST"],
+            response_model = TranslationDocumentResponse,
+            summary = "Translate a long document in chunks",
+        )
+        self.router.add_api_route(
+            path = TRANSLATE_CACHE_STATS_PATH,
+            endpoint = self.cache_stats,
+            methods = ["GET"],
+            summary = "Translation cache hit/miss counters",
+        )
+
+    def cache_stats(self) -> dict[str, int]:
+        """번역 캐시 적중/미적중 통계를 반환한다.
+
+        Returns:
+            dict[str, int]: 계층/종류별 카운터.
+        """
+        return self.service.cache_stats()
 
-    def translate(self, request: TranslationRequest) -> TranslationResponse:
-        """번역 요청을 처리한다.
+    async def atranslate(self, request: TranslationRequest) -> TranslationResponse:
+        """번역 요청을 비동기로 처리한다.
+
+        모델 대기 중 스레드풀을 점유하지 않도록 비동기 서비스 경로를 사용한다.
 
         Args:
             request: 번역 요청 데이터.
@@ -47,5 +106,77 @@ class TranslateRouter:
         Returns:
             TranslationResponse: 번역 결과.
         """
-        result = self.service.translate(request)
-        return result
+        try:
+            return await self.service.atranslate(request)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    async def atranslate_multi(self, request: TranslationMultiRequest) -> TranslationMultiResponse:
+        """다중 목표 언어 번역 요청을 비동기로 처리한다.
+
+        Args:
+            request: 다중 목표 언어 번역 요청 데이터.
+
+        Returns:
+            TranslationMultiResponse: 목표 언어별 번역 결과.
+        """
+        try:
+            return await self.service.atranslate_multi(request)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    async def astream_translate(self, request: TranslationRequest) -> StreamingResponse:
+        """번역 결과를 SSE(text/event-stream)로 스트리밍한다.
+
+        이벤트: token(번역 조각), qc(품질 판정), replace(재번역 결과), blocked(안전 차단), done(최종 결과).
+
+        Args:
+            request: 번역 요청 데이터.
+
+        Returns:
+            StreamingResponse: SSE 응답.
+        """
+        return StreamingResponse(
+            self._sse_events(request),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _sse_events(self, request: TranslationRequest) -> AsyncIterator[str]:
+        """서비스 이벤트를 SSE 형식 문자열로 변환한다. 스트림 도중 오류는 error 이벤트로 보낸다."""
+        try:
+            async for event in self.service.astream_translate(request):
+                yield self._to_sse(event.event, event.data)
+        except Exception as e:
+            yield self._to_sse("error", {"error": f"번역 처리 실패: {e}"})
+
+    def _to_sse(self, event: str, data: dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    async def atranslate_batch(self, request: TranslationBatchRequest) -> TranslationBatchResponse:
+        """배치 번역 요청을 비동기로 처리한다.
+
+        Args:
+            request: 배치 번역 요청 데이터.
+
+        Returns:
+            TranslationBatchResponse: 입력 순서의 항목별 번역 결과.
+        """
+        try:
+            return await self.service.atranslate_batch(request)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    async def atranslate_document(self, request: TranslationDocumentRequest) -> TranslationDocumentResponse:
+        """긴 문서 번역 요청을 비동기로 처리한다.
+
+        Args:
+            request: 문서 번역 요청 데이터.
+
+        Returns:
+            TranslationDocumentResponse: 청크 순서대로 재조립한 번역 결과.
+        """
+        try:
+            return await self.service.atranslate_document(request)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -0,0 +1,209 @@
+# 목적: 긴 문서 번역을 요청 경로 밖에서 실행하는 비동기 작업(job) 관리자를 제공한다.
+# 설명: 작업 생성 시 job_id만 바로 돌려주고, 대기열(asyncio.Queue)에서 작업자들이 꺼내 TranslateGraph로 번역한다.
+#       진행률은 청크 단위로 기록하고, 취소하면 작업 태스크를 취소해 진행 중인 모델 호출도 함께 멈춘다.
+# 디자인 패턴: 생산자-소비자(작업 큐 + 작업자 풀)
+# 참조: firstsession/api/translate/service/translation_service.py, firstsession/api/translate/router/translate_job_router.py
+
+"""번역 작업 관리 모듈."""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+
+from firstsession.config.settings import JobSettings
+from firstsession.api.translate.model.translation_document_request import TranslationDocumentRequest
+from firstsession.api.translate.model.translation_document_response import TranslationDocumentResponse
+from firstsession.api.translate.service.translation_service import TranslationService
+from firstsession.core.translate.metrics.translation_metrics import TRANSLATE_JOB_QUEUE_WAIT, TRANSLATE_JOBS
+
+
+class JobStatus(str, Enum):
+    """작업 상태."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_FINISHED = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED})
+
+
+class JobQueueFullError(RuntimeError):
+    """대기열이 가득 차 작업을 받을 수 없는 경우."""
+
+
+@dataclass
+class TranslationJob:
+    """번역 작업 하나의 상태와 결과."""
+
+    job_id: str
+    request: TranslationDocumentRequest
+    status: JobStatus = JobStatus.QUEUED
+    # 청크(서식 보존 모드에서는 조각 묶음) 단위 진행률
+    completed_chunks: int = 0
+    total_chunks: int = 0
+    result: TranslationDocumentResponse | None = None
+    error: str = ""
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """끝난 작업인지 여부."""
+        return self.status in _FINISHED
+
+
+class TranslationJobManager:
+    """번역 작업 대기열과 작업자 풀을 관리한다."""
+
+    def __init__(self, service: TranslationService, settings: JobSettings) -> None:
+        """작업 관리자를 초기화한다. 작업자는 start() 또는 첫 submit()에서 시작한다.
+
+        Args:
+            service: 번역 서비스(문서 번역 실행).
+            settings: 작업 큐 설정.
+        """
+        self.service = service
+        self.settings = settings
+        self.jobs: dict[str, TranslationJob] = {}
+        self._queue: asyncio.Queue[TranslationJob] | None = None
+        self._workers: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 작업자들을 시작한다. 이미 실행 중이면 아무것도 하지 않는다."""
+        if self._workers and not all(worker.done() for worker in self._workers):
+            return
+        self._queue = asyncio.Queue(maxsize=max(1, self.settings.max_queued_jobs))
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"translate-job-worker-{number}")
+            for number in range(max(1, self.settings.workers))
+        ]
+
+    async def aclose(self) -> None:
+        """작업자와 실행 중인 작업을 취소하고 끝날 때까지 기다린다."""
+        for job in self.jobs.values():
+            if not job.finished:
+                self._mark_cancelled(job)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def submit(self, request: TranslationDocumentRequest) -> TranslationJob:
+        """문서 번역 작업을 대기열에 넣는다.
+
+        Args:
+            request: 문서 번역 요청 데이터.
+
+        Returns:
+            TranslationJob: 생성된 작업(상태 queued).
+
+        Raises:
+            ValueError: 문서 길이가 허용 범위를 넘는 경우.
+            JobQueueFullError: 대기열이 가득 찬 경우.
+        """
+        self.service.check_document_length(request)
+        self.start()
+        self._prune()
+        job = TranslationJob(job_id=uuid.uuid4().hex, request=request)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as e:
+            TRANSLATE_JOBS.inc(event="rejected")
+            raise JobQueueFullError("작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해 주세요.") from e
+        self.jobs[job.job_id] = job
+        TRANSLATE_JOBS.inc(event="submitted")
+        return job
+
+    def get(self, job_id: str) -> TranslationJob | None:
+        """작업을 조회한다."""
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> TranslationJob | None:
+        """작업을 취소한다. 대기 중이면 실행하지 않고, 실행 중이면 남은 모델 호출을 취소한다.
+
+        Args:
+            job_id: 작업 ID.
+
+        Returns:
+            TranslationJob | None: 취소(또는 이미 끝난) 작업. 없는 작업이면 None.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+        self._mark_cancelled(job)
+        return job
+
+    def _mark_cancelled(self, job: TranslationJob) -> None:
+        job.status = JobStatus.CANCELLED
+        job.finished_at = time.time()
+        TRANSLATE_JOBS.inc(event="cancelled")
+        if job.task is not None:
+            job.task.cancel()
+
+    def _prune(self) -> None:
+        """보관 기간이 지났거나 개수 한도를 넘은 끝난 작업을 지운다(오래된 순)."""
+        expires_before = time.time() - self.settings.result_ttl_seconds
+        finished = sorted(
+            (job for job in self.jobs.values() if job.finished),
+            key=lambda job: job.finished_at or job.created_at,
+        )
+        overflow = len(self.jobs) - self.settings.max_retained_jobs + 1
+        for job in finished:
+            if overflow <= 0 and (job.finished_at or job.created_at) >= expires_before:
+                break
+            del self.jobs[job.job_id]
+            overflow -= 1
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status == JobStatus.QUEUED:
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: TranslationJob) -> None:
+        """작업 하나를 실행하고 결과/오류/취소 상태를 기록한다."""
+        job.status = JobStatus.RUNNING
+        job.started_at = time.time()
+        TRANSLATE_JOB_QUEUE_WAIT.observe(job.started_at - job.created_at)
+
+        def on_progress(completed: int, total: int) -> None:
+            job.completed_chunks = completed
+            job.total_chunks = total
+
+        task = asyncio.create_task(self.service.atranslate_document(job.request, on_progress=on_progress))
+        job.task = task
+        try:
+            # 작업 태스크를 직접 await하지 않아 작업 취소와 작업자 종료(취소)를 구분한다.
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            job.task = None
+        if task.cancelled():
+            return
+        if job.status == JobStatus.CANCELLED:
+            # 취소 요청과 완료가 엇갈린 경우에도 취소 상태를 유지한다.
+            task.exception()
+            return
+        job.finished_at = time.time()
+        error = task.exception()
+        if error is not None:
+            job.status = JobStatus.FAILED
+            job.error = f"번역 처리 실패: {error}"
+            TRANSLATE_JOBS.inc(event="failed")
+            return
+        job.result = task.result()
+        job.status = JobStatus.SUCCEEDED
+        TRANSLATE_JOBS.inc(event="succeeded")
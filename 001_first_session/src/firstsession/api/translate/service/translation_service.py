@@ -4,12 +4,38 @@
 # 참조: firstsession/api/translate/router/translate_router.py
 
 """번역 서비스 모듈."""
+import asyncio
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator
+
 from firstsession.config.settings import Settings
 from firstsession.api.translate.model.translation_request import TranslationRequest
 from firstsession.api.translate.model.translation_response import TranslationResponse
+from firstsession.api.translate.model.translation_batch_request import TranslationBatchRequest
+from firstsession.api.translate.model.translation_batch_response import TranslationBatchResponse
+from firstsession.api.translate.model.translation_batch_item import TranslationBatchItem
+from firstsession.api.translate.model.translation_multi_request import TranslationMultiRequest
+from firstsession.api.translate.model.translation_multi_response import TranslationMultiResponse
+from firstsession.api.translate.model.translation_target_result import TranslationTargetResult
+from firstsession.api.translate.model.translation_document_request import TranslationDocumentRequest
+from firstsession.api.translate.model.translation_document_response import TranslationDocumentResponse
+from firstsession.core.common.concurrency import SingleFlight
+from firstsession.core.translate.batch.segment_packer import SegmentPack, SegmentPacker
+from firstsession.core.translate.document.document_chunker import DocumentChunk, DocumentChunker
+from firstsession.core.translate.document.html_segmenter import HtmlSegmenter
+from firstsession.core.translate.document.markdown_segmenter import MarkdownSegmenter
+from firstsession.core.translate.document.segmented_document import SegmentedDocument
 from firstsession.core.translate.graphs.translate_graph import TranslateGraph
+from firstsession.core.translate.graphs.translate_stream import StreamEvent, TranslateStream
+from firstsession.core.translate.metrics.translation_metrics import COALESCED_REQUESTS
 from firstsession.core.translate.state.translation_state import TranslationState
 
+# 문서 번역 진행률 콜백: (완료한 청크 수, 전체 청크 수)
+ProgressCallback = Callable[[int, int], None]
+
 
 class TranslationService:
     """번역 요청을 처리하는 서비스."""
@@ -19,23 +45,33 @@ class TranslationService:
 
         Args:
             graph: 번역 그래프 실행기.
+            settings: 애플리케이션 설정.
         """
         self.graph = graph
         self.settings = settings
+        max_pack_chars = min(settings.batch.max_pack_chars, settings.normalize.max_input_length)
+        self.packer = SegmentPacker(max_chars=max_pack_chars)
+        chunk_chars = min(settings.document.chunk_chars, settings.normalize.max_input_length)
+        self.chunker = DocumentChunker(max_chars=chunk_chars)
+        # 서식 보존 모드는 텍스트 조각을 청크 크기만큼 묶어 모델 호출 수를 줄인다.
+        self.document_packer = SegmentPacker(max_chars=chunk_chars)
+        self.segmenters = {"markdown": MarkdownSegmenter(), "html": HtmlSegmenter()}
+        self.streamer = TranslateStream(graph)
+        # 동시에 들어온 같은 요청은 그래프 실행 한 번을 공유한다.
+        self.flight = SingleFlight()
 
-    def translate(self, request: TranslationRequest) -> TranslationResponse:
-        """번역 요청을 처리한다.
-
-        Args:
-            request: 번역 요청 데이터.
-
-        Returns:
-            TranslationResponse: 번역 결과 응답.
-        """
+    def _build_state(self, request: TranslationRequest) -> TranslationState:
+        """요청 모델을 그래프 입력 상태로 변환한다."""
         state: TranslationState = {
             "source_language": request.source_language,
             "target_language": request.target_language,
+            "target_languages": [],
+            "target_results": {},
+            "detected_language": "",
+            "language_confidence": 0.0,
+            "language_check": "",
             "text": request.text,
+            "packed": False,
 
             "prompt": "",
             "normalized_text": "",
@@ -43,17 +79,656 @@ class TranslationService:
 
             "safeguard_label": "PASS",
             "safeguard_error": "",
+            "preclassify_label": "",
+            "preclassify_rule": "",
+            "safeguard_llm_skipped": False,
 
             "qc_passed": "NO",
+            "heuristic_qc": "",
+            "heuristic_qc_rules": [],
+            "heuristic_qc_hits": {},
+            "qc_llm_skipped": False,
             "can_retry": False,
             "retry_count": 0,
 
+            "cache_hit": False,
+            "safeguard_cached": False,
+            "memory_hit": False,
+            "memory_hints": [],
+
+            "single_call": "",
+            "stream": False,
+
+            "speculative_translated_text": "",
+            "speculative_error": "",
+            "speculative_wasted": False,
+            "speculative_adopted": False,
+            "safeguard_latency_ms": 0.0,
+            "speculative_latency_ms": 0.0,
+
             "max_input_length": self.settings.normalize.max_input_length,
             "max_retry_count": self.settings.translate.max_retry_count,
 
             "error": "",
         }
-        # 그래프 실행
-        result_state = self.graph.run(state)
-        
+        return state
+
+    def _raise_if_mismatch(self, state: TranslationState) -> None:
+        """언어 불일치(reject 정책)로 번역하지 않은 요청은 빈 결과 대신 요청 오류로 돌려준다."""
+        if state.get("language_check") == "MISMATCH":
+            raise ValueError(state.get("error") or "요청한 원문 언어와 입력 텍스트의 언어가 다릅니다.")
+
+    def _to_response(self, state: TranslationState) -> TranslationResponse:
+        """그래프 결과 상태를 응답 모델로 변환한다.
+
+        Raises:
+            ValueError: 요청한 원문 언어와 입력 텍스트의 언어가 달라 번역하지 않은 경우.
+        """
+        self._raise_if_mismatch(state)
+        return TranslationResponse(
+            source_language=state.get("source_language", ""),
+            target_language=state.get("target_language", ""),
+            translated_text=state.get("translated_text", ""),
+        )
+
+    def _flight_key(self, state: TranslationState) -> str:
+        """요청 식별 필드로 병합 키를 만든다. 나머지 상태 필드는 설정에서 오므로 서비스 안에서 동일하다."""
+        identity = [
+            state.get("source_language", ""),
+            state.get("target_language", ""),
+            state.get("target_languages", []),
+            state.get("text", ""),
+        ]
+        payload = json.dumps(identity, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _execute(self, state: TranslationState) -> TranslationState:
+        """그래프를 실행한다. 같은 요청이 진행 중이면 그 결과를 기다려 공유한다."""
+        if not self.settings.translate.coalesce_requests:
+            return self.graph.run(state)
+        result_state, shared = self.flight.do(self._flight_key(state), lambda: self.graph.run(state))
+        COALESCED_REQUESTS.inc(mode="sync", role="follower" if shared else "leader")
         return result_state
+
+    async def _aexecute(self, state: TranslationState) -> TranslationState:
+        """그래프를 비동기로 실행한다. 같은 요청이 진행 중이면 그 결과를 기다려 공유한다."""
+        if not self.settings.translate.coalesce_requests:
+            return await self.graph.arun(state)
+        result_state, shared = await self.flight.ado(self._flight_key(state), lambda: self.graph.arun(state))
+        COALESCED_REQUESTS.inc(mode="async", role="follower" if shared else "leader")
+        return result_state
+
+    def cache_stats(self) -> dict[str, int]:
+        """번역 캐시 적중/미적중 통계를 반환한다. 캐시가 꺼져 있으면 빈 dict."""
+        if self.graph.cache is None:
+            return {}
+        return self.graph.cache.stats()
+
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        """번역 요청을 처리한다.
+
+        Args:
+            request: 번역 요청 데이터.
+
+        Returns:
+            TranslationResponse: 번역 결과 응답.
+
+        Raises:
+            ValueError: 요청한 원문 언어와 입력 텍스트의 언어가 다른 경우(mismatch_policy=reject).
+        """
+        state = self._build_state(request)
+        # 그래프 실행
+        result_state = self._execute(state)
+
+        return self._to_response(result_state)
+
+    async def atranslate(self, request: TranslationRequest) -> TranslationResponse:
+        """번역 요청을 비동기로 처리한다.
+
+        Args:
+            request: 번역 요청 데이터.
+
+        Returns:
+            TranslationResponse: 번역 결과 응답.
+
+        Raises:
+            ValueError: 요청한 원문 언어와 입력 텍스트의 언어가 다른 경우(mismatch_policy=reject).
+        """
+        state = self._build_state(request)
+        result_state = await self._aexecute(state)
+        return self._to_response(result_state)
+
+    def translate_multi(self, request: TranslationMultiRequest) -> TranslationMultiResponse:
+        """하나의 원문을 여러 목표 언어로 번역한다.
+
+        정규화/안전 분류는 한 번만 수행하고 번역/QC/재번역은 그래프 안에서 목표 언어별로 병렬 실행한다.
+
+        Args:
+            request: 다중 목표 언어 번역 요청 데이터.
+
+        Returns:
+            TranslationMultiResponse: 목표 언어별 결과.
+
+        Raises:
+            ValueError: 목표 언어 수가 허용 범위를 넘거나 원문 언어가 불일치하는 경우.
+        """
+        result_state = self._execute(self._build_multi_state(request))
+        return self._to_multi_response(result_state)
+
+    async def atranslate_multi(self, request: TranslationMultiRequest) -> TranslationMultiResponse:
+        """하나의 원문을 여러 목표 언어로 비동기 번역한다.
+
+        Args:
+            request: 다중 목표 언어 번역 요청 데이터.
+
+        Returns:
+            TranslationMultiResponse: 목표 언어별 결과.
+
+        Raises:
+            ValueError: 목표 언어 수가 허용 범위를 넘거나 원문 언어가 불일치하는 경우.
+        """
+        result_state = await self._aexecute(self._build_multi_state(request))
+        return self._to_multi_response(result_state)
+
+    def _build_multi_state(self, request: TranslationMultiRequest) -> TranslationState:
+        """다중 목표 언어 요청을 그래프 입력 상태로 변환한다."""
+        max_targets = self.settings.translate.max_target_languages
+        if len(request.target_languages) > max_targets:
+            raise ValueError(f"목표 언어는 최대 {max_targets}개까지 허용됩니다.")
+        state = self._build_state(
+            TranslationRequest(
+                source_language=request.source_language,
+                target_language="",
+                text=request.text,
+            )
+        )
+        state["target_languages"] = list(request.target_languages)
+        return state
+
+    def _to_multi_response(self, state: TranslationState) -> TranslationMultiResponse:
+        """그래프 결과 상태를 목표 언어별 응답으로 변환한다. 차단 시 모든 언어에 같은 사유를 기록한다."""
+        self._raise_if_mismatch(state)
+        target_results = state.get("target_results") or {}
+        blocked = state.get("safeguard_label") != "SAFE"
+        results: dict[str, TranslationTargetResult] = {}
+        for target_language in state.get("target_languages", []):
+            result = target_results.get(target_language)
+            if blocked or result is None:
+                results[target_language] = TranslationTargetResult(
+                    error=state.get("error") or "번역 결과를 확인할 수 없습니다."
+                )
+                continue
+            qc_passed = result.get("qc_passed") == "YES"
+            results[target_language] = TranslationTargetResult(
+                translated_text=result.get("translated_text", ""),
+                qc_passed=qc_passed,
+                retry_count=result.get("retry_count", 0),
+                error=None if qc_passed else (result.get("error") or "번역 결과를 확인할 수 없습니다."),
+            )
+        return TranslationMultiResponse(
+            source_language=state.get("source_language", ""),
+            results=results,
+        )
+
+    async def astream_translate(self, request: TranslationRequest) -> AsyncIterator[StreamEvent]:
+        """번역 결과를 토큰/QC/교체 이벤트로 스트리밍한다.
+
+        Args:
+            request: 번역 요청 데이터.
+
+        Yields:
+            StreamEvent: 번역 진행 이벤트.
+        """
+        async for event in self.streamer.astream(self._build_state(request)):
+            yield event
+
+    def translate_batch(self, request: TranslationBatchRequest) -> TranslationBatchResponse:
+        """배치 번역 요청을 동시성 제한 안에서 처리한다.
+
+        같은 언어쌍의 항목은 가능한 경우 하나의 모델 호출로 묶고,
+        결과는 입력 순서대로 항목별 오류와 함께 반환한다.
+
+        Args:
+            request: 배치 번역 요청 데이터.
+
+        Returns:
+            TranslationBatchResponse: 입력 순서의 항목별 결과.
+
+        Raises:
+            ValueError: 항목 수가 허용 범위를 넘는 경우.
+        """
+        items = self._validate_batch(request)
+        groups = self._plan_batch(items)
+        max_workers = max(1, min(self.settings.batch.max_concurrency, len(groups)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            group_results = list(executor.map(lambda pack: self._run_pack(items, pack), groups))
+        return self._collect_batch(len(items), group_results)
+
+    async def atranslate_batch(self, request: TranslationBatchRequest) -> TranslationBatchResponse:
+        """배치 번역 요청을 비동기로 처리한다.
+
+        동시에 실행되는 묶음 수는 세마포어로 max_concurrency 이하로 제한한다.
+
+        Args:
+            request: 배치 번역 요청 데이터.
+
+        Returns:
+            TranslationBatchResponse: 입력 순서의 항목별 결과.
+
+        Raises:
+            ValueError: 항목 수가 허용 범위를 넘는 경우.
+        """
+        items = self._validate_batch(request)
+        groups = self._plan_batch(items)
+        semaphore = asyncio.Semaphore(max(1, self.settings.batch.max_concurrency))
+
+        async def run_limited(pack: SegmentPack) -> list[TranslationBatchItem]:
+            async with semaphore:
+                return await self._arun_pack(items, pack)
+
+        group_results = await asyncio.gather(*(run_limited(pack) for pack in groups))
+        return self._collect_batch(len(items), group_results)
+
+    def translate_document(self, request: TranslationDocumentRequest) -> TranslationDocumentResponse:
+        """긴 문서를 청크로 나눠 동시성 제한 안에서 번역한다.
+
+        청크마다 그래프(안전 분류/번역/QC/재번역)를 따로 실행하므로
+        QC에 실패한 청크만 재번역된다.
+
+        Args:
+            request: 문서 번역 요청 데이터.
+
+        Returns:
+            TranslationDocumentResponse: 순서대로 재조립한 번역 문서.
+
+        Raises:
+            ValueError: 문서 길이가 허용 범위를 넘는 경우.
+        """
+        if request.format != "text":
+            return self._translate_structured(request)
+        chunks = self._iter_document(request)
+        lock = threading.Lock()
+        results: dict[int, tuple[str, TranslationBatchItem]] = {}
+
+        def next_chunk() -> DocumentChunk | None:
+            # 제너레이터는 스레드 안전하지 않으므로 꺼낼 때만 잠근다.
+            with lock:
+                return next(chunks, None)
+
+        def worker() -> None:
+            while (chunk := next_chunk()) is not None:
+                item = self._run_chunk(request, chunk)
+                results[chunk.index] = (chunk.separator, item)
+
+        max_workers = max(1, self.settings.document.max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(worker) for _ in range(max_workers)]:
+                future.result()
+        return self._assemble_document(request, results)
+
+    async def atranslate_document(
+        self,
+        request: TranslationDocumentRequest,
+        on_progress: ProgressCallback | None = None,
+    ) -> TranslationDocumentResponse:
+        """긴 문서를 청크로 나눠 비동기로 번역한다.
+
+        max_concurrency개의 작업자가 청크를 하나씩 꺼내 처리하므로
+        동시에 그래프 상태로 존재하는 청크 수가 제한된다.
+        취소되면 진행 중인 청크의 모델 호출도 함께 취소된다.
+
+        Args:
+            request: 문서 번역 요청 데이터.
+            on_progress: 청크(서식 보존 모드에서는 조각 묶음)가 끝날 때마다 호출할 콜백.
+
+        Returns:
+            TranslationDocumentResponse: 순서대로 재조립한 번역 문서.
+
+        Raises:
+            ValueError: 문서 길이가 허용 범위를 넘는 경우.
+        """
+        if request.format != "text":
+            return await self._atranslate_structured(request, on_progress)
+        chunks = self._iter_document(request)
+        results: dict[int, tuple[str, TranslationBatchItem]] = {}
+        # 진행률을 받을 때만 전체 청크 수를 미리 센다(분할을 한 번 더 수행).
+        total = self.chunker.count_chunks(request.text) if on_progress is not None else 0
+        if on_progress is not None:
+            on_progress(0, total)
+
+        async def worker() -> None:
+            for chunk in chunks:
+                item = await self._arun_chunk(request, chunk)
+                results[chunk.index] = (chunk.separator, item)
+                if on_progress is not None:
+                    on_progress(len(results), total)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.settings.document.max_concurrency))))
+        return self._assemble_document(request, results)
+
+    def check_document_length(self, request: TranslationDocumentRequest) -> None:
+        """문서 길이 제한을 확인한다.
+
+        Raises:
+            ValueError: 문서 길이가 허용 범위를 넘는 경우.
+        """
+        max_chars = self.settings.document.max_chars
+        if len(request.text) > max_chars:
+            raise ValueError(f"문서 길이는 최대 {max_chars}자까지 허용됩니다.")
+
+    def _iter_document(self, request: TranslationDocumentRequest) -> Iterator[DocumentChunk]:
+        """문서 길이 제한을 확인하고 청크 이터레이터를 만든다."""
+        self.check_document_length(request)
+        return self.chunker.iter_chunks(request.text)
+
+    def _translate_structured(self, request: TranslationDocumentRequest) -> TranslationDocumentResponse:
+        """서식 보존 모드: 텍스트 조각만 중복 제거 후 묶어서 번역하고 원래 자리에 되돌린다."""
+        document, items, layout, packs = self._plan_structured(request)
+        max_workers = max(1, self.settings.document.max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            group_results = list(executor.map(lambda pack: self._run_pack(items, pack), packs))
+        return self._assemble_structured(request, document, layout, group_results, len(packs))
+
+    async def _atranslate_structured(
+        self,
+        request: TranslationDocumentRequest,
+        on_progress: ProgressCallback | None = None,
+    ) -> TranslationDocumentResponse:
+        """서식 보존 모드를 비동기로 실행한다."""
+        document, items, layout, packs = self._plan_structured(request)
+        semaphore = asyncio.Semaphore(max(1, self.settings.document.max_concurrency))
+        completed = 0
+        if on_progress is not None:
+            on_progress(0, len(packs))
+
+        async def run_limited(pack: SegmentPack) -> list[TranslationBatchItem]:
+            nonlocal completed
+            async with semaphore:
+                group = await self._arun_pack(items, pack)
+            completed += 1
+            if on_progress is not None:
+                on_progress(completed, len(packs))
+            return group
+
+        group_results = await asyncio.gather(*(run_limited(pack) for pack in packs))
+        return self._assemble_structured(request, document, layout, group_results, len(packs))
+
+    def _plan_structured(
+        self,
+        request: TranslationDocumentRequest,
+    ) -> tuple[SegmentedDocument, list[TranslationRequest], dict[str, list[tuple[int, str]]], list[SegmentPack]]:
+        """문서를 텍스트 조각으로 나누고, 같은 조각은 한 번만 번역하도록 묶음을 만든다.
+
+        청크 한도를 넘는 조각은 입력 길이 제한에서 잘리지 않도록 문장 경계에서 나눠 따로 번역하고,
+        조립할 때 다시 잇는다. 반환하는 layout은 조각 텍스트 → (번역 항목 위치, 뒤 구분자) 목록이다.
+        """
+        self.check_document_length(request)
+        document = self.segmenters[request.format].segment(request.text)
+        positions: dict[str, int] = {}
+        layout: dict[str, list[tuple[int, str]]] = {}
+        for text in document.unique_texts():
+            layout[text] = [
+                (positions.setdefault(piece, len(positions)), separator)
+                for piece, separator in self.chunker.split_paragraph(text)
+            ]
+        items = [
+            TranslationRequest(
+                source_language=request.source_language,
+                target_language=request.target_language,
+                text=piece,
+            )
+            for piece in positions
+        ]
+        packs = self.document_packer.pack([(index, item.text) for index, item in enumerate(items)])
+        return document, items, layout, packs
+
+    def _assemble_structured(
+        self,
+        request: TranslationDocumentRequest,
+        document: SegmentedDocument,
+        layout: dict[str, list[tuple[int, str]]],
+        group_results: list[list[TranslationBatchItem]],
+        pack_count: int,
+    ) -> TranslationDocumentResponse:
+        """조각 번역 결과를 문서에 되돌린다. 실패했거나 자리표시자가 깨진 조각은 원문을 유지하고 목록으로 돌려준다."""
+        pieces: dict[int, str] = {}
+        failed: list[TranslationBatchItem] = []
+        for group in group_results:
+            for item in group:
+                if item.error is None:
+                    pieces[item.index] = item.translated_text
+                else:
+                    failed.append(item)
+        # 나눠 번역한 조각은 모든 부분이 성공했을 때만 이어 붙여 쓴다.
+        translations: dict[str, str] = {
+            text: "".join(pieces[index] + separator for index, separator in parts)
+            for text, parts in layout.items()
+            if all(index in pieces for index, _ in parts)
+        }
+        translated_text, broken = document.render(translations)
+        for text in broken:
+            failed.append(TranslationBatchItem(
+                index=layout[text][0][0],
+                source_language=request.source_language,
+                target_language=request.target_language,
+                translated_text=translations[text],
+                error="서식 자리표시자가 번역 결과에 보존되지 않아 원문을 유지했습니다.",
+            ))
+        return TranslationDocumentResponse(
+            source_language=request.source_language,
+            target_language=request.target_language,
+            translated_text=translated_text,
+            chunk_count=pack_count,
+            failed_chunks=sorted(failed, key=lambda item: item.index),
+            segment_count=len(document.segments),
+            unique_segment_count=len(layout),
+        )
+
+    def _plan_chunk(
+        self,
+        request: TranslationDocumentRequest,
+        chunk: DocumentChunk,
+    ) -> tuple[list[TranslationRequest], list[SegmentPack]]:
+        """청크에 묶인 조각을 마커 묶음으로 계획한다.
+
+        정규화가 줄바꿈을 공백으로 접으므로 문단 경계는 마커로 지키고 조립할 때 구분자를 되돌린다.
+        """
+        items = [
+            TranslationRequest(
+                source_language=request.source_language,
+                target_language=request.target_language,
+                text=piece,
+            )
+            for piece, _ in chunk.parts
+        ]
+        packs = self.document_packer.pack([(index, item.text) for index, item in enumerate(items)])
+        return items, packs
+
+    def _run_chunk(self, request: TranslationDocumentRequest, chunk: DocumentChunk) -> TranslationBatchItem:
+        """청크 하나를 번역한다. 조각이 하나면 단건 실행과 같다."""
+        items, packs = self._plan_chunk(request, chunk)
+        return self._merge_chunk(chunk, [self._run_pack(items, pack) for pack in packs])
+
+    async def _arun_chunk(self, request: TranslationDocumentRequest, chunk: DocumentChunk) -> TranslationBatchItem:
+        """청크 하나를 비동기로 번역한다."""
+        items, packs = self._plan_chunk(request, chunk)
+        return self._merge_chunk(chunk, [await self._arun_pack(items, pack) for pack in packs])
+
+    def _merge_chunk(
+        self,
+        chunk: DocumentChunk,
+        group_results: list[list[TranslationBatchItem]],
+    ) -> TranslationBatchItem:
+        """조각 결과를 원래 구분자로 이어 붙여 청크 결과 하나로 만든다. 오류는 첫 조각 오류를 쓴다."""
+        outputs = sorted((item for group in group_results for item in group), key=lambda item: item.index)
+        errors = [item.error for item in outputs if item.error is not None]
+        return TranslationBatchItem(
+            index=chunk.index,
+            source_language=outputs[0].source_language,
+            target_language=outputs[0].target_language,
+            translated_text="".join(
+                item.translated_text + joint for item, (_, joint) in zip(outputs, chunk.parts)
+            ),
+            error=errors[0] if errors else None,
+        )
+
+    def _assemble_document(
+        self,
+        request: TranslationDocumentRequest,
+        results: dict[int, tuple[str, TranslationBatchItem]],
+    ) -> TranslationDocumentResponse:
+        """청크 결과를 순번대로 이어 붙인다. 실패한 청크도 남은 결과(차단 시 빈 문자열)를 그 자리에 두고 목록으로 따로 돌려준다."""
+        parts: list[str] = []
+        failed: list[TranslationBatchItem] = []
+        for index in range(len(results)):
+            separator, item = results[index]
+            parts.append(separator + item.translated_text)
+            if item.error is not None:
+                failed.append(item)
+        return TranslationDocumentResponse(
+            source_language=request.source_language,
+            target_language=request.target_language,
+            translated_text="".join(parts),
+            chunk_count=len(results),
+            failed_chunks=failed,
+        )
+
+    def _validate_batch(self, request: TranslationBatchRequest) -> list[TranslationRequest]:
+        """배치 항목 수 제한을 확인한다."""
+        items = request.items
+        max_items = self.settings.batch.max_items
+        if len(items) > max_items:
+            raise ValueError(f"배치 항목 수는 최대 {max_items}개까지 허용됩니다.")
+        return items
+
+    def _collect_batch(
+        self,
+        size: int,
+        group_results: list[list[TranslationBatchItem]],
+    ) -> TranslationBatchResponse:
+        """묶음별 결과를 입력 순서대로 정렬한다."""
+        results: list[TranslationBatchItem | None] = [None] * size
+        for group in group_results:
+            for item in group:
+                results[item.index] = item
+        return TranslationBatchResponse(results=[item for item in results if item is not None])
+
+    def _plan_batch(self, items: list[TranslationRequest]) -> list[SegmentPack]:
+        """언어쌍 기준으로 항목을 묶어 실행 단위를 만든다."""
+        if not self.settings.batch.enable_packing:
+            return [SegmentPack(indices=(index,), texts=(item.text,)) for index, item in enumerate(items)]
+
+        by_pair: dict[tuple[str, str], list[tuple[int, str]]] = {}
+        for index, item in enumerate(items):
+            pair = (item.source_language.strip().lower(), item.target_language.strip().lower())
+            by_pair.setdefault(pair, []).append((index, item.text.strip()))
+
+        packs: list[SegmentPack] = []
+        for segments in by_pair.values():
+            packs.extend(self.packer.pack(segments))
+        return packs
+
+    def _packed_state(self, items: list[TranslationRequest], pack: SegmentPack) -> TranslationState:
+        """묶음을 하나의 그래프 입력 상태로 만든다. 언어 감지는 묶음 전체가 아니라 항목별 재실행에서만 한다."""
+        first = items[pack.indices[0]]
+        state = self._build_state(
+            TranslationRequest(
+                source_language=first.source_language,
+                target_language=first.target_language,
+                text=self.packer.join(pack),
+            )
+        )
+        state["packed"] = True
+        return state
+
+    def _split_pack(
+        self,
+        pack: SegmentPack,
+        state: TranslationState | None,
+    ) -> list[TranslationBatchItem] | None:
+        """묶음 실행 결과를 항목별 결과로 나눈다.
+
+        차단/QC 실패/마커 손상 시에는 항목별 원인을 돌려주기 위해 None을 반환해
+        개별 실행으로 전환하게 한다.
+        """
+        if not state or state.get("safeguard_label") != "SAFE" or state.get("qc_passed") != "YES":
+            return None
+        outputs = self.packer.split(pack, state.get("translated_text", ""))
+        if outputs is None:
+            return None
+        return [
+            TranslationBatchItem(
+                index=index,
+                source_language=state.get("source_language", ""),
+                target_language=state.get("target_language", ""),
+                translated_text=output,
+            )
+            for index, output in zip(pack.indices, outputs)
+        ]
+
+    def _run_pack(self, items: list[TranslationRequest], pack: SegmentPack) -> list[TranslationBatchItem]:
+        """묶음 하나를 실행하고 실패 시 항목 단위로 다시 실행한다."""
+        if len(pack.indices) == 1:
+            index = pack.indices[0]
+            return [self._run_item(index, items[index])]
+
+        try:
+            state = self.graph.run(self._packed_state(items, pack))
+        except Exception:
+            state = None
+        results = self._split_pack(pack, state)
+        if results is None:
+            return [self._run_item(index, items[index]) for index in pack.indices]
+        return results
+
+    async def _arun_pack(self, items: list[TranslationRequest], pack: SegmentPack) -> list[TranslationBatchItem]:
+        """묶음 하나를 비동기로 실행하고 실패 시 항목 단위로 다시 실행한다."""
+        if len(pack.indices) == 1:
+            index = pack.indices[0]
+            return [await self._arun_item(index, items[index])]
+
+        try:
+            state = await self.graph.arun(self._packed_state(items, pack))
+        except Exception:
+            state = None
+        results = self._split_pack(pack, state)
+        if results is None:
+            return list(await asyncio.gather(*(self._arun_item(index, items[index]) for index in pack.indices)))
+        return results
+
+    def _error_item(self, index: int, request: TranslationRequest, error: Exception) -> TranslationBatchItem:
+        return TranslationBatchItem(
+            index=index,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            error=f"번역 처리 실패: {error}",
+        )
+
+    def _run_item(self, index: int, request: TranslationRequest) -> TranslationBatchItem:
+        """단건 항목을 그래프로 실행하고 결과/오류를 기록한다."""
+        try:
+            state = self._execute(self._build_state(request))
+        except Exception as e:
+            return self._error_item(index, request, e)
+        return self._to_batch_item(index, state)
+
+    async def _arun_item(self, index: int, request: TranslationRequest) -> TranslationBatchItem:
+        """단건 항목을 비동기로 실행하고 결과/오류를 기록한다."""
+        try:
+            state = await self._aexecute(self._build_state(request))
+        except Exception as e:
+            return self._error_item(index, request, e)
+        return self._to_batch_item(index, state)
+
+    def _to_batch_item(self, index: int, state: TranslationState) -> TranslationBatchItem:
+        """그래프 결과 상태를 배치 항목 결과로 변환한다."""
+        error = None
+        if state.get("safeguard_label") != "SAFE" or state.get("qc_passed") != "YES":
+            error = state.get("error") or "번역 결과를 확인할 수 없습니다."
+        return TranslationBatchItem(
+            index=index,
+            source_language=state.get("source_language", ""),
+            target_language=state.get("target_language", ""),
+            translated_text=state.get("translated_text", ""),
+            error=error,
+        )
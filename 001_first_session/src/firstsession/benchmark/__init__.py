@@ -0,0 +1 @@
+"""오프라인 부하 테스트/벤치마크 패키지."""
@@ -0,0 +1,84 @@
+# 목적: 오프라인 벤치마크 CLI 진입점을 제공한다.
+# 설명: `python -m firstsession.benchmark`로 가짜 백엔드 기반 부하 테스트를 실행하고 결과 표를 출력한다.
+# 디자인 패턴: 커맨드 패턴
+# 참조: firstsession/benchmark/load_runner.py
+
+"""벤치마크 실행 모듈."""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+
+from firstsession.benchmark.fake_genai_client import FakeModelConfig
+from firstsession.benchmark.load_runner import build_runner, format_report
+from firstsession.config.settings import CacheSettings, ModelRoutingSettings, Settings, TranslateSettings
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="firstsession offline translation benchmark")
+    parser.add_argument("--levels", default="1,4,16,64", help="동시성 단계(쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=200, help="단계별 요청 수")
+    parser.add_argument("--targets", default="service,http", help="측정 대상: service,http")
+    parser.add_argument("--latency", default="lognormal", choices=["constant", "uniform", "lognormal"])
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=100.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--qc-fail-rate", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--json-malformed-rate", type=float, default=0.0)
+    parser.add_argument("--single-call", action="store_true", help="단일 호출(JSON) 번역 모드로 측정")
+    parser.add_argument("--routing", action="store_true", help="모델 티어 라우팅을 켜고 측정")
+    parser.add_argument(
+        "--model-latency-factors",
+        default="",
+        help="모델별 지연 배율(예: gemini-2.5-flash-lite=0.4,gemini-3-pro-preview=2.0)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="표 대신 JSON으로 출력")
+    return parser.parse_args()
+
+
+def _parse_factors(value: str) -> tuple[tuple[str, float], ...]:
+    factors: list[tuple[str, float]] = []
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        model, _, factor = item.partition("=")
+        factors.append((model.strip(), float(factor)))
+    return tuple(factors)
+
+
+def main() -> None:
+    """벤치마크를 실행하고 결과를 출력한다."""
+    args = _parse_args()
+    config = FakeModelConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        latency_sigma=args.latency_sigma,
+        qc_fail_rate=args.qc_fail_rate,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        json_malformed_rate=args.json_malformed_rate,
+        model_latency_factors=_parse_factors(args.model_latency_factors),
+        seed=args.seed,
+    )
+    app_settings = Settings(
+        cache=CacheSettings(enabled=False),
+        translate=TranslateSettings(single_call=args.single_call),
+        model_routing=ModelRoutingSettings(enabled=args.routing),
+    )
+    runner = build_runner(config, app_settings)
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    results = asyncio.run(runner.run_levels(levels, args.requests, targets))
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], ensure_ascii=False, indent=2))
+    else:
+        print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
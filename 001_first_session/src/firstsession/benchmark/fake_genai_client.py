@@ -0,0 +1,227 @@
+# 목적: 실제 Gemini 호출 없이 번역 그래프를 부하 테스트하기 위한 가짜 모델 백엔드를 제공한다.
+# 설명: genai.Client와 같은 models/aio.models 인터페이스로 지연 분포, QC 실패율, 오류율을 재현한다.
+#       GeminiClient(genai_client=...)에 주입하므로 동시성 제한/재시도 경로도 그대로 실행된다.
+# 디자인 패턴: 테스트 더블(Fake)
+# 참조: firstsession/core/translate/client/gemini_client.py, firstsession/benchmark/load_runner.py
+
+"""가짜 Gemini 백엔드 모듈."""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+from google.genai import errors
+
+# 프롬프트 첫 줄로 호출 목적을 구분한다.
+_PURPOSE_BY_PREFIX: tuple[tuple[str, str], ...] = (
+    ("You are a safety classifier", "safeguard"),
+    ("You are a translation assistant", "single_call"),
+    ("You are a translation quality reviewer", "quality_check"),
+    ("You are a translation rewriter", "retry_translate"),
+    ("You are a professional translator", "translate"),
+)
+_SECTION_PATTERN = r"\[{name}\]\n(.*?)\n\n\["
+# 가짜 번역에서도 그대로 보존해야 하는 토큰(URL/플레이스홀더/배치 마커/숫자)
+_PROTECTED = re.compile(r"https?://\S+|\{[^}]*\}|%\(\w+\)\w|%\w|<[^>]+>|\[\[\d+\]\]|\d+(?:[.,]\d+)*")
+# 목표 언어 문자 체계를 흉내 내기 위한 대표 문자
+_SCRIPT_SAMPLE = {
+    "ko": "가", "ja": "あ", "zh": "中", "ru": "д", "uk": "д", "bg": "д", "el": "λ",
+    "ar": "ب", "fa": "ب", "he": "ש", "th": "ก", "hi": "क",
+}
+
+
+@dataclass(frozen=True)
+class FakeModelConfig:
+    """가짜 백엔드 동작 설정 담당"""
+    # constant | uniform | lognormal
+    latency: str = "lognormal"
+    latency_ms: float = 300.0
+    # uniform: ±latency_jitter_ms, lognormal: 로그 표준편차
+    latency_jitter_ms: float = 100.0
+    latency_sigma: float = 0.5
+    # 모델별 지연 배율((모델 이름, 배율), ...). 모델 티어 라우팅 효과를 재현할 때 쓴다.
+    model_latency_factors: tuple[tuple[str, float], ...] = ()
+    qc_fail_rate: float = 0.1
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    # 단일 호출 JSON 응답 중 닫는 괄호가 빠진(json-repair로 복구 가능한) 응답 비율
+    json_malformed_rate: float = 0.0
+    stream_chunk_chars: int = 8
+    seed: int = 0
+
+
+class FakeGenaiClient:
+    """genai.Client 대체 구현.
+
+    같은 seed와 같은 프롬프트 호출 순번이면 지연/결과가 항상 같으므로
+    동시 실행 순서와 무관하게 결과를 재현할 수 있다.
+    """
+
+    def __init__(self, config: FakeModelConfig | None = None) -> None:
+        self.config = config or FakeModelConfig()
+        self.calls: Counter[str] = Counter()
+        self.failures: Counter[str] = Counter()
+        self._prompt_calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+        self.aio = SimpleNamespace(
+            models=SimpleNamespace(
+                generate_content=self._agenerate_content,
+                generate_content_stream=self._agenerate_content_stream,
+            ),
+            aclose=self._aclose,
+        )
+
+    def reset(self) -> None:
+        """호출 카운터를 초기화한다."""
+        with self._lock:
+            self.calls.clear()
+            self.failures.clear()
+            self._prompt_calls.clear()
+
+    def close(self) -> None:
+        return None
+
+    async def _aclose(self) -> None:
+        return None
+
+    def _purpose(self, prompt: str) -> str:
+        for prefix, purpose in _PURPOSE_BY_PREFIX:
+            if prompt.startswith(prefix):
+                return purpose
+        return "other"
+
+    def _rng(self, prompt: str) -> tuple[random.Random, str]:
+        """프롬프트와 호출 순번으로 결정적인 난수 생성기를 만든다."""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        purpose = self._purpose(prompt)
+        with self._lock:
+            sequence = self._prompt_calls[digest]
+            self._prompt_calls[digest] += 1
+            self.calls[purpose] += 1
+        return random.Random(f"{self.config.seed}:{digest}:{sequence}"), purpose
+
+    def _latency(self, rng: random.Random, model: str = "") -> float:
+        config = self.config
+        if config.latency == "constant":
+            millis = config.latency_ms
+        elif config.latency == "uniform":
+            millis = rng.uniform(config.latency_ms - config.latency_jitter_ms, config.latency_ms + config.latency_jitter_ms)
+        elif config.latency == "lognormal":
+            millis = config.latency_ms * rng.lognormvariate(0.0, config.latency_sigma)
+        else:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {config.latency}")
+        millis *= dict(config.model_latency_factors).get(model, 1.0)
+        return max(0.0, millis) / 1000
+
+    def _maybe_fail(self, rng: random.Random, purpose: str) -> None:
+        roll = rng.random()
+        if roll < self.config.rate_limit_rate:
+            with self._lock:
+                self.failures["429"] += 1
+            raise errors.APIError(429, {"error": {
+                "code": 429,
+                "status": "RESOURCE_EXHAUSTED",
+                "message": f"fake rate limit ({purpose})",
+                "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "0.05s"}],
+            }})
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            with self._lock:
+                self.failures["503"] += 1
+            raise errors.APIError(503, {"error": {
+                "code": 503, "status": "UNAVAILABLE", "message": f"fake error ({purpose})",
+            }})
+
+    def _section(self, prompt: str, name: str) -> str:
+        match = re.search(_SECTION_PATTERN.format(name=re.escape(name)), prompt, re.S)
+        return match.group(1) if match else ""
+
+    def _translate(self, text: str, target_language: str) -> str:
+        """보존 토큰은 그대로 두고 나머지 글자를 목표 언어 문자로 바꾼다."""
+        sample = _SCRIPT_SAMPLE.get(target_language.strip().lower())
+        parts: list[str] = []
+        last = 0
+        for match in _PROTECTED.finditer(text):
+            parts.append(self._replace_letters(text[last:match.start()], sample))
+            parts.append(match.group(0))
+            last = match.end()
+        parts.append(self._replace_letters(text[last:], sample))
+        translated = "".join(parts)
+        # 원문과 똑같으면 미번역으로 판정되므로 라틴 문자 언어는 대소문자를 뒤집는다.
+        return translated if sample else translated.swapcase()
+
+    def _replace_letters(self, text: str, sample: str | None) -> str:
+        if sample is None:
+            return text
+        return "".join(sample if char.isalpha() else char for char in text)
+
+    def _answer(self, prompt: str, purpose: str, rng: random.Random) -> str:
+        if purpose == "safeguard":
+            return "PASS"
+        if purpose == "quality_check":
+            return "NO" if rng.random() < self.config.qc_fail_rate else "YES"
+        if purpose == "translate":
+            text = self._section(prompt, "Text to Translate")
+            return self._translate(text, self._section(prompt, "Target Language"))
+        if purpose == "retry_translate":
+            return self._section(prompt, "Previous Translation") or self._section(prompt, "Source")
+        if purpose == "single_call":
+            text = self._section(prompt, "Text to Translate")
+            answer = json.dumps({
+                "safety_label": "PASS",
+                "translation": self._translate(text, self._section(prompt, "Target Language")),
+                "self_check": "NO" if rng.random() < self.config.qc_fail_rate else "YES",
+            }, ensure_ascii=False)
+            if rng.random() < self.config.json_malformed_rate:
+                return "```json\n" + answer[:-1] + "\n```"
+            return answer
+        return "YES"
+
+    def _response(self, text: str) -> Any:
+        usage = SimpleNamespace(
+            prompt_token_count=0,
+            candidates_token_count=max(1, len(text) // 4),
+            total_token_count=max(1, len(text) // 4),
+        )
+        return SimpleNamespace(text=text, usage_metadata=usage)
+
+    def _generate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        prompt = str(contents)
+        rng, purpose = self._rng(prompt)
+        time.sleep(self._latency(rng, model))
+        self._maybe_fail(rng, purpose)
+        return self._response(self._answer(prompt, purpose, rng))
+
+    async def _agenerate_content(self, *, model: str, contents: Any, config: Any = None) -> Any:
+        prompt = str(contents)
+        rng, purpose = self._rng(prompt)
+        await asyncio.sleep(self._latency(rng, model))
+        self._maybe_fail(rng, purpose)
+        return self._response(self._answer(prompt, purpose, rng))
+
+    async def _agenerate_content_stream(self, *, model: str, contents: Any, config: Any = None) -> AsyncIterator[Any]:
+        prompt = str(contents)
+        rng, purpose = self._rng(prompt)
+        total = self._latency(rng, model)
+        # 첫 조각까지 지연의 절반, 나머지는 조각 사이에 나눈다.
+        await asyncio.sleep(total / 2)
+        self._maybe_fail(rng, purpose)
+        text = self._answer(prompt, purpose, rng)
+        size = max(1, self.config.stream_chunk_chars)
+        chunks = [text[start:start + size] for start in range(0, len(text), size)] or [""]
+
+        async def iterate() -> AsyncIterator[Any]:
+            for index, chunk in enumerate(chunks):
+                if index:
+                    await asyncio.sleep(total / 2 / len(chunks))
+                yield self._response(chunk)
+
+        return iterate()
@@ -0,0 +1,202 @@
+# 목적: 가짜 모델 백엔드로 번역 서비스/HTTP 엔드포인트의 처리량과 꼬리 지연을 측정한다.
+# 설명: 동시성 단계별로 요청을 실행하고 p50/p95/p99, 초당 요청 수, 요청당 모델 호출/재번역 횟수를 집계한다.
+# 디자인 패턴: 러너(Runner)
+# 참조: firstsession/benchmark/fake_genai_client.py, firstsession/api/translate/service/translation_service.py
+
+"""부하 테스트 러너 모듈."""
+
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import httpx
+
+from firstsession.api.translate.model.translation_request import TranslationRequest
+from firstsession.api.translate.service.translation_service import TranslationService
+from firstsession.benchmark.fake_genai_client import FakeGenaiClient, FakeModelConfig
+from firstsession.config.settings import CacheSettings, Settings
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.graphs.translate_graph import TranslateGraph
+
+_SAMPLE_SENTENCES = (
+    "The quarterly report is due on March 3 and covers 12 regional offices.",
+    "Please restart the server before applying the update to version 2.4.1.",
+    "Our support team answers most tickets within 24 hours.",
+    "Click {button} to continue, or visit https://example.com/help for details.",
+    "The meeting was moved to the second floor conference room.",
+    "Shipping is free for orders over 50 dollars.",
+)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """최근접 순위 방식 백분위수를 계산한다."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class LoadResult:
+    """동시성 단계 하나의 측정 결과."""
+
+    target: str
+    concurrency: int
+    requests: int
+    failures: int
+    duration_seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    requests_per_second: float
+    model_calls_per_request: float
+    retries_per_request: float
+    calls_by_purpose: dict[str, int] = field(default_factory=dict)
+
+
+class LoadRunner:
+    """가짜 백엔드를 주입한 서비스와 앱을 단계별 동시성으로 실행한다."""
+
+    def __init__(
+        self,
+        fake: FakeGenaiClient,
+        service: TranslationService,
+        app=None,
+        source_language: str = "en",
+        target_language: str = "fr",
+    ) -> None:
+        """러너를 초기화한다.
+
+        Args:
+            fake: 호출 수를 집계할 가짜 백엔드.
+            service: 측정할 번역 서비스.
+            app: HTTP 경로를 측정할 FastAPI 앱(선택).
+            source_language: 요청 원문 언어.
+            target_language: 요청 목표 언어.
+        """
+        self.fake = fake
+        self.service = service
+        self.app = app
+        self.source_language = source_language
+        self.target_language = target_language
+
+    def _request(self, index: int) -> TranslationRequest:
+        # 캐시 적중으로 모델 호출이 생략되지 않도록 요청마다 텍스트를 다르게 만든다.
+        sentence = _SAMPLE_SENTENCES[index % len(_SAMPLE_SENTENCES)]
+        return TranslationRequest(
+            source_language=self.source_language,
+            target_language=self.target_language,
+            text=f"{sentence} (ref {index})",
+        )
+
+    async def _drive(
+        self,
+        target: str,
+        concurrency: int,
+        total: int,
+        send: Callable[[TranslationRequest], Awaitable[bool]],
+    ) -> LoadResult:
+        """concurrency개의 작업자가 total개의 요청을 나눠 실행하고 결과를 집계한다."""
+        self.fake.reset()
+        latencies: list[float] = []
+        failures = 0
+        indices = iter(range(total))
+
+        async def worker() -> None:
+            nonlocal failures
+            for index in indices:
+                started = time.perf_counter()
+                try:
+                    ok = await send(self._request(index))
+                except Exception:
+                    ok = False
+                latencies.append((time.perf_counter() - started) * 1000)
+                if not ok:
+                    failures += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        duration = time.perf_counter() - started
+        calls = dict(self.fake.calls)
+        return LoadResult(
+            target=target,
+            concurrency=concurrency,
+            requests=total,
+            failures=failures,
+            duration_seconds=duration,
+            p50_ms=percentile(latencies, 50),
+            p95_ms=percentile(latencies, 95),
+            p99_ms=percentile(latencies, 99),
+            requests_per_second=total / duration if duration else 0.0,
+            model_calls_per_request=sum(calls.values()) / total if total else 0.0,
+            retries_per_request=calls.get("retry_translate", 0) / total if total else 0.0,
+            calls_by_purpose=calls,
+        )
+
+    async def run_service(self, concurrency: int, total: int) -> LoadResult:
+        """TranslationService.atranslate를 직접 호출해 측정한다."""
+        async def send(request: TranslationRequest) -> bool:
+            response = await self.service.atranslate(request)
+            return bool(response.translated_text)
+
+        return await self._drive("service", concurrency, total, send)
+
+    async def run_http(self, concurrency: int, total: int) -> LoadResult:
+        """ASGI 전송으로 POST /api/v1/translate를 호출해 측정한다(라우팅/직렬화 비용 포함)."""
+        if self.app is None:
+            raise ValueError("HTTP 측정에는 app이 필요합니다.")
+        transport = httpx.ASGITransport(app=self.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            async def send(request: TranslationRequest) -> bool:
+                response = await client.post("/api/v1/translate", json=request.model_dump())
+                return response.status_code == 200 and bool(response.json().get("translated_text"))
+
+            return await self._drive("http", concurrency, total, send)
+
+    async def run_levels(self, levels: list[int], total: int, targets: list[str]) -> list[LoadResult]:
+        """동시성 단계를 늘려 가며 대상별로 측정한다."""
+        results: list[LoadResult] = []
+        for concurrency in levels:
+            for target in targets:
+                if target == "service":
+                    results.append(await self.run_service(concurrency, total))
+                elif target == "http":
+                    results.append(await self.run_http(concurrency, total))
+                else:
+                    raise ValueError(f"지원하지 않는 측정 대상입니다: {target}")
+        return results
+
+
+def build_runner(fake_config: FakeModelConfig, app_settings: Settings | None = None) -> LoadRunner:
+    """가짜 백엔드를 주입한 서비스/앱으로 러너를 구성한다.
+
+    결과 캐시는 기본으로 끈다. 켜 두면 측정값이 캐시 적중률에 좌우된다.
+    """
+    from firstsession.main import create_app
+
+    app_settings = app_settings or Settings(cache=CacheSettings(enabled=False))
+    fake = FakeGenaiClient(fake_config)
+    model_client = GeminiClient(app_settings.model_client, genai_client=fake)
+    graph = TranslateGraph(settings=app_settings, model_client=model_client)
+    service = TranslationService(graph, settings=app_settings)
+    app = create_app(app_settings=app_settings, model_client=model_client)
+    return LoadRunner(fake, service, app=app)
+
+
+def format_report(results: list[LoadResult]) -> str:
+    """측정 결과를 표 형태 문자열로 만든다."""
+    header = (
+        f"{'target':<8} {'conc':>5} {'reqs':>6} {'fail':>5} {'rps':>8} "
+        f"{'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'calls/req':>9} {'retry/req':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.target:<8} {result.concurrency:>5} {result.requests:>6} {result.failures:>5} "
+            f"{result.requests_per_second:>8.1f} {result.p50_ms:>8.1f} {result.p95_ms:>8.1f} "
+            f"{result.p99_ms:>8.1f} {result.model_calls_per_request:>9.2f} {result.retries_per_request:>9.2f}"
+        )
+    return "\n".join(lines)
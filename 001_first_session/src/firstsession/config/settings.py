@@ -10,10 +10,152 @@ class TranslateSettings(BaseModel):
     max_retry_count: int = 1
     enable_safeguard: bool = True
     enable_qc: bool = True
+    # 다중 목표 언어 요청 한 건에 허용되는 최대 목표 언어 수
+    max_target_languages: int = 16
+    # 안전 분류와 번역을 병렬로 시작한다. SAFE가 아니면 번역 결과는 폐기된다(추가 호출 비용 발생).
+    speculative_translate: bool = False
+    # 안전 분류/번역/자체 QC를 JSON 응답 하나로 받는 단일 호출 모드. 파싱에 실패하면 기존 경로로 처리한다.
+    # 켜면 speculative_translate보다 우선한다.
+    single_call: bool = False
+    # 단일 호출 결과 중 이 비율만큼 기존 안전 분류/QC를 따로 호출해 불일치율을 측정한다(추가 호출 발생).
+    single_call_audit_rate: float = 0.0
+    # 동시에 진행 중인 같은 요청(언어쌍+원문)은 그래프를 한 번만 실행하고 결과를 공유한다.
+    coalesce_requests: bool = True
+
+class ModelClientSettings(BaseModel):
+    """공유 모델 클라이언트(커넥션 풀/동시성/재시도) 관련 argument 관리"""
+    # 동기/비동기 경로 각각의 최대 동시 모델 호출 수
+    max_concurrency: int = 16
+    max_connections: int = 64
+    max_keepalive_connections: int = 32
+    keepalive_expiry_seconds: float = 30.0
+    timeout_seconds: float = 30.0
+    max_retries: int = 3
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 20.0
+    # 헤지 호출(비동기 경로): 최근 지연의 hedge_percentile 백분위를 넘겨도 응답이 없으면 같은 요청을 한 번 더 보내고
+    # 먼저 끝난 응답을 쓴다. 추가 호출은 주 호출 수의 hedge_budget_ratio 이내로 제한한다.
+    hedge_enabled: bool = False
+    hedge_percentile: float = 95.0
+    hedge_budget_ratio: float = 0.05
+    hedge_min_samples: int = 20
+    hedge_window: int = 200
+
+class ModelRoutingSettings(BaseModel):
+    """호출별 모델 티어 선택(길이/언어쌍/호출 목적) 관련 argument 관리"""
+    enabled: bool = False
+    # 티어 이름 → 모델 이름
+    tiers: dict[str, str] = {
+        "small": "gemini-2.5-flash-lite",
+        "standard": "gemini-3-flash-preview",
+        "large": "gemini-3-pro-preview",
+    }
+    default_tier: str = "standard"
+    # 호출 목적별 고정 티어. 안전 분류/QC는 YES/NO 판정이라 작은 모델로 충분하다.
+    purpose_tiers: dict[str, str] = {"safeguard": "small", "quality_check": "small"}
+    # "원문-목표" 언어쌍별 티어("*"는 모든 언어). 예: {"ko-ja": "small", "*-ar": "large"}
+    pair_tiers: dict[str, str] = {}
+    # 원문 길이 기준 티어(0이면 사용 안 함). 우선순위: 호출 목적 > 언어쌍 > 길이 > 기본
+    short_text_chars: int = 40
+    short_tier: str = "small"
+    long_text_chars: int = 2000
+    long_tier: str = "large"
+
+class LanguageIdSettings(BaseModel):
+    """로컬 언어 감지(원문 언어 자동 채움/동일 언어 생략/불일치 처리) 관련 argument 관리"""
+    enabled: bool = True
+    # 이 글자 수보다 짧은 입력은 판정하지 않는다.
+    min_letters: int = 12
+    # 감지 신뢰도가 이 값 이상일 때만 원문 언어를 채우거나 번역을 건너뛴다.
+    min_confidence: float = 0.8
+    # 요청한 원문 언어와 감지 언어가 다를 때: ignore | correct(감지 언어로 교체) | reject(LLM 호출 없이 400 오류)
+    mismatch_policy: str = "ignore"
+    # correct/reject는 감지 신뢰도가 이 값 이상일 때만 적용한다.
+    mismatch_min_confidence: float = 0.95
+
+class PreclassifySettings(BaseModel):
+    """규칙 기반 안전 사전 분류 관련 argument 관리"""
+    enabled: bool = True
+    # 이 길이 이하이면서 패턴과 완전히 일치하면 LLM 분류 없이 SAFE로 처리한다.
+    # 기본값은 숫자/기호만 허용한다. 짧은 UI 문구까지 허용하려면 패턴을 넓힌다(예: r"[\w\s.,!?]*").
+    trivial_max_length: int = 24
+    trivial_pattern: str = r"[\d\s.,:;%+\-/()#]*"
+
+class HeuristicQcSettings(BaseModel):
+    """LLM QC 전 규칙 기반 품질 검사 관련 argument 관리"""
+    enabled: bool = True
+    # 규칙을 모두 통과했을 때 LLM QC 생략 여부: never | short(원문이 skip_llm_max_length 이하) | always
+    skip_llm_policy: str = "never"
+    skip_llm_max_length: int = 200
+    min_length_ratio: float = 0.2
+    max_length_ratio: float = 5.0
+    min_script_ratio: float = 0.3
+
+class BatchSettings(BaseModel):
+    """batch 번역 관련 argument 관리"""
+    max_items: int = 1000
+    max_concurrency: int = 8
+    enable_packing: bool = True
+    max_pack_chars: int = 3000
+
+class DocumentSettings(BaseModel):
+    """긴 문서 번역 관련 argument 관리"""
+    max_chars: int = 200000
+    # normalize.max_input_length보다 크면 max_input_length로 제한된다.
+    chunk_chars: int = 2000
+    max_concurrency: int = 4
+
+class JobSettings(BaseModel):
+    """비동기 번역 작업(job) 큐/작업자 관련 argument 관리"""
+    # 작업을 동시에 실행하는 작업자 수(작업 하나 안의 청크 동시성은 document.max_concurrency)
+    workers: int = 2
+    # 대기열이 가득 차면 새 작업을 거절한다.
+    max_queued_jobs: int = 100
+    # 끝난 작업(결과 포함)을 보관하는 시간과 최대 개수
+    result_ttl_seconds: float = 3600
+    max_retained_jobs: int = 1000
+
+class CacheSettings(BaseModel):
+    """번역/안전 분류 결과 캐시 관련 argument 관리"""
+    enabled: bool = True
+    max_entries: int = 10000
+    ttl_seconds: float = 86400
+    # none | sqlite | redis
+    persistent_backend: str = "none"
+    sqlite_path: str = "translation_cache.sqlite3"
+    redis_url: str = "redis://localhost:6379/0"
+
+class MemorySettings(BaseModel):
+    """문장 단위 번역 메모리(퍼지 매칭) 관련 argument 관리"""
+    enabled: bool = False
+    sqlite_path: str = "translation_memory.sqlite3"
+    # 문장 유사도가 이 값 이상이면 번역 프롬프트에 참고 번역으로 넣는다(완전 일치는 그대로 재사용).
+    min_similarity: float = 0.7
+    max_hints: int = 3
+    max_candidates: int = 20
+    # 보관 문장 수 상한(넘으면 오래된 문장부터 지운다)
+    max_segments: int = 5_000_000
+    max_segment_chars: int = 1000
+    # 문장 쌍 길이 비율이 텍스트 전체 비율에서 이 배수 넘게 벗어나면 문장 단위로 저장하지 않는다(정렬 어긋남).
+    max_length_skew: float = 2.0
+    # MinHash/LSH 파라미터. 바꾸면 기존 인덱스와 호환되지 않으므로 새 파일을 써야 한다.
+    ngram_size: int = 3
+    num_perm: int = 64
+    bands: int = 16
 
 class Settings(BaseSettings):
     """argument 전달"""
     normalize: NormalizeSettings = NormalizeSettings()
     translate: TranslateSettings = TranslateSettings()
+    model_client: ModelClientSettings = ModelClientSettings()
+    model_routing: ModelRoutingSettings = ModelRoutingSettings()
+    language_id: LanguageIdSettings = LanguageIdSettings()
+    preclassify: PreclassifySettings = PreclassifySettings()
+    heuristic_qc: HeuristicQcSettings = HeuristicQcSettings()
+    batch: BatchSettings = BatchSettings()
+    document: DocumentSettings = DocumentSettings()
+    job: JobSettings = JobSettings()
+    cache: CacheSettings = CacheSettings()
+    memory: MemorySettings = MemorySettings()
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,7 @@
+"""공통 캐시 패키지."""
+
+from firstsession.core.common.cache.lru_ttl_cache import LruTtlCache
+from firstsession.core.common.cache.redis_cache_store import RedisCacheStore
+from firstsession.core.common.cache.sqlite_cache_store import SqliteCacheStore
+
+__all__ = ["LruTtlCache", "RedisCacheStore", "SqliteCacheStore"]
@@ -0,0 +1,54 @@
+# 목적: 프로세스 내부 LRU 캐시를 제공한다.
+# 설명: 항목 수 상한과 TTL을 함께 적용하며 스레드 안전하게 동작한다.
+# 디자인 패턴: 캐시 어사이드(Cache-Aside)
+# 참조: firstsession/core/translate/cache/translation_cache.py
+
+"""LRU + TTL 인메모리 캐시 모듈."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LruTtlCache:
+    """항목 수와 만료 시간을 제한하는 LRU 캐시."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """캐시를 초기화한다.
+
+        Args:
+            max_entries: 보관할 최대 항목 수.
+            ttl_seconds: 항목 만료 시간(초). 0 이하이면 만료하지 않는다.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """값을 조회한다. 만료된 항목은 제거하고 None을 반환한다."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at <= now:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 저장하고 상한을 넘으면 가장 오래 쓰지 않은 항목을 제거한다."""
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
@@ -0,0 +1,53 @@
+# 목적: Redis 기반 영속 캐시 저장소를 제공한다.
+# 설명: 여러 워커 프로세스가 캐시를 공유하기 위한 2차 계층이다.
+# 디자인 패턴: 리포지토리 패턴
+# 참조: firstsession/core/translate/cache/translation_cache.py
+
+"""Redis 캐시 저장소 모듈."""
+
+import json
+from typing import Any
+
+
+class RedisCacheStore:
+    """Redis 문자열 키에 JSON 값을 저장하는 캐시 저장소."""
+
+    def __init__(self, url: str, ttl_seconds: float, key_prefix: str = "firstsession:cache") -> None:
+        """저장소를 초기화한다.
+
+        Args:
+            url: Redis 접속 URL.
+            ttl_seconds: 항목 만료 시간(초). 0 이하이면 만료하지 않는다.
+            key_prefix: 캐시 키 접두사.
+
+        Raises:
+            ImportError: redis 패키지가 설치되어 있지 않은 경우.
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("Redis 캐시를 사용하려면 redis 패키지를 설치해야 합니다.") from e
+
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._redis = redis.Redis.from_url(url)
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def get(self, key: str) -> Any | None:
+        """값을 조회한다."""
+        value = self._redis.get(self._key(key))
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 JSON으로 직렬화해 TTL과 함께 저장한다."""
+        payload = json.dumps(value, ensure_ascii=False)
+        ttl = int(self.ttl_seconds) if self.ttl_seconds > 0 else None
+        self._redis.set(self._key(key), payload, ex=ttl)
+
+    def close(self) -> None:
+        """연결을 닫는다."""
+        self._redis.close()
@@ -0,0 +1,64 @@
+# 목적: SQLite 기반 영속 캐시 저장소를 제공한다.
+# 설명: 프로세스 재시작 후에도 캐시를 유지하기 위한 2차 계층이다.
+# 디자인 패턴: 리포지토리 패턴
+# 참조: firstsession/core/translate/cache/translation_cache.py
+
+"""SQLite 캐시 저장소 모듈."""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+class SqliteCacheStore:
+    """SQLite 파일에 JSON 값을 저장하는 캐시 저장소."""
+
+    def __init__(self, path: str, ttl_seconds: float) -> None:
+        """저장소를 초기화하고 테이블을 준비한다.
+
+        Args:
+            path: SQLite 파일 경로.
+            ttl_seconds: 항목 만료 시간(초). 0 이하이면 만료하지 않는다.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Any | None:
+        """값을 조회한다. 만료된 항목은 삭제하고 None을 반환한다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at and expires_at <= time.time():
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """값을 JSON으로 직렬화해 저장한다."""
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,5 @@
+"""공통 동시성 유틸리티 패키지."""
+
+from firstsession.core.common.concurrency.single_flight import SingleFlight
+
+__all__ = ["SingleFlight"]
@@ -0,0 +1,126 @@
+# 목적: 같은 키로 동시에 들어온 작업을 한 번만 실행하고 결과를 공유한다.
+# 설명: 먼저 도착한 호출(leader)만 작업을 실행하고, 실행 중에 도착한 같은 키의 호출(follower)은
+#       그 결과나 예외를 그대로 받는다. 완료되면 키를 지우므로 결과를 캐시하지는 않는다.
+# 디자인 패턴: 싱글 플라이트(Single-Flight)
+# 참조: firstsession/api/translate/service/translation_service.py
+
+"""진행 중 요청 병합 모듈."""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """동기 경로에서 진행 중인 호출 하나."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class _AsyncCall:
+    """비동기 경로에서 진행 중인 호출 하나와 그 결과를 기다리는 호출자 수."""
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별 진행 중 호출을 병합하는 실행기.
+
+    동기 경로는 스레드 간, 비동기 경로는 같은 이벤트 루프 안의 태스크 간에서만 병합한다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call[Any]] = {}
+        self._lock = threading.Lock()
+        # 이벤트 루프별 진행 중 태스크(루프가 사라지면 함께 정리된다)
+        self._tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, _AsyncCall]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def do(self, key: str, func: Callable[[], T]) -> tuple[T, bool]:
+        """key로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func를 실행한다.
+
+        Args:
+            key: 병합 기준 키.
+            func: 실제 작업.
+
+        Returns:
+            tuple[T, bool]: 결과와 다른 호출의 결과를 공유받았는지 여부.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+
+        if shared:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    async def ado(self, key: str, func: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """비동기 버전. 작업은 별도 태스크로 실행하므로 한 호출자가 취소돼도 나머지는 결과를 받는다.
+
+        기다리는 호출자가 모두 취소되면 작업 태스크도 취소해 남은 모델 호출을 멈춘다.
+
+        Args:
+            key: 병합 기준 키.
+            func: 실제 작업 코루틴 팩토리.
+
+        Returns:
+            tuple[T, bool]: 결과와 다른 호출의 결과를 공유받았는지 여부.
+        """
+        loop = asyncio.get_running_loop()
+        tasks = self._tasks.setdefault(loop, {})
+        call = tasks.get(key)
+        shared = call is not None
+        if call is None:
+            call = _AsyncCall(asyncio.ensure_future(func()))
+            tasks[key] = call
+
+            def forget(done: asyncio.Future) -> None:
+                if tasks.get(key) is call:
+                    del tasks[key]
+                # 모든 호출자가 취소된 경우에도 "exception was never retrieved" 경고가 남지 않게 한다.
+                if not done.cancelled():
+                    done.exception()
+
+            call.task.add_done_callback(forget)
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task), shared
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 키 수(동기 + 현재 루프)."""
+        with self._lock:
+            count = len(self._calls)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return count
+        return count + len(self._tasks.get(loop, {}))
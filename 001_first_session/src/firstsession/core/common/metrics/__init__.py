@@ -0,0 +1,11 @@
+"""공통 메트릭 패키지."""
+
+from firstsession.core.common.metrics.metrics_registry import (
+    DEFAULT_LATENCY_BUCKETS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    registry,
+)
+
+__all__ = ["DEFAULT_LATENCY_BUCKETS", "Counter", "Histogram", "MetricsRegistry", "registry"]
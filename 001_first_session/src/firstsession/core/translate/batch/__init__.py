@@ -0,0 +1 @@
+"""배치 번역 보조 패키지."""
@@ -0,0 +1,92 @@
+# 목적: 같은 언어쌍의 짧은 텍스트를 하나의 모델 호출로 묶는다.
+# 설명: 번호 마커로 세그먼트를 이어 붙이고, 번역 결과를 마커 기준으로 다시 나눈다.
+# 디자인 패턴: 전략 패턴
+# 참조: firstsession/api/translate/service/translation_service.py
+
+"""세그먼트 패킹 모듈."""
+
+import re
+from dataclasses import dataclass
+
+_MARKER_PATTERN = re.compile(r"\[\[(\d+)\]\]")
+
+
+@dataclass(frozen=True)
+class SegmentPack:
+    """하나의 모델 호출로 보낼 세그먼트 묶음."""
+
+    indices: tuple[int, ...]
+    texts: tuple[str, ...]
+
+
+class SegmentPacker:
+    """세그먼트를 문자 수 예산 안에서 묶고 다시 나눈다."""
+
+    def __init__(self, max_chars: int) -> None:
+        """패커를 초기화한다.
+
+        Args:
+            max_chars: 묶음 하나에 허용되는 최대 문자 수(마커 포함).
+        """
+        self.max_chars = max_chars
+
+    def _marker(self, number: int) -> str:
+        return f"[[{number}]]"
+
+    def pack(self, segments: list[tuple[int, str]]) -> list[SegmentPack]:
+        """세그먼트를 입력 순서대로 묶는다.
+
+        Args:
+            segments: (원래 위치, 텍스트) 목록.
+
+        Returns:
+            list[SegmentPack]: 묶음 목록. 예산을 넘거나 마커와 충돌하는 세그먼트는 단독 묶음이 된다.
+        """
+        packs: list[SegmentPack] = []
+        indices: list[int] = []
+        texts: list[str] = []
+        size = 0
+        for index, text in segments:
+            cost = len(self._marker(len(texts) + 1)) + len(text) + 2
+            packable = cost <= self.max_chars and not _MARKER_PATTERN.search(text)
+            if not packable:
+                packs.append(SegmentPack(indices=(index,), texts=(text,)))
+                continue
+            if texts and size + cost > self.max_chars:
+                packs.append(SegmentPack(indices=tuple(indices), texts=tuple(texts)))
+                indices, texts, size = [], [], 0
+                cost = len(self._marker(1)) + len(text) + 2
+            indices.append(index)
+            texts.append(text)
+            size += cost
+        if texts:
+            packs.append(SegmentPack(indices=tuple(indices), texts=tuple(texts)))
+        return packs
+
+    def join(self, pack: SegmentPack) -> str:
+        """묶음을 모델에 보낼 하나의 텍스트로 합친다."""
+        return "\n".join(
+            f"{self._marker(number)} {text}" for number, text in enumerate(pack.texts, start=1)
+        )
+
+    def split(self, pack: SegmentPack, translated_text: str) -> list[str] | None:
+        """번역된 묶음을 세그먼트 단위로 나눈다.
+
+        Args:
+            pack: 번역에 사용한 묶음.
+            translated_text: 모델이 반환한 번역 텍스트.
+
+        Returns:
+            list[str] | None: 세그먼트별 번역. 마커가 누락/중복/재배열되면 None.
+        """
+        parts = _MARKER_PATTERN.split(translated_text or "")
+        # split 결과: [머리말, 번호, 본문, 번호, 본문, ...]
+        if parts[0].strip():
+            return None
+        numbers = [int(number) for number in parts[1::2]]
+        if numbers != list(range(1, len(pack.texts) + 1)):
+            return None
+        outputs = [body.strip() for body in parts[2::2]]
+        if any(not output for output in outputs):
+            return None
+        return outputs
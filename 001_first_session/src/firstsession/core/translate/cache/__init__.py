@@ -0,0 +1,5 @@
+"""번역 결과 캐시 패키지."""
+
+from firstsession.core.translate.cache.translation_cache import TranslationCache
+
+__all__ = ["TranslationCache"]
@@ -0,0 +1,163 @@
+# 목적: 번역/안전 분류 결과를 내용 주소 기반으로 캐시한다.
+# 설명: (정규화 텍스트, 언어쌍, 프롬프트 버전, 모델명) 해시를 키로 인메모리 LRU와 선택적 영속 계층을 조회한다.
+# 디자인 패턴: 캐시 어사이드(Cache-Aside) + 파사드
+# 참조: firstsession/core/translate/nodes/cache_lookup_node.py, firstsession/core/common/cache
+
+"""번역 결과 캐시 모듈."""
+
+import asyncio
+import hashlib
+import threading
+from typing import Any, Protocol
+
+from firstsession.config.settings import CacheSettings
+from firstsession.core.common.cache import LruTtlCache, RedisCacheStore, SqliteCacheStore
+from firstsession.core.translate.prompts.quality_check_prompt import QUALITY_CHECK_PROMPT
+from firstsession.core.translate.prompts.retry_translate_prompt import RETRY_TRANSLATE_PROMPT
+from firstsession.core.translate.prompts.safeguard_prompt import SAFEGUARD_PROMPT
+from firstsession.core.translate.prompts.single_call_prompt import SINGLE_CALL_PROMPT
+from firstsession.core.translate.prompts.translation_memory_prompt import TRANSLATION_MEMORY_PROMPT
+from firstsession.core.translate.prompts.translation_prompt import TRANSLATION_PROMPT
+
+
+class CacheStore(Protocol):
+    """영속 캐시 계층 인터페이스."""
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def prompt_version(*templates: str) -> str:
+    """프롬프트 템플릿 내용으로 버전 문자열을 만든다.
+
+    템플릿이 바뀌면 버전이 바뀌므로 이전 프롬프트로 만든 결과는 자동으로 무효화된다.
+    """
+    digest = hashlib.sha256("\x1f".join(templates).encode("utf-8")).hexdigest()
+    return digest[:12]
+
+
+# 단일 호출 모드도 같은 번역 키에 결과를 저장하므로 그 프롬프트도 버전에 넣는다.
+TRANSLATION_PROMPT_VERSION = prompt_version(
+    TRANSLATION_PROMPT.template,
+    SINGLE_CALL_PROMPT.template,
+    TRANSLATION_MEMORY_PROMPT.template,
+    QUALITY_CHECK_PROMPT.template,
+    RETRY_TRANSLATE_PROMPT.template,
+)
+SAFEGUARD_PROMPT_VERSION = prompt_version(SAFEGUARD_PROMPT.template)
+
+
+class TranslationCache:
+    """QC를 통과한 번역과 안전 분류 라벨을 보관하는 2계층 캐시."""
+
+    def __init__(self, memory: LruTtlCache, persistent: CacheStore | None = None) -> None:
+        """캐시를 초기화한다.
+
+        Args:
+            memory: 인메모리 LRU 계층.
+            persistent: 선택적 영속 계층(SQLite/Redis).
+        """
+        self.memory = memory
+        self.persistent = persistent
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> "TranslationCache | None":
+        """설정으로 캐시를 생성한다. 비활성화된 경우 None을 반환한다."""
+        if not settings.enabled:
+            return None
+        memory = LruTtlCache(max_entries=settings.max_entries, ttl_seconds=settings.ttl_seconds)
+        backend = settings.persistent_backend.strip().lower()
+        persistent: CacheStore | None = None
+        if backend == "sqlite":
+            persistent = SqliteCacheStore(settings.sqlite_path, ttl_seconds=settings.ttl_seconds)
+        elif backend == "redis":
+            persistent = RedisCacheStore(settings.redis_url, ttl_seconds=settings.ttl_seconds)
+        elif backend not in ("", "none"):
+            raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {settings.persistent_backend}")
+        return cls(memory=memory, persistent=persistent)
+
+    def _hash(self, *parts: str) -> str:
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    def translation_key(self, text: str, source_language: str, target_language: str, model_name: str) -> str:
+        """번역 결과 캐시 키를 만든다."""
+        return "translation:" + self._hash(
+            text, source_language, target_language, TRANSLATION_PROMPT_VERSION, model_name
+        )
+
+    def safeguard_key(self, text: str, model_name: str) -> str:
+        """안전 분류 결과 캐시 키를 만든다. 라벨은 언어쌍과 무관하다."""
+        return "safeguard:" + self._hash(text, SAFEGUARD_PROMPT_VERSION, model_name)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def _kind(self, key: str) -> str:
+        return key.split(":", 1)[0]
+
+    def _record_lookup(self, key: str, tier: str | None) -> None:
+        kind = self._kind(key)
+        if tier is None:
+            self._count(f"{kind}_misses")
+            return
+        self._count(f"{kind}_hits")
+        self._count(f"{kind}_{tier}_hits")
+
+    def get(self, key: str) -> Any | None:
+        """메모리 → 영속 계층 순으로 조회하고, 영속 계층 적중은 메모리로 승격한다."""
+        value = self.memory.get(key)
+        if value is not None:
+            self._record_lookup(key, "lru")
+            return value
+        if self.persistent is not None:
+            try:
+                value = self.persistent.get(key)
+            except Exception:
+                self._count("persistent_errors")
+                value = None
+            if value is not None:
+                self.memory.set(key, value)
+                self._record_lookup(key, "persistent")
+                return value
+        self._record_lookup(key, None)
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """모든 계층에 값을 저장한다. 영속 계층 오류는 요청을 실패시키지 않는다."""
+        self.memory.set(key, value)
+        if self.persistent is not None:
+            try:
+                self.persistent.set(key, value)
+            except Exception:
+                self._count("persistent_errors")
+
+    async def aget(self, key: str) -> Any | None:
+        """비동기 경로에서 조회한다. 영속 계층 I/O는 이벤트 루프 밖에서 수행한다."""
+        if self.persistent is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """비동기 경로에서 저장한다."""
+        if self.persistent is None:
+            self.set(key, value)
+            return
+        await asyncio.to_thread(self.set, key, value)
+
+    def close(self) -> None:
+        """영속 계층 연결을 닫는다. 인메모리 계층은 닫을 자원이 없다."""
+        if self.persistent is not None:
+            self.persistent.close()
+
+    def stats(self) -> dict[str, int]:
+        """적중/미적중 카운터와 LRU 계층 크기를 반환한다."""
+        with self._lock:
+            stats = dict(self._counters)
+        stats["lru_entries"] = len(self.memory)
+        return stats
@@ -0,0 +1,7 @@
+"""모델 클라이언트 패키지."""
+
+from firstsession.core.translate.client.gemini_client import GeminiClient, default_client
+from firstsession.core.translate.client.hedge_policy import HedgePolicy
+from firstsession.core.translate.client.model_router import ModelRouter, RouteDecision
+
+__all__ = ["GeminiClient", "HedgePolicy", "ModelRouter", "RouteDecision", "default_client"]
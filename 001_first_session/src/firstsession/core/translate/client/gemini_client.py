@@ -0,0 +1,259 @@
+# 목적: 모든 번역 노드가 공유하는 Gemini 클라이언트를 제공한다.
+# 설명: 하나의 커넥션 풀(keep-alive)을 재사용하고, 전역 동시 호출 수 제한과 지터 백오프 재시도,
+#       429/RetryInfo 기반 대기 시간을 적용한다.
+# 디자인 패턴: 파사드 + 프록시
+# 참조: firstsession/core/translate/nodes/call_model_node.py, firstsession/main.py
+
+"""공유 Gemini 클라이언트 모듈."""
+
+import asyncio
+import os
+import random
+import re
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator
+
+import httpx
+from google import genai
+from google.genai import errors, types
+
+from firstsession.config.settings import ModelClientSettings
+from firstsession.core.translate.client.hedge_policy import HedgePolicy
+from firstsession.core.translate.metrics.translation_metrics import MODEL_LIMITER_WAIT, MODEL_RETRIES
+
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+_RETRY_INFO_TYPE = "type.googleapis.com/google.rpc.RetryInfo"
+_DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)s\s*$")
+
+
+class GeminiClient:
+    """커넥션 풀과 호출 제한을 공유하는 Gemini 클라이언트.
+
+    동기 경로와 비동기 경로는 각각 max_concurrency만큼 동시 호출을 허용한다.
+    레이트 리밋(429) 응답을 받으면 제공자가 알려준 대기 시간 동안 모든 호출자가 새 요청을 멈춘다.
+    """
+
+    def __init__(
+        self,
+        settings: ModelClientSettings | None = None,
+        api_key: str | None = None,
+        genai_client: Any | None = None,
+    ) -> None:
+        """클라이언트를 초기화한다. 실제 연결은 첫 호출 시 만든다.
+
+        Args:
+            settings: 커넥션 풀/동시성/재시도 설정.
+            api_key: Gemini API 키(기본값: GEMINI_API_KEY 환경변수).
+            genai_client: genai.Client와 같은 인터페이스의 대체 구현(벤치마크용 가짜 백엔드 등).
+        """
+        self.settings = settings or ModelClientSettings()
+        self._api_key = api_key
+        self._client: genai.Client | None = genai_client
+        self._client_lock = threading.Lock()
+        self._sync_slots = threading.BoundedSemaphore(max(1, self.settings.max_concurrency))
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프별로 만든다.
+        self._async_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        # 429 이후 새 호출을 시작하지 않는 시각(time.monotonic 기준)
+        self._blocked_until = 0.0
+        # 모든 노드가 지연 분포와 추가 호출 예산을 공유한다(꺼져 있으면 None).
+        self.hedge = HedgePolicy.from_settings(self.settings)
+
+    def _build_client(self) -> genai.Client:
+        api_key = self._api_key or os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("API KEY 환경변수가 설정되지 않았습니다.")
+        limits = httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry_seconds,
+        )
+        http_options = types.HttpOptions(
+            timeout=int(self.settings.timeout_seconds * 1000),
+            client_args={"limits": limits},
+            async_client_args={"limits": limits},
+        )
+        return genai.Client(api_key=api_key, http_options=http_options)
+
+    @property
+    def client(self) -> genai.Client:
+        """내부 genai.Client. 처음 접근할 때 한 번만 생성한다."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(max(1, self.settings.max_concurrency))
+            self._async_slots[loop] = slots
+        return slots
+
+    def _retry_hint(self, error: Exception) -> float | None:
+        """제공자가 알려준 재시도 대기 시간(RetryInfo.retryDelay 또는 Retry-After)을 초 단위로 반환한다."""
+        details = getattr(error, "details", None)
+        body = details.get("error", details) if isinstance(details, dict) else {}
+        for detail in body.get("details", []) if isinstance(body, dict) else []:
+            if isinstance(detail, dict) and detail.get("@type") == _RETRY_INFO_TYPE:
+                match = _DURATION_PATTERN.match(str(detail.get("retryDelay", "")))
+                if match:
+                    return float(match.group(1))
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("retry-after") if hasattr(headers, "get") else None
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return None
+        return None
+
+    def _retry_reason(self, error: Exception) -> str | None:
+        """재시도할 오류면 사유 레이블을, 아니면 None을 반환한다."""
+        if isinstance(error, errors.APIError):
+            return str(error.code) if error.code in _RETRYABLE_STATUS else None
+        if isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+            return "transport"
+        return None
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """다음 시도까지 대기할 시간을 계산한다.
+
+        기본은 full jitter 지수 백오프이고, 제공자 힌트가 있으면 힌트에 작은 지터를 더해
+        같은 시각에 재시도가 몰리지 않게 한다. 429는 공유 차단 시각도 갱신한다.
+        """
+        cap = min(self.settings.backoff_max_seconds, self.settings.backoff_base_seconds * (2 ** attempt))
+        delay = random.uniform(0, cap)
+        hint = self._retry_hint(error)
+        if hint is not None:
+            delay = min(hint, self.settings.backoff_max_seconds) + random.uniform(0, self.settings.backoff_base_seconds)
+        if isinstance(error, errors.APIError) and error.code == 429:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        return delay
+
+    def _cooldown(self) -> float:
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def _config(self, temperature: float) -> dict[str, Any]:
+        return {"temperature": temperature}
+
+    def generate_content(self, model: str, contents: str, temperature: float) -> types.GenerateContentResponse:
+        """동기 호출. 재시도 가능한 오류는 백오프 후 다시 시도한다."""
+        attempt = 0
+        while True:
+            time.sleep(self._cooldown())
+            started = time.perf_counter()
+            with self._sync_slots:
+                MODEL_LIMITER_WAIT.observe(time.perf_counter() - started, mode="sync")
+                try:
+                    return self.client.models.generate_content(
+                        model=model, contents=contents, config=self._config(temperature)
+                    )
+                except Exception as error:
+                    reason = self._retry_reason(error)
+                    if reason is None or attempt >= self.settings.max_retries:
+                        raise
+                    delay = self._backoff(attempt, error)
+            # 대기는 슬롯을 반납한 뒤 수행한다.
+            MODEL_RETRIES.inc(reason=reason)
+            time.sleep(delay)
+            attempt += 1
+
+    async def agenerate_content(self, model: str, contents: str, temperature: float) -> types.GenerateContentResponse:
+        """비동기 호출. 재시도 가능한 오류는 백오프 후 다시 시도한다."""
+        slots = self._async_semaphore()
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._cooldown())
+            started = time.perf_counter()
+            async with slots:
+                MODEL_LIMITER_WAIT.observe(time.perf_counter() - started, mode="async")
+                try:
+                    return await self.client.aio.models.generate_content(
+                        model=model, contents=contents, config=self._config(temperature)
+                    )
+                except Exception as error:
+                    reason = self._retry_reason(error)
+                    if reason is None or attempt >= self.settings.max_retries:
+                        raise
+                    delay = self._backoff(attempt, error)
+            MODEL_RETRIES.inc(reason=reason)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def agenerate_content_stream(
+        self,
+        model: str,
+        contents: str,
+        temperature: float,
+    ) -> AsyncIterator[types.GenerateContentResponse]:
+        """비동기 스트리밍 호출.
+
+        이미 내보낸 조각은 되돌릴 수 없으므로 첫 조각을 받기 전의 오류만 재시도한다.
+        동시 호출 슬롯은 요청을 보내고 첫 조각을 받을 때까지만 점유한다. 소비자가 조각을 천천히 읽거나
+        읽다 멈춰도 다른 호출이 막히지 않으며, 제너레이터를 닫으면 제공자 스트림도 함께 닫는다.
+        """
+        slots = self._async_semaphore()
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._cooldown())
+            started = time.perf_counter()
+            async with slots:
+                MODEL_LIMITER_WAIT.observe(time.perf_counter() - started, mode="stream")
+                try:
+                    stream = await self.client.aio.models.generate_content_stream(
+                        model=model, contents=contents, config=self._config(temperature)
+                    )
+                    iterator = aiter(stream)
+                    first = await anext(iterator, None)
+                    break
+                except Exception as error:
+                    reason = self._retry_reason(error)
+                    if reason is None or attempt >= self.settings.max_retries:
+                        raise
+                    delay = self._backoff(attempt, error)
+            MODEL_RETRIES.inc(reason=reason)
+            await asyncio.sleep(delay)
+            attempt += 1
+        try:
+            if first is None:
+                return
+            yield first
+            async for chunk in iterator:
+                yield chunk
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def close(self) -> None:
+        """동기 커넥션 풀을 닫는다."""
+        if self._client is not None:
+            self._client.close()
+
+    async def aclose(self) -> None:
+        """동기/비동기 커넥션 풀을 모두 닫는다."""
+        if self._client is not None:
+            await self._client.aio.aclose()
+            self._client.close()
+            self._client = None
+
+
+_default_client: GeminiClient | None = None
+_default_lock = threading.Lock()
+
+
+def default_client() -> GeminiClient:
+    """명시적으로 주입받지 못한 노드가 함께 쓰는 프로세스 기본 클라이언트."""
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = GeminiClient()
+    return _default_client
@@ -0,0 +1,143 @@
+# 목적: 느린 모델 호출의 꼬리 지연을 줄이기 위한 헤지(hedged) 호출 정책을 제공한다.
+# 설명: 호출 목적별 최근 지연 분포의 백분위를 넘겨도 응답이 없으면 같은 요청을 한 번 더 보내고
+#       먼저 성공한 응답을 쓴 뒤 나머지는 취소한다. 추가 호출은 주 호출 수 대비 비율 예산 안에서만 허용한다.
+# 디자인 패턴: 전략 + 토큰 버킷
+# 참조: firstsession/core/translate/nodes/call_model_node.py, firstsession/core/translate/client/gemini_client.py
+
+"""헤지 호출 정책 모듈."""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from firstsession.config.settings import ModelClientSettings
+from firstsession.core.translate.metrics.translation_metrics import MODEL_HEDGES
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """최근 지연 백분위 기반 헤지 호출 정책.
+
+    예산은 주 호출마다 budget_ratio만큼 쌓이고 헤지 한 번에 1씩 쓰므로
+    장기적으로 추가 호출 비율이 budget_ratio를 넘지 않는다.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        """정책을 초기화한다.
+
+        Args:
+            percentile: 헤지를 시작할 최근 지연 백분위(0~100).
+            budget_ratio: 주 호출 대비 허용하는 추가 호출 비율.
+            min_samples: 백분위를 신뢰하기 위한 최소 표본 수. 그 전에는 헤지하지 않는다.
+            window: 키별로 보관하는 최근 지연 표본 수.
+        """
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = max(1, min_samples)
+        self.window = max(self.min_samples, window)
+        # 짧은 구간에 헤지가 몰려도 예산을 한꺼번에 다 쓰지 않도록 적립 상한을 둔다.
+        self._max_tokens = max(1.0, budget_ratio * 100)
+        self._tokens = 0.0
+        self._latencies: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: ModelClientSettings) -> "HedgePolicy | None":
+        """설정으로 정책을 만든다. 헤지가 꺼져 있으면 None."""
+        if not settings.hedge_enabled:
+            return None
+        return cls(
+            percentile=settings.hedge_percentile,
+            budget_ratio=settings.hedge_budget_ratio,
+            min_samples=settings.hedge_min_samples,
+            window=settings.hedge_window,
+        )
+
+    def observe(self, key: str, seconds: float) -> None:
+        """성공한 호출의 지연을 기록한다."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._latencies[key] = samples
+            samples.append(seconds)
+
+    def threshold(self, key: str) -> float | None:
+        """헤지를 시작할 대기 시간(초). 표본이 부족하면 None."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        rank = max(1, math.ceil(self.percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def _earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self.budget_ratio)
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    async def arun(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """call을 실행하고, 임계 시간을 넘기면 한 번 더 실행해 먼저 성공한 결과를 반환한다.
+
+        Args:
+            key: 지연 분포를 나누는 키(호출 목적).
+            call: 같은 요청을 보내는 코루틴 팩토리.
+
+        Returns:
+            T: 먼저 성공한 호출의 결과. 둘 다 실패하면 주 호출의 예외를 올린다.
+        """
+        self._earn()
+        delay = self.threshold(key)
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(call())
+        tasks = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done:
+                    if self._spend():
+                        tasks.append(asyncio.ensure_future(call()))
+                    else:
+                        MODEL_HEDGES.inc(purpose=key, outcome="budget_exhausted")
+            winner = await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        if len(tasks) > 1:
+            MODEL_HEDGES.inc(purpose=key, outcome="primary_won" if winner is primary else "hedge_won")
+        result = winner.result()
+        # 헤지가 이겨 주 호출이 취소돼도 주 호출 지연은 최소 이만큼이므로 그대로 표본에 넣는다.
+        self.observe(key, time.perf_counter() - started)
+        return result
+
+    async def _first_success(self, tasks: list[asyncio.Future]) -> asyncio.Future:
+        """먼저 성공한 태스크를 반환한다. 모두 실패하면 첫 태스크(주 호출)의 예외를 올린다."""
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task in done and not task.cancelled() and task.exception() is None:
+                    return task
+        # 주 호출의 예외를 우선하고, 헤지 쪽 예외는 회수만 해 둔다.
+        for task in tasks[1:]:
+            if not task.cancelled():
+                task.exception()
+        return tasks[0]
@@ -0,0 +1,117 @@
+# 목적: 호출마다 사용할 모델 티어를 고른다.
+# 설명: 호출 목적(안전 분류/QC는 작은 모델), 언어쌍, 원문 길이 순서로 규칙을 적용해 티어와 모델을 결정한다.
+#       결정 사유는 메트릭 레이블로 남겨 규칙을 조정하는 데 쓴다.
+# 디자인 패턴: 전략 패턴(규칙 기반 라우팅)
+# 참조: firstsession/core/translate/nodes/call_model_node.py, firstsession/config/settings.py
+
+"""모델 티어 라우팅 모듈."""
+
+from dataclasses import dataclass
+
+from firstsession.config.settings import ModelRoutingSettings
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """모델 선택 결과."""
+
+    tier: str
+    model: str
+    # purpose | pair | short | long | default
+    reason: str
+
+
+class ModelRouter:
+    """호출 목적/언어쌍/원문 길이로 모델 티어를 고르는 라우터."""
+
+    def __init__(
+        self,
+        tiers: dict[str, str],
+        default_tier: str,
+        purpose_tiers: dict[str, str] | None = None,
+        pair_tiers: dict[str, str] | None = None,
+        short_text_chars: int = 0,
+        short_tier: str = "",
+        long_text_chars: int = 0,
+        long_tier: str = "",
+    ) -> None:
+        """라우터를 초기화한다.
+
+        Args:
+            tiers: 티어 이름 → 모델 이름.
+            default_tier: 어떤 규칙에도 해당하지 않을 때의 티어.
+            purpose_tiers: 호출 목적별 고정 티어(길이/언어쌍 규칙보다 우선).
+            pair_tiers: "원문-목표" 언어쌍별 티어. "*"는 모든 언어와 일치한다.
+            short_text_chars: 원문이 이 길이 이하이면 short_tier를 쓴다(0이면 사용 안 함).
+            short_tier: 짧은 원문용 티어.
+            long_text_chars: 원문이 이 길이 이상이면 long_tier를 쓴다(0이면 사용 안 함).
+            long_tier: 긴 원문용 티어.
+
+        Raises:
+            ValueError: 규칙이 정의되지 않은 티어를 가리키는 경우.
+        """
+        self.tiers = dict(tiers)
+        self.default_tier = default_tier
+        self.purpose_tiers = dict(purpose_tiers or {})
+        self.pair_tiers = {pair.strip().lower(): tier for pair, tier in (pair_tiers or {}).items()}
+        self.short_text_chars = short_text_chars
+        self.short_tier = short_tier
+        self.long_text_chars = long_text_chars
+        self.long_tier = long_tier
+        used = {default_tier, *self.purpose_tiers.values(), *self.pair_tiers.values()}
+        used.update(tier for tier in (short_tier if short_text_chars else "", long_tier if long_text_chars else "") if tier)
+        unknown = sorted(used - self.tiers.keys())
+        if unknown:
+            raise ValueError(f"정의되지 않은 모델 티어입니다: {', '.join(unknown)}")
+
+    @classmethod
+    def from_settings(cls, settings: ModelRoutingSettings) -> "ModelRouter | None":
+        """설정으로 라우터를 만든다. 꺼져 있으면 None을 반환한다."""
+        if not settings.enabled:
+            return None
+        return cls(
+            tiers=settings.tiers,
+            default_tier=settings.default_tier,
+            purpose_tiers=settings.purpose_tiers,
+            pair_tiers=settings.pair_tiers,
+            short_text_chars=settings.short_text_chars,
+            short_tier=settings.short_tier,
+            long_text_chars=settings.long_text_chars,
+            long_tier=settings.long_tier,
+        )
+
+    def _pair_tier(self, source_language: str, target_language: str) -> str | None:
+        for pair in (
+            f"{source_language}-{target_language}",
+            f"{source_language}-*",
+            f"*-{target_language}",
+        ):
+            if pair in self.pair_tiers:
+                return self.pair_tiers[pair]
+        return None
+
+    def _decision(self, tier: str, reason: str) -> RouteDecision:
+        return RouteDecision(tier=tier, model=self.tiers[tier], reason=reason)
+
+    def select(self, purpose: str, text_length: int, source_language: str, target_language: str) -> RouteDecision:
+        """호출 하나에 쓸 모델을 고른다.
+
+        Args:
+            purpose: 호출 목적(safeguard/translate/quality_check/retry_translate/single_call).
+            text_length: 원문(정규화된 입력) 길이.
+            source_language: 원문 언어 코드.
+            target_language: 목표 언어 코드.
+
+        Returns:
+            RouteDecision: 선택한 티어/모델과 사유.
+        """
+        if purpose in self.purpose_tiers:
+            return self._decision(self.purpose_tiers[purpose], "purpose")
+        pair_tier = self._pair_tier(source_language, target_language)
+        if pair_tier is not None:
+            return self._decision(pair_tier, "pair")
+        if self.short_text_chars and text_length <= self.short_text_chars:
+            return self._decision(self.short_tier, "short")
+        if self.long_text_chars and text_length >= self.long_text_chars:
+            return self._decision(self.long_tier, "long")
+        return self._decision(self.default_tier, "default")
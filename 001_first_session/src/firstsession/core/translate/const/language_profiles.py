@@ -0,0 +1,100 @@
+# 목적: 라틴 문자 언어를 구분하는 단어/문자 n-gram 프로필을 제공한다.
+# 설명: 언어별 고빈도 기능어, 고빈도 문자 3-gram(단어 앞뒤 공백 포함), 특징 문자를 정의한다.
+# 디자인 패턴: 상수 모듈 패턴
+# 참조: firstsession/core/translate/language/language_identifier.py
+
+"""라틴 문자 언어 프로필 상수 모듈."""
+
+# 언어별 고빈도 기능어(소문자)
+LATIN_STOPWORDS: dict[str, frozenset[str]] = {
+    "en": frozenset(
+        "the and of to is in that it for was on are with as this be at have from or by not you we they "
+        "will can an but which has were been would there what your".split()
+    ),
+    "fr": frozenset(
+        "le la les de des du et est un une que qui dans pour pas sur avec ce il elle nous vous sont au aux "
+        "ne se plus par mais cette été être je".split()
+    ),
+    "de": frozenset(
+        "der die das und ist nicht ein eine zu den dem des mit sich auf für von auch es im sie wir ich "
+        "werden wird sind bei oder aber dass noch nach wie".split()
+    ),
+    "es": frozenset(
+        "el la los las de del y que en un una es por con para no se su al lo como más pero sus este esta "
+        "está son fue muy hay también".split()
+    ),
+    "it": frozenset(
+        "il la di che e un una per non con del della sono è le gli da in lo si ma come anche questo alla "
+        "nel più dei ha essere".split()
+    ),
+    "pt": frozenset(
+        "o a os as de do da dos das e que em um uma para com não por se no na mais mas como é ao foi são "
+        "está seu sua também".split()
+    ),
+    "nl": frozenset(
+        "de het een en van is dat niet op te in zijn voor met die aan er ook als maar om bij wordt naar "
+        "dit wat je ik we hij".split()
+    ),
+    "sv": frozenset(
+        "och att det är som en ett på för med av den till inte har de om jag vi kan ska var men från så "
+        "eller också".split()
+    ),
+    "pl": frozenset(
+        "i w na z się nie do że to jest jak o a ale od co po za przez dla są jego tak czy już może być".split()
+    ),
+    "tr": frozenset(
+        "ve bir bu da de için ile çok ne daha gibi olarak var ben sen o değil mi ama kadar olan her şey".split()
+    ),
+    "vi": frozenset(
+        "và của là có không các một những được cho với trong này người đã để khi thì tôi bạn cũng như từ "
+        "đến".split()
+    ),
+    "id": frozenset(
+        "dan yang di ini itu dengan untuk tidak dari dalam akan pada ada juga saya kami anda bisa sudah "
+        "karena atau oleh adalah".split()
+    ),
+}
+
+# 언어별 고빈도 문자 3-gram(공백은 단어 경계)
+LATIN_TRIGRAMS: dict[str, frozenset[str]] = {
+    "en": frozenset([" th", "the", "he ", "and", " an", "nd ", "ing", "ng ", "ion", " of", "of ", " to",
+                     "ed ", "er ", "tio", "is ", "ent", " in", "hat", "tha"]),
+    "fr": frozenset([" de", "es ", "ent", "de ", "le ", "ion", " le", "les", "tio", "ne ", " la", "que",
+                     "la ", "re ", "ait", " qu", "ue ", " co", "eme", "men"]),
+    "de": frozenset(["en ", "er ", "der", "ch ", "ich", "ein", "die", "sch", " de", "ie ", "che", "und",
+                     "nd ", " un", " di", "cht", "ung", "ten", "gen", "den"]),
+    "es": frozenset([" de", "de ", "os ", "la ", " la", "ión", "ent", "el ", "es ", " el", "ció", "as ",
+                     "ado", " co", "aci", "que", "del", " qu", "nte", "los"]),
+    "it": frozenset(["re ", " di", "di ", "to ", "la ", "che", " ch", "zio", "ion", "ell", "one", "ent",
+                     "lla", "del", " de", "ato", "are", "per", " pe", "no "]),
+    "pt": frozenset([" de", "de ", "os ", "ão ", "ção", "do ", "da ", " co", "ent", "as ", "que", " qu",
+                     "ado", "men", " da", " do", "nte", "açã", "em ", "es "]),
+    "nl": frozenset(["en ", "de ", " de", "van", " va", "an ", "et ", "het", " he", "een", " ee", "ij ",
+                     "aar", "oor", "ijk", "sch", "cht", "ver", " ve", "ing"]),
+    "sv": frozenset(["en ", "er ", "och", " oc", "ch ", "för", " fö", "att", " at", "tt ", "ar ", "det",
+                     " de", "ade", "ing", "ng ", "and", "ter", "nde", "lig"]),
+    "pl": frozenset(["ie ", "nie", " ni", "ch ", "ego", "prz", " pr", "rze", "ani", "wie", " po", "owa",
+                     "ych", "ość", "ści", "cze", " za", "dzi", "nia", " si"]),
+    "tr": frozenset(["lar", "ler", "ın ", "in ", "an ", "eri", "ar ", "da ", "de ", "bir", " bi", "ir ",
+                     "yor", "ını", "nin", "ası", "ile", " ve", "ve ", "ara"]),
+    "vi": frozenset(["ng ", "nh ", " th", " ng", "ông", "ươn", "ời ", "ược", "ủa ", " kh", "hôn", "ác ",
+                     "ột ", "ững", " tr", "ất ", " đư", "ại ", "ều ", "ới "]),
+    "id": frozenset(["an ", "kan", "ang", "ng ", "yan", " me", "men", "nga", "ya ", " di", "ber", "aka",
+                     "per", " be", "eng", "ah ", "ata", "lah", "asi", "dan"]),
+}
+
+# 언어별 특징 문자. 여러 언어에 나오는 문자는 나오는 언어 수로 나눠 점수를 준다.
+LATIN_CHARACTERS: dict[str, str] = {
+    "en": "",
+    "fr": "àâçèéêëîïôùûœ",
+    "de": "äöüß",
+    "es": "áéíñóú¿¡",
+    "it": "àèéìòù",
+    "pt": "àáâãçéêíóôõú",
+    "nl": "ëï",
+    "sv": "åäö",
+    "pl": "ąćęłńóśźż",
+    "tr": "çğıöşü",
+    "vi": "ăâđêôơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ",
+    "id": "",
+}
@@ -0,0 +1,40 @@
+# 목적: 언어 코드별 대표 문자 체계(스크립트) 패턴을 제공한다.
+# 설명: 번역 결과가 목표 언어의 문자로 작성되었는지 빠르게 확인하는 데 사용한다.
+# 디자인 패턴: 상수 모듈 패턴
+# 참조: firstsession/core/translate/nodes/heuristic_qc_node.py
+
+"""언어별 문자 체계 상수 모듈."""
+
+import re
+
+_LATIN = re.compile(r"[A-Za-z\u00c0-\u024f\u1e00-\u1eff]")
+_CYRILLIC = re.compile(r"[\u0400-\u04ff]")
+_ARABIC = re.compile(r"[\u0600-\u06ff\u0750-\u077f]")
+_HAN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]")
+
+LANGUAGE_SCRIPTS: dict[str, re.Pattern[str]] = {
+    "ko": re.compile(r"[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]"),
+    "ja": re.compile(r"[\u3040-\u30ff\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff]"),
+    "zh": _HAN,
+    "ru": _CYRILLIC,
+    "uk": _CYRILLIC,
+    "bg": _CYRILLIC,
+    "el": re.compile(r"[\u0370-\u03ff]"),
+    "ar": _ARABIC,
+    "fa": _ARABIC,
+    "he": re.compile(r"[\u0590-\u05ff]"),
+    "th": re.compile(r"[\u0e00-\u0e7f]"),
+    "hi": re.compile(r"[\u0900-\u097f]"),
+    "en": _LATIN,
+    "fr": _LATIN,
+    "de": _LATIN,
+    "es": _LATIN,
+    "it": _LATIN,
+    "pt": _LATIN,
+    "nl": _LATIN,
+    "sv": _LATIN,
+    "pl": _LATIN,
+    "tr": _LATIN,
+    "vi": _LATIN,
+    "id": _LATIN,
+}
@@ -0,0 +1 @@
+"""긴 문서 번역 보조 패키지."""
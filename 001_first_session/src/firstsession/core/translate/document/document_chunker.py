@@ -0,0 +1,151 @@
+# 목적: 긴 문서를 모델 입력 한도 안의 청크로 나눈다.
+# 설명: 짧은 문단은 한도 안에서 한 청크로 묶고, 긴 문단은 문장 경계로 나누며 구분자를 함께 기록한다.
+# 디자인 패턴: 이터레이터(제너레이터)
+# 참조: firstsession/api/translate/service/translation_service.py
+
+"""문서 청크 분할 모듈."""
+
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+# 라틴 문장부호 뒤 공백, 또는 CJK 문장부호 바로 뒤를 문장 경계로 본다.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*")
+
+PARAGRAPH_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class DocumentChunk:
+    """번역 단위가 되는 문서 조각."""
+
+    index: int
+    text: str
+    # 재조립 시 이 청크 앞에 붙일 구분자(첫 청크는 빈 문자열).
+    separator: str
+    # 청크에 묶인 (조각, 다음 조각과의 구분자) 목록. 이어 붙이면 text가 된다.
+    parts: tuple[tuple[str, str], ...]
+
+
+class DocumentChunker:
+    """문서를 문단/문장 경계 기준 청크로 나눈다."""
+
+    def __init__(self, max_chars: int) -> None:
+        """청커를 초기화한다.
+
+        Args:
+            max_chars: 청크 하나에 허용되는 최대 문자 수.
+        """
+        self.max_chars = max(1, max_chars)
+
+    def _iter_paragraphs(self, text: str) -> Iterator[str]:
+        start = 0
+        for match in _PARAGRAPH_BREAK.finditer(text):
+            paragraph = text[start:match.start()].strip()
+            if paragraph:
+                yield paragraph
+            start = match.end()
+        paragraph = text[start:].strip()
+        if paragraph:
+            yield paragraph
+
+    def _iter_sentences(self, paragraph: str) -> Iterator[tuple[str, str]]:
+        """(문장, 다음 문장과의 구분자)를 순서대로 반환한다."""
+        start = 0
+        for match in _SENTENCE_BREAK.finditer(paragraph):
+            if match.end() >= len(paragraph):
+                break
+            sentence = paragraph[start:match.start()]
+            if sentence:
+                yield sentence, " " if match.group(0) else ""
+            start = match.end()
+        yield paragraph[start:], ""
+
+    def _hard_split(self, sentence: str) -> Iterator[tuple[str, str]]:
+        """문장 하나가 한도를 넘으면 공백 위치(없으면 한도 위치)에서 자른다."""
+        while len(sentence) > self.max_chars:
+            cut = sentence.rfind(" ", 0, self.max_chars + 1)
+            if cut <= 0:
+                yield sentence[:self.max_chars], ""
+                sentence = sentence[self.max_chars:]
+            else:
+                yield sentence[:cut], " "
+                sentence = sentence[cut + 1:]
+        yield sentence, ""
+
+    def split_paragraph(self, paragraph: str) -> Iterator[tuple[str, str]]:
+        """문단을 (청크, 다음 청크와의 구분자) 목록으로 나눈다.
+
+        한도 안의 문단은 그대로 하나의 청크가 되고, 긴 문단은 문장 경계(문장이 길면 공백)에서 나눈다.
+        청크와 구분자를 순서대로 이어 붙이면 원래 문단이 된다.
+        """
+        if len(paragraph) <= self.max_chars:
+            yield paragraph, ""
+            return
+
+        buffer = ""
+        pending = ""
+        for sentence, separator in self._iter_sentences(paragraph):
+            for piece, piece_separator in self._hard_split(sentence):
+                if not piece:
+                    continue
+                if buffer and len(buffer) + len(pending) + len(piece) > self.max_chars:
+                    yield buffer, pending
+                    buffer = piece
+                elif buffer:
+                    buffer = buffer + pending + piece
+                else:
+                    buffer = piece
+                pending = piece_separator
+            pending = separator
+        if buffer:
+            yield buffer, ""
+
+    def _make_chunk(self, index: int, separator: str, parts: list[tuple[str, str]]) -> DocumentChunk:
+        return DocumentChunk(
+            index=index,
+            text="".join(piece + joint for piece, joint in parts),
+            separator=separator,
+            parts=tuple(parts),
+        )
+
+    def iter_chunks(self, text: str) -> Iterator[DocumentChunk]:
+        """문서를 청크 단위로 순서대로 반환한다.
+
+        연속한 짧은 문단은 구분자와 함께 max_chars 안에서 한 청크로 묶으므로
+        청크 수는 문단 수가 아니라 문서 길이를 따른다.
+        전체 청크 목록을 만들지 않고 필요한 만큼만 생성하므로
+        호출 측에서 동시 처리 중인 청크 수만큼만 메모리를 사용한다.
+
+        Args:
+            text: 원문 문서.
+
+        Yields:
+            DocumentChunk: 순번과 앞 구분자가 포함된 청크.
+        """
+        index = 0
+        separator = ""
+        parts: list[tuple[str, str]] = []
+        size = 0
+        joint = ""
+        for paragraph in self._iter_paragraphs(text or ""):
+            for piece, next_joint in self.split_paragraph(paragraph):
+                if parts and size + len(joint) + len(piece) > self.max_chars:
+                    yield self._make_chunk(index, separator, parts)
+                    index += 1
+                    separator = joint
+                    parts, size = [], 0
+                elif parts:
+                    parts[-1] = (parts[-1][0], joint)
+                    size += len(joint)
+                parts.append((piece, ""))
+                size += len(piece)
+                joint = next_joint
+            joint = PARAGRAPH_SEPARATOR
+        if parts:
+            yield self._make_chunk(index, separator, parts)
+
+    def count_chunks(self, text: str) -> int:
+        """문서를 나눴을 때의 청크 수(진행률 표시용)."""
+        return sum(1 for _ in self.iter_chunks(text))
@@ -0,0 +1,82 @@
+# 목적: HTML 문서에서 번역할 텍스트 노드만 골라낸다.
+# 설명: 태그/주석/선언은 원문 그대로 두고, 블록 태그 사이의 텍스트를 번역 조각으로 만든다.
+#       인라인 태그(a, b, em 등)는 문장이 끊기지 않도록 조각 안의 자리표시자로 보호하고,
+#       script/style/pre/code 등의 내용은 번역하지 않는다.
+# 디자인 패턴: 전략 패턴(서식별 분할기)
+# 참조: firstsession/core/translate/document/segmented_document.py
+
+"""HTML 분할 모듈."""
+
+import re
+
+from firstsession.core.translate.document.segmented_document import SegmentedDocument
+
+# 주석, CDATA, 선언(<!DOCTYPE>), 처리 지시문, 시작/종료 태그
+_MARKUP = re.compile(
+    r"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<![^>]*>|<\?.*?\?>|</?[A-Za-z][^<>]*>",
+    re.DOTALL,
+)
+_TAG_NAME = re.compile(r"^</?\s*([A-Za-z][\w:-]*)")
+_PROTECTED = re.compile(r"&#?\w+;|https?://[^\s<>\"']+|\{\{.*?\}\}|\{[\w.]*\}")
+
+# 문장 안에서 쓰이는 태그. 이 태그에서는 텍스트 조각을 나누지 않는다.
+_INLINE_TAGS = frozenset({
+    "a", "abbr", "b", "bdi", "bdo", "br", "cite", "code", "data", "dfn", "em", "i", "img", "kbd",
+    "mark", "q", "s", "samp", "small", "span", "strong", "sub", "sup", "time", "u", "var", "wbr",
+})
+# 내용을 번역하지 않는 태그
+_RAW_TAGS = frozenset({"script", "style", "pre", "code", "kbd", "samp", "var", "textarea", "svg", "math"})
+_VOID_TAGS = frozenset({"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"})
+
+
+class HtmlSegmenter:
+    """HTML 문서를 번역 조각과 원문 유지 구간으로 나눈다."""
+
+    def segment(self, text: str) -> SegmentedDocument:
+        """문서를 나눈다.
+
+        Args:
+            text: HTML 문서(또는 조각).
+
+        Returns:
+            SegmentedDocument: 번역 조각과 원문 유지 구간.
+        """
+        document = SegmentedDocument()
+        # 같은 조각이 될 (보호 여부, 문자열) 목록
+        run: list[tuple[bool, str]] = []
+        # 번역하지 않는 태그의 중첩 깊이
+        raw_depth = 0
+
+        def flush() -> None:
+            if run:
+                document.add_text(run.copy(), _PROTECTED)
+                run.clear()
+
+        position = 0
+        for match in _MARKUP.finditer(text):
+            if match.start() > position:
+                run.append((raw_depth > 0, text[position:match.start()]))
+            position = match.end()
+            markup = match.group(0)
+            name_match = _TAG_NAME.match(markup)
+            name = name_match.group(1).lower() if name_match else ""
+            closing = markup.startswith("</")
+            is_raw = name in _RAW_TAGS and name not in _VOID_TAGS and not markup.endswith("/>")
+            is_block_raw = is_raw and name not in _INLINE_TAGS
+            if is_block_raw and not closing and raw_depth == 0:
+                # pre/script 같은 블록은 앞 조각과 섞지 않고 통째로 원문 유지 구간이 된다.
+                flush()
+            if is_raw:
+                raw_depth = max(0, raw_depth + (-1 if closing else 1))
+            if raw_depth > 0 or name in _INLINE_TAGS or is_raw:
+                run.append((True, markup))
+                if is_block_raw and raw_depth == 0:
+                    flush()
+                continue
+            # 블록 태그/주석/선언은 조각을 끊고 그대로 둔다.
+            flush()
+            document.add_literal(markup)
+        if position < len(text):
+            run.append((raw_depth > 0, text[position:]))
+        flush()
+        return document
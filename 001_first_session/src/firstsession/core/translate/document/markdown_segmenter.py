@@ -0,0 +1,127 @@
+# 목적: Markdown 문서에서 번역할 텍스트만 골라낸다.
+# 설명: 코드 블록/구분선/링크 정의/표 구분 행과 줄머리 기호(제목/인용/목록)는 그대로 두고,
+#       문단/제목/목록/표 셀의 본문만 번역 조각으로 만든다. 인라인 코드/링크 주소/태그/URL은 자리표시자로 보호한다.
+# 디자인 패턴: 전략 패턴(서식별 분할기)
+# 참조: firstsession/core/translate/document/segmented_document.py
+
+"""Markdown 분할 모듈."""
+
+import re
+
+from firstsession.core.translate.document.segmented_document import SegmentedDocument
+
+_FENCE = re.compile(r"^[ ]{0,3}(`{3,}|~{3,})")
+_THEMATIC_BREAK = re.compile(r"^[ ]{0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_SETEXT_UNDERLINE = re.compile(r"^[ ]{0,3}(?:=+|-+)[ \t]*$")
+_LINK_DEFINITION = re.compile(r"^[ ]{0,3}\[[^\]]+\]:\s*\S+")
+_TABLE_DELIMITER = re.compile(r"^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+_INDENTED_CODE = re.compile(r"^(?: {4}|\t)")
+# 줄머리 기호: 들여쓰기, 인용(>), 제목(#), 목록(-, *, +, 1.), 체크박스
+_BLOCK_PREFIX = re.compile(
+    r"^(?:[ \t]*(?:>[ ]?|#{1,6}[ \t]+|(?:[-*+]|\d{1,9}[.)])[ \t]+(?:\[[ xX]\][ \t]+)?))*[ \t]*"
+)
+_TABLE_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+# 줄 끝 공백 두 칸/역슬래시는 강제 줄바꿈이므로 다음 줄과 합치지 않는다.
+_HARD_BREAK = re.compile(r"(?: {2,}|\\)$")
+_PROTECTED = re.compile(
+    r"(`+).+?\1"                      # 인라인 코드
+    r"|\]\([^)\s]*(?:\s+\"[^\"]*\")?\)"  # 링크/이미지 주소
+    r"|\]\[[^\]]*\]"                  # 참조 링크 이름
+    r"|<[^<>\s][^<>]*>"               # HTML 태그, 자동 링크
+    r"|https?://[^\s<>()]+|www\.[^\s<>()]+"
+    r"|\{\{.*?\}\}|\{[\w.]*\}"         # 템플릿 변수
+    r"|&#?\w+;"                       # HTML 엔티티
+)
+
+
+class MarkdownSegmenter:
+    """Markdown 문서를 번역 조각과 원문 유지 구간으로 나눈다."""
+
+    def segment(self, text: str) -> SegmentedDocument:
+        """문서를 나눈다.
+
+        이어지는 문단 줄(소프트 줄바꿈)은 하나의 조각으로 합쳐 문장이 끊기지 않게 하고,
+        번역 결과는 한 줄로 기록한다.
+
+        Args:
+            text: Markdown 문서.
+
+        Returns:
+            SegmentedDocument: 번역 조각과 원문 유지 구간.
+        """
+        document = SegmentedDocument()
+        # 합치는 중인 문단의 줄머리 기호와 본문 줄, 문단 뒤에 붙일 줄바꿈
+        prefix = ""
+        paragraph: list[str] = []
+        trailer = ""
+        fence: str | None = None
+
+        def flush() -> None:
+            if paragraph:
+                document.add_literal(prefix)
+                document.add_text([(False, " ".join(paragraph))], _PROTECTED)
+                document.add_literal(trailer)
+                paragraph.clear()
+
+        for line in text.splitlines(keepends=True):
+            body = line.rstrip("\r\n")
+            newline = line[len(body):]
+            if fence is not None:
+                document.add_literal(line)
+                closing = body.strip()
+                if closing and set(closing) == {fence[0]} and len(closing) >= len(fence):
+                    fence = None
+                continue
+            match = _FENCE.match(body)
+            if match:
+                flush()
+                fence = match.group(1)
+                document.add_literal(line)
+                continue
+            if not body.strip():
+                flush()
+                document.add_literal(line)
+                continue
+            if (
+                _THEMATIC_BREAK.match(body)
+                or _LINK_DEFINITION.match(body)
+                or (_SETEXT_UNDERLINE.match(body) and paragraph)
+                # 들여쓴 코드 블록은 문단을 이어 쓰는 줄이 될 수 없다.
+                or (_INDENTED_CODE.match(body) and not paragraph)
+            ):
+                flush()
+                document.add_literal(line)
+                continue
+            if "|" in body and (body.lstrip().startswith("|") or _TABLE_DELIMITER.match(body)):
+                flush()
+                self._add_table_row(document, body, newline)
+                continue
+
+            line_prefix = _BLOCK_PREFIX.match(body).group(0)
+            if paragraph and not line_prefix.strip():
+                content = body.strip()
+            else:
+                flush()
+                prefix = line_prefix
+                content = body[len(line_prefix):]
+            hard_break = _HARD_BREAK.search(content)
+            marker = content[hard_break.start():] if hard_break else ""
+            paragraph.append(content[:len(content) - len(marker)].rstrip())
+            trailer = marker + newline
+            if marker or prefix.lstrip().startswith("#"):
+                # 강제 줄바꿈/제목은 다음 줄과 합치지 않는다.
+                flush()
+        flush()
+        return document
+
+    def _add_table_row(self, document: SegmentedDocument, body: str, newline: str) -> None:
+        """표 행은 칸막이(|)를 그대로 두고 칸마다 번역 조각을 만든다."""
+        if _TABLE_DELIMITER.match(body):
+            document.add_literal(body + newline)
+            return
+        cells = _TABLE_CELL_SPLIT.split(body)
+        for position, cell in enumerate(cells):
+            if position:
+                document.add_literal("|")
+            document.add_text([(False, cell)], _PROTECTED)
+        document.add_literal(newline)
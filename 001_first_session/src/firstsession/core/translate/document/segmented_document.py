@@ -0,0 +1,119 @@
+# 목적: 서식 문서를 그대로 둘 부분과 번역할 텍스트 조각으로 나눠 보관한다.
+# 설명: 번역할 조각 안의 보호 구간(코드/태그/URL 등)은 {{n}} 자리표시자로 바꾸고,
+#       번역 후 자리표시자를 원래 문자열로 되돌려 문서를 다시 조립한다.
+# 디자인 패턴: 템플릿(조각 목록) + 값 객체
+# 참조: firstsession/core/translate/document/markdown_segmenter.py, firstsession/core/translate/document/html_segmenter.py
+
+"""서식 보존 문서 모듈."""
+
+import re
+from dataclasses import dataclass
+
+_PLACEHOLDER = re.compile(r"\{\{(\d+)\}\}")
+# 자리표시자를 빼고 글자가 하나도 없으면 번역하지 않는다(숫자/기호만 있는 조각 등).
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+@dataclass(frozen=True)
+class TextSegment:
+    """번역할 텍스트 조각. 보호 구간은 {{n}} 자리표시자로 바뀌어 있다."""
+
+    text: str
+    placeholders: tuple[str, ...]
+
+    def restore(self, translated_text: str) -> str | None:
+        """번역 결과의 자리표시자를 원래 문자열로 되돌린다.
+
+        Args:
+            translated_text: 자리표시자가 포함된 번역 결과.
+
+        Returns:
+            str | None: 복원된 텍스트. 자리표시자가 누락/중복/변형되었으면 None.
+        """
+        numbers = sorted(int(number) for number in _PLACEHOLDER.findall(translated_text))
+        if numbers != list(range(len(self.placeholders))):
+            return None
+        return _PLACEHOLDER.sub(lambda match: self.placeholders[int(match.group(1))], translated_text)
+
+
+class SegmentedDocument:
+    """그대로 둘 문자열과 번역할 조각을 원래 순서대로 보관한다."""
+
+    def __init__(self) -> None:
+        self.pieces: list[str | TextSegment] = []
+
+    def add_literal(self, text: str) -> None:
+        """번역하지 않고 그대로 둘 문자열을 추가한다."""
+        if text:
+            self.pieces.append(text)
+
+    def add_text(self, parts: list[tuple[bool, str]], protected: re.Pattern[str]) -> None:
+        """텍스트 구간을 추가한다. 앞뒤 공백은 그대로 두고 나머지를 번역할 조각으로 만든다.
+
+        Args:
+            parts: (보호 여부, 문자열) 목록. 보호 구간은 통째로 자리표시자가 된다.
+            protected: 보호하지 않은 문자열 안에서 추가로 보호할 패턴(URL/인라인 코드 등).
+        """
+        placeholders: list[str] = []
+
+        def hold(value: str) -> str:
+            placeholders.append(value)
+            return f"{{{{{len(placeholders) - 1}}}}}"
+
+        # 이어지는 보호 구간은 자리표시자 하나로 합친다(예: <code>...</code>).
+        merged: list[tuple[bool, str]] = []
+        for is_protected, value in parts:
+            if is_protected and merged and merged[-1][0]:
+                merged[-1] = (True, merged[-1][1] + value)
+            else:
+                merged.append((is_protected, value))
+        masked_parts: list[str] = []
+        for is_protected, value in merged:
+            if is_protected:
+                masked_parts.append(hold(value))
+            else:
+                masked_parts.append(protected.sub(lambda match: hold(match.group(0)), value))
+        masked = "".join(masked_parts)
+        stripped = masked.strip()
+        segment = TextSegment(text=stripped, placeholders=tuple(placeholders))
+        if not _LETTER.search(_PLACEHOLDER.sub("", stripped)):
+            # 번역할 글자가 없으면 원문 그대로 둔다.
+            self.add_literal("".join(value for _, value in parts))
+            return
+        self.add_literal(masked[:len(masked) - len(masked.lstrip())])
+        self.pieces.append(segment)
+        self.add_literal(masked[len(masked.rstrip()):])
+
+    @property
+    def segments(self) -> list[TextSegment]:
+        """번역할 조각 목록(문서 순서, 중복 포함)."""
+        return [piece for piece in self.pieces if isinstance(piece, TextSegment)]
+
+    def unique_texts(self) -> list[str]:
+        """중복을 제거한 번역 대상 텍스트 목록(처음 나온 순서)."""
+        return list(dict.fromkeys(segment.text for segment in self.segments))
+
+    def render(self, translations: dict[str, str]) -> tuple[str, list[str]]:
+        """번역 결과로 문서를 다시 조립한다.
+
+        번역이 없거나 자리표시자를 되돌릴 수 없는 조각은 원문을 그대로 둔다.
+
+        Args:
+            translations: 번역 대상 텍스트 → 번역 결과.
+
+        Returns:
+            tuple[str, list[str]]: (조립한 문서, 자리표시자 복원에 실패한 번역 대상 텍스트 목록).
+        """
+        output: list[str] = []
+        broken: dict[str, None] = {}
+        for piece in self.pieces:
+            if isinstance(piece, str):
+                output.append(piece)
+                continue
+            original = piece.restore(piece.text) or piece.text
+            translated = translations.get(piece.text)
+            restored = piece.restore(translated) if translated is not None else None
+            if translated is not None and restored is None:
+                broken[piece.text] = None
+            output.append(restored if restored is not None else original)
+        return "".join(output), list(broken)
@@ -1,39 +1,133 @@
 # 목적: 번역 처리를 LangGraph로 구성한다.
-# 설명: 입력 → 안전 분류 → 번역 → QC → 재번역 → 응답 흐름을 연결한다.
+# 설명: 입력 → 언어 감지 → 캐시 조회 → 번역 메모리 조회 → 규칙 사전 분류 → 안전 분류 → 번역 → 규칙 QC → QC → 재번역 → 캐시/번역 메모리 저장 → 응답 흐름을 연결한다.
 # 디자인 패턴: 파이프라인 + 빌더
 # 참조: docs/04_string_tricks/01_yes_no_파서.md, docs/04_string_tricks/02_single_choice_파서.md
 
 """번역 그래프 구성 모듈."""
 
+import time
+from typing import Any, AsyncIterator
+
+from langchain_core.runnables import RunnableLambda
+from langgraph.config import get_stream_writer
 from langgraph.graph import START, END, StateGraph
+from langgraph.types import Send
 
+from firstsession.config.settings import Settings, settings as default_settings
+from firstsession.core.translate.cache.translation_cache import TranslationCache
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.client.model_router import ModelRouter
+from firstsession.core.translate.memory.translation_memory import TranslationMemory
+from firstsession.core.translate.metrics.translation_metrics import atimed, count_model_calls, record_request, timed
 from firstsession.core.translate.state.translation_state import TranslationState
 # 노드 설정
 from firstsession.core.translate.nodes.normalize_input_node import NormalizeInputNode
+from firstsession.core.translate.nodes.language_detect_node import LanguageDetectConfig, LanguageDetectNode
+from firstsession.core.translate.nodes.cache_lookup_node import CacheLookupNode
+from firstsession.core.translate.nodes.cache_store_node import CacheStoreNode
+from firstsession.core.translate.nodes.memory_lookup_node import MemoryLookupNode
+from firstsession.core.translate.nodes.memory_store_node import MemoryStoreNode
+from firstsession.core.translate.nodes.safeguard_preclassify_node import PreclassifyConfig, SafeguardPreclassifyNode
 from firstsession.core.translate.nodes.safeguard_classify_node import SafeguardClassifyNode
 from firstsession.core.translate.nodes.safeguard_decision_node import SafeguardDecisionNode
 from firstsession.core.translate.nodes.safeguard_fail_response_node import SafeguardFailResponseNode
 from firstsession.core.translate.nodes.translate_node import TranslateNode
+from firstsession.core.translate.nodes.heuristic_qc_node import HeuristicQcConfig, HeuristicQcNode
 from firstsession.core.translate.nodes.quality_check_node import QualityCheckNode
 from firstsession.core.translate.nodes.retry_gate_node import RetryGateNode
 from firstsession.core.translate.nodes.retry_translate_node import RetryTranslateNode
 from firstsession.core.translate.nodes.response_node import ResponseNode
+from firstsession.core.translate.nodes.speculative_safeguard_node import SpeculativeSafeguardNode
+from firstsession.core.translate.nodes.speculative_translate_node import SpeculativeTranslateNode
+from firstsession.core.translate.nodes.speculative_resolve_node import SpeculativeResolveNode
+from firstsession.core.translate.nodes.target_translate_node import TargetTranslateNode
+from firstsession.core.translate.nodes.single_call_translate_node import SingleCallTranslateNode
+from firstsession.core.translate.nodes.single_call_audit_node import SingleCallAuditNode
 
 class TranslateGraph:
     """번역 그래프 실행기."""
 
-    def __init__(self) -> None:
-        """그래프를 초기화한다."""
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        cache: TranslationCache | None = None,
+        model_client: GeminiClient | None = None,
+        memory: TranslationMemory | None = None,
+    ) -> None:
+        """그래프를 초기화한다.
+
+        Args:
+            settings: 애플리케이션 설정(기본값: 전역 설정).
+            cache: 번역/안전 분류 결과 캐시(선택).
+            model_client: 모든 모델 호출 노드가 공유할 클라이언트(기본값: 프로세스 기본 클라이언트).
+            memory: 문장 단위 번역 메모리(선택).
+        """
+        self.settings = settings or default_settings
+        self.cache = cache
+        self.memory = memory
+        self.model_client = model_client
+        # 호출마다 모델 티어를 고르는 라우터(꺼져 있으면 None → 기본 모델 고정)
+        self.model_router = ModelRouter.from_settings(self.settings.model_routing)
+        model_router = self.model_router
         # 노드 인스턴스 초기화
         self.normalize = NormalizeInputNode()
-        self.safeguard_classify = SafeguardClassifyNode()
+        language_id = self.settings.language_id
+        self.language_detect = LanguageDetectNode(
+            LanguageDetectConfig(
+                enabled=language_id.enabled,
+                min_letters=language_id.min_letters,
+                min_confidence=language_id.min_confidence,
+                mismatch_policy=language_id.mismatch_policy,
+                mismatch_min_confidence=language_id.mismatch_min_confidence,
+            )
+        )
+        preclassify = self.settings.preclassify
+        self.safeguard_preclassify = SafeguardPreclassifyNode(
+            PreclassifyConfig(
+                enabled=preclassify.enabled,
+                trivial_max_length=preclassify.trivial_max_length,
+                trivial_pattern=preclassify.trivial_pattern,
+            )
+        )
+        self.safeguard_classify = SafeguardClassifyNode(cache=cache, client=model_client, model_router=model_router)
         self.safeguard_decision = SafeguardDecisionNode()
         self.safeguard_fail_response = SafeguardFailResponseNode()
-        self.translate = TranslateNode()
-        self.quality_check = QualityCheckNode()
+        self.translate = TranslateNode(client=model_client, model_router=model_router)
+        heuristic_qc = self.settings.heuristic_qc
+        self.heuristic_qc = HeuristicQcNode(
+            HeuristicQcConfig(
+                enabled=heuristic_qc.enabled,
+                skip_llm_policy=heuristic_qc.skip_llm_policy,
+                skip_llm_max_length=heuristic_qc.skip_llm_max_length,
+                min_length_ratio=heuristic_qc.min_length_ratio,
+                max_length_ratio=heuristic_qc.max_length_ratio,
+                min_script_ratio=heuristic_qc.min_script_ratio,
+            )
+        )
+        self.quality_check = QualityCheckNode(client=model_client, model_router=model_router)
         self.retry_gate = RetryGateNode()
-        self.retry_translate = RetryTranslateNode()
+        self.retry_translate = RetryTranslateNode(client=model_client, model_router=model_router)
         self.response = ResponseNode()
+        model_name = self.translate.call_model_node.config.model_name
+        model_selector = self.translate.call_model_node.model_for if model_router is not None else None
+        self.cache_lookup = CacheLookupNode(cache, model_name=model_name, model_selector=model_selector)
+        self.cache_store = CacheStoreNode(cache, model_name=model_name, model_selector=model_selector)
+        self.memory_lookup = MemoryLookupNode(memory)
+        self.memory_store = MemoryStoreNode(memory)
+        # 단일 호출 모드가 켜져 있으면 추측 번역은 쓰지 않는다.
+        self.single_call = self.settings.translate.single_call
+        self.single_call_translate = SingleCallTranslateNode(client=model_client, model_router=model_router)
+        self.single_call_audit = SingleCallAuditNode(
+            self.safeguard_classify,
+            self.quality_check,
+            sample_rate=self.settings.translate.single_call_audit_rate,
+        )
+        self.speculative = self.settings.translate.speculative_translate and not self.single_call
+        self.speculative_safeguard = SpeculativeSafeguardNode(self.safeguard_classify)
+        self.speculative_translate = SpeculativeTranslateNode(self.translate)
+        self.speculative_resolve = SpeculativeResolveNode()
+        # 다중 목표 언어: 목표 언어별 하위 그래프를 Send로 병렬 실행한다.
+        self.target_translate = TargetTranslateNode(self._build_target_graph().compile())
         # 그래프 초기화
         graph = self._build_graph()
         self._compiled = graph.compile()
@@ -49,19 +143,156 @@ class TranslateGraph:
         """
         if state is None:
             raise ValueError('state는 None일 수 없습니다. 다시 확인해야 합니다.')
-        result = self._compiled.invoke(state)
+        started = time.perf_counter()
+        with count_model_calls() as calls:
+            result = self._compiled.invoke(state)
+        record_request(result, time.perf_counter() - started, mode="sync", model_calls=calls[0])
         return result
 
-    def _route_after_safeguard(self, state: TranslationState) -> str:
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """번역 그래프를 비동기로 실행한다.
+
+        모델을 호출하는 노드는 arun(client.aio)으로 실행되므로
+        대기 중에 스레드를 점유하지 않는다.
+
+        Args:
+            state: 번역 입력 상태.
+
+        Returns:
+            TranslationState: 번역 결과 상태.
+        """
+        if state is None:
+            raise ValueError('state는 None일 수 없습니다. 다시 확인해야 합니다.')
+        started = time.perf_counter()
+        with count_model_calls() as calls:
+            result = await self._compiled.ainvoke(state)
+        record_request(result, time.perf_counter() - started, mode="async", model_calls=calls[0])
+        return result
+
+    async def astream(self, state: TranslationState) -> AsyncIterator[tuple[str, Any]]:
+        """번역 그래프를 스트리밍 모드로 실행한다.
+
+        분기는 run/arun과 같은 컴파일된 그래프가 결정한다. 노드가 끝날 때마다 ("updates", {노드 이름: 갱신})을,
+        번역 노드가 조각을 받을 때마다 ("custom", {"token": 조각})을 반환한다.
+
+        Args:
+            state: 번역 입력 상태.
+
+        Yields:
+            tuple[str, Any]: (스트림 모드, 데이터).
+        """
+        if state is None:
+            raise ValueError('state는 None일 수 없습니다. 다시 확인해야 합니다.')
+        state = dict(state)
+        state["stream"] = True
+        async for mode, chunk in self._compiled.astream(state, stream_mode=["updates", "custom"]):
+            yield mode, chunk
+
+    async def _atranslate(self, state: TranslationState) -> TranslationState:
+        """번역 노드의 비동기 실행. 스트리밍 실행이면 번역 조각을 custom 스트림으로 내보낸다."""
+        if not state.get("stream"):
+            return await self.translate.arun(state)
+        writer = get_stream_writer()
+        async for delta in self.translate.astream(state):
+            writer({"token": delta})
+        return state
+
+    def _node(self, name: str, node):
+        """노드를 그래프에 등록할 실행 단위로 변환한다.
+
+        모든 노드는 실행 시간/예외를 기록하도록 감싸고,
+        arun을 제공하는 노드는 invoke에서 run, ainvoke에서 arun이 호출되도록 묶는다.
+        """
+        if hasattr(node, "arun"):
+            return RunnableLambda(timed(name, node.run), afunc=atimed(name, node.arun), name=name)
+        return timed(name, node.run)
+
+    def _route_after_language_detect(self, state: TranslationState) -> str:
+        # 이미 목표 언어로 작성된 입력과 원문 언어가 맞지 않는 입력은 모델을 호출하지 않는다.
+        if state.get("language_check") in ("SAME_LANGUAGE", "MISMATCH"):
+            return "response"
+        return self._route_after_normalize(state)
+
+    def _route_after_normalize(self, state: TranslationState) -> str:
+        # 다중 목표 언어 요청은 목표 언어별 하위 그래프에서 캐시를 조회한다.
+        if state.get("target_languages"):
+            return "safeguard_preclassify"
+        return "cache_lookup"
+
+    def _fan_out_targets(self, state: TranslationState) -> list[Send]:
+        """정규화/안전 분류를 마친 상태를 목표 언어마다 복사해 병렬로 보낸다."""
+        sends = []
+        for target_language in state.get("target_languages", []):
+            target_state = dict(state)
+            target_state["target_language"] = target_language
+            target_state["target_results"] = {}
+            sends.append(Send("target_translate", target_state))
+        return sends
+
+    def _route_after_cache_lookup(self, state: TranslationState) -> str:
+        # QC를 통과한 캐시 번역이 있으면 안전 분류/번역/QC를 모두 건너뛴다.
+        if state.get("cache_hit"):
+            return "response"
+        return "memory_lookup"
+
+    def _route_after_memory_lookup(self, state: TranslationState) -> str:
+        # 한 문장 입력이 번역 메모리와 완전히 일치하면 저장된 번역을 그대로 쓴다.
+        if state.get("memory_hit"):
+            return "response"
+        return "safeguard_preclassify"
+
+    def _route_after_preclassify(self, state: TranslationState) -> str | list[str]:
+        # 규칙으로 라벨이 확정되면 LLM 안전 분류를 건너뛴다.
+        if state.get("safeguard_llm_skipped"):
+            return "safeguard_decision"
+        if self.single_call and not state.get("target_languages"):
+            # 단일 호출 모드: 안전 분류/번역/자체 QC를 한 번에 요청한다.
+            return "single_call"
+        if self.speculative:
+            # 추측 모드: 안전 분류와 번역을 동시에 시작한다.
+            return ["safeguard_classify", "speculative_translate"]
+        return "safeguard_classify"
+
+    def _route_after_single_call(self, state: TranslationState) -> str:
+        # JSON 응답을 해석하지 못했으면 기존 안전 분류 → 번역 → QC 경로로 처리한다.
+        if state.get("single_call") == "OK":
+            return "single_call_audit"
+        return "safeguard_classify"
+
+    def _route_after_safeguard(self, state: TranslationState) -> str | list[Send]:
         if state.get("safeguard_label") == "SAFE":
+            if state.get("target_languages"):
+                return self._fan_out_targets(state)
+            if state.get("single_call") == "OK":
+                # 단일 호출 번역은 규칙 QC만 거치고 자체 QC 판정을 사용한다.
+                return "heuristic_qc"
             return "translate"
         else:
             return "safeguard_fail_response"
 
+    def _route_after_speculative_resolve(self, state: TranslationState) -> str | list[Send]:
+        if state.get("safeguard_label") != "SAFE":
+            return "safeguard_fail_response"
+        if state.get("target_languages"):
+            return self._fan_out_targets(state)
+        # 추측 번역이 실패했으면 일반 번역 경로로 다시 시도한다.
+        if state.get("translated_text"):
+            return "heuristic_qc"
+        return "translate"
+
+    def _route_after_heuristic_qc(self, state: TranslationState) -> str:
+        # 규칙 위반(NO) 또는 확신 통과(YES)가 확정되면 LLM QC를 건너뛴다.
+        if state.get("qc_llm_skipped"):
+            return "retry_gate"
+        # 단일 호출 번역은 응답에 포함된 자체 QC 판정(qc_passed)을 그대로 쓴다. 재번역 결과는 LLM QC를 거친다.
+        if state.get("single_call") == "OK" and not state.get("retry_count"):
+            return "retry_gate"
+        return "quality_check"
+
     def _route_after_retry_gate(self, state: TranslationState) -> str:
         # QC passed 기준으로 분기 처리
         if state.get('qc_passed') == "YES":
-            return "response"
+            return "cache_store"
         else:
             if state.get("can_retry"):
                 return "retry_translate"
@@ -81,15 +312,37 @@ class TranslateGraph:
         # - 함수형: graph.add_node("normalize", normalize_input)
         # - 클래스형: graph.add_node("normalize", self.normalize_input_node.run)
         #   - 클래스형은 무상태로 설계하고, 공유 데이터는 state에만 기록한다.
-        graph.add_node("normalize", self.normalize.run)
-        graph.add_node("safeguard_classify", self.safeguard_classify.run)
-        graph.add_node("safeguard_decision", self.safeguard_decision.run)
-        graph.add_node("safeguard_fail_response", self.safeguard_fail_response.run)
-        graph.add_node("translate", self.translate.run)
-        graph.add_node("quality_check", self.quality_check.run)
-        graph.add_node("retry_gate", self.retry_gate.run)
-        graph.add_node("retry_translate", self.retry_translate.run)
-        graph.add_node("response", self.response.run)
+        graph.add_node("normalize", self._node("normalize", self.normalize))
+        graph.add_node("language_detect", self._node("language_detect", self.language_detect))
+        graph.add_node("cache_lookup", self._node("cache_lookup", self.cache_lookup))
+        graph.add_node("memory_lookup", self._node("memory_lookup", self.memory_lookup))
+        graph.add_node("safeguard_preclassify", self._node("safeguard_preclassify", self.safeguard_preclassify))
+        if self.speculative:
+            # 병렬 분기는 서로 다른 키만 반환해야 하므로 부분 업데이트 노드로 감싼다.
+            graph.add_node("safeguard_classify", self._node("safeguard_classify", self.speculative_safeguard))
+            graph.add_node("speculative_translate", self._node("speculative_translate", self.speculative_translate))
+            graph.add_node("speculative_resolve", self._node("speculative_resolve", self.speculative_resolve))
+        else:
+            graph.add_node("safeguard_classify", self._node("safeguard_classify", self.safeguard_classify))
+        if self.single_call:
+            graph.add_node("single_call", self._node("single_call", self.single_call_translate))
+            graph.add_node("single_call_audit", self._node("single_call_audit", self.single_call_audit))
+        graph.add_node("safeguard_decision", self._node("safeguard_decision", self.safeguard_decision))
+        graph.add_node("safeguard_fail_response", self._node("safeguard_fail_response", self.safeguard_fail_response))
+        # 스트리밍 실행(astream)에서는 번역 조각을 바로 내보낸다. 추측 번역 분기는 안전 분류 전이므로 내보내지 않는다.
+        graph.add_node("translate", RunnableLambda(
+            timed("translate", self.translate.run),
+            afunc=atimed("translate", self._atranslate),
+            name="translate",
+        ))
+        graph.add_node("heuristic_qc", self._node("heuristic_qc", self.heuristic_qc))
+        graph.add_node("quality_check", self._node("quality_check", self.quality_check))
+        graph.add_node("retry_gate", self._node("retry_gate", self.retry_gate))
+        graph.add_node("retry_translate", self._node("retry_translate", self.retry_translate))
+        graph.add_node("cache_store", self._node("cache_store", self.cache_store))
+        graph.add_node("memory_store", self._node("memory_store", self.memory_store))
+        graph.add_node("target_translate", self._node("target_translate", self.target_translate))
+        graph.add_node("response", self._node("response", self.response))
         # TODO: 다음 노드들을 추가하고 엣지를 연결한다.
         # - NormalizeInputNode: 입력 정규화
         # - SafeguardClassifyNode: PASS/PII/HARMFUL/PROMPT_INJECTION 판정
@@ -101,14 +354,34 @@ class TranslateGraph:
         # - RetryTranslateNode: 재번역 수행
         # - ResponseNode: 최종 응답 구성
         graph.add_edge(START, "normalize")
-        graph.add_edge("normalize", "safeguard_classify")
-        graph.add_edge("safeguard_classify", "safeguard_decision")
-        graph.add_conditional_edges("safeguard_decision", self._route_after_safeguard,{"translate":"translate", "safeguard_fail_response": "safeguard_fail_response",}) # safeguard 분기 처리
+        graph.add_edge("normalize", "language_detect")
+        graph.add_conditional_edges("language_detect", self._route_after_language_detect,{"cache_lookup":"cache_lookup", "safeguard_preclassify": "safeguard_preclassify", "response": "response",}) # 동일 언어/원문 언어 불일치, 다중 목표 언어 분기 처리
+        graph.add_conditional_edges("cache_lookup", self._route_after_cache_lookup,{"memory_lookup":"memory_lookup", "response": "response",}) # 캐시 적중 분기 처리
+        graph.add_conditional_edges("memory_lookup", self._route_after_memory_lookup,{"safeguard_preclassify":"safeguard_preclassify", "response": "response",}) # 번역 메모리 완전 일치 분기 처리
+        if self.speculative:
+            graph.add_conditional_edges("safeguard_preclassify", self._route_after_preclassify,["safeguard_classify", "speculative_translate", "safeguard_decision"]) # 규칙 사전 분류 + 추측 번역 분기 처리
+            graph.add_edge(["safeguard_classify", "speculative_translate"], "safeguard_decision") # 두 분기가 모두 끝나면 합류
+            graph.add_edge("safeguard_decision", "speculative_resolve")
+            graph.add_conditional_edges("speculative_resolve", self._route_after_speculative_resolve,["heuristic_qc", "translate", "target_translate", "safeguard_fail_response"]) # 추측 번역 채택/폐기 분기 처리
+        elif self.single_call:
+            graph.add_conditional_edges("safeguard_preclassify", self._route_after_preclassify,{"single_call":"single_call", "safeguard_classify":"safeguard_classify", "safeguard_decision": "safeguard_decision",}) # 규칙 사전 분류 + 단일 호출 분기 처리
+            graph.add_conditional_edges("single_call", self._route_after_single_call,{"single_call_audit":"single_call_audit", "safeguard_classify": "safeguard_classify",}) # JSON 해석 실패 시 기존 경로로 전환
+            graph.add_edge("single_call_audit", "safeguard_decision")
+            graph.add_edge("safeguard_classify", "safeguard_decision")
+            graph.add_conditional_edges("safeguard_decision", self._route_after_safeguard,["translate", "heuristic_qc", "target_translate", "safeguard_fail_response"]) # safeguard 분기 처리(단일 호출 번역은 규칙 QC로)
+        else:
+            graph.add_conditional_edges("safeguard_preclassify", self._route_after_preclassify,{"safeguard_classify":"safeguard_classify", "safeguard_decision": "safeguard_decision",}) # 규칙 사전 분류 분기 처리
+            graph.add_edge("safeguard_classify", "safeguard_decision")
+            graph.add_conditional_edges("safeguard_decision", self._route_after_safeguard,["translate", "target_translate", "safeguard_fail_response"]) # safeguard 분기 처리(다중 목표 언어는 Send로 분기)
         graph.add_edge("safeguard_fail_response", "response")
-        graph.add_edge("translate", "quality_check")
+        graph.add_edge("translate", "heuristic_qc")
+        graph.add_conditional_edges("heuristic_qc", self._route_after_heuristic_qc,{"quality_check":"quality_check", "retry_gate": "retry_gate",}) # 규칙 QC 분기 처리
         graph.add_edge("quality_check", "retry_gate")
-        graph.add_conditional_edges("retry_gate", self._route_after_retry_gate,{"retry_translate":"retry_translate", "response": "response",}) # retry_gate 분기 처리
-        graph.add_edge("retry_translate", "quality_check")
+        graph.add_conditional_edges("retry_gate", self._route_after_retry_gate,{"retry_translate":"retry_translate", "cache_store": "cache_store", "response": "response",}) # retry_gate 분기 처리
+        graph.add_edge("cache_store", "memory_store")
+        graph.add_edge("memory_store", "response")
+        graph.add_edge("target_translate", "response")
+        graph.add_edge("retry_translate", "heuristic_qc")
         graph.add_edge("response", END)
         # TODO: 조건부 엣지 설계(구체 경로 예시)
         # - NormalizeInputNode -> SafeguardClassifyNode -> SafeguardDecisionNode
@@ -123,3 +396,34 @@ class TranslateGraph:
         #   - max_retry_count: 최대 재시도 횟수
         # - RetryGateNode에서 qc_passed가 NO이고 재시도 불가이면 ResponseNode -> END
         return graph
+
+    def _build_target_graph(self) -> StateGraph:
+        """목표 언어 하나의 번역 하위 그래프를 구성한다.
+
+        단건 그래프의 번역 이후 구간(캐시/번역 메모리 조회 → 번역 → 규칙 QC → QC → 재번역 → 캐시/번역 메모리 저장)과 같은
+        노드/분기 규칙을 사용한다.
+
+        Returns:
+            StateGraph: 구성된 하위 그래프.
+        """
+        graph = StateGraph(TranslationState)
+        graph.add_node("cache_lookup", self._node("cache_lookup", self.cache_lookup))
+        graph.add_node("memory_lookup", self._node("memory_lookup", self.memory_lookup))
+        graph.add_node("translate", self._node("translate", self.translate))
+        graph.add_node("heuristic_qc", self._node("heuristic_qc", self.heuristic_qc))
+        graph.add_node("quality_check", self._node("quality_check", self.quality_check))
+        graph.add_node("retry_gate", self._node("retry_gate", self.retry_gate))
+        graph.add_node("retry_translate", self._node("retry_translate", self.retry_translate))
+        graph.add_node("cache_store", self._node("cache_store", self.cache_store))
+        graph.add_node("memory_store", self._node("memory_store", self.memory_store))
+        graph.add_edge(START, "cache_lookup")
+        graph.add_conditional_edges("cache_lookup", self._route_after_cache_lookup,{"memory_lookup": "memory_lookup", "response": END,}) # 캐시 적중 시 종료
+        graph.add_conditional_edges("memory_lookup", self._route_after_memory_lookup,{"safeguard_preclassify": "translate", "response": END,}) # 번역 메모리 완전 일치 시 종료, 아니면 번역
+        graph.add_edge("translate", "heuristic_qc")
+        graph.add_conditional_edges("heuristic_qc", self._route_after_heuristic_qc,{"quality_check":"quality_check", "retry_gate": "retry_gate",})
+        graph.add_edge("quality_check", "retry_gate")
+        graph.add_conditional_edges("retry_gate", self._route_after_retry_gate,{"retry_translate":"retry_translate", "cache_store": "cache_store", "response": END,})
+        graph.add_edge("retry_translate", "heuristic_qc")
+        graph.add_edge("cache_store", "memory_store")
+        graph.add_edge("memory_store", END)
+        return graph
@@ -0,0 +1,132 @@
+# 목적: 번역 결과를 토큰 단위 이벤트로 스트리밍한다.
+# 설명: 컴파일된 번역 그래프를 스트리밍 모드로 실행하고, 번역 조각과 노드 결과를 token/qc/replace/blocked/done 이벤트로 바꾼다.
+# 디자인 패턴: 이터레이터(비동기 제너레이터) + 어댑터
+# 참조: firstsession/core/translate/graphs/translate_graph.py
+
+"""번역 스트리밍 실행 모듈."""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+from firstsession.core.translate.graphs.translate_graph import TranslateGraph
+from firstsession.core.translate.metrics.translation_metrics import STREAM_TTFT, record_request
+from firstsession.core.translate.state.translation_state import TranslationState
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """스트리밍 이벤트 하나."""
+
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+class TranslateStream:
+    """번역 그래프의 스트리밍 실행 결과를 클라이언트 이벤트로 바꾼다.
+
+    분기는 run/arun과 같은 컴파일된 그래프가 결정하고(TranslateGraph.astream),
+    여기서는 번역 노드의 조각과 노드별 갱신만 이벤트로 옮긴다.
+    캐시/번역 메모리 적중, 동일 언어, 추측 번역 채택, 단일 호출처럼 조각 없이 번역이 정해진 경우는
+    결과 전체를 token 이벤트 하나로 보낸다.
+
+    이벤트 순서:
+        token* → qc → (replace → qc)* → done
+        차단(또는 원문 언어 불일치) 시: blocked → done
+    """
+
+    def __init__(self, graph: TranslateGraph) -> None:
+        """스트리밍 실행기를 초기화한다.
+
+        Args:
+            graph: 스트리밍 모드로 실행할 번역 그래프.
+        """
+        self.graph = graph
+
+    def _elapsed_ms(self, started: float) -> float:
+        return (time.perf_counter() - started) * 1000
+
+    def _qc_event(self, state: TranslationState) -> StreamEvent:
+        return StreamEvent("qc", {
+            "qc_passed": state.get("qc_passed", "NO"),
+            "heuristic_qc_rules": list(state.get("heuristic_qc_rules") or []),
+            "retry_count": int(state.get("retry_count", 0) or 0),
+        })
+
+    def _blocked_event(self, state: TranslationState, safeguard_label: str) -> StreamEvent:
+        return StreamEvent("blocked", {"safeguard_label": safeguard_label, "error": state.get("error", "")})
+
+    def _done_event(self, state: TranslationState, started: float, ttft_ms: float | None) -> StreamEvent:
+        total_ms = self._elapsed_ms(started)
+        record_request(state, total_ms / 1000, mode="stream")
+        if ttft_ms is not None:
+            STREAM_TTFT.observe(ttft_ms / 1000)
+        logger.info("translate stream done: ttft_ms=%s total_ms=%.1f", ttft_ms, total_ms)
+        return StreamEvent("done", {
+            "source_language": state.get("source_language", ""),
+            "target_language": state.get("target_language", ""),
+            "translated_text": state.get("translated_text", ""),
+            "qc_passed": state.get("qc_passed", "NO"),
+            "error": state.get("error", ""),
+            "ttft_ms": ttft_ms,
+            "total_ms": total_ms,
+        })
+
+    async def astream(self, state: TranslationState) -> AsyncIterator[StreamEvent]:
+        """번역을 실행하며 이벤트를 순서대로 반환한다.
+
+        Args:
+            state: 번역 입력 상태.
+
+        Yields:
+            StreamEvent: token/qc/replace/blocked/done 이벤트.
+        """
+        if state is None:
+            raise ValueError('state는 None일 수 없습니다. 다시 확인해야 합니다.')
+        started = time.perf_counter()
+        state = dict(state)
+        ttft_ms: float | None = None
+        qc_sent = False
+        blocked = False
+
+        async for mode, chunk in self.graph.astream(state):
+            if mode == "custom":
+                if ttft_ms is None:
+                    ttft_ms = self._elapsed_ms(started)
+                yield StreamEvent("token", {"text": chunk["token"]})
+                continue
+            for node_name, update in chunk.items():
+                if update:
+                    state.update(update)
+                if node_name == "safeguard_fail_response":
+                    blocked = True
+                    yield self._blocked_event(state, state.get("safeguard_label", ""))
+                elif node_name == "retry_translate":
+                    # 이미 내보낸 토큰은 되돌릴 수 없으므로 재번역 결과는 전체 교체 이벤트로 보낸다.
+                    yield StreamEvent("replace", {
+                        "translated_text": state.get("translated_text", ""),
+                        "retry_count": int(state.get("retry_count", 0) or 0),
+                    })
+                elif node_name == "retry_gate":
+                    # QC 판정이 끝난 시점. 조각 없이 정해진 번역은 판정 전에 한 번에 보낸다.
+                    if ttft_ms is None:
+                        ttft_ms = self._elapsed_ms(started)
+                        yield StreamEvent("token", {"text": state.get("translated_text", "")})
+                    qc_sent = True
+                    yield self._qc_event(state)
+
+        if not blocked and state.get("language_check") == "MISMATCH":
+            # 원문 언어 불일치는 안전 분류 전에 끝나므로 라벨이 없다.
+            blocked = True
+            yield self._blocked_event(state, "")
+        if not blocked:
+            # 동일 언어/캐시/번역 메모리 적중은 번역 노드와 QC를 거치지 않는다.
+            if ttft_ms is None:
+                ttft_ms = self._elapsed_ms(started)
+                yield StreamEvent("token", {"text": state.get("translated_text", "")})
+            if not qc_sent:
+                yield self._qc_event(state)
+        yield self._done_event(state, started, ttft_ms)
@@ -0,0 +1,5 @@
+"""로컬 언어 식별 패키지."""
+
+from firstsession.core.translate.language.language_identifier import LanguageGuess, LanguageIdentifier
+
+__all__ = ["LanguageGuess", "LanguageIdentifier"]
@@ -0,0 +1,155 @@
+# 목적: 네트워크 호출 없이 텍스트의 언어를 빠르게 추정한다.
+# 설명: 먼저 문자 체계(스크립트) 비율로 언어 후보를 좁히고, 라틴 문자는 기능어/문자 3-gram/특징 문자 점수로 구분한다.
+# 디자인 패턴: 전략 패턴(스크립트별 판별 규칙)
+# 참조: firstsession/core/translate/const/language_profiles.py, firstsession/core/translate/nodes/language_detect_node.py
+
+"""로컬 언어 식별 모듈."""
+
+import re
+from dataclasses import dataclass
+
+from firstsession.core.translate.const.language_profiles import LATIN_CHARACTERS, LATIN_STOPWORDS, LATIN_TRIGRAMS
+
+# 스크립트 이름 → 글자 패턴. 한자는 가나가 함께 나오면 일본어로 본다.
+_SCRIPTS: dict[str, re.Pattern[str]] = {
+    "hangul": re.compile(r"[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]"),
+    "kana": re.compile(r"[\u3040-\u30ff\u31f0-\u31ff]"),
+    "han": re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]"),
+    "cyrillic": re.compile(r"[\u0400-\u04ff]"),
+    "greek": re.compile(r"[\u0370-\u03ff]"),
+    "arabic": re.compile(r"[\u0600-\u06ff\u0750-\u077f]"),
+    "hebrew": re.compile(r"[\u0590-\u05ff]"),
+    "thai": re.compile(r"[\u0e00-\u0e7f]"),
+    "devanagari": re.compile(r"[\u0900-\u097f]"),
+    "latin": re.compile(r"[A-Za-z\u00c0-\u024f\u1e00-\u1eff]"),
+}
+# 스크립트 하나가 곧 언어 하나인 경우
+_SCRIPT_LANGUAGES = {
+    "hangul": "ko",
+    "kana": "ja",
+    "han": "zh",
+    "greek": "el",
+    "hebrew": "he",
+    "thai": "th",
+    "devanagari": "hi",
+}
+# 링크/메일 주소의 라틴 문자는 본문 언어와 무관하므로 세지 않는다.
+_IGNORED = re.compile(r"https?://\S+|www\.\S+|\S+@\S+")
+_LATIN_WORD = re.compile(r"[a-z\u00c0-\u024f\u1e00-\u1eff]+")
+_UKRAINIAN = re.compile(r"[іїєґІЇЄҐ]")
+_RUSSIAN = re.compile(r"[ыэёЫЭЁ]")
+_PERSIAN = re.compile(r"[پچژگکی]")
+
+# 라틴 문자 점수 가중치
+_STOPWORD_WEIGHT = 1.0
+_TRIGRAM_WEIGHT = 0.25
+_CHARACTER_WEIGHT = 1.0
+# 이 점수보다 낮으면 근거가 부족한 것으로 보고 판정하지 않는다.
+_MIN_LATIN_SCORE = 3.0
+# 라틴 문자 점수는 앞부분 단어만으로 계산한다(긴 입력도 판정 비용을 일정하게 유지).
+_MAX_LATIN_WORDS = 200
+# 같은 스크립트를 쓰는 언어 중 표시 문자가 없어 구분이 불확실할 때의 신뢰도 배율
+_AMBIGUOUS_FACTOR = 0.85
+
+
+@dataclass(frozen=True)
+class LanguageGuess:
+    """언어 추정 결과."""
+
+    language: str
+    confidence: float
+    script: str
+
+
+_UNKNOWN = LanguageGuess(language="", confidence=0.0, script="")
+
+
+class LanguageIdentifier:
+    """문자 체계와 n-gram 프로필로 언어를 추정한다."""
+
+    def __init__(self, min_letters: int = 12) -> None:
+        """언어 식별기를 초기화한다.
+
+        Args:
+            min_letters: 판정에 필요한 최소 글자 수(이보다 짧으면 알 수 없음으로 반환).
+        """
+        self.min_letters = min_letters
+        # 여러 언어에 나오는 특징 문자는 나오는 언어 수로 나눠 점수를 준다.
+        owners: dict[str, list[str]] = {}
+        for language, characters in LATIN_CHARACTERS.items():
+            for character in characters:
+                owners.setdefault(character, []).append(language)
+        self._character_scores = {
+            character: {language: _CHARACTER_WEIGHT / len(languages) for language in languages}
+            for character, languages in owners.items()
+        }
+
+    def detect(self, text: str) -> LanguageGuess:
+        """텍스트의 언어를 추정한다.
+
+        Args:
+            text: 정규화된 입력 텍스트.
+
+        Returns:
+            LanguageGuess: 언어 코드(판정 불가 시 빈 문자열), 0~1 신뢰도, 주 스크립트.
+        """
+        text = _IGNORED.sub(" ", text or "")
+        counts = {script: len(pattern.findall(text)) for script, pattern in _SCRIPTS.items()}
+        # 가나가 조금이라도 섞인 한자 문장은 일본어로 본다.
+        if counts["kana"] and counts["kana"] * 20 >= counts["han"]:
+            counts["kana"] += counts.pop("han")
+        total = sum(counts.values())
+        if total < self.min_letters:
+            return _UNKNOWN
+        script = max(counts, key=counts.get)
+        share = counts[script] / total
+
+        if script == "han":
+            # 가나 없는 한자 문장은 일본어/한국어 한자 표기일 수도 있어 중국어로 단정하지 않는다.
+            return LanguageGuess("zh", share * _AMBIGUOUS_FACTOR, script)
+        if script in _SCRIPT_LANGUAGES:
+            return LanguageGuess(_SCRIPT_LANGUAGES[script], share, script)
+        if script == "cyrillic":
+            return self._detect_cyrillic(text, share)
+        if script == "arabic":
+            if _PERSIAN.search(text):
+                return LanguageGuess("fa", share, script)
+            return LanguageGuess("ar", share * _AMBIGUOUS_FACTOR, script)
+        return self._detect_latin(text, share)
+
+    def _detect_cyrillic(self, text: str, share: float) -> LanguageGuess:
+        if _UKRAINIAN.search(text):
+            return LanguageGuess("uk", share, "cyrillic")
+        if _RUSSIAN.search(text):
+            return LanguageGuess("ru", share, "cyrillic")
+        # ы/э/ё가 없고 ъ가 자주 나오면 불가리아어일 가능성이 높다.
+        if text.count("ъ") >= 2:
+            return LanguageGuess("bg", share * _AMBIGUOUS_FACTOR, "cyrillic")
+        return LanguageGuess("ru", share * _AMBIGUOUS_FACTOR, "cyrillic")
+
+    def _latin_scores(self, text: str) -> dict[str, float]:
+        scores = dict.fromkeys(LATIN_STOPWORDS, 0.0)
+        for word in _LATIN_WORD.findall(text.lower())[:_MAX_LATIN_WORDS]:
+            for language, stopwords in LATIN_STOPWORDS.items():
+                if word in stopwords:
+                    scores[language] += _STOPWORD_WEIGHT
+            padded = f" {word} "
+            for index in range(len(padded) - 2):
+                trigram = padded[index:index + 3]
+                for language, trigrams in LATIN_TRIGRAMS.items():
+                    if trigram in trigrams:
+                        scores[language] += _TRIGRAM_WEIGHT
+            for character in word:
+                for language, score in self._character_scores.get(character, {}).items():
+                    scores[language] += score
+        return scores
+
+    def _detect_latin(self, text: str, share: float) -> LanguageGuess:
+        scores = self._latin_scores(text)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        (best, best_score), (_, runner_up) = ranked[0], ranked[1]
+        if best_score < _MIN_LATIN_SCORE:
+            return LanguageGuess("", 0.0, "latin")
+        # 1등과 2등의 점수 차이가 클수록 신뢰도가 높다(동점이면 0).
+        margin = (best_score - runner_up) / best_score
+        return LanguageGuess(best, share * min(1.0, 2 * margin), "latin")
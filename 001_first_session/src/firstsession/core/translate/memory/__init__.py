@@ -0,0 +1,6 @@
+"""문장 단위 번역 메모리 패키지."""
+
+from firstsession.core.translate.memory.min_hasher import MinHasher
+from firstsession.core.translate.memory.translation_memory import MemoryMatch, TranslationMemory
+
+__all__ = ["MemoryMatch", "MinHasher", "TranslationMemory"]
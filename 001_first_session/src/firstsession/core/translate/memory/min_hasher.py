@@ -0,0 +1,91 @@
+# 목적: 문장 유사도 근사 검색을 위한 MinHash 서명과 LSH 버킷을 계산한다.
+# 설명: 숫자를 0으로 바꾸고 소문자화한 문자 n-gram 집합의 MinHash 서명을 만들고,
+#       서명을 밴드로 나눠 해시한 버킷 값을 돌려준다. 버킷을 하나라도 공유하면 후보가 된다.
+# 디자인 패턴: 전략 패턴
+# 참조: firstsession/core/translate/memory/translation_memory.py
+
+"""MinHash/LSH 계산 모듈."""
+
+import hashlib
+import random
+import re
+
+# 2^61 - 1 (메르센 소수)
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_DIGITS = re.compile(r"\d")
+_SPACES = re.compile(r"\s+")
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    """문자 n-gram MinHash 서명과 LSH 밴드 버킷 계산기.
+
+    숫자만 다른 문장이 같은 후보로 모이도록 서명 전에 숫자를 모두 0으로 바꾼다.
+    """
+
+    def __init__(self, ngram_size: int = 3, num_perm: int = 64, bands: int = 16, seed: int = 1) -> None:
+        """계산기를 초기화한다.
+
+        Args:
+            ngram_size: 문자 n-gram 길이.
+            num_perm: MinHash 순열(해시 함수) 수.
+            bands: LSH 밴드 수. num_perm의 약수여야 한다.
+            seed: 해시 계수 생성 시드. 저장된 인덱스와 같은 값을 써야 한다.
+        """
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.ngram_size = max(1, ngram_size)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+
+    def normalize(self, text: str) -> str:
+        """유사도 비교용 정규화(소문자, 숫자 → 0, 공백 축약)."""
+        return _SPACES.sub(" ", _DIGITS.sub("0", text.lower())).strip()
+
+    def shingles(self, text: str) -> set[str]:
+        """정규화한 텍스트의 문자 n-gram 집합을 만든다."""
+        normalized = self.normalize(text)
+        if len(normalized) <= self.ngram_size:
+            return {normalized} if normalized else set()
+        size = self.ngram_size
+        return {normalized[index:index + size] for index in range(len(normalized) - size + 1)}
+
+    def signature(self, text: str) -> list[int]:
+        """MinHash 서명을 계산한다. 빈 텍스트는 빈 목록."""
+        hashes = [_hash64(shingle.encode("utf-8")) for shingle in self.shingles(text)]
+        if not hashes:
+            return []
+        return [
+            min((a * value + b) % _PRIME for value in hashes) & _MAX_HASH
+            for a, b in self._coefficients
+        ]
+
+    def buckets(self, text: str, namespace: str = "") -> list[int]:
+        """LSH 밴드별 버킷 값을 계산한다(SQLite INTEGER 범위의 부호 있는 64비트 정수).
+
+        Args:
+            text: 원문 문장.
+            namespace: 버킷을 분리할 이름공간(언어쌍 등).
+
+        Returns:
+            list[int]: 밴드 수만큼의 버킷 값. 빈 텍스트는 빈 목록.
+        """
+        signature = self.signature(text)
+        if not signature:
+            return []
+        buckets: list[int] = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            payload = f"{namespace}\x1f{band}\x1f" + ",".join(map(str, rows))
+            value = _hash64(payload.encode("utf-8"))
+            buckets.append(value - (1 << 64) if value >= (1 << 63) else value)
+        return buckets
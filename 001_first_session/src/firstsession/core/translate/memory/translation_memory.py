@@ -0,0 +1,309 @@
+# 목적: QC를 통과한 번역을 문장 단위로 저장하고 같은/비슷한 문장을 찾아 준다.
+# 설명: 정규화 문장 해시로 완전 일치를, MinHash LSH 버킷으로 퍼지 후보를 SQLite에서 조회한다.
+#       문장 쌍은 길이 비율로 정렬을 확인한 뒤에만 문장 단위로 저장하고, 그렇지 않으면 텍스트 전체를 한 쌍으로 저장한다.
+#       인덱스는 모두 디스크(SQLite)에 두므로 문장 수가 수백만이어도 메모리 사용량은 일정하다.
+# 디자인 패턴: 리포지토리 패턴 + 파사드
+# 참조: firstsession/core/translate/memory/min_hasher.py, firstsession/core/translate/nodes/memory_lookup_node.py
+
+"""번역 메모리 모듈."""
+
+import asyncio
+import difflib
+import hashlib
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+
+from firstsession.config.settings import MemorySettings
+from firstsession.core.translate.memory.min_hasher import MinHasher
+
+# 문장 경계(라틴 문장부호 뒤 공백, CJK 문장부호 뒤, 줄바꿈). 구분자는 원문 그대로 보존한다.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*|\s*\n\s*")
+_SPACES = re.compile(r"\s+")
+# 이 횟수만큼 저장할 때마다 상한 초과 여부를 확인한다.
+_PRUNE_INTERVAL = 1024
+# 짧은 문장은 길이 비율이 크게 흔들리므로 정렬 확인 시 이 글자 수만큼 여유를 둔다.
+_ALIGN_SLACK_CHARS = 8
+
+
+def split_segments(text: str) -> list[tuple[str, str]]:
+    """텍스트를 (문장, 뒤따르는 구분자) 목록으로 나눈다. 이어 붙이면 원문과 같다(앞뒤 공백 제외)."""
+    text = text.strip()
+    segments: list[tuple[str, str]] = []
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        if match.end() >= len(text) or match.start() <= start:
+            continue
+        segments.append((text[start:match.start()], match.group(0)))
+        start = match.end()
+    if start < len(text):
+        segments.append((text[start:], ""))
+    return segments
+
+
+@dataclass(frozen=True)
+class MemoryMatch:
+    """번역 메모리에서 찾은 문장 쌍."""
+
+    source: str
+    target: str
+    similarity: float
+
+
+@dataclass
+class MemoryLookup:
+    """텍스트 하나에 대한 번역 메모리 조회 결과."""
+
+    # 한 문장(또는 통째로 저장된 텍스트)이 완전 일치하면 저장된 번역, 아니면 None
+    translation: str | None = None
+    # 번역 프롬프트에 넣을 참고 문장 쌍(유사도 내림차순). 여러 문장의 완전 일치도 여기에 들어간다.
+    hints: list[MemoryMatch] = field(default_factory=list)
+    exact: int = 0
+    fuzzy: int = 0
+    missed: int = 0
+
+
+class TranslationMemory:
+    """SQLite에 영속화되는 문장 단위 번역 메모리."""
+
+    def __init__(
+        self,
+        path: str,
+        hasher: MinHasher | None = None,
+        min_similarity: float = 0.7,
+        max_hints: int = 3,
+        max_candidates: int = 20,
+        max_segments: int = 5_000_000,
+        max_segment_chars: int = 1000,
+        max_length_skew: float = 2.0,
+    ) -> None:
+        """번역 메모리를 초기화하고 테이블을 준비한다.
+
+        Args:
+            path: SQLite 파일 경로.
+            hasher: MinHash/LSH 계산기(저장된 인덱스와 같은 파라미터여야 한다).
+            min_similarity: 퍼지 일치로 인정할 최소 문장 유사도(0~1).
+            max_hints: 반환할 최대 참고 문장 수.
+            max_candidates: 문장 하나당 유사도를 직접 계산할 최대 후보 수.
+            max_segments: 보관할 최대 문장 수. 넘으면 오래된 문장부터 지운다.
+            max_segment_chars: 저장할 문장의 최대 길이.
+            max_length_skew: 문장 쌍의 길이 비율이 텍스트 전체 비율에서 벗어나도 되는 최대 배수.
+                넘는 쌍이 하나라도 있으면 문장 정렬이 어긋난 것으로 보고 문장 단위로 저장하지 않는다.
+        """
+        self.hasher = hasher or MinHasher()
+        self.min_similarity = min_similarity
+        self.max_hints = max_hints
+        self.max_candidates = max_candidates
+        self.max_segments = max_segments
+        self.max_segment_chars = max_segment_chars
+        self.max_length_skew = max_length_skew
+        self._inserts = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tm_segments ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, pair TEXT NOT NULL, source_hash TEXT NOT NULL, "
+                "source TEXT NOT NULL, target TEXT NOT NULL, UNIQUE (pair, source_hash))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tm_buckets ("
+                "bucket INTEGER NOT NULL, segment_id INTEGER NOT NULL, "
+                "PRIMARY KEY (bucket, segment_id)) WITHOUT ROWID"
+            )
+            self._conn.commit()
+
+    @classmethod
+    def from_settings(cls, settings: MemorySettings) -> "TranslationMemory | None":
+        """설정으로 번역 메모리를 생성한다. 비활성화된 경우 None을 반환한다."""
+        if not settings.enabled:
+            return None
+        return cls(
+            settings.sqlite_path,
+            hasher=MinHasher(ngram_size=settings.ngram_size, num_perm=settings.num_perm, bands=settings.bands),
+            min_similarity=settings.min_similarity,
+            max_hints=settings.max_hints,
+            max_candidates=settings.max_candidates,
+            max_segments=settings.max_segments,
+            max_segment_chars=settings.max_segment_chars,
+            max_length_skew=settings.max_length_skew,
+        )
+
+    def _pair(self, source_language: str, target_language: str) -> str:
+        return f"{source_language.strip().lower()}>{target_language.strip().lower()}"
+
+    def _exact_key(self, sentence: str) -> str:
+        normalized = _SPACES.sub(" ", sentence).strip()
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _similarity(self, left: str, right: str) -> float:
+        normalize = self.hasher.normalize
+        return difflib.SequenceMatcher(None, normalize(left), normalize(right), autojunk=False).ratio()
+
+    def _find_exact(self, pair: str, sentence: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT target FROM tm_segments WHERE pair = ? AND source_hash = ?",
+            (pair, self._exact_key(sentence)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _find_fuzzy(self, pair: str, sentence: str) -> MemoryMatch | None:
+        buckets = self.hasher.buckets(sentence, namespace=pair)
+        if not buckets:
+            return None
+        placeholders = ",".join("?" * len(buckets))
+        rows = self._conn.execute(
+            "SELECT s.source, s.target FROM tm_segments s JOIN ("
+            f"SELECT segment_id, COUNT(*) AS hits FROM tm_buckets WHERE bucket IN ({placeholders}) "
+            "GROUP BY segment_id ORDER BY hits DESC LIMIT ?"
+            ") c ON c.segment_id = s.id",
+            (*buckets, self.max_candidates),
+        ).fetchall()
+        best: MemoryMatch | None = None
+        for source, target in rows:
+            similarity = self._similarity(sentence, source)
+            if similarity >= self.min_similarity and (best is None or similarity > best.similarity):
+                best = MemoryMatch(source=source, target=target, similarity=round(similarity, 4))
+        return best
+
+    def lookup(self, text: str, source_language: str, target_language: str) -> MemoryLookup:
+        """텍스트를 문장으로 나눠 완전/퍼지 일치를 찾는다.
+
+        Args:
+            text: 정규화된 원문.
+            source_language: 원문 언어 코드.
+            target_language: 목표 언어 코드.
+
+        Returns:
+            MemoryLookup: 한 문장 입력이 완전 일치하면 저장된 번역, 아니면 참고 문장 쌍.
+                여러 문장을 이어 붙인 번역은 안전 분류/QC를 거치지 않은 조합이므로 참고 문장으로만 돌려준다.
+        """
+        pair = self._pair(source_language, target_language)
+        result = MemoryLookup()
+        matches: list[MemoryMatch] = []
+        segments = split_segments(text)
+        with self._lock:
+            for sentence, _ in segments:
+                target = self._find_exact(pair, sentence)
+                if target is not None:
+                    result.exact += 1
+                    matches.append(MemoryMatch(source=sentence, target=target, similarity=1.0))
+                    continue
+                match = self._find_fuzzy(pair, sentence)
+                if match is None:
+                    result.missed += 1
+                else:
+                    result.fuzzy += 1
+                    matches.append(match)
+        if len(segments) == 1 and result.exact == 1:
+            result.translation = matches[0].target.strip()
+            return result
+        # 같은 참고 문장이 여러 번 나오지 않게 하고 유사도가 높은 순으로 자른다.
+        unique = {match.source: match for match in matches}
+        result.hints = sorted(unique.values(), key=lambda match: match.similarity, reverse=True)[:self.max_hints]
+        return result
+
+    def add(self, text: str, translated_text: str, source_language: str, target_language: str) -> int:
+        """번역 결과를 문장 단위로 저장한다.
+
+        원문과 번역의 문장 수가 같고 문장별 길이 비율이 맞으면 문장별로,
+        아니면 텍스트 전체를 한 쌍으로 저장한다.
+
+        Args:
+            text: 정규화된 원문.
+            translated_text: QC를 통과한 번역.
+            source_language: 원문 언어 코드.
+            target_language: 목표 언어 코드.
+
+        Returns:
+            int: 새로 저장하거나 갱신한 문장 수.
+        """
+        sources = split_segments(text)
+        targets = split_segments(translated_text)
+        pairs = [(source, target) for (source, _), (target, _) in zip(sources, targets)]
+        if len(sources) != len(targets) or not self._aligned(pairs):
+            pairs = [(text.strip(), translated_text.strip())]
+        pairs = [
+            (source, target) for source, target in pairs
+            if source and target and len(source) <= self.max_segment_chars
+        ]
+        if not pairs:
+            return 0
+        pair = self._pair(source_language, target_language)
+        with self._lock:
+            for source, target in pairs:
+                self._upsert(pair, source, target)
+            self._conn.commit()
+            self._inserts += len(pairs)
+            if self._inserts >= _PRUNE_INTERVAL:
+                self._inserts = 0
+                self._prune()
+        return len(pairs)
+
+    def _aligned(self, pairs: list[tuple[str, str]]) -> bool:
+        """문장 쌍마다 번역 길이가 텍스트 전체 길이 비율로 기대한 길이에서 max_length_skew배 안에 드는지 확인한다."""
+        source_chars = sum(len(source) for source, _ in pairs)
+        target_chars = sum(len(target) for _, target in pairs)
+        if not source_chars or not target_chars:
+            return False
+        ratio = target_chars / source_chars
+        for source, target in pairs:
+            expected = len(source) * ratio
+            if not expected / self.max_length_skew - _ALIGN_SLACK_CHARS <= len(target) <= (
+                expected * self.max_length_skew + _ALIGN_SLACK_CHARS
+            ):
+                return False
+        return True
+
+    def _upsert(self, pair: str, source: str, target: str) -> None:
+        source_hash = self._exact_key(source)
+        row = self._conn.execute(
+            "SELECT id FROM tm_segments WHERE pair = ? AND source_hash = ?", (pair, source_hash)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("UPDATE tm_segments SET target = ? WHERE id = ?", (target, row[0]))
+            return
+        cursor = self._conn.execute(
+            "INSERT INTO tm_segments (pair, source_hash, source, target) VALUES (?, ?, ?, ?)",
+            (pair, source_hash, source, target),
+        )
+        segment_id = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO tm_buckets (bucket, segment_id) VALUES (?, ?)",
+            [(bucket, segment_id) for bucket in self.hasher.buckets(source, namespace=pair)],
+        )
+
+    def _prune(self) -> None:
+        """문장 수가 상한을 넘으면 가장 오래된 문장부터 상한의 90%까지 지운다."""
+        count = self._conn.execute("SELECT COUNT(*) FROM tm_segments").fetchone()[0]
+        if count <= self.max_segments:
+            return
+        excess = count - int(self.max_segments * 0.9)
+        self._conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS tm_evict (id INTEGER PRIMARY KEY)"
+        )
+        self._conn.execute("DELETE FROM tm_evict")
+        self._conn.execute("INSERT INTO tm_evict SELECT id FROM tm_segments ORDER BY id LIMIT ?", (excess,))
+        self._conn.execute("DELETE FROM tm_buckets WHERE segment_id IN (SELECT id FROM tm_evict)")
+        self._conn.execute("DELETE FROM tm_segments WHERE id IN (SELECT id FROM tm_evict)")
+        self._conn.commit()
+
+    async def alookup(self, text: str, source_language: str, target_language: str) -> MemoryLookup:
+        """비동기 경로에서 조회한다. SQLite I/O는 이벤트 루프 밖에서 수행한다."""
+        return await asyncio.to_thread(self.lookup, text, source_language, target_language)
+
+    async def aadd(self, text: str, translated_text: str, source_language: str, target_language: str) -> int:
+        """비동기 경로에서 저장한다."""
+        return await asyncio.to_thread(self.add, text, translated_text, source_language, target_language)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tm_segments").fetchone()[0]
+
+    def close(self) -> None:
+        """연결을 닫는다."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1 @@
+"""번역 메트릭 패키지."""
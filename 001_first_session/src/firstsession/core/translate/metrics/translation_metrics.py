@@ -0,0 +1,284 @@
+# 목적: 번역 그래프와 모델 호출의 메트릭을 정의한다.
+# 설명: 노드별 지연, 모델 호출/토큰 사용량, 재번역 반복 횟수 등을 기본 레지스트리에 등록한다.
+# 디자인 패턴: 레지스트리 + 데코레이터
+# 참조: firstsession/core/common/metrics/metrics_registry.py
+
+"""번역 메트릭 정의 모듈."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator
+
+from firstsession.core.common.metrics import registry
+from firstsession.core.translate.state.translation_state import TranslationState
+
+NODE_LATENCY = registry.histogram(
+    "translate_node_duration_seconds", "Time spent in each TranslateGraph node.", ("node",)
+)
+NODE_ERRORS = registry.counter(
+    "translate_node_errors_total", "Exceptions raised by TranslateGraph nodes.", ("node",)
+)
+REQUEST_LATENCY = registry.histogram(
+    "translate_request_duration_seconds", "End-to-end translation latency.", ("mode", "path")
+)
+MODEL_CALLS_PER_REQUEST = registry.histogram(
+    "translate_model_calls_per_request",
+    "Model calls made by one graph execution.",
+    ("path",),
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 12),
+)
+REQUESTS = registry.counter(
+    "translate_requests_total", "Translation requests by outcome.", ("mode", "outcome")
+)
+RETRY_ITERATIONS = registry.histogram(
+    "translate_retry_iterations", "Retry-loop iterations per request.", buckets=(0, 1, 2, 3, 5, 8)
+)
+SAFEGUARD_LABELS = registry.counter(
+    "translate_safeguard_labels_total", "Safeguard labels by decision source.", ("label", "source")
+)
+HEURISTIC_QC_HITS = registry.counter(
+    "translate_heuristic_qc_rule_hits_total", "Heuristic QC rule violations.", ("rule",)
+)
+QC_LLM_SKIPPED = registry.counter(
+    "translate_qc_llm_skipped_total", "Requests whose final QC verdict came from heuristics.", ()
+)
+MEMORY_SEGMENTS = registry.counter(
+    "translate_memory_segments_total",
+    "Translation-memory sentence lookups by match type (exact / fuzzy / miss).",
+    ("match",),
+)
+LANGUAGE_CHECKS = registry.counter(
+    "translate_language_checks_total",
+    "Local language identification results (auto_filled / same_language / mismatch / ...).",
+    ("result",),
+)
+SINGLE_CALL_OUTCOMES = registry.counter(
+    "translate_single_call_total",
+    "Single-call responses by parse outcome (strict / repaired / fallback).",
+    ("outcome",),
+)
+SINGLE_CALL_AGREEMENT = registry.counter(
+    "translate_single_call_agreement_total",
+    "Sampled single-call verdicts compared with the separate-call path.",
+    ("check", "result"),
+)
+SPECULATIVE_TRANSLATIONS = registry.counter(
+    "translate_speculative_total", "Speculative translations by outcome (adopted / failed / wasted).", ("outcome",)
+)
+SPECULATIVE_BRANCH_LATENCY = registry.histogram(
+    "translate_speculative_branch_duration_seconds",
+    "Duration of the parallel branches in speculative mode (safeguard / translate).",
+    ("branch",),
+)
+COALESCED_REQUESTS = registry.counter(
+    "translate_coalesced_requests_total",
+    "Requests by single-flight role (follower / (leader + follower) = coalescing ratio).",
+    ("mode", "role"),
+)
+TRANSLATE_JOBS = registry.counter(
+    "translate_jobs_total",
+    "Translation jobs by event (submitted / rejected / succeeded / failed / cancelled).",
+    ("event",),
+)
+TRANSLATE_JOB_QUEUE_WAIT = registry.histogram(
+    "translate_job_queue_wait_seconds", "Time a translation job waited in the queue before a worker picked it up.", ()
+)
+STREAM_TTFT = registry.histogram(
+    "translate_stream_ttft_seconds", "Time to first streamed token.", ()
+)
+MODEL_CALLS = registry.counter(
+    "model_calls_total", "Model calls by purpose and status.", ("model", "purpose", "status")
+)
+MODEL_LATENCY = registry.histogram(
+    "model_call_duration_seconds", "Model call latency.", ("model", "purpose")
+)
+MODEL_TOKENS = registry.counter(
+    "model_tokens_total", "Tokens reported by usage_metadata.", ("model", "purpose", "kind")
+)
+MODEL_RETRIES = registry.counter(
+    "model_retries_total", "Model call retries by reason (HTTP status or transport).", ("reason",)
+)
+MODEL_HEDGES = registry.counter(
+    "model_hedges_total",
+    "Hedged model calls by outcome (primary_won / hedge_won / budget_exhausted).",
+    ("purpose", "outcome"),
+)
+MODEL_ROUTES = registry.counter(
+    "model_routes_total",
+    "Model tier routing decisions by purpose, tier and reason (purpose / pair / short / long / default).",
+    ("purpose", "tier", "reason"),
+)
+MODEL_TIER_LATENCY = registry.histogram(
+    "model_tier_call_duration_seconds", "Routed model call latency by tier.", ("purpose", "tier", "status")
+)
+MODEL_LIMITER_WAIT = registry.histogram(
+    "model_limiter_wait_seconds", "Time spent waiting for a global model-call slot.", ("mode",)
+)
+
+# 그래프 실행 한 번의 모델 호출 수(run/arun이 설정하고 record_model_call이 증가시킨다)
+_MODEL_CALL_COUNTER: ContextVar[list[int] | None] = ContextVar("model_call_counter", default=None)
+
+# usage_metadata 필드 → 메트릭 kind 레이블
+_USAGE_FIELDS = {
+    "prompt_token_count": "prompt",
+    "candidates_token_count": "candidates",
+    "thoughts_token_count": "thoughts",
+    "cached_content_token_count": "cached",
+    "total_token_count": "total",
+}
+
+
+@contextmanager
+def count_model_calls() -> Iterator[list[int]]:
+    """블록 안에서 일어난 모델 호출 수를 센다. 병렬 분기/하위 그래프도 같은 카운터를 공유한다."""
+    counter = [0]
+    token = _MODEL_CALL_COUNTER.set(counter)
+    try:
+        yield counter
+    finally:
+        _MODEL_CALL_COUNTER.reset(token)
+
+
+def record_model_call(model: str, purpose: str, status: str, seconds: float, tier: str = "") -> None:
+    """모델 호출 한 번의 결과와 지연을 기록한다. 티어 라우팅을 거친 호출은 티어별 지연도 남긴다."""
+    MODEL_CALLS.inc(model=model, purpose=purpose, status=status)
+    MODEL_LATENCY.observe(seconds, model=model, purpose=purpose)
+    if tier:
+        MODEL_TIER_LATENCY.observe(seconds, purpose=purpose, tier=tier, status=status)
+    counter = _MODEL_CALL_COUNTER.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def record_model_route(purpose: str, tier: str, reason: str) -> None:
+    """모델 티어 라우팅 결정 하나를 기록한다."""
+    MODEL_ROUTES.inc(purpose=purpose, tier=tier, reason=reason)
+
+
+def record_single_call_agreement(check: str, agreed: bool) -> None:
+    """단일 호출 판정과 개별 호출 판정의 일치 여부를 기록한다(disagree / 전체 = 불일치율)."""
+    SINGLE_CALL_AGREEMENT.inc(check=check, result="agree" if agreed else "disagree")
+
+
+def record_model_usage(model: str, purpose: str, usage_metadata: Any) -> None:
+    """Gemini 응답의 usage_metadata 토큰 수를 기록한다."""
+    if usage_metadata is None:
+        return
+    for field_name, kind in _USAGE_FIELDS.items():
+        count = getattr(usage_metadata, field_name, None)
+        if count:
+            MODEL_TOKENS.inc(count, model=model, purpose=purpose, kind=kind)
+
+
+def record_memory_lookup(exact: int, fuzzy: int, missed: int) -> None:
+    """번역 메모리 조회 한 번의 문장별 일치 종류를 기록한다(exact / 전체 = 완전 일치율)."""
+    for match, count in (("exact", exact), ("fuzzy", fuzzy), ("miss", missed)):
+        if count:
+            MEMORY_SEGMENTS.inc(count, match=match)
+
+
+def record_language_check(result: str) -> None:
+    """로컬 언어 감지 결과 하나를 기록한다."""
+    LANGUAGE_CHECKS.inc(result=result)
+
+
+def _request_path(state: TranslationState) -> str:
+    single_call = state.get("single_call")
+    if single_call == "OK":
+        return "single_call"
+    if single_call == "FALLBACK":
+        return "single_call_fallback"
+    return "multi_node"
+
+
+def record_request(state: TranslationState, seconds: float, mode: str, model_calls: int | None = None) -> None:
+    """그래프 실행 한 번이 끝난 뒤 요청 단위 메트릭을 기록한다."""
+    path = _request_path(state)
+    REQUEST_LATENCY.observe(seconds, mode=mode, path=path)
+    if model_calls is not None:
+        MODEL_CALLS_PER_REQUEST.observe(model_calls, path=path)
+    target_results = state.get("target_results") or {}
+    language_check = state.get("language_check")
+    if language_check == "SAME_LANGUAGE":
+        outcome = "same_language"
+    elif language_check == "MISMATCH":
+        outcome = "language_mismatch"
+    elif state.get("cache_hit"):
+        outcome = "cache_hit"
+    elif state.get("memory_hit"):
+        outcome = "memory_hit"
+    elif state.get("safeguard_label") != "SAFE":
+        outcome = "blocked"
+    elif target_results:
+        passed = all(result.get("qc_passed") == "YES" for result in target_results.values())
+        outcome = "passed" if passed else "qc_failed"
+    elif state.get("qc_passed") == "YES":
+        outcome = "passed"
+    else:
+        outcome = "qc_failed"
+    REQUESTS.inc(mode=mode, outcome=outcome)
+    for branch, field_name in (("safeguard", "safeguard_latency_ms"), ("translate", "speculative_latency_ms")):
+        latency_ms = state.get(field_name)
+        if latency_ms:
+            SPECULATIVE_BRANCH_LATENCY.observe(latency_ms / 1000, branch=branch)
+    if outcome in ("same_language", "language_mismatch", "cache_hit", "memory_hit"):
+        return
+
+    if state.get("preclassify_label") and state.get("safeguard_llm_skipped") and not state.get("safeguard_cached"):
+        # PII 규칙 일치는 힌트일 뿐이므로 LLM/캐시가 판정한 경우는 각 출처로 센다.
+        source = "preclassify"
+    elif state.get("safeguard_cached"):
+        source = "cache"
+    else:
+        source = "llm"
+    SAFEGUARD_LABELS.inc(label=str(state.get("safeguard_label", "")), source=source)
+    if outcome == "blocked":
+        if state.get("speculative_wasted"):
+            SPECULATIVE_TRANSLATIONS.inc(outcome="wasted")
+        return
+
+    if state.get("speculative_adopted"):
+        SPECULATIVE_TRANSLATIONS.inc(outcome="adopted")
+    elif state.get("speculative_latency_ms"):
+        # 추측 번역이 실패해 일반 번역 경로로 다시 번역한 경우
+        SPECULATIVE_TRANSLATIONS.inc(outcome="failed")
+    if target_results:
+        for result in target_results.values():
+            RETRY_ITERATIONS.observe(int(result.get("retry_count", 0) or 0))
+    else:
+        RETRY_ITERATIONS.observe(int(state.get("retry_count", 0) or 0))
+    hits = [result.get("heuristic_qc_hits") or {} for result in target_results.values()]
+    for rule_hits in hits or [state.get("heuristic_qc_hits") or {}]:
+        for rule, count in rule_hits.items():
+            HEURISTIC_QC_HITS.inc(count, rule=rule)
+    if state.get("qc_llm_skipped"):
+        QC_LLM_SKIPPED.inc()
+
+
+def timed(name: str, func: Callable) -> Callable:
+    """동기 노드 함수를 감싸 실행 시간과 예외를 기록한다."""
+    def wrapper(state):
+        started = time.perf_counter()
+        try:
+            return func(state)
+        except Exception:
+            NODE_ERRORS.inc(node=name)
+            raise
+        finally:
+            NODE_LATENCY.observe(time.perf_counter() - started, node=name)
+    return wrapper
+
+
+def atimed(name: str, func: Callable) -> Callable:
+    """비동기 노드 함수를 감싸 실행 시간과 예외를 기록한다."""
+    async def wrapper(state):
+        started = time.perf_counter()
+        try:
+            return await func(state)
+        except Exception:
+            NODE_ERRORS.inc(node=name)
+            raise
+        finally:
+            NODE_LATENCY.observe(time.perf_counter() - started, node=name)
+    return wrapper
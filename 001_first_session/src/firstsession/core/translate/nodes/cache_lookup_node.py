@@ -0,0 +1,73 @@
+# 목적: 캐시된 번역 결과를 조회하는 노드를 정의한다.
+# 설명: QC를 통과한 번역이 캐시에 있으면 안전 분류/번역/QC를 건너뛰도록 상태를 채운다.
+# 디자인 패턴: 캐시 어사이드 + 파이프라인 노드
+# 참조: firstsession/core/translate/cache/translation_cache.py
+
+"""번역 캐시 조회 노드 모듈."""
+
+from typing import Callable
+
+from firstsession.core.translate.cache.translation_cache import TranslationCache
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class CacheLookupNode:
+    """번역 캐시 조회를 담당하는 노드."""
+    def __init__(
+        self,
+        cache: TranslationCache | None,
+        model_name: str,
+        model_selector: Callable[[TranslationState], str] | None = None,
+    ) -> None:
+        self.cache = cache
+        self.model_name = model_name
+        # 모델 티어 라우팅을 쓰면 요청마다 번역 모델이 달라지므로 키에 실제 모델을 넣는다.
+        self.model_selector = model_selector
+
+    def _key(self, state: TranslationState) -> str:
+        return self.cache.translation_key(
+            state.get("normalized_text", ""),
+            state.get("source_language", ""),
+            state.get("target_language", ""),
+            self.model_selector(state) if self.model_selector else self.model_name,
+        )
+
+    def _apply_hit(self, state: TranslationState, cached: dict | None) -> TranslationState:
+        if not cached or not cached.get("translated_text"):
+            state["cache_hit"] = False
+            return state
+        state["cache_hit"] = True
+        state["translated_text"] = cached["translated_text"]
+        state["safeguard_label"] = "SAFE"
+        state["qc_passed"] = "YES"
+        state["can_retry"] = False
+        state["error"] = ""
+        return state
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """캐시된 번역을 조회한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: cache_hit과 (적중 시) 번역 결과가 포함된 상태.
+        """
+        if self.cache is None or not state.get("normalized_text"):
+            state["cache_hit"] = False
+            return state
+        return self._apply_hit(state, self.cache.get(self._key(state)))
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """캐시된 번역을 비동기로 조회한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: cache_hit과 (적중 시) 번역 결과가 포함된 상태.
+        """
+        if self.cache is None or not state.get("normalized_text"):
+            state["cache_hit"] = False
+            return state
+        return self._apply_hit(state, await self.cache.aget(self._key(state)))
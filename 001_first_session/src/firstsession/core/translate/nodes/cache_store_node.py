@@ -0,0 +1,68 @@
+# 목적: QC를 통과한 번역 결과를 캐시에 저장하는 노드를 정의한다.
+# 설명: 안전 분류 SAFE + QC YES인 결과만 저장해 검증된 번역만 재사용되도록 한다.
+# 디자인 패턴: 캐시 어사이드 + 파이프라인 노드
+# 참조: firstsession/core/translate/cache/translation_cache.py
+
+"""번역 캐시 저장 노드 모듈."""
+
+from typing import Callable
+
+from firstsession.core.translate.cache.translation_cache import TranslationCache
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class CacheStoreNode:
+    """번역 캐시 저장을 담당하는 노드."""
+    def __init__(
+        self,
+        cache: TranslationCache | None,
+        model_name: str,
+        model_selector: Callable[[TranslationState], str] | None = None,
+    ) -> None:
+        self.cache = cache
+        self.model_name = model_name
+        # 모델 티어 라우팅을 쓰면 요청마다 번역 모델이 달라지므로 키에 실제 모델을 넣는다.
+        self.model_selector = model_selector
+
+    def _should_store(self, state: TranslationState) -> bool:
+        return (
+            self.cache is not None
+            and not state.get("cache_hit", False)
+            and state.get("safeguard_label") == "SAFE"
+            and state.get("qc_passed") == "YES"
+            and bool(state.get("translated_text"))
+        )
+
+    def _key(self, state: TranslationState) -> str:
+        return self.cache.translation_key(
+            state.get("normalized_text", ""),
+            state.get("source_language", ""),
+            state.get("target_language", ""),
+            self.model_selector(state) if self.model_selector else self.model_name,
+        )
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """QC를 통과한 번역을 캐시에 저장한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 변경 없는 상태.
+        """
+        if self._should_store(state):
+            self.cache.set(self._key(state), {"translated_text": state["translated_text"]})
+        return state
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """QC를 통과한 번역을 비동기로 캐시에 저장한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 변경 없는 상태.
+        """
+        if self._should_store(state):
+            await self.cache.aset(self._key(state), {"translated_text": state["translated_text"]})
+        return state
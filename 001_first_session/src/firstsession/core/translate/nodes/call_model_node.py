@@ -6,9 +6,16 @@
 """모델 호출 노드 모듈."""
 
 from dataclasses import dataclass
-from google import genai
-import os
+from typing import AsyncIterator
+import time
 
+from firstsession.core.translate.client.gemini_client import GeminiClient, default_client
+from firstsession.core.translate.client.model_router import ModelRouter, RouteDecision
+from firstsession.core.translate.metrics.translation_metrics import (
+    record_model_call,
+    record_model_route,
+    record_model_usage,
+)
 from firstsession.core.translate.state.translation_state import TranslationState
 
 @dataclass(frozen=True)
@@ -20,30 +27,106 @@ class CallModelConfig:
 
 class CallModelNode:
     """모델 호출을 담당하는 노드."""
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        purpose: str = "default",
+        client: GeminiClient | None = None,
+        router: ModelRouter | None = None,
+    ) -> None:
+        """모델 호출 노드를 초기화한다.
+
+        Args:
+            purpose: 메트릭 레이블로 쓰는 호출 목적(translate/quality_check/safeguard 등).
+            client: 공유 모델 클라이언트(기본값: 프로세스 기본 클라이언트).
+            router: 호출마다 모델 티어를 고르는 라우터(없으면 config.model_name 고정).
+        """
         self.config = CallModelConfig()
-        self.client = None
+        self.purpose = purpose
+        self.client = client
+        self.router = router
 
-    def _get_client(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("API KEY 환경변수가 설정되지 않았습니다.")
-        
+    def _get_client(self) -> GeminiClient:
+        # 노드마다 클라이언트를 만들지 않고 커넥션 풀/호출 제한을 공유한다.
         if self.client is None:
-            self.client = genai.Client(api_key=api_key)
+            self.client = default_client()
         return self.client
 
-    def _call_model(self, prompt: str) -> str:
-        client = self._get_client()
-        response = client.models.generate_content(
-            model  = self.config.model_name,
+    def route(self, state: TranslationState) -> RouteDecision:
+        """원문 길이/언어쌍/호출 목적으로 이번 호출에 쓸 모델을 고른다."""
+        if self.router is None:
+            return RouteDecision(tier="", model=self.config.model_name, reason="")
+        return self.router.select(
+            self.purpose,
+            len(str(state.get("normalized_text", ""))),
+            str(state.get("source_language", "")),
+            str(state.get("target_language", "")),
+        )
+
+    def model_for(self, state: TranslationState) -> str:
+        """상태에 대해 호출할 모델 이름(캐시 키 등에 사용)."""
+        return self.route(state).model
+
+    def _select(self, state: TranslationState) -> RouteDecision:
+        decision = self.route(state)
+        if decision.tier:
+            record_model_route(self.purpose, decision.tier, decision.reason)
+        return decision
+
+    def _call_model(self, prompt: str, route: RouteDecision) -> str:
+        response = self._get_client().generate_content(
+            model = route.model,
             contents = str(prompt),
-            config = {
-                "temperature": self.config.temperature,
-            },
+            temperature = self.config.temperature,
         )
+        record_model_usage(route.model, self.purpose, getattr(response, "usage_metadata", None))
         return response.text
-    
+
+    async def _acall_model(self, prompt: str, route: RouteDecision) -> str:
+        client = self._get_client()
+
+        def call():
+            return client.agenerate_content(
+                model = route.model,
+                contents = str(prompt),
+                temperature = self.config.temperature,
+            )
+
+        # 헤지 정책이 있으면 느린 호출에 한해 같은 요청을 한 번 더 보내고 먼저 끝난 응답을 쓴다.
+        # 티어마다 지연 분포가 다르므로 티어별로 기준 지연을 따로 잡는다.
+        hedge = getattr(client, "hedge", None)
+        hedge_key = f"{self.purpose}:{route.tier}" if route.tier else self.purpose
+        response = await (hedge.arun(hedge_key, call) if hedge is not None else call())
+        record_model_usage(route.model, self.purpose, getattr(response, "usage_metadata", None))
+        return response.text
+
+    async def _astream_model(self, prompt: str, route: RouteDecision) -> AsyncIterator[str]:
+        stream = self._get_client().agenerate_content_stream(
+            model = route.model,
+            contents = str(prompt),
+            temperature = self.config.temperature,
+        )
+        usage_metadata = None
+        async for chunk in stream:
+            # 사용량은 마지막 조각에 누적값으로 실린다.
+            usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
+            if chunk.text:
+                yield chunk.text
+        record_model_usage(route.model, self.purpose, usage_metadata)
+
+    def _record_call(self, route: RouteDecision, status: str, started: float) -> None:
+        record_model_call(route.model, self.purpose, status, time.perf_counter() - started, tier=route.tier)
+
+    def _apply_output(self, state: TranslationState, model_output: str) -> TranslationState:
+        """모델 응답을 상태에 기록한다."""
+        if not model_output:
+            state["error"] = "모델 응답이 비어있습니다."
+            state["model_output"] = ""
+            return state
+
+        state["model_output"] = model_output
+        state.pop("error", None)
+        return state
+
     def run(self, state: TranslationState) -> TranslationState:
         """프롬프트를 기반으로 번역 결과를 생성한다.
 
@@ -61,18 +144,73 @@ class CallModelNode:
             state["model_output"] = ""
             return state
     
+        route = self._select(state)
+        started = time.perf_counter()
         try:
-            model_output = self._call_model(str(prompt))
-            if not model_output:
-                state["error"] = "모델 응답이 비어있습니다."
-                state["model_output"] = ""
-                return state
-            
-            state["model_output"] = model_output
-            state.pop("error", None)
+            model_output = self._call_model(str(prompt), route)
+        except Exception as e:
+            self._record_call(route, "error", started)
+            state["error"] = f"모델 호출 실패: {e}"
+            state["model_output"] = ""
+            return state
+        self._record_call(route, "ok", started)
+        return self._apply_output(state, model_output)
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """비동기 클라이언트(client.aio)로 번역 결과를 생성한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 번역 결과가 포함된 상태.
+        """
+        prompt = state.get("prompt")
+        if not prompt or not str(prompt).strip():
+            state["error"] = "모델에 전달할 텍스트가 비어 있습니다."
+            state["model_output"] = ""
             return state
 
+        route = self._select(state)
+        started = time.perf_counter()
+        try:
+            model_output = await self._acall_model(str(prompt), route)
         except Exception as e:
+            self._record_call(route, "error", started)
             state["error"] = f"모델 호출 실패: {e}"
             state["model_output"] = ""
             return state
+        self._record_call(route, "ok", started)
+        return self._apply_output(state, model_output)
+
+    async def astream(self, state: TranslationState) -> AsyncIterator[str]:
+        """스트리밍 API(generate_content_stream)로 응답 조각을 받는 대로 반환한다.
+
+        스트림이 끝나면 전체 응답을 model_output에 기록한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Yields:
+            str: 모델 응답 조각.
+        """
+        prompt = state.get("prompt")
+        if not prompt or not str(prompt).strip():
+            state["error"] = "모델에 전달할 텍스트가 비어 있습니다."
+            state["model_output"] = ""
+            return
+
+        parts: list[str] = []
+        route = self._select(state)
+        started = time.perf_counter()
+        try:
+            async for delta in self._astream_model(str(prompt), route):
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            self._record_call(route, "error", started)
+            state["error"] = f"모델 호출 실패: {e}"
+            state["model_output"] = ""
+            return
+        self._record_call(route, "ok", started)
+        self._apply_output(state, "".join(parts))
@@ -0,0 +1,196 @@
+# 목적: LLM 품질 검사 전에 규칙 기반으로 번역 결과를 검사한다.
+# 설명: 빈 출력/문자 체계 불일치/숫자·URL·플레이스홀더 누락/길이 비율 이상을 LLM 호출 없이 판정한다.
+# 디자인 패턴: 전략 패턴 + 파이프라인 노드
+# 참조: firstsession/core/translate/nodes/quality_check_node.py
+
+"""규칙 기반 번역 품질 검사 노드 모듈."""
+
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+
+from firstsession.core.translate.const.language_scripts import LANGUAGE_SCRIPTS
+from firstsession.core.translate.state.translation_state import TranslationState
+
+_URL_PATTERN = re.compile(r"https?://[^\s<>\"'()\[\]]+|[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+_PLACEHOLDER_PATTERN = re.compile(
+    r"\{\{\s*[\w.]+\s*\}\}"      # {{name}}
+    r"|\{[\w.]*\}"               # {name}, {0}, {}
+    r"|%\(\w+\)[sdif]"           # %(name)s
+    r"|%[sdif]"                  # %s
+    r"|\$\{\w+\}"                # ${name}
+    r"|</?[A-Za-z][\w-]*[^<>]*>" # <b>, </a>
+    r"|\[\[\d+\]\]"              # 배치 묶음 마커
+)
+# \d는 아랍-인도 숫자(٢٠٢٤)나 전각 숫자(２０２４)도 잡으므로 비교 전에 _number_digits로 ASCII 숫자열로 바꾼다.
+_NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+def _number_digits(token: str) -> str:
+    """숫자 토큰에서 구분 기호를 빼고 모든 숫자 체계의 숫자를 ASCII 숫자열로 바꾼다(٢٠٢٤ → 2024)."""
+    return "".join(str(unicodedata.decimal(char)) for char in token if char.isdecimal())
+
+
+class HeuristicQcRule(Enum):
+    """규칙 이름."""
+    EMPTY_OUTPUT = "empty_output"
+    WRONG_SCRIPT = "wrong_script"
+    NUMBERS_NOT_PRESERVED = "numbers_not_preserved"
+    URLS_NOT_PRESERVED = "urls_not_preserved"
+    PLACEHOLDERS_NOT_PRESERVED = "placeholders_not_preserved"
+    LENGTH_RATIO = "length_ratio"
+    UNTRANSLATED = "untranslated"
+
+
+class HeuristicQcResult(Enum):
+    """규칙 검사 결과."""
+    PASS = "PASS"
+    FAIL = "FAIL"
+    UNSURE = "UNSURE"
+
+
+class SkipLlmPolicy(Enum):
+    """규칙 검사 통과 시 LLM QC 생략 정책."""
+    NEVER = "never"
+    SHORT = "short"
+    ALWAYS = "always"
+
+
+@dataclass(frozen=True)
+class HeuristicQcConfig:
+    """규칙 기반 QC 설정 담당"""
+    enabled: bool = True
+    skip_llm_policy: str = SkipLlmPolicy.NEVER.value
+    skip_llm_max_length: int = 200
+    min_length_ratio: float = 0.2
+    max_length_ratio: float = 5.0
+    length_ratio_min_chars: int = 20
+    min_script_ratio: float = 0.3
+    script_min_letters: int = 4
+
+
+class HeuristicQcNode:
+    """규칙 기반 번역 품질 검사를 담당하는 노드."""
+    def __init__(self, config: HeuristicQcConfig | None = None) -> None:
+        self.config = config or HeuristicQcConfig()
+        self.skip_llm_policy = SkipLlmPolicy(self.config.skip_llm_policy.strip().lower())
+
+    def _missing(self, pattern: re.Pattern[str], source: str, translated: str, normalize=None) -> bool:
+        """원문의 토큰이 번역문에 같은 개수 이상 남아 있는지 확인한다."""
+        normalize = normalize or (lambda token: token)
+        expected = Counter(normalize(m.group(0)) for m in pattern.finditer(source))
+        if not expected:
+            return False
+        actual = Counter(normalize(m.group(0)) for m in pattern.finditer(translated))
+        return any(actual[token] < count for token, count in expected.items())
+
+    def _wrong_script(self, target_language: str, translated: str) -> bool | None:
+        """목표 언어 문자 비율이 낮으면 True. 판단할 수 없으면 None."""
+        script = LANGUAGE_SCRIPTS.get(target_language)
+        if script is None:
+            return None
+        letters = [char for char in translated if char.isalpha()]
+        if len(letters) < self.config.script_min_letters:
+            return None
+        matched = sum(1 for char in letters if script.match(char))
+        return matched / len(letters) < self.config.min_script_ratio
+
+    def _length_ratio_violated(self, source: str, translated: str) -> bool:
+        if len(source) < self.config.length_ratio_min_chars:
+            return False
+        ratio = len(translated) / len(source)
+        return not (self.config.min_length_ratio <= ratio <= self.config.max_length_ratio)
+
+    def check(self, source: str, translated: str, source_language: str, target_language: str) -> tuple[HeuristicQcResult, list[str]]:
+        """번역 결과를 규칙으로 검사한다.
+
+        Args:
+            source: 정규화된 원문.
+            translated: 번역 결과.
+            source_language: 원문 언어 코드.
+            target_language: 목표 언어 코드.
+
+        Returns:
+            tuple[HeuristicQcResult, list[str]]: (검사 결과, 위반한 규칙 이름 목록).
+        """
+        if not translated.strip():
+            return HeuristicQcResult.FAIL, [HeuristicQcRule.EMPTY_OUTPUT.value]
+
+        violations: list[str] = []
+        wrong_script = self._wrong_script(target_language, translated)
+        if wrong_script:
+            violations.append(HeuristicQcRule.WRONG_SCRIPT.value)
+        if self._missing(_NUMBER_PATTERN, source, translated, normalize=_number_digits):
+            violations.append(HeuristicQcRule.NUMBERS_NOT_PRESERVED.value)
+        if self._missing(_URL_PATTERN, source, translated, normalize=lambda token: token.rstrip(".,;:!?")):
+            violations.append(HeuristicQcRule.URLS_NOT_PRESERVED.value)
+        if self._missing(_PLACEHOLDER_PATTERN, source, translated):
+            violations.append(HeuristicQcRule.PLACEHOLDERS_NOT_PRESERVED.value)
+        if self._length_ratio_violated(source, translated):
+            violations.append(HeuristicQcRule.LENGTH_RATIO.value)
+        if (
+            source_language != target_language
+            and len(source) >= self.config.length_ratio_min_chars
+            and translated.strip() == source.strip()
+        ):
+            violations.append(HeuristicQcRule.UNTRANSLATED.value)
+
+        if violations:
+            return HeuristicQcResult.FAIL, violations
+        # 문자 체계를 확인할 수 없는 언어는 확신할 수 없으므로 LLM QC에 맡긴다.
+        if wrong_script is None:
+            return HeuristicQcResult.UNSURE, []
+        return HeuristicQcResult.PASS, []
+
+    def _skip_llm(self, source: str) -> bool:
+        if self.skip_llm_policy == SkipLlmPolicy.ALWAYS:
+            return True
+        if self.skip_llm_policy == SkipLlmPolicy.SHORT:
+            return len(source) <= self.config.skip_llm_max_length
+        return False
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """번역 결과를 규칙으로 검사하고 결과를 상태에 기록한다.
+
+        위반이 있으면 qc_passed를 NO로 확정해 LLM QC 없이 retry_gate로 보내고,
+        정책상 확신할 수 있는 통과이면 qc_passed를 YES로 확정한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: heuristic_qc/heuristic_qc_rules/heuristic_qc_hits/qc_llm_skipped가 포함된 상태.
+        """
+        state["heuristic_qc"] = ""
+        state["heuristic_qc_rules"] = []
+        state["qc_llm_skipped"] = False
+        if not self.config.enabled:
+            return state
+
+        source = str(state.get("normalized_text", ""))
+        translated = str(state.get("translated_text", "") or "")
+        result, violations = self.check(
+            source,
+            translated,
+            state.get("source_language", ""),
+            state.get("target_language", ""),
+        )
+        state["heuristic_qc"] = result.value
+        state["heuristic_qc_rules"] = violations
+        # 재번역 루프 전체에 걸친 규칙별 적중 횟수
+        hits = dict(state.get("heuristic_qc_hits") or {})
+        for rule in violations:
+            hits[rule] = hits.get(rule, 0) + 1
+        state["heuristic_qc_hits"] = hits
+
+        if result == HeuristicQcResult.FAIL:
+            state["qc_passed"] = "NO"
+            state["qc_llm_skipped"] = True
+            state["error"] = f"품질 규칙 검사를 통과하지 못했습니다: {', '.join(violations)}"
+        elif result == HeuristicQcResult.PASS and self._skip_llm(source):
+            state["qc_passed"] = "YES"
+            state["qc_llm_skipped"] = True
+            state.pop("error", None)
+        return state
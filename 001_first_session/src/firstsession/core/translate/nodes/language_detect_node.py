@@ -0,0 +1,124 @@
+# 목적: 입력 텍스트의 언어를 로컬에서 감지해 원문 언어를 채우거나 번역을 건너뛴다.
+# 설명: 원문 언어가 비어 있으면 감지 언어로 채우고, 이미 목표 언어로 작성된 입력은 원문을 그대로 응답하며,
+#       선언한 원문 언어와 감지 언어가 다르면 정책에 따라 무시/교체하거나 LLM 호출 없이 오류로 처리한다.
+#       한자만으로 된 입력은 중국어/일본어/한국어 한자 표기를 구분할 수 없으므로 선언한 언어와 어긋나도 불일치로 보지 않는다.
+# 디자인 패턴: 전략 패턴 + 파이프라인 노드
+# 참조: firstsession/core/translate/language/language_identifier.py, firstsession/core/translate/graphs/translate_graph.py
+
+"""언어 감지 노드 모듈."""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from firstsession.core.translate.language.language_identifier import LanguageGuess, LanguageIdentifier
+from firstsession.core.translate.metrics.translation_metrics import record_language_check
+from firstsession.core.translate.state.translation_state import TranslationState
+
+# 원문 언어를 모른다는 뜻으로 받는 값
+_AUTO_LANGUAGES = frozenset({"", "auto"})
+# 한자만으로 쓸 수 있는 언어(가나/한글 없이 한자만 있으면 셋 중 무엇인지 알 수 없다)
+_HAN_LANGUAGES = frozenset({"zh", "ja", "ko"})
+
+
+class LanguageCheck(Enum):
+    """언어 감지 결과에 따른 처리."""
+
+    AUTO_FILLED = "AUTO_FILLED"
+    MATCHED = "MATCHED"
+    SAME_LANGUAGE = "SAME_LANGUAGE"
+    MISMATCH = "MISMATCH"
+    CORRECTED = "CORRECTED"
+    IGNORED = "IGNORED"
+    UNKNOWN = "UNKNOWN"
+
+
+@dataclass(frozen=True)
+class LanguageDetectConfig:
+    """언어 감지 설정 담당"""
+    enabled: bool = True
+    min_letters: int = 12
+    min_confidence: float = 0.8
+    # ignore | correct | reject
+    mismatch_policy: str = "ignore"
+    # reject/correct는 신뢰도가 이 값 이상일 때만 적용한다(그 아래는 ignore).
+    mismatch_min_confidence: float = 0.95
+
+
+class LanguageDetectNode:
+    """언어 감지를 담당하는 노드."""
+    def __init__(self, config: LanguageDetectConfig | None = None) -> None:
+        self.config = config or LanguageDetectConfig()
+        self.identifier = LanguageIdentifier(min_letters=self.config.min_letters)
+
+    def _check(self, state: TranslationState, guess: LanguageGuess) -> LanguageCheck:
+        """감지 언어와 요청 언어를 비교해 처리 방법을 정한다."""
+        source_language = state.get("source_language", "")
+        han_only = guess.script == "han"
+        # 한자만 있는 입력은 선언한 원문 언어(ja/ko)의 한자 표기일 수 있으므로 그대로 믿는다.
+        if han_only and source_language in _HAN_LANGUAGES:
+            return LanguageCheck.MATCHED
+        # 다중 목표 언어 요청은 언어별 하위 그래프가 번역하므로 원문 언어만 확인한다.
+        if not state.get("target_languages") and guess.language == state.get("target_language"):
+            return LanguageCheck.SAME_LANGUAGE
+        if source_language in _AUTO_LANGUAGES:
+            return LanguageCheck.AUTO_FILLED
+        if source_language == guess.language:
+            return LanguageCheck.MATCHED
+        if guess.confidence < self.config.mismatch_min_confidence:
+            return LanguageCheck.IGNORED
+        if self.config.mismatch_policy == "correct":
+            return LanguageCheck.CORRECTED
+        if self.config.mismatch_policy == "reject":
+            return LanguageCheck.MISMATCH
+        return LanguageCheck.IGNORED
+
+    def _apply(self, state: TranslationState, check: LanguageCheck, detected: str) -> TranslationState:
+        if check == LanguageCheck.MISMATCH:
+            state["translated_text"] = ""
+            state["qc_passed"] = "NO"
+            state["can_retry"] = False
+            state["error"] = (
+                f"요청한 원문 언어({state.get('source_language', '')})와 "
+                f"입력 텍스트의 언어({detected})가 다릅니다."
+            )
+            return state
+        if check in (LanguageCheck.SAME_LANGUAGE, LanguageCheck.AUTO_FILLED, LanguageCheck.CORRECTED):
+            state["source_language"] = detected
+        if check == LanguageCheck.SAME_LANGUAGE:
+            # 번역할 필요가 없으므로 정규화된 원문을 그대로 응답한다.
+            state["translated_text"] = state.get("normalized_text", "")
+            state["safeguard_label"] = "SAFE"
+            state["qc_passed"] = "YES"
+            state["can_retry"] = False
+            state["error"] = ""
+        return state
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """입력 텍스트의 언어를 감지하고 처리 방법을 기록한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: detected_language/language_confidence/language_check가 포함된 상태.
+        """
+        state["detected_language"] = ""
+        state["language_confidence"] = 0.0
+        state["language_check"] = ""
+        normalized_text = str(state.get("normalized_text", ""))
+        # 묶음 입력은 항목마다 언어가 다를 수 있으므로 전체를 한 언어로 판정해 건너뛰거나 거부하지 않는다.
+        if not self.config.enabled or not normalized_text or state.get("packed"):
+            return state
+
+        guess = self.identifier.detect(normalized_text)
+        state["detected_language"] = guess.language
+        state["language_confidence"] = round(guess.confidence, 3)
+        if not guess.language or guess.confidence < self.config.min_confidence:
+            check = LanguageCheck.UNKNOWN
+        else:
+            check = self._check(state, guess)
+        state["language_check"] = check.value
+        record_language_check(check.value.lower())
+        if check in (LanguageCheck.UNKNOWN, LanguageCheck.IGNORED):
+            return state
+        return self._apply(state, check, guess.language)
@@ -0,0 +1,70 @@
+# 목적: 번역 메모리에서 같은/비슷한 문장을 찾는 노드를 정의한다.
+# 설명: 한 문장 입력(또는 통째로 저장된 텍스트)이 완전 일치하면 저장된 번역으로 안전 분류/번역/QC를 건너뛰고,
+#       아니면(여러 문장의 완전 일치 포함) 승인된 번역을 번역 프롬프트 참고 예시로 상태에 남긴다.
+# 디자인 패턴: 캐시 어사이드 + 파이프라인 노드
+# 참조: firstsession/core/translate/memory/translation_memory.py, firstsession/core/translate/nodes/translate_node.py
+
+"""번역 메모리 조회 노드 모듈."""
+
+from dataclasses import asdict
+
+from firstsession.core.translate.memory.translation_memory import MemoryLookup, TranslationMemory
+from firstsession.core.translate.metrics.translation_metrics import record_memory_lookup
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class MemoryLookupNode:
+    """번역 메모리 조회를 담당하는 노드."""
+    def __init__(self, memory: TranslationMemory | None) -> None:
+        self.memory = memory
+
+    def _skip(self, state: TranslationState) -> bool:
+        state["memory_hit"] = False
+        state["memory_hints"] = []
+        return self.memory is None or not state.get("normalized_text")
+
+    def _apply(self, state: TranslationState, lookup: MemoryLookup) -> TranslationState:
+        record_memory_lookup(lookup.exact, lookup.fuzzy, lookup.missed)
+        if lookup.translation:
+            state["memory_hit"] = True
+            state["translated_text"] = lookup.translation
+            state["safeguard_label"] = "SAFE"
+            state["qc_passed"] = "YES"
+            state["can_retry"] = False
+            state["error"] = ""
+            return state
+        state["memory_hints"] = [asdict(match) for match in lookup.hints]
+        return state
+
+    def _args(self, state: TranslationState) -> tuple[str, str, str]:
+        return (
+            state.get("normalized_text", ""),
+            state.get("source_language", ""),
+            state.get("target_language", ""),
+        )
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """번역 메모리를 조회한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: memory_hit과 (적중 시) 번역 결과 또는 memory_hints가 포함된 상태.
+        """
+        if self._skip(state):
+            return state
+        return self._apply(state, self.memory.lookup(*self._args(state)))
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """번역 메모리를 비동기로 조회한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: memory_hit과 (적중 시) 번역 결과 또는 memory_hints가 포함된 상태.
+        """
+        if self._skip(state):
+            return state
+        return self._apply(state, await self.memory.alookup(*self._args(state)))
@@ -0,0 +1,67 @@
+# 목적: QC를 통과한 번역을 번역 메모리에 문장 단위로 저장하는 노드를 정의한다.
+# 설명: 안전 분류 SAFE + QC YES이고 캐시/메모리에서 가져온 결과가 아닐 때만 저장한다.
+# 디자인 패턴: 캐시 어사이드 + 파이프라인 노드
+# 참조: firstsession/core/translate/memory/translation_memory.py
+
+"""번역 메모리 저장 노드 모듈."""
+
+from firstsession.core.translate.memory.translation_memory import TranslationMemory
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class MemoryStoreNode:
+    """번역 메모리 저장을 담당하는 노드."""
+    def __init__(self, memory: TranslationMemory | None) -> None:
+        self.memory = memory
+
+    def _should_store(self, state: TranslationState) -> bool:
+        return (
+            self.memory is not None
+            and not state.get("cache_hit", False)
+            and not state.get("memory_hit", False)
+            and state.get("safeguard_label") == "SAFE"
+            and state.get("qc_passed") == "YES"
+            and bool(state.get("normalized_text"))
+            and bool(state.get("translated_text"))
+        )
+
+    def _args(self, state: TranslationState) -> tuple[str, str, str, str]:
+        return (
+            state["normalized_text"],
+            state["translated_text"],
+            state.get("source_language", ""),
+            state.get("target_language", ""),
+        )
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """QC를 통과한 번역을 번역 메모리에 저장한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 변경 없는 상태.
+        """
+        if self._should_store(state):
+            try:
+                self.memory.add(*self._args(state))
+            except Exception:
+                # 저장 실패는 이미 완성된 번역 응답을 실패시키지 않는다.
+                pass
+        return state
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """QC를 통과한 번역을 비동기로 번역 메모리에 저장한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 변경 없는 상태.
+        """
+        if self._should_store(state):
+            try:
+                await self.memory.aadd(*self._args(state))
+            except Exception:
+                pass
+        return state
@@ -51,6 +51,9 @@ class NormalizeInputNode:
         # 언어 코드 표준화
         state["source_language"] = self._normalize_lang(state.get("source_language", ""))
         state["target_language"] = self._normalize_lang(state.get("target_language", ""))
+        # 다중 목표 언어: 표준화 후 순서를 유지하며 중복 제거
+        target_languages = [self._normalize_lang(lang) for lang in state.get("target_languages") or []]
+        state["target_languages"] = [lang for lang in dict.fromkeys(target_languages) if lang]
         # 입력 text 표준화
         raw_text = state.get("text", "")
         normalized_text = self._normalize_text(raw_text)
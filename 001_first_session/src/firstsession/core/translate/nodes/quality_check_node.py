@@ -9,6 +9,8 @@ from enum import Enum
 
 from firstsession.core.translate.state.translation_state import TranslationState
 from firstsession.core.translate.prompts.quality_check_prompt import QUALITY_CHECK_PROMPT
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.client.model_router import ModelRouter
 from firstsession.core.translate.nodes.call_model_node import CallModelNode
 
 class YesNoRoute(Enum):
@@ -19,8 +21,8 @@ class YesNoRoute(Enum):
 
 class QualityCheckNode:
     """번역 품질 검사를 담당하는 노드."""
-    def __init__(self) -> None:
-        self.call_model_node = CallModelNode()
+    def __init__(self, client: GeminiClient | None = None, model_router: ModelRouter | None = None) -> None:
+        self.call_model_node = CallModelNode(purpose="quality_check", client=client, router=model_router)
 
     def _parse_yes_no(self, raw_text: str) -> YesNoRoute:
         if raw_text is None:
@@ -37,31 +39,27 @@ class QualityCheckNode:
             return YesNoRoute.NO
         return YesNoRoute.UNKNOWN
 
-    def run(self, state: TranslationState) -> TranslationState:
-        """번역 품질을 검사한다.
-
-        Args:
-            state: 현재 번역 상태.
-
-        Returns:
-            TranslationState: 품질 검사 결과가 포함된 상태.
-        """
-        # TODO: 품질 검사 프롬프트로 YES/NO를 판정한다.
-        # TODO: 결과를 qc_passed 필드에 기록하는 규칙을 정의한다.
+    def _prepare(self, state: TranslationState) -> bool:
+        """QC 프롬프트를 상태에 기록한다. 비교할 텍스트가 없으면 False를 반환한다."""
         normalized_text = state.get("normalized_text", "")
         translated_text = state.get("translated_text","")
         if not normalized_text or not translated_text:
             state["error"] = "품질 검사를 할 텍스트가 비어 있습니다."
             state["qc_passed"] = "NO"
-            return state
+            return False
 
         prompt = QUALITY_CHECK_PROMPT.format(source_text=str(normalized_text), translated_text=str(translated_text))
         state["prompt"] = prompt
-        state = self.call_model_node.run(state)
+        return True
+
+    def _apply_output(self, state: TranslationState) -> TranslationState:
+        """모델 응답을 YES/NO로 해석해 qc_passed에 기록한다."""
         output = state.get("model_output","")
         route = self._parse_yes_no(output)
         if route == YesNoRoute.YES:
             state["qc_passed"] = "YES"
+            # 이전 시도(규칙 QC/LLM QC)에서 남은 실패 메시지를 지운다.
+            state.pop("error", None)
         elif route == YesNoRoute.NO:
             state["error"] = "품질 검사를 통과하지 못했습니다."
             state["qc_passed"] = "NO"
@@ -69,3 +67,33 @@ class QualityCheckNode:
             state["error"] = "품질 검사 결과를 확인할 수 없습니다."
             state["qc_passed"] = "NO"
         return state
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """번역 품질을 검사한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 품질 검사 결과가 포함된 상태.
+        """
+        # TODO: 품질 검사 프롬프트로 YES/NO를 판정한다.
+        # TODO: 결과를 qc_passed 필드에 기록하는 규칙을 정의한다.
+        if not self._prepare(state):
+            return state
+        state = self.call_model_node.run(state)
+        return self._apply_output(state)
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """번역 품질을 비동기로 검사한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 품질 검사 결과가 포함된 상태.
+        """
+        if not self._prepare(state):
+            return state
+        state = await self.call_model_node.arun(state)
+        return self._apply_output(state)
@@ -6,10 +6,39 @@
 """재번역 노드 모듈."""
 
 from firstsession.core.translate.state.translation_state import TranslationState
+from firstsession.core.translate.prompts.retry_translate_prompt import RETRY_TRANSLATE_PROMPT
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.client.model_router import ModelRouter
+from firstsession.core.translate.nodes.call_model_node import CallModelNode
 
 
 class RetryTranslateNode:
     """재번역을 담당하는 노드."""
+    def __init__(self, client: GeminiClient | None = None, model_router: ModelRouter | None = None) -> None:
+        self.call_model_node = CallModelNode(purpose="retry_translate", client=client, router=model_router)
+
+    def _build_prompt(self, state: TranslationState) -> str:
+        return RETRY_TRANSLATE_PROMPT.format(
+            source_text=str(state.get("normalized_text", "")),
+            failed_translation=str(state.get("translated_text", "")),
+        )
+
+    def _pick_translation(self, state: TranslationState) -> str:
+        """재번역 결과를 고른다. 모델 호출이 실패하면 이전 번역을 유지한다."""
+        output = str(state.get("model_output") or "").strip()
+        if not output:
+            return state.get("translated_text", "")
+        return output
+
+    def _translate_again(self, state: TranslationState) -> str:
+        state["prompt"] = self._build_prompt(state)
+        state = self.call_model_node.run(state)
+        return self._pick_translation(state)
+
+    async def _atranslate_again(self, state: TranslationState) -> str:
+        state["prompt"] = self._build_prompt(state)
+        state = await self.call_model_node.arun(state)
+        return self._pick_translation(state)
 
     def run(self, state: TranslationState) -> TranslationState:
         """재번역을 수행한다.
@@ -30,3 +59,19 @@ class RetryTranslateNode:
         state["translated_text"] = translated
 
         return state
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """재번역을 비동기로 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 재번역 결과가 포함된 상태.
+        """
+        retry_count = int(state.get("retry_count", 0) or 0)
+        state["retry_count"] = retry_count + 1
+        translated = await self._atranslate_again(state)
+        state["translated_text"] = translated
+
+        return state
@@ -9,8 +9,11 @@ import re
 from enum import Enum
 from dataclasses import dataclass
 
+from firstsession.core.translate.cache.translation_cache import TranslationCache
 from firstsession.core.translate.state.translation_state import TranslationState
 from firstsession.core.translate.prompts.safeguard_prompt import SAFEGUARD_PROMPT
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.client.model_router import ModelRouter
 from firstsession.core.translate.nodes.call_model_node import CallModelNode
 
 class SafeguardRoute(Enum):
@@ -49,33 +52,57 @@ class SafeguardRouter:
 
 class SafeguardClassifyNode:
     """안전 분류를 담당하는 노드."""
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: TranslationCache | None = None,
+        client: GeminiClient | None = None,
+        model_router: ModelRouter | None = None,
+    ) -> None:
         self.router = SafeguardRouter()
-        self.call_model_node = CallModelNode()
+        self.call_model_node = CallModelNode(purpose="safeguard", client=client, router=model_router)
+        self.cache = cache
 
-    def run(self, state: TranslationState) -> TranslationState:
-        """입력에 대한 안전 라벨을 판정한다.
+    def _cache_key(self, state: TranslationState) -> str:
+        return self.cache.safeguard_key(
+            str(state.get("normalized_text", "")),
+            self.call_model_node.model_for(state),
+        )
 
-        Args:
-            state: 현재 번역 상태.
+    def _apply_cached(self, state: TranslationState, cached: dict | None) -> bool:
+        """캐시된 라벨이 있으면 상태에 기록하고 True를 반환한다."""
+        if not cached or not cached.get("safeguard_label"):
+            state["safeguard_cached"] = False
+            return False
+        state["safeguard_label"] = cached["safeguard_label"]
+        state["safeguard_error"] = SafeguardError.NONE.value
+        state["safeguard_cached"] = True
+        state["safeguard_llm_skipped"] = True
+        return True
 
-        Returns:
-            TranslationState: 안전 라벨이 포함된 상태.
-        """
-        # TODO: 안전 분류 프롬프트를 호출하고 PASS/PII/HARMFUL/PROMPT_INJECTION을 산출한다.
-        # TODO: 출력 검증 및 정규화 규칙을 정의한다.
+    def _cacheable(self, state: TranslationState) -> dict | None:
+        """확정된 라벨만 캐시 값으로 만든다. UNKNOWN은 재분류가 필요하므로 저장하지 않는다."""
+        label = state.get("safeguard_label")
+        if self.cache is None or label == SafeguardRoute.UNKNOWN.value:
+            return None
+        return {"safeguard_label": label}
+
+    def _prepare(self, state: TranslationState) -> bool:
+        """분류 프롬프트를 상태에 기록한다. 입력이 비어 있으면 False를 반환한다."""
         normalized_text = state.get("normalized_text", "")
         if not normalized_text:
             state['safeguard_label'] = SafeguardRoute.UNKNOWN.value
             state['safeguard_error'] = "입력 텍스트가 비어있습니다."
-            return state
-        
+            return False
+
         prompt = SAFEGUARD_PROMPT.format(user_input=str(normalized_text))
         state["prompt"] = prompt
-        state = self.call_model_node.run(state)
+        return True
+
+    def _apply_output(self, state: TranslationState) -> TranslationState:
+        """모델 응답을 안전 라벨로 변환해 기록한다."""
         output = state.get("model_output", "")
         label, error = self.router.parse(output)
-        
+
         if error != SafeguardError.NONE:
             state["safeguard_label"] = SafeguardRoute.UNKNOWN.value
             state["safeguard_error"] = error.value
@@ -84,3 +111,45 @@ class SafeguardClassifyNode:
         state["safeguard_label"] = label.value
         state["safeguard_error"] = SafeguardError.NONE.value
         return state
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """입력에 대한 안전 라벨을 판정한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 안전 라벨이 포함된 상태.
+        """
+        # TODO: 안전 분류 프롬프트를 호출하고 PASS/PII/HARMFUL/PROMPT_INJECTION을 산출한다.
+        # TODO: 출력 검증 및 정규화 규칙을 정의한다.
+        if not self._prepare(state):
+            return state
+        if self.cache is not None and self._apply_cached(state, self.cache.get(self._cache_key(state))):
+            return state
+        state = self.call_model_node.run(state)
+        state = self._apply_output(state)
+        value = self._cacheable(state)
+        if value is not None:
+            self.cache.set(self._cache_key(state), value)
+        return state
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """입력에 대한 안전 라벨을 비동기로 판정한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 안전 라벨이 포함된 상태.
+        """
+        if not self._prepare(state):
+            return state
+        if self.cache is not None and self._apply_cached(state, await self.cache.aget(self._cache_key(state))):
+            return state
+        state = await self.call_model_node.arun(state)
+        state = self._apply_output(state)
+        value = self._cacheable(state)
+        if value is not None:
+            await self.cache.aset(self._cache_key(state), value)
+        return state
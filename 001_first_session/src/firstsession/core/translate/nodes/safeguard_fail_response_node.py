@@ -5,8 +5,12 @@
 
 """안전 분류 실패 응답 노드 모듈."""
 
+import logging
+
 from firstsession.core.translate.state.translation_state import TranslationState
 
+logger = logging.getLogger(__name__)
+
 
 class SafeguardFailResponseNode:
     """안전 분류 실패 응답을 담당하는 노드."""
@@ -20,6 +24,15 @@ class SafeguardFailResponseNode:
         Returns:
             TranslationState: 차단 응답이 포함된 상태.
         """
-        # TODO: 차단 메시지를 응답 필드로 설정한다.
-        # TODO: 차단 사유 로깅 규칙을 정의한다.
-        raise NotImplementedError("안전 분류 실패 응답 로직을 구현해야 합니다.")
+        # 차단된 요청은 번역 결과를 노출하지 않는다.
+        state["translated_text"] = ""
+        state["qc_passed"] = "NO"
+        state["can_retry"] = False
+        # 원문은 남기지 않고 라벨/판정 근거만 기록한다.
+        logger.info(
+            "safeguard blocked: label=%s rule=%s llm_skipped=%s",
+            state.get("safeguard_label", ""),
+            state.get("preclassify_rule", ""),
+            state.get("safeguard_llm_skipped", False),
+        )
+        return state
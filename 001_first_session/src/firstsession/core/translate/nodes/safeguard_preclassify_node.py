@@ -0,0 +1,166 @@
+# 목적: LLM 호출 전에 규칙 기반으로 안전 라벨을 사전 분류한다.
+# 설명: 명백한 프롬프트 인젝션과 정밀도가 높은 PII(이메일, 검증 숫자가 맞는 주민등록번호,
+#       묶음 형식 + IIN/Luhn이 맞는 카드 번호)는 즉시 차단 라벨을, 자명하게 안전한 입력은 SAFE를 부여한다.
+#       오탐 가능성이 있는 PII 규칙(전화번호, 문맥으로만 찾은 카드 번호)은 힌트로만 기록하고 LLM 안전 분류가 판단한다.
+# 디자인 패턴: 전략 패턴 + 파이프라인 노드
+# 참조: firstsession/core/translate/nodes/safeguard_classify_node.py
+
+"""규칙 기반 안전 사전 분류 노드 모듈."""
+
+import re
+from dataclasses import dataclass
+
+from firstsession.core.translate.nodes.safeguard_classify_node import SafeguardRoute
+from firstsession.core.translate.state.translation_state import TranslationState
+
+# 인젝션 > PII 순으로 검사한다(안전 분류 프롬프트의 우선순위와 동일). PII는 확정 규칙을 힌트 규칙보다 먼저 본다.
+_INJECTION_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("ignore_instructions", re.compile(
+        r"\b(ignore|disregard|forget)\s+(all\s+|any\s+)?(the\s+)?(previous|prior|above|earlier)\s+"
+        r"(instructions?|rules|prompts?|directions)", re.IGNORECASE)),
+    ("reveal_system_prompt", re.compile(
+        r"\b(reveal|show|print|repeat|leak)\s+(me\s+)?(your|the)\s+(system|hidden|initial)\s+"
+        r"(prompt|instructions?)", re.IGNORECASE)),
+    ("jailbreak_mode", re.compile(r"\b(developer|jailbreak|DAN)\s+mode\b", re.IGNORECASE)),
+    ("ko_ignore_instructions", re.compile(r"(이전|위의?|앞의|기존)\s*(지시|지침|규칙|명령)\S*\s*(을|를)?\s*(모두\s*)?무시")),
+    ("ko_reveal_system_prompt", re.compile(r"시스템\s*프롬프트\S*\s*(을|를)?\s*(보여|출력|알려|공개)")),
+)
+
+_EMAIL = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+# 번호 범위/주문 번호 등과 겹칠 수 있어 힌트로만 쓰는 규칙
+_HINT_PII_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("mobile_phone", re.compile(r"(?<!\d)01[016789][-.\s]?\d{3,4}[-.\s]?\d{4}(?!\d)")),
+    ("landline_phone", re.compile(r"(?<!\d)0\d{1,2}[-)\s]\s?\d{3,4}-\d{4}(?!\d)")),
+    ("international_phone", re.compile(r"(?<!\w)\+\d{1,3}[-\s]?\(?\d{1,4}\)?[-\s]?\d{3,4}[-\s]?\d{4}(?!\d)")),
+)
+
+# 정밀도가 높아 LLM 분류 없이 라벨을 확정하는 PII 규칙
+_DECISIVE_PII_RULES = frozenset({"email", "resident_registration_number", "card_number"})
+
+_RRN_CANDIDATE = re.compile(
+    r"(?<!\d)(\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01]))\s?-?\s?([1-8]\d{6})(?!\d)")
+# 주민등록번호 검증 가중치(앞 12자리)
+_RRN_WEIGHTS = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
+
+# 카드 번호 후보: 같은 구분자의 4-4-4-4, 4-6-5(AMEX) 묶음 또는 구분자 없는 13~19자리
+_CARD_GROUPED = re.compile(r"(?<![\d-])(?:\d{4}([ -])\d{4}\1\d{4}\1\d{4}|\d{4}([ -])\d{6}\2\d{5})(?![\d-])")
+_CARD_UNGROUPED = re.compile(r"(?<!\d)\d{13,19}(?!\d)")
+# 주요 카드사 IIN 앞자리(VISA 4, Master 51-55/22-27, AMEX 34/37, Diners/JCB 30/36/38/35, Discover/UnionPay 6, 국내 9)
+_CARD_PREFIX = re.compile(r"(?:4|5[1-5]|2[2-7]|3[04-8]|6|9)")
+# 구분자 없는 후보는 앞쪽 문맥에 카드 관련 단어가 있을 때만 인정한다.
+_CARD_CONTEXT = re.compile(r"(card|credit|debit|visa|master|amex|카드|신용|체크)", re.IGNORECASE)
+_CARD_CONTEXT_WINDOW = 24
+
+
+def _luhn_valid(digits: str) -> bool:
+    """Luhn 체크섬으로 카드 번호 후보를 검증한다."""
+    total = 0
+    for position, char in enumerate(reversed(digits)):
+        value = int(char)
+        if position % 2 == 1:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return total % 10 == 0
+
+
+def _rrn_valid(digits: str) -> bool:
+    """주민등록번호 13자리의 검증 숫자를 확인한다."""
+    total = sum(int(char) * weight for char, weight in zip(digits, _RRN_WEIGHTS))
+    return (11 - total % 11) % 10 == int(digits[12])
+
+
+def _card_number_valid(digits: str) -> bool:
+    """카드사 IIN 앞자리와 Luhn 체크섬을 모두 만족하는지 확인한다."""
+    return 13 <= len(digits) <= 19 and bool(_CARD_PREFIX.match(digits)) and _luhn_valid(digits)
+
+
+@dataclass(frozen=True)
+class PreclassifyConfig:
+    """사전 분류 설정 담당"""
+    enabled: bool = True
+    trivial_max_length: int = 24
+    trivial_pattern: str = r"[\d\s.,:;%+\-/()#]*"
+
+
+class SafeguardPreclassifyNode:
+    """규칙 기반 안전 사전 분류를 담당하는 노드."""
+    def __init__(self, config: PreclassifyConfig | None = None) -> None:
+        self.config = config or PreclassifyConfig()
+        self._trivial = re.compile(self.config.trivial_pattern)
+
+    def _find_rrn(self, text: str) -> bool:
+        return any(_rrn_valid(match.group(1) + match.group(2)) for match in _RRN_CANDIDATE.finditer(text))
+
+    def _find_grouped_card_number(self, text: str) -> bool:
+        return any(_card_number_valid(re.sub(r"\D", "", match.group(0))) for match in _CARD_GROUPED.finditer(text))
+
+    def _find_contextual_card_number(self, text: str) -> bool:
+        for match in _CARD_UNGROUPED.finditer(text):
+            context = text[max(0, match.start() - _CARD_CONTEXT_WINDOW):match.start()]
+            if _CARD_CONTEXT.search(context) and _card_number_valid(match.group(0)):
+                return True
+        return False
+
+    def classify(self, text: str) -> tuple[str, str]:
+        """텍스트를 규칙으로 분류한다.
+
+        Args:
+            text: 정규화된 입력 텍스트.
+
+        Returns:
+            tuple[str, str]: (라벨, 규칙 이름). 판단할 수 없으면 ("", "").
+        """
+        for rule, pattern in _INJECTION_PATTERNS:
+            if pattern.search(text):
+                return SafeguardRoute.PROMPT_INJECTION.value, rule
+        if _EMAIL.search(text):
+            return SafeguardRoute.PII.value, "email"
+        if self._find_rrn(text):
+            return SafeguardRoute.PII.value, "resident_registration_number"
+        if self._find_grouped_card_number(text):
+            return SafeguardRoute.PII.value, "card_number"
+        for rule, pattern in _HINT_PII_PATTERNS:
+            if pattern.search(text):
+                return SafeguardRoute.PII.value, rule
+        if self._find_contextual_card_number(text):
+            return SafeguardRoute.PII.value, "card_number_context"
+        if len(text) <= self.config.trivial_max_length and self._trivial.fullmatch(text):
+            # 문맥 없는 긴 숫자열(카드/식별 번호일 수 있음)은 자명하게 안전하다고 보지 않고 LLM에 맡긴다.
+            if _CARD_UNGROUPED.search(text):
+                return "", ""
+            return SafeguardRoute.SAFE.value, "trivially_safe"
+        return "", ""
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """규칙으로 안전 라벨을 판정하고, 정밀도가 높은 규칙이면 LLM 분류를 건너뛰도록 기록한다.
+
+        인젝션, 확정 PII 규칙(이메일/주민등록번호/카드 번호), 자명한 안전 입력은 라벨을 확정한다.
+        전화번호/문맥 카드 번호 규칙 일치는 preclassify_label/rule에 힌트로만 남기고 LLM 안전 분류가 최종 라벨을 정한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: preclassify_label/preclassify_rule/safeguard_llm_skipped가 포함된 상태.
+        """
+        state["preclassify_label"] = ""
+        state["preclassify_rule"] = ""
+        state["safeguard_llm_skipped"] = False
+        normalized_text = str(state.get("normalized_text", ""))
+        if not self.config.enabled or not normalized_text:
+            return state
+
+        label, rule = self.classify(normalized_text)
+        if not label:
+            return state
+
+        state["preclassify_label"] = label
+        state["preclassify_rule"] = rule
+        if label == SafeguardRoute.PII.value and rule not in _DECISIVE_PII_RULES:
+            return state
+        state["safeguard_label"] = label
+        state["safeguard_error"] = ""
+        state["safeguard_llm_skipped"] = True
+        return state
@@ -0,0 +1,91 @@
+# 목적: 단일 호출 결과를 기존 개별 호출 경로와 비교해 불일치율을 측정하는 노드를 정의한다.
+# 설명: 표본 비율만큼의 요청에 대해 안전 분류/QC 노드를 상태 복사본으로 따로 실행하고
+#       라벨/판정 일치 여부만 메트릭으로 남긴다. 원래 상태와 응답은 바꾸지 않는다.
+# 디자인 패턴: 섀도 실행(Shadow) + 파이프라인 노드
+# 참조: firstsession/core/translate/nodes/single_call_translate_node.py
+
+"""단일 호출 비교 측정 노드 모듈."""
+
+import random
+
+from firstsession.core.translate.metrics.translation_metrics import count_model_calls, record_single_call_agreement
+from firstsession.core.translate.nodes.quality_check_node import QualityCheckNode
+from firstsession.core.translate.nodes.safeguard_classify_node import SafeguardClassifyNode, SafeguardRoute
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class SingleCallAuditNode:
+    """단일 호출 결과의 표본 비교를 담당하는 노드."""
+    def __init__(
+        self,
+        safeguard_classify: SafeguardClassifyNode,
+        quality_check: QualityCheckNode,
+        sample_rate: float,
+    ) -> None:
+        """노드를 초기화한다.
+
+        Args:
+            safeguard_classify: 개별 호출 경로의 안전 분류 노드.
+            quality_check: 개별 호출 경로의 QC 노드.
+            sample_rate: 비교할 요청 비율(0~1). 비교 호출만큼 모델 호출이 늘어난다.
+        """
+        self.safeguard_classify = safeguard_classify
+        self.quality_check = quality_check
+        self.sample_rate = sample_rate
+
+    def _sampled(self, state: TranslationState) -> bool:
+        return (
+            state.get("single_call") == "OK"
+            and self.sample_rate > 0
+            and random.random() < self.sample_rate
+        )
+
+    def _shadow(self, state: TranslationState) -> TranslationState:
+        shadow = dict(state)
+        shadow.pop("error", None)
+        return shadow
+
+    def _record(self, state: TranslationState, safeguard: TranslationState, quality: TranslationState | None) -> None:
+        if safeguard.get("safeguard_label") != SafeguardRoute.UNKNOWN.value:
+            record_single_call_agreement("safety", state.get("safeguard_label") == safeguard.get("safeguard_label"))
+        if quality is not None and quality.get("qc_passed") in ("YES", "NO"):
+            record_single_call_agreement("qc", state.get("qc_passed") == quality.get("qc_passed"))
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """표본 요청이면 개별 호출 경로로 다시 판정해 일치 여부를 기록한다.
+
+        Args:
+            state: 단일 호출 결과가 포함된 상태.
+
+        Returns:
+            TranslationState: 변경 없는 상태.
+        """
+        if not self._sampled(state):
+            return state
+        # 비교 호출은 요청당 모델 호출 수에 포함하지 않는다.
+        with count_model_calls():
+            safeguard = self.safeguard_classify.run(self._shadow(state))
+            quality = None
+            if state.get("safeguard_label") == SafeguardRoute.SAFE.value:
+                quality = self.quality_check.run(self._shadow(state))
+        self._record(state, safeguard, quality)
+        return state
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """표본 요청이면 개별 호출 경로로 다시 판정해 일치 여부를 비동기로 기록한다.
+
+        Args:
+            state: 단일 호출 결과가 포함된 상태.
+
+        Returns:
+            TranslationState: 변경 없는 상태.
+        """
+        if not self._sampled(state):
+            return state
+        with count_model_calls():
+            safeguard = await self.safeguard_classify.arun(self._shadow(state))
+            quality = None
+            if state.get("safeguard_label") == SafeguardRoute.SAFE.value:
+                quality = await self.quality_check.arun(self._shadow(state))
+        self._record(state, safeguard, quality)
+        return state
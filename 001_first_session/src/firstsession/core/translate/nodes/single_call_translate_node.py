@@ -0,0 +1,142 @@
+# 목적: 안전 분류/번역/자체 품질 검사를 모델 호출 한 번으로 수행하는 노드를 정의한다.
+# 설명: 구조화된 JSON 응답을 엄격 파싱 → json-repair 복구 → Pydantic 검증 순으로 해석하고,
+#       실패하면 single_call을 FALLBACK으로 기록해 기존 다중 노드 경로로 넘긴다.
+# 디자인 패턴: 전략 패턴 + 파이프라인 노드
+# 참조: docs/04_string_tricks/04_json_안전_파싱.md, docs/04_string_tricks/05_retry_logic.md
+
+"""단일 호출 번역 노드 모듈."""
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+
+from json_repair import repair_json
+from pydantic import BaseModel, Field, ValidationError
+
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.client.model_router import ModelRouter
+from firstsession.core.translate.metrics.translation_metrics import SINGLE_CALL_OUTCOMES
+from firstsession.core.translate.nodes.call_model_node import CallModelNode
+from firstsession.core.translate.nodes.safeguard_classify_node import SafeguardError, SafeguardRoute, SafeguardRouter
+from firstsession.core.translate.prompts.single_call_prompt import SINGLE_CALL_PROMPT
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class SingleCallStatus(Enum):
+    """단일 호출 처리 결과."""
+    OK = "OK"
+    FALLBACK = "FALLBACK"
+
+
+class SingleCallOutput(BaseModel):
+    """단일 호출 응답 스키마."""
+
+    safety_label: str = Field(..., description="PASS|PII|HARMFUL|PROMPT_INJECTION")
+    translation: str = Field("", description="번역 결과")
+    self_check: str = Field(..., description="YES|NO")
+
+
+@dataclass(frozen=True)
+class SingleCallParser:
+    """json-repair 기반 단일 호출 응답 파서."""
+
+    def parse(self, raw_text: str) -> tuple[SingleCallOutput | None, str]:
+        """원본 텍스트를 스키마 객체와 파싱 방식(strict/repaired/failed)으로 변환한다."""
+        cleaned = (raw_text or "").replace("```json", "").replace("```", "").strip()
+        if not cleaned:
+            return None, "failed"
+        try:
+            return SingleCallOutput.model_validate(json.loads(cleaned)), "strict"
+        except (json.JSONDecodeError, ValidationError):
+            pass
+        # 엄격 파싱/검증에 실패하면 json-repair로 복구한 뒤 같은 스키마로 다시 검증한다.
+        try:
+            data = json.loads(repair_json(cleaned))
+            return SingleCallOutput.model_validate(data), "repaired"
+        except (json.JSONDecodeError, ValidationError, ValueError, TypeError):
+            return None, "failed"
+
+
+class SingleCallTranslateNode:
+    """단일 호출 번역을 담당하는 노드."""
+    def __init__(self, client: GeminiClient | None = None, model_router: ModelRouter | None = None) -> None:
+        self.parser = SingleCallParser()
+        self.router = SafeguardRouter()
+        self.call_model_node = CallModelNode(purpose="single_call", client=client, router=model_router)
+
+    def _prepare(self, state: TranslationState) -> bool:
+        """단일 호출 프롬프트를 상태에 기록한다. 입력이 유효하지 않으면 False를 반환한다."""
+        source_language = state.get("source_language", "")
+        target_language = state.get("target_language", "")
+        normalized_text = state.get("normalized_text", "")
+        if not source_language or not target_language or not normalized_text:
+            return False
+        state["prompt"] = SINGLE_CALL_PROMPT.format(
+            source_language = str(source_language),
+            target_language = str(target_language),
+            text = str(normalized_text),
+        )
+        return True
+
+    def _fallback(self, state: TranslationState) -> TranslationState:
+        SINGLE_CALL_OUTCOMES.inc(outcome="fallback")
+        state["single_call"] = SingleCallStatus.FALLBACK.value
+        state["translated_text"] = ""
+        state.pop("error", None)
+        return state
+
+    def _apply_output(self, state: TranslationState) -> TranslationState:
+        """JSON 응답을 안전 라벨/번역/자체 QC 결과로 기록한다. 해석할 수 없으면 다중 노드 경로로 넘긴다."""
+        if state.get("error"):
+            return self._fallback(state)
+        output, method = self.parser.parse(state.get("model_output", ""))
+        if output is None:
+            return self._fallback(state)
+
+        label, error = self.router.parse(output.safety_label)
+        verdict = output.self_check.strip().upper()
+        translation = output.translation.strip()
+        if error != SafeguardError.NONE or verdict not in ("YES", "NO"):
+            return self._fallback(state)
+        if label == SafeguardRoute.SAFE and not translation:
+            return self._fallback(state)
+
+        SINGLE_CALL_OUTCOMES.inc(outcome=method)
+        state["single_call"] = SingleCallStatus.OK.value
+        state["safeguard_label"] = label.value
+        state["safeguard_error"] = SafeguardError.NONE.value
+        state["translated_text"] = translation if label == SafeguardRoute.SAFE else ""
+        state["qc_passed"] = verdict
+        if verdict == "NO":
+            state["error"] = "품질 검사를 통과하지 못했습니다."
+        else:
+            state.pop("error", None)
+        return state
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """안전 분류/번역/자체 QC를 한 번에 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: single_call(OK/FALLBACK)과 결과가 포함된 상태.
+        """
+        if not self._prepare(state):
+            return self._fallback(state)
+        state = self.call_model_node.run(state)
+        return self._apply_output(state)
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """안전 분류/번역/자체 QC를 비동기로 한 번에 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: single_call(OK/FALLBACK)과 결과가 포함된 상태.
+        """
+        if not self._prepare(state):
+            return self._fallback(state)
+        state = await self.call_model_node.arun(state)
+        return self._apply_output(state)
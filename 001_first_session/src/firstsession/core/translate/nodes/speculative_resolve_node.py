@@ -0,0 +1,36 @@
+# 목적: 안전 분류 결과에 따라 추측 번역을 채택하거나 폐기한다.
+# 설명: SAFE이면 추측 번역을 번역 결과로 옮기고, 아니면 결과를 지우고 낭비 호출로 기록한다.
+# 디자인 패턴: 파이프라인 노드
+# 참조: firstsession/core/translate/nodes/speculative_translate_node.py
+
+"""추측 번역 확정 노드 모듈."""
+
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class SpeculativeResolveNode:
+    """추측 번역의 채택/폐기를 담당하는 노드."""
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """추측 번역을 채택하거나 폐기한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 채택 시 translated_text와 speculative_adopted가, 폐기 시 speculative_wasted가 기록된 상태.
+        """
+        speculative_text = state.get("speculative_translated_text", "")
+        if state.get("safeguard_label") != "SAFE":
+            # 차단된 요청의 추측 번역은 어떤 경로로도 반환되지 않도록 지운다.
+            state["speculative_translated_text"] = ""
+            state["speculative_wasted"] = bool(speculative_text or state.get("speculative_error"))
+            state["speculative_adopted"] = False
+            return state
+
+        state["speculative_wasted"] = False
+        # 추측 번역이 실패했으면 일반 번역 경로로 넘어가므로 채택으로 보지 않는다.
+        state["speculative_adopted"] = bool(speculative_text)
+        if speculative_text:
+            state["translated_text"] = speculative_text
+        return state
@@ -0,0 +1,50 @@
+# 목적: 추측 번역과 병렬로 실행되는 안전 분류 노드를 정의한다.
+# 설명: 안전 분류 결과를 safeguard_* 필드의 부분 업데이트로만 반환한다.
+# 디자인 패턴: 데코레이터 + 파이프라인 노드
+# 참조: firstsession/core/translate/nodes/speculative_translate_node.py
+
+"""병렬 안전 분류 노드 모듈."""
+
+import time
+
+from firstsession.core.translate.nodes.safeguard_classify_node import SafeguardClassifyNode
+from firstsession.core.translate.state.translation_state import TranslationState
+
+_SAFEGUARD_KEYS = ("safeguard_label", "safeguard_error", "safeguard_cached", "safeguard_llm_skipped")
+
+
+class SpeculativeSafeguardNode:
+    """추측 번역과 병렬로 안전 분류를 수행하는 노드."""
+    def __init__(self, safeguard_node: SafeguardClassifyNode) -> None:
+        self.safeguard_node = safeguard_node
+
+    def _to_update(self, result: TranslationState, started: float) -> dict:
+        update = {key: result[key] for key in _SAFEGUARD_KEYS if key in result}
+        update["safeguard_latency_ms"] = (time.perf_counter() - started) * 1000
+        return update
+
+    def run(self, state: TranslationState) -> dict:
+        """안전 분류를 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            dict: safeguard_* 필드만 담은 부분 상태.
+        """
+        started = time.perf_counter()
+        result = self.safeguard_node.run(dict(state))
+        return self._to_update(result, started)
+
+    async def arun(self, state: TranslationState) -> dict:
+        """안전 분류를 비동기로 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            dict: safeguard_* 필드만 담은 부분 상태.
+        """
+        started = time.perf_counter()
+        result = await self.safeguard_node.arun(dict(state))
+        return self._to_update(result, started)
@@ -0,0 +1,59 @@
+# 목적: 안전 분류와 병렬로 실행되는 추측 번역 노드를 정의한다.
+# 설명: 안전 분류 결과를 기다리지 않고 번역을 먼저 수행해 별도 필드에만 기록한다.
+# 디자인 패턴: 데코레이터 + 파이프라인 노드
+# 참조: firstsession/core/translate/nodes/speculative_resolve_node.py
+
+"""추측 번역 노드 모듈."""
+
+import time
+
+from firstsession.core.translate.nodes.translate_node import TranslateNode
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class SpeculativeTranslateNode:
+    """안전 분류와 병렬로 번역을 수행하는 노드.
+
+    병렬 분기는 같은 상태 키를 동시에 쓸 수 없으므로, 복사본에서 번역을 실행하고
+    speculative_* 필드만 부분 업데이트로 반환한다.
+    """
+    def __init__(self, translate_node: TranslateNode) -> None:
+        self.translate_node = translate_node
+
+    def _to_update(self, result: TranslationState, started: float) -> dict:
+        return {
+            "speculative_translated_text": result.get("translated_text", ""),
+            "speculative_error": result.get("error", ""),
+            "speculative_latency_ms": (time.perf_counter() - started) * 1000,
+        }
+
+    def run(self, state: TranslationState) -> dict:
+        """추측 번역을 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            dict: speculative_* 필드만 담은 부분 상태.
+        """
+        started = time.perf_counter()
+        if state.get("target_languages"):
+            # 다중 목표 언어는 안전 분류 후 목표 언어별로 번역하므로 추측 번역을 하지 않는다.
+            return {}
+        result = self.translate_node.run(dict(state))
+        return self._to_update(result, started)
+
+    async def arun(self, state: TranslationState) -> dict:
+        """추측 번역을 비동기로 수행한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            dict: speculative_* 필드만 담은 부분 상태.
+        """
+        started = time.perf_counter()
+        if state.get("target_languages"):
+            return {}
+        result = await self.translate_node.arun(dict(state))
+        return self._to_update(result, started)
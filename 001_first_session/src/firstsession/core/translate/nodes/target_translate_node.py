@@ -0,0 +1,63 @@
+# 목적: 다중 목표 언어 요청에서 목표 언어 하나의 번역/QC/재번역을 수행하는 노드를 정의한다.
+# 설명: 정규화/안전 분류가 끝난 상태를 받아 목표 언어별 하위 그래프를 실행하고 결과를 언어 키로 반환한다.
+# 디자인 패턴: 컴포지트(하위 그래프) + 파이프라인 노드
+# 참조: firstsession/core/translate/graphs/translate_graph.py
+
+"""목표 언어별 번역 노드 모듈."""
+
+from typing import Any
+
+from firstsession.core.translate.state.translation_state import TranslationState
+
+
+class TargetTranslateNode:
+    """목표 언어 하나에 대한 번역 하위 그래프 실행을 담당하는 노드.
+
+    LangGraph Send로 목표 언어마다 병렬 실행되며, 병렬 분기가 같은 키를 덮어쓰지 않도록
+    target_results에 {목표 언어: 결과}만 부분 업데이트로 반환한다(리듀서가 병합).
+    """
+    def __init__(self, subgraph: Any) -> None:
+        """노드를 초기화한다.
+
+        Args:
+            subgraph: 캐시/번역 메모리 조회 → 번역 → 규칙 QC → QC → 재번역 → 캐시/번역 메모리 저장으로 구성된 컴파일된 하위 그래프.
+        """
+        self.subgraph = subgraph
+
+    def _to_update(self, result: TranslationState) -> dict:
+        target_language = result.get("target_language", "")
+        return {
+            "target_results": {
+                target_language: {
+                    "translated_text": result.get("translated_text", ""),
+                    "qc_passed": result.get("qc_passed", "NO"),
+                    "retry_count": int(result.get("retry_count", 0) or 0),
+                    "cache_hit": bool(result.get("cache_hit", False)),
+                    "memory_hit": bool(result.get("memory_hit", False)),
+                    "heuristic_qc_hits": dict(result.get("heuristic_qc_hits") or {}),
+                    "error": "" if result.get("qc_passed") == "YES" else result.get("error", ""),
+                }
+            }
+        }
+
+    def run(self, state: TranslationState) -> dict:
+        """목표 언어 하나를 번역한다.
+
+        Args:
+            state: target_language가 하나로 지정된 번역 상태.
+
+        Returns:
+            dict: target_results 부분 업데이트.
+        """
+        return self._to_update(self.subgraph.invoke(state))
+
+    async def arun(self, state: TranslationState) -> dict:
+        """목표 언어 하나를 비동기로 번역한다.
+
+        Args:
+            state: target_language가 하나로 지정된 번역 상태.
+
+        Returns:
+            dict: target_results 부분 업데이트.
+        """
+        return self._to_update(await self.subgraph.ainvoke(state))
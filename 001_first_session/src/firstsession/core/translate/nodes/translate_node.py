@@ -5,26 +5,22 @@
 
 """번역 수행 노드 모듈."""
 
+from typing import AsyncIterator
+
 from firstsession.core.translate.state.translation_state import TranslationState
 from firstsession.core.translate.prompts.translation_prompt import TRANSLATION_PROMPT
+from firstsession.core.translate.prompts.translation_memory_prompt import TRANSLATION_MEMORY_PROMPT
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.client.model_router import ModelRouter
 from firstsession.core.translate.nodes.call_model_node import CallModelNode
 
 class TranslateNode:
     """번역 수행을 담당하는 노드."""
-    def __init__(self) -> None:
-        self.call_model_node = CallModelNode()
-
-    def run(self, state: TranslationState) -> TranslationState:
-        """번역 결과를 생성한다.
-
-        Args:
-            state: 현재 번역 상태.
+    def __init__(self, client: GeminiClient | None = None, model_router: ModelRouter | None = None) -> None:
+        self.call_model_node = CallModelNode(purpose="translate", client=client, router=model_router)
 
-        Returns:
-            TranslationState: 번역 결과가 포함된 상태.
-        """
-        # TODO: 번역 프롬프트를 구성하고 모델/외부 API를 호출한다.
-        # TODO: 번역 결과를 상태에 기록하는 규칙을 정의한다.
+    def _prepare(self, state: TranslationState) -> bool:
+        """번역 프롬프트를 상태에 기록한다. 입력이 유효하지 않으면 False를 반환한다."""
         source_language = state.get("source_language", "")
         target_language = state.get("target_language", "")
         normalized_text = state.get("normalized_text", "")
@@ -32,21 +28,41 @@ class TranslateNode:
         if not source_language or not target_language:
             state["error"] = "번역작업을 위한 언어가 설정되어있지 않습니다."
             state["translated_text"] = ""
-            return state
+            return False
 
         if not normalized_text:
             state["error"] = "번역작업을 수행 할 텍스트가 비어 있습니다."
             state["translated_text"] = ""
-            return state
-        
-        prompt = TRANSLATION_PROMPT.format(
-            source_language = str(source_language),
-            target_language = str(target_language),
-            text = str(normalized_text)
-        )
+            return False
+
+        hints = state.get("memory_hints") or []
+        if hints:
+            # 번역 메모리의 비슷한 문장 번역을 few-shot 참고 예시로 넣는다.
+            prompt = TRANSLATION_MEMORY_PROMPT.format(
+                source_language = str(source_language),
+                target_language = str(target_language),
+                references = self._format_references(hints),
+                text = str(normalized_text)
+            )
+        else:
+            prompt = TRANSLATION_PROMPT.format(
+                source_language = str(source_language),
+                target_language = str(target_language),
+                text = str(normalized_text)
+            )
 
         state["prompt"] = prompt
-        state = self.call_model_node.run(state)
+        return True
+
+    def _format_references(self, hints: list[dict]) -> str:
+        lines = []
+        for hint in hints:
+            lines.append(f"- Source: {hint.get('source', '')}")
+            lines.append(f"  Translation: {hint.get('target', '')}")
+        return "\n".join(lines)
+
+    def _apply_output(self, state: TranslationState) -> TranslationState:
+        """모델 응답을 번역 결과로 기록한다."""
         output = state.get("model_output", "")
         if output is None:
             state["error"] = "번역 모델 응답이 비어있습니다."
@@ -61,4 +77,51 @@ class TranslateNode:
 
         state["translated_text"] = translated_text
         state.pop("error", None)
-        return state
\ No newline at end of file
+        return state
+
+    def run(self, state: TranslationState) -> TranslationState:
+        """번역 결과를 생성한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 번역 결과가 포함된 상태.
+        """
+        # TODO: 번역 프롬프트를 구성하고 모델/외부 API를 호출한다.
+        # TODO: 번역 결과를 상태에 기록하는 규칙을 정의한다.
+        if not self._prepare(state):
+            return state
+        state = self.call_model_node.run(state)
+        return self._apply_output(state)
+
+    async def arun(self, state: TranslationState) -> TranslationState:
+        """번역 결과를 비동기로 생성한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Returns:
+            TranslationState: 번역 결과가 포함된 상태.
+        """
+        if not self._prepare(state):
+            return state
+        state = await self.call_model_node.arun(state)
+        return self._apply_output(state)
+
+    async def astream(self, state: TranslationState) -> AsyncIterator[str]:
+        """번역 결과를 생성되는 대로 조각 단위로 반환한다.
+
+        스트림이 끝나면 run/arun과 같은 규칙으로 translated_text를 기록한다.
+
+        Args:
+            state: 현재 번역 상태.
+
+        Yields:
+            str: 번역 결과 조각.
+        """
+        if not self._prepare(state):
+            return
+        async for delta in self.call_model_node.astream(state):
+            yield delta
+        self._apply_output(state)
@@ -15,6 +15,7 @@ You are a translation rewriter.
 [Rules]
 - Refer to the existing translation but do not add new content.
 - Preserve the original meaning while improving translation quality.
+- Keep markers such as [[1]] and placeholders such as {{0}} exactly as they appear.
 - Output only the translation (no explanation).
 
 [Source]
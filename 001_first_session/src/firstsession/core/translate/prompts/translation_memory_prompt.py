@@ -0,0 +1,43 @@
+# 목적: 번역 메모리 참고 문장을 포함한 번역 프롬프트 템플릿을 제공한다.
+# 설명: 비슷한 문장의 승인된 번역을 few-shot 예시로 넣어 용어/문체를 맞추게 한다.
+# 디자인 패턴: Singleton
+# 참조: firstsession/core/translate/nodes/translate_node.py, firstsession/core/translate/memory/translation_memory.py
+
+"""번역 메모리 참고 번역 프롬프트 템플릿 모듈."""
+
+from textwrap import dedent
+from langchain_core.prompts import PromptTemplate
+
+_TRANSLATION_MEMORY_PROMPT = dedent(
+    """\
+You are a professional translator.
+
+[Source Language]
+{source_language}
+
+[Target Language]
+{target_language}
+
+[Rules]
+- Translate naturally without distorting the meaning.
+- Preserve proper nouns, code, and numbers when possible.
+- Keep markers such as [[1]] and placeholders such as {{0}} exactly as they appear.
+- The reference translations are approved translations of similar sentences.
+  Reuse their terminology and style, but translate the given text exactly (numbers and names may differ).
+- Output only the translation (no explanation, no preface or closing).
+
+[Reference Translations]
+{references}
+
+[Text to Translate]
+{text}
+
+[Output]
+Provide only the translated text.
+"""
+)
+
+TRANSLATION_MEMORY_PROMPT = PromptTemplate(
+    template=_TRANSLATION_MEMORY_PROMPT,
+    input_variables=["source_language", "target_language", "references", "text"],
+)
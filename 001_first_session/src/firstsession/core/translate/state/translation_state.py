@@ -5,7 +5,14 @@
 
 """번역 그래프 상태 모듈."""
 
-from typing import TypedDict
+from typing import Annotated, TypedDict
+
+
+def merge_target_results(current: dict | None, update: dict | None) -> dict:
+    """목표 언어별 결과를 병합한다(병렬 분기 결과 합치기용 리듀서)."""
+    merged = dict(current or {})
+    merged.update(update or {})
+    return merged
 
 
 class TranslationState(TypedDict):
@@ -14,8 +21,19 @@ class TranslationState(TypedDict):
     # 언어설정
     source_language: str
     target_language: str
+    # 다중 목표 언어 요청(비어 있으면 target_language 단건 처리)
+    target_languages: list[str]
+    target_results: Annotated[dict[str, dict], merge_target_results]
+    # 로컬 언어 감지(language_check: AUTO_FILLED/MATCHED/SAME_LANGUAGE/MISMATCH/CORRECTED/IGNORED/UNKNOWN)
+    detected_language: str
+    language_confidence: float
+    language_check: str
     # 입력
     text: str
+    # 배치/서식 보존 묶음([[n]] 마커로 이은 여러 항목). 항목마다 언어가 다를 수 있어 언어 감지를 건너뛴다.
+    packed: bool
+    # 스트리밍 실행 여부. 켜져 있으면 번역 노드가 번역 조각을 custom 스트림으로 내보낸다.
+    stream: bool
     normalized_text: str
     translated_text: str
     prompt: str
@@ -24,9 +42,32 @@ class TranslationState(TypedDict):
     # 분기 처리
     safeguard_label: str
     safeguard_error: str
+    preclassify_label: str
+    preclassify_rule: str
+    safeguard_llm_skipped: bool
     qc_passed: str
+    heuristic_qc: str
+    heuristic_qc_rules: list[str]
+    heuristic_qc_hits: dict[str, int]
+    qc_llm_skipped: bool
     can_retry: bool
     retry_count: int
+    # 캐시
+    cache_hit: bool
+    safeguard_cached: bool
+    # 번역 메모리(완전 일치 재사용 여부, 퍼지 일치 참고 문장 쌍)
+    memory_hit: bool
+    memory_hints: list[dict]
+    # 단일 호출 모드(OK: JSON 응답 사용, FALLBACK: 다중 노드 경로로 전환, 빈 값: 미사용)
+    single_call: str
+    # 추측 번역
+    speculative_translated_text: str
+    speculative_error: str
+    speculative_wasted: bool
+    # 추측 번역 결과를 번역 결과로 실제로 사용했는지 여부
+    speculative_adopted: bool
+    safeguard_latency_ms: float
+    speculative_latency_ms: float
     # 설정
     max_input_length: int
     max_retry_count: int
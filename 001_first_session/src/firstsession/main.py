@@ -5,33 +5,77 @@
 
 """FastAPI 애플리케이션 진입점 모듈."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from firstsession.config.settings import settings
+from fastapi.responses import PlainTextResponse
+from firstsession.config.settings import Settings, settings
+from firstsession.core.common.metrics import registry
 from firstsession.api.translate.router.translate_router import TranslateRouter
+from firstsession.api.translate.router.translate_job_router import TranslateJobRouter
+from firstsession.api.translate.service.translation_job_manager import TranslationJobManager
 from firstsession.api.translate.service.translation_service import TranslationService
+from firstsession.core.translate.cache.translation_cache import TranslationCache
+from firstsession.core.translate.client.gemini_client import GeminiClient
 from firstsession.core.translate.graphs.translate_graph import TranslateGraph
+from firstsession.core.translate.memory.translation_memory import TranslationMemory
 
 from dotenv import load_dotenv
 load_dotenv()
 
-def create_app() -> FastAPI:
+def create_app(
+    app_settings: Settings | None = None,
+    model_client: GeminiClient | None = None,
+) -> FastAPI:
     """FastAPI 애플리케이션을 생성한다.
 
+    Args:
+        app_settings: 애플리케이션 설정(기본값: 전역 설정).
+        model_client: 모든 노드가 공유할 모델 클라이언트(기본값: 설정으로 생성).
+
     Returns:
         FastAPI: 구성된 애플리케이션 인스턴스.
     """
-    app = FastAPI(title="firstsession API")
+    app_settings = app_settings or settings
+    # 모든 노드가 공유하는 모델 클라이언트(커넥션 풀/동시성 제한/재시도)
+    model_client = model_client or GeminiClient(app_settings.model_client)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # 작업자는 서버 이벤트 루프에서 실행한다.
+        job_manager.start()
+        yield
+        await job_manager.aclose()
+        await model_client.aclose()
+        # 작업자가 모두 멈춘 뒤에 캐시/번역 메모리 연결을 닫는다.
+        if cache is not None:
+            cache.close()
+        if memory is not None:
+            memory.close()
+
+    app = FastAPI(title="firstsession API", lifespan=lifespan)
 
     @app.get("/health", tags=["health"])
     def health() -> dict[str, str]:
         """간단한 헬스 체크 엔드포인트."""
         return {"status": "ok"}
 
+    @app.get("/metrics", tags=["metrics"], response_class=PlainTextResponse)
+    def metrics() -> PlainTextResponse:
+        """Prometheus 텍스트 형식 메트릭 엔드포인트."""
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
     # graph 생성
-    graph = TranslateGraph()
-    service = TranslationService(graph, settings=settings)
+    cache = TranslationCache.from_settings(app_settings.cache)
+    memory = TranslationMemory.from_settings(app_settings.memory)
+    graph = TranslateGraph(settings=app_settings, cache=cache, model_client=model_client, memory=memory)
+    service = TranslationService(graph, settings=app_settings)
     translate_router = TranslateRouter(service)
     app.include_router(translate_router.router)
+    # 긴 문서 번역은 작업 큐로 요청 경로 밖에서 실행한다.
+    job_manager = TranslationJobManager(service, app_settings.job)
+    job_router = TranslateJobRouter(job_manager)
+    app.include_router(job_router.router)
 
     return app
 
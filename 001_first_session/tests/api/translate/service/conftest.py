@@ -0,0 +1,33 @@
+"""번역 서비스 테스트 공용 fixture(가짜 모델 백엔드)."""
+
+from collections.abc import Callable
+
+import pytest
+
+from firstsession.api.translate.service.translation_service import TranslationService
+from firstsession.benchmark.fake_genai_client import FakeGenaiClient, FakeModelConfig
+from firstsession.config.settings import CacheSettings, Settings
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.graphs.translate_graph import TranslateGraph
+
+
+@pytest.fixture
+def fake() -> FakeGenaiClient:
+    return FakeGenaiClient(FakeModelConfig(latency="constant", latency_ms=0, qc_fail_rate=0))
+
+
+@pytest.fixture
+def make_service(fake) -> Callable[..., TranslationService]:
+    """설정을 바꿔 서비스를 만드는 팩토리. 결과 캐시는 기본으로 끈다."""
+
+    def build(**overrides) -> TranslationService:
+        settings = Settings(cache=CacheSettings(enabled=False), **overrides)
+        graph = TranslateGraph(settings=settings, model_client=GeminiClient(settings.model_client, genai_client=fake))
+        return TranslationService(graph, settings=settings)
+
+    return build
+
+
+@pytest.fixture
+def service(make_service) -> TranslationService:
+    return make_service()
@@ -0,0 +1,23 @@
+"""배치 번역 서비스 테스트(가짜 모델 백엔드)."""
+
+from firstsession.api.translate.model.translation_batch_request import TranslationBatchRequest
+from firstsession.api.translate.model.translation_request import TranslationRequest
+
+
+def test_mixed_language_batch_is_not_short_circuited(service, fake):
+    texts = [
+        "The meeting starts at nine o'clock today.",
+        "Please bring your laptop to the office.",
+        "The report is due next Friday afternoon.",
+        "Lunch will be served in the main hall.",
+        "오늘 회의는 아홉 시에 시작합니다 모두 참석해 주세요.",
+    ]
+    request = TranslationBatchRequest(
+        items=[TranslationRequest(source_language="ko", target_language="en", text=text) for text in texts]
+    )
+    response = service.translate_batch(request)
+
+    # 묶음 전체가 영어로 감지돼 "이미 목표 언어" 처리되면 모델 호출 없이 원문이 그대로 돌아온다.
+    assert fake.calls["translate"] >= 1
+    assert [item.source_language for item in response.results] == ["ko"] * len(texts)
+    assert all(item.error is None for item in response.results)
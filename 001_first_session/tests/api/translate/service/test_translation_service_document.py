@@ -0,0 +1,40 @@
+"""문서 번역 서비스 테스트(가짜 모델 백엔드)."""
+
+from firstsession.api.translate.model.translation_document_request import TranslationDocumentRequest
+from firstsession.config.settings import NormalizeSettings
+
+
+def test_oversize_markdown_segment_is_split_not_truncated(make_service, fake):
+    service = make_service(normalize=NormalizeSettings(max_input_length=300))
+    paragraph = " ".join(f"Sentence {index} mentions `code{index}` here." for index in range(1, 41))
+    request = TranslationDocumentRequest(
+        source_language="en",
+        target_language="ko",
+        text=f"# Title\n\n{paragraph}\n",
+        format="markdown",
+    )
+    response = service.translate_document(request)
+
+    assert len(paragraph) > 300
+    assert response.failed_chunks == []
+    assert response.unique_segment_count == 2
+    # 마지막 문장까지 번역되고 모든 인라인 코드가 자리에 돌아온다.
+    assert all(f"`code{index}`" in response.translated_text for index in range(1, 41))
+    assert "40" in response.translated_text.rstrip().splitlines()[-1]
+    assert fake.calls["translate"] >= 2
+
+
+def test_short_paragraphs_share_a_chunk_and_keep_breaks(service, fake):
+    paragraphs = [f"Paragraph {index} has a short sentence." for index in range(1, 6)]
+    request = TranslationDocumentRequest(
+        source_language="en",
+        target_language="ko",
+        text="\n\n".join(paragraphs),
+    )
+    response = service.translate_document(request)
+
+    assert response.chunk_count == 1
+    assert response.failed_chunks == []
+    assert fake.calls["translate"] == 1
+    # 정규화가 줄바꿈을 접어도 문단 경계는 그대로 남는다.
+    assert response.translated_text.count("\n\n") == len(paragraphs) - 1
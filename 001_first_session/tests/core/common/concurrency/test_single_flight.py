@@ -0,0 +1,75 @@
+"""진행 중 요청 병합(SingleFlight) 비동기 경로 테스트."""
+
+import asyncio
+
+import pytest
+
+from firstsession.core.common.concurrency.single_flight import SingleFlight
+
+
+class _Work:
+    """release가 설정될 때까지 기다렸다가 값을 돌려주는 작업. 시작/취소 횟수를 기록한다."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return "result"
+
+
+@pytest.mark.asyncio
+async def test_followers_share_leader_result():
+    flight = SingleFlight()
+    work = _Work()
+    leader = asyncio.create_task(flight.ado("key", work))
+    follower = asyncio.create_task(flight.ado("key", work))
+    await asyncio.sleep(0)
+    work.release.set()
+    assert await leader == ("result", False)
+    assert await follower == ("result", True)
+    assert work.started == 1
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_work_running():
+    flight = SingleFlight()
+    work = _Work()
+    leader = asyncio.create_task(flight.ado("key", work))
+    follower = asyncio.create_task(flight.ado("key", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    work.release.set()
+    assert await follower == ("result", True)
+    assert work.cancelled == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelling_all_waiters_cancels_work():
+    flight = SingleFlight()
+    work = _Work()
+    waiters = [asyncio.create_task(flight.ado("key", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    # 작업 태스크가 취소 신호를 처리하고 키가 정리될 때까지 한 바퀴 더 돌린다.
+    await asyncio.sleep(0)
+    assert work.cancelled == 1
+    assert flight.in_flight() == 0
+
+    # 같은 키의 다음 호출은 취소된 태스크를 공유하지 않고 새로 실행한다.
+    work.release.set()
+    assert await flight.ado("key", work) == ("result", False)
+    assert work.started == 2
@@ -0,0 +1,37 @@
+"""번역 캐시 프롬프트 버전/자원 정리 테스트."""
+
+import importlib
+import sqlite3
+
+import pytest
+from langchain_core.prompts import PromptTemplate
+
+from firstsession.config.settings import CacheSettings
+from firstsession.core.translate.cache import translation_cache
+from firstsession.core.translate.prompts import single_call_prompt
+
+
+def test_single_call_prompt_change_invalidates_translation_keys(monkeypatch):
+    before = translation_cache.TRANSLATION_PROMPT_VERSION
+    changed = PromptTemplate(
+        template=single_call_prompt.SINGLE_CALL_PROMPT.template + "\nRespond in JSON only.",
+        input_variables=single_call_prompt.SINGLE_CALL_PROMPT.input_variables,
+    )
+    monkeypatch.setattr(single_call_prompt, "SINGLE_CALL_PROMPT", changed)
+    try:
+        assert importlib.reload(translation_cache).TRANSLATION_PROMPT_VERSION != before
+    finally:
+        monkeypatch.undo()
+        importlib.reload(translation_cache)
+    assert translation_cache.TRANSLATION_PROMPT_VERSION == before
+
+
+def test_close_closes_persistent_store(tmp_path):
+    cache = translation_cache.TranslationCache.from_settings(
+        CacheSettings(persistent_backend="sqlite", sqlite_path=str(tmp_path / "cache.sqlite3"))
+    )
+    cache.set("key", {"translated_text": "안녕"})
+    cache.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.persistent.get("key")
@@ -0,0 +1,74 @@
+"""공유 Gemini 클라이언트 스트리밍 슬롯 테스트."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from firstsession.config.settings import ModelClientSettings
+from firstsession.core.translate.client.gemini_client import GeminiClient
+
+
+class _StreamBackend:
+    """contents가 "hang"이면 첫 조각 전에 멈추고, 아니면 조각 3개를 내보내는 가짜 스트리밍 백엔드."""
+
+    def __init__(self) -> None:
+        self.closed: list[str] = []
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content_stream=self._stream))
+
+    async def _stream(self, *, model: str, contents: str, config: object = None):
+        if contents == "hang":
+            await asyncio.Event().wait()
+
+        async def iterate():
+            try:
+                for index in range(3):
+                    yield SimpleNamespace(text=f"{contents}-{index}")
+            finally:
+                self.closed.append(contents)
+
+        return iterate()
+
+
+@pytest.fixture
+def backend() -> _StreamBackend:
+    return _StreamBackend()
+
+
+@pytest.fixture
+def client(backend) -> GeminiClient:
+    return GeminiClient(ModelClientSettings(max_concurrency=1), genai_client=backend)
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_does_not_hold_slot(client):
+    first = client.agenerate_content_stream("m", "a", 0.0)
+    assert (await anext(first)).text == "a-0"
+    # 첫 스트림을 다 읽지 않은 상태에서도 두 번째 스트림이 슬롯을 얻는다.
+    second = client.agenerate_content_stream("m", "b", 0.0)
+    assert await asyncio.wait_for(_collect(second), timeout=1.0) == ["b-0", "b-1", "b-2"]
+    assert [chunk.text async for chunk in first] == ["a-1", "a-2"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_first_chunk_releases_slot(client):
+    stuck = asyncio.create_task(anext(client.agenerate_content_stream("m", "hang", 0.0)))
+    await asyncio.sleep(0.01)
+    stuck.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stuck
+    stream = client.agenerate_content_stream("m", "a", 0.0)
+    chunks = await asyncio.wait_for(_collect(stream), timeout=1.0)
+    assert chunks == ["a-0", "a-1", "a-2"]
+
+
+@pytest.mark.asyncio
+async def test_close_after_first_chunk_closes_provider_stream(client, backend):
+    stream = client.agenerate_content_stream("m", "a", 0.0)
+    await anext(stream)
+    await stream.aclose()
+    assert backend.closed == ["a"]
+
+
+async def _collect(stream) -> list[str]:
+    return [chunk.text async for chunk in stream]
@@ -0,0 +1,47 @@
+"""문서 청커의 문단 묶음/분할 테스트."""
+
+from firstsession.core.translate.document.document_chunker import DocumentChunker
+
+
+def _reassemble(chunks) -> str:
+    return "".join(chunk.separator + chunk.text for chunk in chunks)
+
+
+def test_short_paragraphs_are_packed_into_one_chunk():
+    text = "First paragraph.\n\nSecond paragraph.\n\n\nThird paragraph."
+    chunks = list(DocumentChunker(max_chars=100).iter_chunks(text))
+
+    assert len(chunks) == 1
+    assert chunks[0].text == "First paragraph.\n\nSecond paragraph.\n\nThird paragraph."
+    assert [piece for piece, _ in chunks[0].parts] == ["First paragraph.", "Second paragraph.", "Third paragraph."]
+
+
+def test_chunk_count_follows_length_not_paragraph_count():
+    paragraphs = [f"Paragraph number {index:02d}." for index in range(20)]
+    text = "\n\n".join(paragraphs)
+    chunker = DocumentChunker(max_chars=100)
+    chunks = list(chunker.iter_chunks(text))
+
+    assert len(chunks) < len(paragraphs)
+    assert all(len(chunk.text) <= 100 for chunk in chunks)
+    assert chunks[0].separator == ""
+    assert all(chunk.separator == "\n\n" for chunk in chunks[1:])
+    assert _reassemble(chunks) == text
+    assert chunker.count_chunks(text) == len(chunks)
+
+
+def test_long_paragraph_is_split_and_tail_packed_with_next():
+    long_paragraph = " ".join(f"Sentence {index} is here." for index in range(10))
+    text = f"{long_paragraph}\n\nShort one."
+    chunks = list(DocumentChunker(max_chars=60).iter_chunks(text))
+
+    assert len(chunks) > 1
+    assert all(len(chunk.text) <= 60 for chunk in chunks)
+    assert chunks[-1].text.endswith("\n\nShort one.")
+    assert _reassemble(chunks) == text
+
+
+def test_parts_rebuild_chunk_text():
+    text = "Alpha.\n\nBeta gamma. Delta epsilon.\n\nZeta."
+    for chunk in DocumentChunker(max_chars=20).iter_chunks(text):
+        assert "".join(piece + joint for piece, joint in chunk.parts) == chunk.text
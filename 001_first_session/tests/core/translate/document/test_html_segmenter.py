@@ -0,0 +1,18 @@
+"""HTML 분할기 테스트."""
+
+from firstsession.core.translate.document.html_segmenter import HtmlSegmenter
+
+
+def test_inline_tags_stay_inside_one_segment():
+    document = HtmlSegmenter().segment('<p>Hello <b>world</b>, visit <a href="https://x.y">site</a>.</p>')
+    (segment,) = document.segments
+    assert segment.text == "Hello {{0}}world{{1}}, visit {{2}}site{{3}}."
+    assert segment.placeholders == ("<b>", "</b>", '<a href="https://x.y">', "</a>")
+
+
+def test_raw_blocks_are_not_translated():
+    html = "<p>Keep going.</p><pre>keep me</pre><script>var a = 'text';</script><p>Done now.</p>"
+    document = HtmlSegmenter().segment(html)
+    assert [segment.text for segment in document.segments] == ["Keep going.", "Done now."]
+    rendered, _ = document.render({"Keep going.": "계속.", "Done now.": "끝."})
+    assert rendered == "<p>계속.</p><pre>keep me</pre><script>var a = 'text';</script><p>끝.</p>"
@@ -0,0 +1,66 @@
+"""Markdown 분할기 테스트."""
+
+from firstsession.core.translate.document.markdown_segmenter import MarkdownSegmenter
+from firstsession.core.translate.document.segmented_document import TextSegment
+
+_DOCUMENT = """# Install guide
+
+Run `pip install foo` and see https://example.com/docs for details.
+
+```python
+print("Install guide")
+```
+
+| Name | Description |
+|------|-------------|
+| foo | Install guide |
+
+- Install guide
+"""
+
+
+def _segments(text: str) -> list[TextSegment]:
+    return MarkdownSegmenter().segment(text).segments
+
+
+def test_fenced_code_is_not_translated():
+    texts = [segment.text for segment in _segments(_DOCUMENT)]
+    assert not any("print" in text for text in texts)
+
+
+def test_inline_code_and_urls_become_placeholders():
+    paragraph = next(segment for segment in _segments(_DOCUMENT) if segment.text.startswith("Run"))
+    assert paragraph.text == "Run {{0}} and see {{1}} for details."
+    assert paragraph.placeholders == ("`pip install foo`", "https://example.com/docs")
+
+
+def test_table_cells_are_separate_segments_and_delimiter_is_kept():
+    document = MarkdownSegmenter().segment(_DOCUMENT)
+    texts = [segment.text for segment in document.segments]
+    assert {"Name", "Description", "foo"} <= set(texts)
+    assert "|------|-------------|\n" in document.pieces
+
+
+def test_repeated_text_is_translated_once():
+    document = MarkdownSegmenter().segment(_DOCUMENT)
+    # 제목/표 칸/목록에 같은 문구가 세 번 나오지만 번역 대상은 한 번이다.
+    assert [segment.text for segment in document.segments].count("Install guide") == 3
+    assert document.unique_texts().count("Install guide") == 1
+
+
+def test_render_without_translations_returns_original():
+    document = MarkdownSegmenter().segment(_DOCUMENT)
+    rendered, broken = document.render({})
+    assert rendered == _DOCUMENT
+    assert broken == []
+
+
+def test_render_restores_placeholders_in_every_occurrence():
+    document = MarkdownSegmenter().segment(_DOCUMENT)
+    translations = {text: text.upper() for text in document.unique_texts()}
+    translations["Run {{0}} and see {{1}} for details."] = "{{1}} 문서를 보고 {{0}} 를 실행하세요."
+    rendered, broken = document.render(translations)
+    assert broken == []
+    assert rendered.count("INSTALL GUIDE") == 3
+    assert "https://example.com/docs 문서를 보고 `pip install foo` 를 실행하세요." in rendered
+    assert 'print("Install guide")' in rendered
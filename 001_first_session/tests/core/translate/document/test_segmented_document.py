@@ -0,0 +1,45 @@
+"""서식 보존 문서(자리표시자 복원/재조립) 테스트."""
+
+import re
+
+import pytest
+
+from firstsession.core.translate.document.segmented_document import SegmentedDocument, TextSegment
+
+_URL = re.compile(r"https?://\S+")
+
+
+@pytest.mark.parametrize(
+    "translated",
+    [
+        "{{0}} 를 보세요",             # {{1}} 누락
+        "{{0}} {{1}} {{1}} 를 보세요",  # 중복
+        "{{0}} {{2}} 를 보세요",        # 번호 변형
+        "{0} {{1}} 를 보세요",          # 괄호 훼손
+    ],
+)
+def test_restore_rejects_broken_placeholders(translated):
+    segment = TextSegment(text="See {{0}} and {{1}}", placeholders=("`a`", "`b`"))
+    assert segment.restore(translated) is None
+
+
+def test_restore_allows_reordered_placeholders():
+    segment = TextSegment(text="See {{0}} and {{1}}", placeholders=("`a`", "`b`"))
+    assert segment.restore("{{1}} 와 {{0}} 참고") == "`b` 와 `a` 참고"
+
+
+def test_broken_translation_keeps_original_and_is_reported():
+    document = SegmentedDocument()
+    document.add_literal("<p>")
+    document.add_text([(False, "Visit https://example.com today")], _URL)
+    document.add_literal("</p>")
+    rendered, broken = document.render({"Visit {{0}} today": "오늘 방문하세요"})
+    assert rendered == "<p>Visit https://example.com today</p>"
+    assert broken == ["Visit {{0}} today"]
+
+
+def test_text_without_letters_is_kept_literal():
+    document = SegmentedDocument()
+    document.add_text([(False, "  12:30 - 13:00  ")], _URL)
+    assert document.segments == []
+    assert document.render({})[0] == "  12:30 - 13:00  "
@@ -0,0 +1,42 @@
+"""번역 메모리 정렬/완전 일치 테스트."""
+
+import pytest
+
+from firstsession.core.translate.memory.translation_memory import TranslationMemory
+
+
+@pytest.fixture
+def memory(tmp_path) -> TranslationMemory:
+    tm = TranslationMemory(str(tmp_path / "tm.sqlite3"))
+    yield tm
+    tm.close()
+
+
+def test_aligned_sentences_are_stored_per_sentence(memory):
+    stored = memory.add(
+        "The meeting starts at nine. Please bring your laptop.",
+        "회의는 9시에 시작합니다. 노트북을 가져오세요.",
+        "en",
+        "ko",
+    )
+    assert stored == 2
+    assert memory.lookup("Please bring your laptop.", "en", "ko").translation == "노트북을 가져오세요."
+
+
+def test_misaligned_sentences_are_stored_as_whole_text(memory):
+    # 문장 수는 같지만 번역 모델이 문장 경계를 옮겨 쌍이 어긋난 경우
+    text = "Hi. The quarterly report covering every regional office is attached to this message."
+    translated = "안녕하세요, 분기 보고서가 있습니다. 모든 지역 사무소를 다룬 보고서를 이 메시지에 첨부했습니다만 확인 부탁드립니다."
+    assert memory.add(text, translated, "en", "ko") == 1
+    assert len(memory) == 1
+    assert memory.lookup("Hi.", "en", "ko").translation is None
+
+
+def test_multi_sentence_exact_hit_is_only_a_hint(memory):
+    memory.add("The meeting starts at nine.", "회의는 9시에 시작합니다.", "en", "ko")
+    memory.add("Please bring your laptop.", "노트북을 가져오세요.", "en", "ko")
+    lookup = memory.lookup("The meeting starts at nine. Please bring your laptop.", "en", "ko")
+    assert lookup.translation is None
+    assert lookup.exact == 2
+    assert {hint.target for hint in lookup.hints} == {"회의는 9시에 시작합니다.", "노트북을 가져오세요."}
+    assert all(hint.similarity == 1.0 for hint in lookup.hints)
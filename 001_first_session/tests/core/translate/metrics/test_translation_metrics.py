@@ -0,0 +1,60 @@
+"""요청 단위 번역 메트릭 기록 테스트."""
+
+from firstsession.core.translate.metrics.translation_metrics import (
+    SPECULATIVE_BRANCH_LATENCY,
+    SPECULATIVE_TRANSLATIONS,
+    record_request,
+)
+from firstsession.core.translate.nodes.speculative_resolve_node import SpeculativeResolveNode
+
+
+def _speculative_state(speculative_text: str, speculative_error: str = "") -> dict:
+    return {
+        "safeguard_label": "SAFE",
+        "qc_passed": "YES",
+        "translated_text": "",
+        "speculative_translated_text": speculative_text,
+        "speculative_error": speculative_error,
+        "safeguard_latency_ms": 120.0,
+        "speculative_latency_ms": 300.0,
+    }
+
+
+def _branch_count(branch: str) -> int:
+    prefix = f'{SPECULATIVE_BRANCH_LATENCY.name}_count{{branch="{branch}"}} '
+    for line in SPECULATIVE_BRANCH_LATENCY.render():
+        if line.startswith(prefix):
+            return int(line[len(prefix):])
+    return 0
+
+
+def test_used_speculative_translation_counts_as_adopted():
+    before = SPECULATIVE_TRANSLATIONS.value(outcome="adopted")
+    state = SpeculativeResolveNode().run(_speculative_state("안녕하세요"))
+    record_request(state, 0.5, mode="sync")
+
+    assert state["speculative_adopted"] is True
+    assert SPECULATIVE_TRANSLATIONS.value(outcome="adopted") == before + 1
+
+
+def test_failed_speculative_translation_counts_as_failed():
+    adopted = SPECULATIVE_TRANSLATIONS.value(outcome="adopted")
+    failed = SPECULATIVE_TRANSLATIONS.value(outcome="failed")
+    state = SpeculativeResolveNode().run(_speculative_state("", speculative_error="timeout"))
+    # 일반 번역 경로로 다시 번역한 결과
+    state["translated_text"] = "안녕하세요"
+    record_request(state, 0.5, mode="sync")
+
+    assert state["speculative_adopted"] is False
+    assert SPECULATIVE_TRANSLATIONS.value(outcome="adopted") == adopted
+    assert SPECULATIVE_TRANSLATIONS.value(outcome="failed") == failed + 1
+
+
+def test_branch_latencies_are_observed():
+    safeguard = _branch_count("safeguard")
+    translate = _branch_count("translate")
+    state = SpeculativeResolveNode().run(_speculative_state("안녕하세요"))
+    record_request(state, 0.5, mode="sync")
+
+    assert _branch_count("safeguard") == safeguard + 1
+    assert _branch_count("translate") == translate + 1
@@ -0,0 +1,38 @@
+"""규칙 기반 번역 품질 검사 노드 테스트."""
+
+import pytest
+
+from firstsession.core.translate.nodes.heuristic_qc_node import HeuristicQcNode, HeuristicQcRule
+
+_NUMBERS = HeuristicQcRule.NUMBERS_NOT_PRESERVED.value
+
+
+@pytest.fixture
+def node() -> HeuristicQcNode:
+    return HeuristicQcNode()
+
+
+@pytest.mark.parametrize(
+    ("source", "translated", "source_language"),
+    [
+        ("تأسست الشركة في عام ٢٠٢٤", "The company was founded in 2024", "ar"),
+        ("The company was founded in 2024", "تأسست الشركة في عام ٢٠٢٤", "en"),
+        ("２０２４年に設立された", "It was founded in 2024", "ja"),
+        ("Price: 1,234.50 dollars", "Price: 1.234,50 dollars", "en"),
+    ],
+)
+def test_numbers_in_other_digit_systems_are_preserved(node, source, translated, source_language):
+    _, violations = node.check(source, translated, source_language, "en")
+    assert _NUMBERS not in violations
+
+
+@pytest.mark.parametrize(
+    ("source", "translated"),
+    [
+        ("تأسست الشركة في عام ٢٠٢٤", "The company was founded in 2023"),
+        ("The meeting is at 10 on floor 3", "The meeting is at 10 on the top floor"),
+    ],
+)
+def test_missing_numbers_are_flagged(node, source, translated):
+    _, violations = node.check(source, translated, "ar", "en")
+    assert _NUMBERS in violations
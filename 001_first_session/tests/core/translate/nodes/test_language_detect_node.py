@@ -0,0 +1,62 @@
+"""언어 감지 노드 테스트."""
+
+from firstsession.core.translate.nodes.language_detect_node import LanguageDetectConfig, LanguageDetectNode
+
+# 가나 없이 한자만으로 된 일본어 문장(12자 이상)
+_KANJI_ONLY_JAPANESE = "東京都千代田区丸之内一丁目営業時間変更"
+_ENGLISH = "The quick brown fox jumps over the lazy dog and runs into the forest."
+
+
+def _state(text: str, source_language: str, target_language: str) -> dict:
+    return {
+        "source_language": source_language,
+        "target_language": target_language,
+        "text": text,
+        "normalized_text": text,
+    }
+
+
+def test_default_policy_does_not_reject_mismatch():
+    node = LanguageDetectNode()
+    state = node.run(_state(_ENGLISH, "fr", "ko"))
+    assert state["language_check"] == "IGNORED"
+    assert state["source_language"] == "fr"
+    assert "translated_text" not in state
+
+
+def test_reject_policy_marks_confident_mismatch():
+    node = LanguageDetectNode(LanguageDetectConfig(mismatch_policy="reject"))
+    state = node.run(_state(_ENGLISH, "fr", "ko"))
+    assert state["language_check"] == "MISMATCH"
+    assert state["error"]
+
+
+def test_kanji_only_japanese_is_not_rejected():
+    node = LanguageDetectNode(LanguageDetectConfig(mismatch_policy="reject"))
+    state = node.run(_state(_KANJI_ONLY_JAPANESE, "ja", "ko"))
+    assert state["language_check"] == "MATCHED"
+    assert state["source_language"] == "ja"
+
+
+def test_kanji_only_japanese_to_chinese_is_translated():
+    node = LanguageDetectNode(LanguageDetectConfig(mismatch_policy="reject"))
+    state = node.run(_state(_KANJI_ONLY_JAPANESE, "ja", "zh"))
+    assert state["language_check"] == "MATCHED"
+    assert "translated_text" not in state
+
+
+def test_han_only_guess_is_below_mismatch_margin():
+    node = LanguageDetectNode(LanguageDetectConfig(mismatch_policy="correct"))
+    state = node.run(_state(_KANJI_ONLY_JAPANESE, "en", "ko"))
+    assert state["language_check"] == "IGNORED"
+    assert state["source_language"] == "en"
+
+
+def test_packed_input_is_not_checked():
+    node = LanguageDetectNode(LanguageDetectConfig(mismatch_policy="reject"))
+    state = _state("[[0]] " + _ENGLISH, "fr", "en")
+    state["packed"] = True
+    state = node.run(state)
+    assert state["language_check"] == ""
+    assert state["source_language"] == "fr"
+    assert "translated_text" not in state
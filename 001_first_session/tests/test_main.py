@@ -0,0 +1,28 @@
+"""애플리케이션 수명 주기 테스트."""
+
+from fastapi.testclient import TestClient
+
+from firstsession.benchmark.fake_genai_client import FakeGenaiClient, FakeModelConfig
+from firstsession.config.settings import CacheSettings, MemorySettings, Settings
+from firstsession.core.translate.cache.translation_cache import TranslationCache
+from firstsession.core.translate.client.gemini_client import GeminiClient
+from firstsession.core.translate.memory.translation_memory import TranslationMemory
+from firstsession.main import create_app
+
+
+def test_shutdown_closes_cache_and_memory(tmp_path, monkeypatch):
+    closed: list[str] = []
+    monkeypatch.setattr(TranslationCache, "close", lambda self: closed.append("cache"))
+    monkeypatch.setattr(TranslationMemory, "close", lambda self: closed.append("memory"))
+    app_settings = Settings(
+        cache=CacheSettings(persistent_backend="sqlite", sqlite_path=str(tmp_path / "cache.sqlite3")),
+        memory=MemorySettings(enabled=True, sqlite_path=str(tmp_path / "memory.sqlite3")),
+    )
+    model_client = GeminiClient(app_settings.model_client, genai_client=FakeGenaiClient(FakeModelConfig()))
+    app = create_app(app_settings, model_client=model_client)
+
+    with TestClient(app) as client:
+        assert client.get("/health").json() == {"status": "ok"}
+        assert closed == []
+
+    assert closed == ["cache", "memory"]
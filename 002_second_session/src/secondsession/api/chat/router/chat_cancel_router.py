@@ -34,6 +34,6 @@ class ChatCancelRouter:
             response_model=ChatJobCancelResponse,
         )
 
-    def cancel_chat_job(self, job_id: str) -> ChatJobCancelResponse:
+    async def cancel_chat_job(self, job_id: str) -> ChatJobCancelResponse:
         """대화 작업을 취소한다."""
-        return self._service.cancel(job_id)
+        return await self._service.cancel(job_id)
@@ -5,7 +5,7 @@
 
 """대화 스트리밍 라우터 모듈."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Query, Request
 from fastapi.responses import StreamingResponse
 
 from secondsession.api.chat.service import ChatService
@@ -32,10 +32,29 @@ class ChatStreamRouter:
             methods=["GET"],
         )
 
-    def stream_chat(self, job_id: str) -> StreamingResponse:
-        """대화 스트리밍 엔드포인트."""
+    async def stream_chat(
+        self,
+        job_id: str,
+        request: Request,
+        last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+        seq: int | None = Query(default=None, ge=0, description="이 seq 다음 이벤트부터 이어 받는다"),
+    ) -> StreamingResponse:
+        """대화 스트리밍 엔드포인트.
+
+        브라우저 EventSource는 재연결 시 마지막으로 받은 id를 Last-Event-ID 헤더로 보내고,
+        헤더를 보낼 수 없는 클라이언트는 seq 쿼리로 재개 위치를 지정한다(헤더 우선).
+        이벤트가 없는 동안 하트비트 주석을 보내고, done 전에 구독자가 모두 떠나면 유예 후 작업을 취소한다.
+        """
+        last_seq = seq or 0
+        if last_event_id is not None and last_event_id.strip().isdigit():
+            last_seq = int(last_event_id.strip())
         return StreamingResponse(
-            self._service.stream_events(job_id),
+            self._service.stream_events(
+                job_id,
+                last_seq=last_seq,
+                is_disconnected=request.is_disconnected,
+            ),
             media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache"},
+            # 프록시(nginx 등)가 응답을 버퍼링하면 토큰이 묶여서 늦게 도착한다.
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
@@ -5,8 +5,13 @@
 
 """대화 서비스 인터페이스 모듈."""
 
-from collections.abc import Iterable
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 
+from secondsession.api.chat.const import StreamEventType
 from secondsession.api.chat.model import (
     ChatJobRequest,
     ChatJobResponse,
@@ -14,18 +19,48 @@ from secondsession.api.chat.model import (
     ChatJobCancelResponse,
 )
 from secondsession.core.chat.graphs.chat_graph import ChatGraph
+from secondsession.core.common.queue import ChatJobQueue, ChatStreamEventQueue
+
+# 프록시가 유휴 연결을 끊지 않도록 보내는 SSE 주석 라인(클라이언트는 무시한다)
+_HEARTBEAT_LINE = ": ping\n\n"
 
 
 class ChatService:
     """대화 서비스 인터페이스."""
 
-    def __init__(self, graph: ChatGraph) -> None:
+    def __init__(
+        self,
+        graph: ChatGraph,
+        event_queue: ChatStreamEventQueue | None = None,
+        stream_block_ms: int = 5000,
+        job_queue: ChatJobQueue | None = None,
+        heartbeat_interval: float = 15.0,
+        cancel_on_disconnect: bool = True,
+        cancel_grace_seconds: float = 15.0,
+    ) -> None:
         """서비스 의존성을 초기화한다.
 
         Args:
             graph: 대화 그래프 실행기.
+            event_queue: 스트리밍 이벤트 큐(Redis Streams).
+            stream_block_ms: 새 이벤트를 기다리는 XREAD BLOCK 시간(밀리초). 연결 끊김 확인 주기이기도 하다.
+            job_queue: 대화 작업 큐(취소 플래그 기록에 사용한다).
+            heartbeat_interval: 이벤트가 없을 때 하트비트 주석을 보내는 간격(초).
+            cancel_on_disconnect: done 전에 구독자가 모두 떠나면 작업을 취소할지 여부.
+            cancel_grace_seconds: 마지막 구독자가 떠난 뒤 취소 전까지 재연결을 기다리는 시간(초).
+                EventSource 재연결 간격보다 길어야 한다.
         """
         self._graph = graph
+        self._event_queue = event_queue
+        self._stream_block_ms = stream_block_ms
+        self._job_queue = job_queue
+        self._heartbeat_interval = heartbeat_interval
+        self._cancel_on_disconnect = cancel_on_disconnect
+        self._cancel_grace_seconds = cancel_grace_seconds
+        # 구독자 lease: 유휴 중에도 BLOCK이 끝날 때마다 갱신되므로 BLOCK 몇 번 분량이면 충분하다.
+        self._reader_lease_seconds = max(3 * stream_block_ms / 1000, 10.0)
+        # 유예 시간 뒤 취소 여부를 확인하는 태스크(GC로 사라지지 않도록 참조를 보관한다)
+        self._pending_cancel_checks: set[asyncio.Task] = set()
 
     def create_job(self, request: ChatJobRequest) -> ChatJobResponse:
         """대화 작업을 생성한다.
@@ -41,19 +76,96 @@ class ChatService:
         """
         raise NotImplementedError("대화 작업 생성 로직을 구현해야 합니다.")
 
-    def stream_events(self, job_id: str) -> Iterable[str]:
+    async def stream_events(
+        self,
+        job_id: str,
+        last_seq: int = 0,
+        is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+    ) -> AsyncIterator[str]:
         """스트리밍 이벤트를 SSE 라인으로 반환한다.
 
-        TODO:
-            - Redis에서 이벤트를 소비
-            - done 이벤트까지 전송
-            - 대화 응답 토큰과 메타데이터를 순서대로 전달
-            - seq는 job_id 기준으로 단조 증가하도록 구성
-            - type/token/metadata/error/done 포맷을 유지
-            - 종료 시 done 이벤트를 반드시 적재
-            - 폴백 에러 코드가 있는 경우 error 이벤트를 먼저 전송
+        job 스트림을 XREAD BLOCK으로 기다리며 읽으므로 폴링 간격 없이 이벤트가 적재되는 즉시 전송한다.
+        이벤트를 지우지 않고 읽으므로 여러 API 인스턴스/탭이 같은 job을 동시에 구독할 수 있고,
+        재연결 시 마지막으로 받은 seq(SSE Last-Event-ID) 다음 이벤트부터 이어서 받는다.
+        이벤트가 없는 동안에는 heartbeat_interval마다 `: ping` 주석을 보내고 BLOCK이 끝날 때마다
+        연결 끊김을 확인한다. 연결마다 구독자 lease를 등록하고, done 전에 연결이 끊기면
+        cancel_grace_seconds 뒤에도 남은 구독자(다른 탭/인스턴스, 재연결)가 없을 때만 작업을 취소한다.
+
+        Args:
+            job_id: 작업 식별자.
+            last_seq: 이미 받은 마지막 seq(처음 연결이면 0).
+            is_disconnected: 클라이언트 연결이 끊겼는지 확인하는 함수(예: Request.is_disconnected).
+
+        Yields:
+            str: `id: {seq}` + `data: {json}` 형식의 SSE 이벤트 또는 하트비트 주석. done 이벤트를 보내면 종료한다.
         """
-        raise NotImplementedError("스트리밍 이벤트 소비 로직을 구현해야 합니다.")
+        if self._event_queue is None:
+            raise RuntimeError("스트리밍 이벤트 큐(REDIS_URL)가 설정되어야 합니다.")
+        cursor = last_seq
+        finished = False
+        last_sent = time.monotonic()
+        reader_id = uuid.uuid4().hex
+        await self._event_queue.register_reader(job_id, reader_id, self._reader_lease_seconds)
+        lease_renewed = time.monotonic()
+        try:
+            while True:
+                if time.monotonic() - lease_renewed >= self._reader_lease_seconds / 3:
+                    await self._event_queue.register_reader(job_id, reader_id, self._reader_lease_seconds)
+                    lease_renewed = time.monotonic()
+                events, cursor = await self._event_queue.read_events(
+                    job_id,
+                    after_seq=cursor,
+                    block_ms=self._stream_block_ms,
+                )
+                if not events:
+                    if is_disconnected is not None and await is_disconnected():
+                        return
+                    if time.monotonic() - last_sent >= self._heartbeat_interval:
+                        last_sent = time.monotonic()
+                        yield _HEARTBEAT_LINE
+                    continue
+                for event in events:
+                    yield self._to_sse(event)
+                    if event.get("type") == StreamEventType.DONE.value:
+                        finished = True
+                        return
+                last_sent = time.monotonic()
+        except Exception:
+            # Redis 오류 등 서버 측 실패는 연결 끊김이 아니므로 작업을 취소하지 않는다.
+            finished = True
+            raise
+        finally:
+            # 스트림 태스크가 취소된 상태에서도 lease 해제는 끝까지 실행한다.
+            try:
+                await asyncio.shield(self._leave_stream(job_id, reader_id, abandoned=not finished))
+            except asyncio.CancelledError:
+                pass
+
+    async def _leave_stream(self, job_id: str, reader_id: str, abandoned: bool) -> None:
+        """구독자 lease를 해제하고, done 전에 떠났다면 유예 후 취소 확인을 예약한다."""
+        try:
+            await self._event_queue.unregister_reader(job_id, reader_id)
+        except Exception:
+            # 해제에 실패해도 lease가 만료되면 떠난 것으로 본다.
+            pass
+        if not abandoned or not self._cancel_on_disconnect or self._job_queue is None:
+            return
+        task = asyncio.create_task(self._cancel_if_abandoned(job_id))
+        self._pending_cancel_checks.add(task)
+        task.add_done_callback(self._pending_cancel_checks.discard)
+
+    async def _cancel_if_abandoned(self, job_id: str) -> None:
+        """유예 시간 뒤에도 구독자가 없으면 작업을 취소한다. 실패해도 다른 요청에 영향을 주지 않는다."""
+        try:
+            await asyncio.sleep(self._cancel_grace_seconds)
+            if await self._event_queue.active_readers(job_id) == 0:
+                await self._job_queue.request_cancel(job_id)
+        except Exception:
+            pass
+
+    def _to_sse(self, event: dict) -> str:
+        """이벤트를 SSE 형식 문자열로 변환한다. id는 재연결 시 Last-Event-ID로 돌아온다."""
+        return f"id: {event['seq']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
 
     def get_status(self, job_id: str) -> ChatJobStatusResponse:
         """작업 상태를 조회한다.
@@ -64,11 +176,16 @@ class ChatService:
         """
         raise NotImplementedError("작업 상태 조회 로직을 구현해야 합니다.")
 
-    def cancel(self, job_id: str) -> ChatJobCancelResponse:
-        """작업을 취소한다.
+    async def cancel(self, job_id: str) -> ChatJobCancelResponse:
+        """작업 취소 플래그를 기록한다. 워커가 처리 중 플래그를 확인하고 멈춘다.
 
-        TODO:
-            - 취소 플래그 기록
-            - 워커가 취소를 확인하도록 구성
+        Args:
+            job_id: 작업 식별자.
+
+        Returns:
+            ChatJobCancelResponse: 취소 요청 결과.
         """
-        raise NotImplementedError("작업 취소 로직을 구현해야 합니다.")
+        if self._job_queue is None:
+            raise RuntimeError("작업 큐(REDIS_URL)가 설정되어야 합니다.")
+        await self._job_queue.request_cancel(job_id)
+        return ChatJobCancelResponse(job_id=job_id, status="cancel_requested")
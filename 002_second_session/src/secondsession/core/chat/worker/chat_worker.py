@@ -7,14 +7,17 @@
 
 from __future__ import annotations
 
+import os
+import socket
+import uuid
 from typing import Any
 
 from secondsession.core.chat.graphs import ChatGraph
-from secondsession.core.common.queue import ChatJobQueue, ChatStreamEventQueue
-from secondsession.core.common.worker import WorkerBase
+from secondsession.core.common.queue import ChatJobQueue, ChatStreamEventQueue, ChatStreamEventWriter
+from secondsession.core.common.worker import AsyncWorkerBase
 
 
-class ChatWorker(WorkerBase):
+class ChatWorker(AsyncWorkerBase):
     """대화 워커."""
 
     def __init__(
@@ -23,6 +26,11 @@ class ChatWorker(WorkerBase):
         event_queue: ChatStreamEventQueue,
         checkpointer: Any,
         poll_interval: float = 0.1,
+        block_timeout: float = 1.0,
+        worker_id: str | None = None,
+        concurrency: int = 1,
+        event_flush_interval: float = 0.01,
+        event_flush_max_events: int = 32,
     ) -> None:
         """워커를 초기화한다.
 
@@ -30,24 +38,89 @@ class ChatWorker(WorkerBase):
             job_queue: 대화 작업 큐.
             event_queue: 스트리밍 이벤트 큐.
             checkpointer: LangGraph 체크포인터.
-            poll_interval: 큐 폴링 간격(초).
+            poll_interval: 큐 오류 시 재시도 전 대기 간격(초).
+            block_timeout: 블로킹 dequeue 최대 대기 시간(초). 종료 요청 확인 주기이기도 하다.
+            worker_id: 워커 식별자. 없으면 호스트명/PID 기반으로 만든다.
+            concurrency: 동시에 처리할 최대 작업 수(슬롯 수).
+            event_flush_interval: token 이벤트를 모아 적재하기까지 기다리는 최대 시간(초).
+            event_flush_max_events: 이 개수만큼 모이면 바로 적재한다.
         """
-        super().__init__(poll_interval=poll_interval)
+        # 하트비트는 가시성 타임아웃 안에 세 번 이상 갱신되도록 한다.
+        super().__init__(
+            poll_interval=poll_interval,
+            maintenance_interval=job_queue.visibility_timeout / 3,
+            concurrency=concurrency,
+        )
         self._job_queue = job_queue
         self._event_queue = event_queue
         self._checkpointer = checkpointer
+        self._block_timeout = block_timeout
+        self._event_flush_interval = event_flush_interval
+        self._event_flush_max_events = event_flush_max_events
+        self._worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
-    def _dequeue_job(self) -> dict | None:
-        """큐에서 작업을 꺼낸다."""
-        return self._job_queue.dequeue()
+    @property
+    def worker_id(self) -> str:
+        """워커 식별자."""
+        return self._worker_id
 
-    def _process_job(self, job: dict) -> None:
+    async def _dequeue_job(self) -> dict | None:
+        """큐에서 작업을 꺼낸다(작업이 올 때까지 block_timeout 동안 블로킹)."""
+        return await self._job_queue.dequeue(self._worker_id, timeout=self._block_timeout)
+
+    async def _ack_job(self, job: dict) -> None:
+        """처리를 마친 작업을 처리 중 리스트에서 지운다."""
+        await self._job_queue.ack(self._worker_id, job)
+
+    async def _heartbeat(self) -> None:
+        """워커 생존 키를 갱신하며 직전 주기의 슬롯별 사용률을 보고한다."""
+        utilization = [slot.utilization for slot in self.slot_utilization(reset=True)]
+        await self._job_queue.heartbeat(self._worker_id, utilization)
+
+    async def _requeue_stale_jobs(self) -> None:
+        """죽은 워커의 처리 중 작업을 대기 큐로 되돌린다."""
+        await self._job_queue.requeue_stale()
+
+    async def _open_event_writer(self, job_id: str) -> ChatStreamEventWriter:
+        """job의 이벤트 writer를 만든다.
+
+        reaper가 되돌린 작업을 다시 처리할 때도 seq가 이어지도록 스트림의 마지막 seq부터 시작한다.
+
+        Args:
+            job_id: 작업 식별자.
+
+        Returns:
+            ChatStreamEventWriter: token 이벤트를 묶어 적재하는 writer.
+        """
+        return ChatStreamEventWriter(
+            self._event_queue,
+            job_id,
+            start_seq=await self._event_queue.last_seq(job_id),
+            flush_interval=self._event_flush_interval,
+            max_batch=self._event_flush_max_events,
+        )
+
+    async def _is_cancelled(self, job_id: str) -> bool:
+        """작업 취소가 요청되었는지 확인한다(API 취소 또는 스트림 연결 끊김).
+
+        Args:
+            job_id: 작업 식별자.
+
+        Returns:
+            bool: 취소 요청 여부.
+        """
+        return await self._job_queue.is_cancel_requested(job_id)
+
+    async def _process_job(self, job: dict) -> None:
         """단일 작업을 처리한다.
 
         TODO:
             - 그래프를 빌드하고 invoke/stream을 실행한다.
             - config에 thread_id를 넣어 체크포인터 복구를 활성화한다.
-            - 실행 중 token/metadata/error 이벤트를 event_queue에 적재한다.
+            - 실행 중 token/metadata/error 이벤트를 `_open_event_writer`로 만든 writer에 쓴다
+              (`async with` 블록으로 감싸 종료 시 남은 이벤트를 적재한다. seq는 writer가 부여한다).
+            - 시작 전과 토큰 사이(예: writer 적재 주기마다)에 `_is_cancelled`를 확인하고,
+              취소되면 LLM 호출을 멈추고 done을 적재한 뒤 종료한다.
             - 메타데이터 content는 JSON 문자열(예: event, message, route, timestamp)을 사용한다.
             - error 발생 시 error → done 순서로 적재한다.
             - done 이벤트를 반드시 적재하고 종료한다.
@@ -21,6 +21,23 @@ class AppConfig:
     llm_temperature: float
     llm_timeout: float
     redis_url: str | None
+    # 스트리밍 이벤트(Redis Streams): job 스트림 최대 길이, 보관 시간(초), XREAD 대기 시간(밀리초)
+    stream_maxlen: int = 10000
+    stream_ttl_seconds: int = 3600
+    stream_block_ms: int = 5000
+    # 워커의 token 이벤트 묶음 적재: 최대 대기 시간(밀리초), 최대 묶음 크기
+    stream_flush_interval_ms: int = 10
+    stream_flush_max_events: int = 32
+    # SSE: 유휴 시 하트비트 간격(초), done 전에 구독자가 모두 떠나면 작업 취소 여부와 재연결 유예 시간(초)
+    stream_heartbeat_seconds: float = 15.0
+    stream_cancel_on_disconnect: bool = True
+    stream_cancel_grace_seconds: float = 15.0
+    # 작업 큐: 하트비트가 끊긴 워커의 작업을 되돌리기까지의 시간(초)
+    job_visibility_timeout: float = 30.0
+    # 워커: 프로세스 수, 프로세스당 동시 처리 작업 수, 종료 시 드레인 대기 시간(초)
+    worker_processes: int = 1
+    worker_concurrency: int = 8
+    worker_shutdown_timeout: float = 30.0
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -44,4 +61,17 @@ class AppConfig:
             llm_temperature=parse_float(os.getenv("LLM_TEMPERATURE"), 0.0),
             llm_timeout=parse_float(os.getenv("LLM_TIMEOUT"), 30.0),
             redis_url=os.getenv("REDIS_URL"),
+            stream_maxlen=int(parse_float(os.getenv("STREAM_MAXLEN"), 10000)),
+            stream_ttl_seconds=int(parse_float(os.getenv("STREAM_TTL_SECONDS"), 3600)),
+            stream_block_ms=int(parse_float(os.getenv("STREAM_BLOCK_MS"), 5000)),
+            stream_flush_interval_ms=int(parse_float(os.getenv("STREAM_FLUSH_INTERVAL_MS"), 10)),
+            stream_flush_max_events=int(parse_float(os.getenv("STREAM_FLUSH_MAX_EVENTS"), 32)),
+            stream_heartbeat_seconds=parse_float(os.getenv("STREAM_HEARTBEAT_SECONDS"), 15.0),
+            stream_cancel_on_disconnect=os.getenv("STREAM_CANCEL_ON_DISCONNECT", "true").strip().lower()
+            not in ("0", "false", "no"),
+            stream_cancel_grace_seconds=parse_float(os.getenv("STREAM_CANCEL_GRACE_SECONDS"), 15.0),
+            job_visibility_timeout=parse_float(os.getenv("JOB_VISIBILITY_TIMEOUT"), 30.0),
+            worker_processes=int(parse_float(os.getenv("WORKER_PROCESSES"), 1)),
+            worker_concurrency=int(parse_float(os.getenv("WORKER_CONCURRENCY"), 8)),
+            worker_shutdown_timeout=parse_float(os.getenv("WORKER_SHUTDOWN_TIMEOUT"), 30.0),
         )
@@ -1,11 +1,13 @@
 # 목적: 큐 모듈을 외부에 노출한다.
-# 설명: 대화 작업 큐와 스트리밍 이벤트 큐를 집계한다.
+# 설명: 대화 작업 큐와 스트리밍 이벤트 큐/writer를 집계한다.
 # 디자인 패턴: 파사드
-# 참조: secondsession/core/common/queue/chat_job_queue.py
+# 참조: secondsession/core/common/queue/chat_job_queue.py,
+#       secondsession/core/common/queue/chat_stream_event_writer.py
 
 """큐 패키지."""
 
 from secondsession.core.common.queue.chat_job_queue import ChatJobQueue
 from secondsession.core.common.queue.chat_stream_event_queue import ChatStreamEventQueue
+from secondsession.core.common.queue.chat_stream_event_writer import ChatStreamEventWriter
 
-__all__ = ["ChatJobQueue", "ChatStreamEventQueue"]
+__all__ = ["ChatJobQueue", "ChatStreamEventQueue", "ChatStreamEventWriter"]
@@ -1,5 +1,8 @@
 # 목적: 대화 작업 큐를 정의한다.
 # 설명: Redis 리스트 기반으로 작업을 적재/소비한다.
+#       소비는 BLMOVE로 대기 큐에서 워커별 처리 중 리스트로 원자적으로 옮기고(블로킹, 폴링 없음),
+#       처리가 끝나면 ack로 처리 중 리스트에서 지운다. 하트비트가 끊긴(죽은) 워커의 처리 중 작업은
+#       reaper가 가시성 타임아웃 이후 대기 큐 앞쪽으로 되돌린다. 작업 취소는 job_id별 플래그 키로 알린다.
 # 디자인 패턴: Repository, Producer-Consumer
 # 참조: docs/02_backend_service_layer/04_Redis_캐시_rpush_lpop.md
 
@@ -8,40 +11,196 @@
 import json
 from typing import Any
 
+# 작업 페이로드 필수 필드
+_REQUIRED_FIELDS = ("job_id", "trace_id", "thread_id", "query")
+
 
 class ChatJobQueue:
-    """대화 작업 큐."""
+    """대화 작업 큐(신뢰성 있는 소비: BLMOVE + ack + reaper)."""
 
-    def __init__(self, redis_client: Any, key: str = "chat:jobs") -> None:
+    def __init__(
+        self,
+        redis_client: Any,
+        key: str = "chat:jobs",
+        visibility_timeout: float = 30.0,
+        cancel_key_prefix: str = "chat:cancel",
+        cancel_ttl_seconds: int = 3600,
+    ) -> None:
         """큐를 초기화한다.
 
         Args:
-            redis_client: Redis 클라이언트.
+            redis_client: 비동기 Redis 클라이언트(redis.asyncio.Redis).
             key: 작업 큐 키.
+            visibility_timeout: 워커 하트비트가 이 시간(초) 동안 없으면 죽은 것으로 보고
+                처리 중이던 작업을 다시 대기 큐에 넣는다.
+            cancel_key_prefix: job_id별 취소 플래그 키 접두사.
+            cancel_ttl_seconds: 취소 플래그 보관 시간(초).
         """
         self._redis = redis_client
         self._key = key
+        self._visibility_timeout = visibility_timeout
+        self._cancel_key_prefix = cancel_key_prefix
+        self._cancel_ttl_seconds = cancel_ttl_seconds
+        # ack 시 LREM에 필요한 원본 문자열(job_id → 직렬화된 페이로드)
+        self._leases: dict[str, str] = {}
+
+    @property
+    def visibility_timeout(self) -> float:
+        """가시성 타임아웃(초)."""
+        return self._visibility_timeout
+
+    def _processing_key(self, worker_id: str) -> str:
+        return f"{self._key}:processing:{worker_id}"
+
+    def _alive_key(self, worker_id: str) -> str:
+        return f"{self._key}:alive:{worker_id}"
+
+    @property
+    def _workers_key(self) -> str:
+        # 처리 중 리스트를 가진 워커 목록(reaper가 SCAN 없이 확인한다)
+        return f"{self._key}:workers"
+
+    @property
+    def _dead_letter_key(self) -> str:
+        # 역직렬화/검증에 실패한 페이로드 보관 리스트
+        return f"{self._key}:dead"
+
+    def _validate(self, payload: dict) -> None:
+        missing = [field for field in _REQUIRED_FIELDS if not payload.get(field)]
+        if missing:
+            raise ValueError(f"작업 필수 필드가 없습니다: {', '.join(missing)}")
 
     async def enqueue(self, payload: dict) -> None:
         """작업을 큐에 적재한다.
 
-        TODO:
-            - payload 필수 필드(job_id, trace_id, thread_id, query)를 검증한다.
-            - JSON 문자열로 직렬화한다(UTF-8, ensure_ascii=False).
-            - rpush로 큐에 적재한다.
-            - 직렬화 실패/Redis 오류 정책을 정의한다(로깅/예외).
+        Args:
+            payload: job_id/trace_id/thread_id/query를 포함한 작업 페이로드.
+
+        Raises:
+            ValueError: 필수 필드가 없는 경우.
+        """
+        self._validate(payload)
+        await self._redis.rpush(self._key, json.dumps(payload, ensure_ascii=False))
+
+    async def dequeue(self, worker_id: str, timeout: float = 1.0) -> dict | None:
+        """작업 하나를 워커의 처리 중 리스트로 옮기며 꺼낸다.
+
+        작업이 들어올 때까지 최대 timeout초 동안 블로킹하므로 폴링 지연이 없다.
+        꺼낸 작업은 ack 전까지 처리 중 리스트에 남아 워커가 죽어도 잃어버리지 않는다.
+
+        Args:
+            worker_id: 워커 식별자.
+            timeout: 최대 대기 시간(초).
+
+        Returns:
+            dict | None: 작업 페이로드. 시간 안에 작업이 없거나 깨진 페이로드면 None.
+        """
+        processing_key = self._processing_key(worker_id)
+        raw = await self._redis.blmove(self._key, processing_key, timeout, "LEFT", "RIGHT")
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        try:
+            payload = json.loads(raw)
+            if not isinstance(payload, dict):
+                raise ValueError("작업 페이로드는 JSON 객체여야 합니다.")
+            self._validate(payload)
+        except ValueError:
+            # 다시 시도해도 실패하므로 dead 리스트로 옮기고 건너뛴다.
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.lrem(processing_key, 1, raw)
+            pipe.rpush(self._dead_letter_key, raw)
+            await pipe.execute()
+            return None
+        self._leases[payload["job_id"]] = raw
+        return payload
+
+    async def ack(self, worker_id: str, payload: dict) -> None:
+        """처리를 마친 작업을 처리 중 리스트에서 지운다.
+
+        Args:
+            worker_id: 작업을 꺼낸 워커 식별자.
+            payload: dequeue가 반환한 작업 페이로드.
+        """
+        raw = self._leases.pop(payload["job_id"], None)
+        if raw is None:
+            raw = json.dumps(payload, ensure_ascii=False)
+        await self._redis.lrem(self._processing_key(worker_id), 1, raw)
+
+    async def heartbeat(self, worker_id: str, utilization: list[float] | None = None) -> None:
+        """워커가 살아 있음을 기록한다. 가시성 타임아웃보다 짧은 간격으로 호출해야 한다.
+
+        Args:
+            worker_id: 워커 식별자.
+            utilization: 슬롯별 사용률(0.0 ~ 1.0). 생존 키 값으로 함께 보고한다.
+        """
+        value = json.dumps({"slots": [round(ratio, 3) for ratio in utilization or []]})
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.set(self._alive_key(worker_id), value, px=int(self._visibility_timeout * 1000))
+        pipe.sadd(self._workers_key, worker_id)
+        await pipe.execute()
+
+    async def worker_utilization(self) -> dict[str, list[float]]:
+        """살아 있는 워커의 마지막 하트비트 기준 슬롯별 사용률을 반환한다.
+
+        Returns:
+            dict[str, list[float]]: worker_id → 슬롯별 사용률.
+        """
+        worker_ids = [
+            worker_id.decode("utf-8") if isinstance(worker_id, bytes) else worker_id
+            for worker_id in await self._redis.smembers(self._workers_key)
+        ]
+        if not worker_ids:
+            return {}
+        values = await self._redis.mget([self._alive_key(worker_id) for worker_id in worker_ids])
+        report: dict[str, list[float]] = {}
+        for worker_id, raw in zip(worker_ids, values):
+            if raw is None:
+                continue
+            try:
+                report[worker_id] = list(json.loads(raw).get("slots", []))
+            except (AttributeError, TypeError, ValueError):
+                report[worker_id] = []
+        return report
+
+    def _cancel_key(self, job_id: str) -> str:
+        return f"{self._cancel_key_prefix}:{job_id}"
+
+    async def request_cancel(self, job_id: str) -> None:
+        """작업 취소 플래그를 기록한다. 워커는 처리 중 주기적으로 확인하고 멈춘다.
+
+        Args:
+            job_id: 작업 식별자.
+        """
+        await self._redis.set(self._cancel_key(job_id), "1", ex=self._cancel_ttl_seconds)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        """작업 취소가 요청되었는지 확인한다.
+
+        Args:
+            job_id: 작업 식별자.
+
+        Returns:
+            bool: 취소 요청 여부.
         """
-        _ = json.dumps(payload, ensure_ascii=False)
-        raise NotImplementedError("대화 작업 큐 적재 로직을 구현해야 합니다.")
+        return bool(await self._redis.exists(self._cancel_key(job_id)))
 
-    async def dequeue(self) -> dict | None:
-        """작업을 큐에서 꺼낸다.
+    async def requeue_stale(self) -> int:
+        """하트비트가 끊긴 워커의 처리 중 작업을 대기 큐 앞쪽으로 되돌린다(reaper).
 
-        TODO:
-            - lpop으로 큐에서 하나를 가져온다.
-            - 값이 없으면 None을 반환한다.
-            - JSON을 dict로 역직렬화한다.
-            - 역직렬화 실패 시 스킵/로깅 규칙을 정의한다.
-            - 필수 필드가 없으면 에러 처리 정책을 정의한다.
+        Returns:
+            int: 되돌린 작업 수.
         """
-        raise NotImplementedError("대화 작업 큐 소비 로직을 구현해야 합니다.")
+        requeued = 0
+        for worker_id in await self._redis.smembers(self._workers_key):
+            if isinstance(worker_id, bytes):
+                worker_id = worker_id.decode("utf-8")
+            if await self._redis.exists(self._alive_key(worker_id)):
+                continue
+            processing_key = self._processing_key(worker_id)
+            # 뒤에서부터 앞쪽으로 옮기면 원래 순서대로 대기 큐 맨 앞에 선다.
+            while await self._redis.lmove(processing_key, self._key, "RIGHT", "LEFT") is not None:
+                requeued += 1
+            await self._redis.srem(self._workers_key, worker_id)
+        return requeued
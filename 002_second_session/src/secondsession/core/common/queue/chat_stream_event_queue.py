@@ -1,50 +1,200 @@
 # 목적: 스트리밍 이벤트 큐를 정의한다.
-# 설명: Redis 리스트 기반으로 이벤트를 적재/소비한다.
+# 설명: Redis Streams(XADD/XREAD) 기반으로 job_id별 이벤트를 적재/조회한다.
+#       여러 이벤트는 XADD를 파이프라인으로 묶어 왕복 1회로 적재한다.
+#       job별 구독자(reader) lease를 sorted set으로 관리해 남은 구독자가 있는지 확인할 수 있다.
+#       엔트리 ID를 seq로 고정(`{seq}-0`)하므로 SSE 재연결 시 Last-Event-ID(seq) 이후부터 이어 읽을 수 있고,
+#       읽어도 지워지지 않아 여러 API 인스턴스/탭이 같은 job 스트림을 함께 읽을 수 있다.
 # 디자인 패턴: Repository, Producer-Consumer
 # 참조: docs/02_backend_service_layer/04_Redis_캐시_rpush_lpop.md
 
 """스트리밍 이벤트 큐 모듈."""
 
 import json
+import time
 from typing import Any
 
+# 이벤트 필수 필드
+_REQUIRED_FIELDS = ("type", "trace_id", "seq")
+# 스트림 엔트리 안에서 이벤트 JSON을 담는 필드 이름
+_DATA_FIELD = "data"
+
 
 class ChatStreamEventQueue:
-    """스트리밍 이벤트 큐."""
+    """스트리밍 이벤트 큐(Redis Streams)."""
 
-    def __init__(self, redis_client: Any, key_prefix: str = "chat:stream") -> None:
+    def __init__(
+        self,
+        redis_client: Any,
+        key_prefix: str = "chat:stream",
+        maxlen: int = 10000,
+        ttl_seconds: int = 3600,
+    ) -> None:
         """큐를 초기화한다.
 
         Args:
-            redis_client: Redis 클라이언트.
+            redis_client: 비동기 Redis 클라이언트(redis.asyncio.Redis).
             key_prefix: job_id별 이벤트 키 접두사.
+            maxlen: job 스트림 하나에 보관할 최대 이벤트 수(XADD MAXLEN ~ 로 대략 트리밍).
+            ttl_seconds: 마지막 적재 후 스트림 키를 보관하는 시간(초).
         """
         self._redis = redis_client
         self._key_prefix = key_prefix
+        self._maxlen = maxlen
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, job_id: str) -> str:
+        """job_id별 스트림 키를 만든다."""
+        return f"{self._key_prefix}:{job_id}"
+
+    def _readers_key(self, job_id: str) -> str:
+        """job_id별 구독자 lease 키를 만든다(member = reader_id, score = lease 만료 시각(ms))."""
+        return f"{self._key_prefix}:{job_id}:readers"
+
+    def _serialize(self, event: dict) -> str:
+        """필수 필드를 검증하고 이벤트를 JSON 문자열로 만든다."""
+        missing = [field for field in _REQUIRED_FIELDS if event.get(field) is None]
+        if missing:
+            raise ValueError(f"이벤트 필수 필드가 없습니다: {', '.join(missing)}")
+        if not isinstance(event["seq"], int) or event["seq"] < 1:
+            raise ValueError("이벤트 seq는 1 이상의 정수여야 합니다.")
+        return json.dumps(event, ensure_ascii=False)
 
     async def push_event(self, job_id: str, event: dict) -> None:
-        """이벤트를 큐에 적재한다.
-
-        TODO:
-            - job_id별 키를 생성한다(f\"{key_prefix}:{job_id}\").
-            - event 필수 필드(type, trace_id, seq)를 검증한다.
-            - event를 JSON 문자열로 직렬화한다(UTF-8, ensure_ascii=False).
-            - rpush로 이벤트를 적재한다.
-            - seq 단조 증가 규칙을 보장한다(워커 측에서 증가).
-        """
-        _ = job_id
-        _ = json.dumps(event, ensure_ascii=False)
-        raise NotImplementedError("스트리밍 이벤트 적재 로직을 구현해야 합니다.")
-
-    async def pop_event(self, job_id: str) -> dict | None:
-        """이벤트를 큐에서 꺼낸다.
-
-        TODO:
-            - job_id별 키를 생성한다.
-            - lpop으로 이벤트를 소비한다.
-            - 값이 없으면 None을 반환한다.
-            - JSON을 dict로 역직렬화한다.
-            - 역직렬화 실패 시 스킵/로깅 규칙을 정의한다.
-        """
-        _ = job_id
-        raise NotImplementedError("스트리밍 이벤트 소비 로직을 구현해야 합니다.")
+        """이벤트를 job 스트림에 적재한다.
+
+        엔트리 ID를 `{seq}-0`으로 지정하므로 seq가 이전 이벤트보다 크지 않으면 Redis가 거절한다
+        (seq 단조 증가는 워커 측에서 보장한다).
+
+        Args:
+            job_id: 작업 식별자.
+            event: type/trace_id/seq를 포함한 이벤트.
+
+        Raises:
+            ValueError: 필수 필드가 없거나 seq가 올바르지 않은 경우.
+        """
+        await self.push_events(job_id, [event])
+
+    async def push_events(self, job_id: str, events: list[dict]) -> None:
+        """여러 이벤트를 한 번의 파이프라인(왕복 1회)으로 순서대로 적재한다.
+
+        Args:
+            job_id: 작업 식별자.
+            events: seq 오름차순 이벤트 목록.
+
+        Raises:
+            ValueError: 필수 필드가 없거나 seq가 올바르지 않거나 오름차순이 아닌 경우(아무것도 적재하지 않는다).
+        """
+        if not events:
+            return
+        # 직렬화/검증을 먼저 끝내 일부만 적재되는 일을 막는다.
+        entries = [(event["seq"], self._serialize(event)) for event in events]
+        if any(prev >= cur for (prev, _), (cur, _) in zip(entries, entries[1:])):
+            raise ValueError("이벤트 seq는 오름차순이어야 합니다.")
+        key = self._key(job_id)
+        pipe = self._redis.pipeline(transaction=False)
+        for seq, data in entries:
+            pipe.xadd(
+                key,
+                {_DATA_FIELD: data},
+                id=f"{seq}-0",
+                maxlen=self._maxlen,
+                approximate=True,
+            )
+        pipe.expire(key, self._ttl_seconds)
+        await pipe.execute()
+
+    async def last_seq(self, job_id: str) -> int:
+        """job 스트림에 마지막으로 적재된 seq를 반환한다(재처리 시 seq를 이어 쓰는 데 사용한다).
+
+        Args:
+            job_id: 작업 식별자.
+
+        Returns:
+            int: 마지막 seq. 스트림이 없으면 0.
+        """
+        entries = await self._redis.xrevrange(self._key(job_id), count=1)
+        if not entries:
+            return 0
+        entry_id = entries[0][0]
+        entry_id = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+        return int(entry_id.split("-", 1)[0])
+
+    async def read_events(
+        self,
+        job_id: str,
+        after_seq: int = 0,
+        block_ms: int | None = None,
+        count: int = 100,
+    ) -> tuple[list[dict], int]:
+        """after_seq 이후의 이벤트를 순서대로 읽는다. 읽은 이벤트는 지우지 않는다.
+
+        Args:
+            job_id: 작업 식별자.
+            after_seq: 이 seq 다음 이벤트부터 읽는다(0이면 처음부터).
+            block_ms: 새 이벤트가 없을 때 기다리는 최대 시간(밀리초). None이면 기다리지 않는다.
+            count: 한 번에 읽을 최대 이벤트 수.
+
+        Returns:
+            tuple[list[dict], int]: seq 순서의 이벤트 목록(기다리는 동안 새 이벤트가 없으면 빈 목록)과
+                다음 호출에 넘길 after_seq(깨진 엔트리도 건너뛴 위치).
+        """
+        response = await self._redis.xread(
+            {self._key(job_id): f"{max(0, after_seq)}-0"},
+            count=count,
+            block=block_ms,
+        )
+        events: list[dict] = []
+        cursor = after_seq
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                entry_id = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+                cursor = max(cursor, int(entry_id.split("-", 1)[0]))
+                raw = fields.get(_DATA_FIELD) or fields.get(_DATA_FIELD.encode())
+                if raw is None:
+                    continue
+                try:
+                    events.append(json.loads(raw))
+                except (TypeError, ValueError):
+                    # 깨진 엔트리는 건너뛴다(다음 엔트리의 seq로 이어 읽는다).
+                    continue
+        return events, cursor
+
+    async def register_reader(self, job_id: str, reader_id: str, lease_seconds: float) -> None:
+        """구독자 lease를 등록하거나 연장한다. lease 안에 다시 호출하지 않으면 떠난 것으로 본다.
+
+        Args:
+            job_id: 작업 식별자.
+            reader_id: 구독자(SSE 연결) 식별자.
+            lease_seconds: lease 유지 시간(초).
+        """
+        key = self._readers_key(job_id)
+        expires_at = int((time.time() + lease_seconds) * 1000)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.zadd(key, {reader_id: expires_at})
+        pipe.expire(key, self._ttl_seconds)
+        await pipe.execute()
+
+    async def unregister_reader(self, job_id: str, reader_id: str) -> None:
+        """구독자 lease를 지운다.
+
+        Args:
+            job_id: 작업 식별자.
+            reader_id: 구독자(SSE 연결) 식별자.
+        """
+        await self._redis.zrem(self._readers_key(job_id), reader_id)
+
+    async def active_readers(self, job_id: str) -> int:
+        """lease가 살아 있는 구독자 수를 반환한다(만료된 lease는 정리한다).
+
+        Args:
+            job_id: 작업 식별자.
+
+        Returns:
+            int: 구독자 수.
+        """
+        key = self._readers_key(job_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.zremrangebyscore(key, "-inf", int(time.time() * 1000))
+        pipe.zcard(key)
+        _, count = await pipe.execute()
+        return int(count)
@@ -0,0 +1,123 @@
+# 목적: job 하나의 스트리밍 이벤트를 모아서 적재한다.
+# 설명: token 이벤트를 버퍼에 모았다가 flush_interval마다 또는 max_batch개가 차면
+#       파이프라인 한 번으로 적재해 토큰당 Redis 왕복을 없앤다.
+#       seq는 writer가 1씩 증가시켜 부여하고 배치는 잠금 아래 순서대로 적재하므로 순서가 보장된다.
+#       error/done 이벤트는 버퍼와 함께 즉시 적재한다.
+# 디자인 패턴: Buffered Writer
+# 참조: secondsession/core/common/queue/chat_stream_event_queue.py,
+#       secondsession/core/chat/worker/chat_worker.py
+
+"""스트리밍 이벤트 writer 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+
+from secondsession.core.common.queue.chat_stream_event_queue import ChatStreamEventQueue
+
+# 버퍼를 기다리지 않고 즉시 적재하는 이벤트 타입
+_IMMEDIATE_TYPES = ("error", "done")
+
+
+class ChatStreamEventWriter:
+    """job 단위 스트리밍 이벤트 버퍼 writer."""
+
+    def __init__(
+        self,
+        event_queue: ChatStreamEventQueue,
+        job_id: str,
+        start_seq: int = 0,
+        flush_interval: float = 0.01,
+        max_batch: int = 32,
+    ) -> None:
+        """writer를 초기화한다.
+
+        Args:
+            event_queue: 스트리밍 이벤트 큐.
+            job_id: 작업 식별자.
+            start_seq: 이미 적재된 마지막 seq. 다음 이벤트는 start_seq + 1부터 부여한다.
+            flush_interval: 첫 이벤트가 버퍼에 들어온 뒤 적재까지 기다리는 최대 시간(초).
+            max_batch: 이 개수만큼 모이면 시간과 관계없이 적재한다.
+
+        Raises:
+            ValueError: max_batch가 1보다 작은 경우.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch는 1 이상이어야 합니다.")
+        self._event_queue = event_queue
+        self._job_id = job_id
+        self._seq = start_seq
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._buffer: list[dict] = []
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        # 타이머 적재 실패는 다음 write/flush 호출에서 다시 던진다.
+        self._error: BaseException | None = None
+
+    @property
+    def seq(self) -> int:
+        """마지막으로 부여한 seq."""
+        return self._seq
+
+    async def write(self, event: dict) -> int:
+        """이벤트에 seq를 부여해 버퍼에 넣는다. 조건을 만족하면 바로 적재한다.
+
+        Args:
+            event: type/trace_id를 포함한 이벤트(seq는 writer가 부여한다).
+
+        Returns:
+            int: 부여한 seq.
+        """
+        self._raise_pending_error()
+        self._seq += 1
+        self._buffer.append({**event, "seq": self._seq})
+        if event.get("type") in _IMMEDIATE_TYPES or len(self._buffer) >= self._max_batch:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return self._seq
+
+    async def flush(self) -> None:
+        """버퍼에 모인 이벤트를 즉시 적재한다."""
+        self._cancel_timer()
+        await self._flush()
+        self._raise_pending_error()
+
+    async def aclose(self) -> None:
+        """남은 이벤트를 적재하고 writer를 닫는다."""
+        await self.flush()
+
+    async def __aenter__(self) -> "ChatStreamEventWriter":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _flush(self) -> None:
+        # 배치를 잠금 안에서 떼어 내고 적재해야 앞 배치보다 뒤 배치가 먼저 적재되지 않는다.
+        async with self._lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            await self._event_queue.push_events(self._job_id, batch)
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self._flush_interval)
+            self._timer = None
+            await self._flush()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error = e
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
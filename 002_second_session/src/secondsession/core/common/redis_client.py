@@ -0,0 +1,26 @@
+# 목적: 비동기 Redis 클라이언트 생성 함수를 제공한다.
+# 설명: 작업 큐/스트리밍 이벤트 큐가 공유할 redis.asyncio 클라이언트를 만든다.
+# 디자인 패턴: 팩토리 메서드
+# 참조: secondsession/main.py, secondsession/core/common/queue/chat_stream_event_queue.py
+
+"""Redis 클라이언트 팩토리 모듈."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def build_async_redis(redis_url: str) -> Any:
+    """비동기 Redis 클라이언트를 생성한다.
+
+    응답을 str로 받도록 decode_responses를 켠다(큐는 JSON 문자열만 저장한다).
+
+    Args:
+        redis_url: Redis 접속 URL(예: redis://localhost:6379/0).
+
+    Returns:
+        redis.asyncio.Redis: 커넥션 풀을 가진 비동기 클라이언트.
+    """
+    from redis.asyncio import Redis
+
+    return Redis.from_url(redis_url, decode_responses=True)
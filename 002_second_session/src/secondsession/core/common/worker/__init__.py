@@ -1,12 +1,14 @@
 # 목적: 공통 워커 모듈을 외부에 노출한다.
-# 설명: 워커 베이스 클래스를 집계한다.
+# 설명: 워커 베이스 클래스와 프로세스 감독자를 집계한다.
 # 디자인 패턴: 파사드
 # 참조: secondsession/core/common/worker/worker_base.py,
-#       secondsession/core/common/worker/async_worker_base.py
+#       secondsession/core/common/worker/async_worker_base.py,
+#       secondsession/core/common/worker/worker_supervisor.py
 
 """공통 워커 패키지."""
 
 from secondsession.core.common.worker.worker_base import WorkerBase
-from secondsession.core.common.worker.async_worker_base import AsyncWorkerBase
+from secondsession.core.common.worker.async_worker_base import AsyncWorkerBase, SlotUtilization
+from secondsession.core.common.worker.worker_supervisor import WorkerSupervisor
 
-__all__ = ["WorkerBase", "AsyncWorkerBase"]
+__all__ = ["WorkerBase", "AsyncWorkerBase", "SlotUtilization", "WorkerSupervisor"]
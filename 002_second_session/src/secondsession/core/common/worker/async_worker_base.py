@@ -1,40 +1,194 @@
 # 목적: 비동기 워커 실행 루프의 공통 흐름을 정의한다.
-# 설명: 비동기 큐 폴링과 작업 처리 흐름을 템플릿 메서드로 제공한다.
+# 설명: 블로킹 dequeue → 처리 → ack 흐름을 템플릿 메서드로 제공한다.
+#       세마포어로 제한한 N개 슬롯에서 작업을 동시에 처리하고(LLM 호출은 대부분 I/O 대기),
+#       슬롯별 사용률을 집계한다. 종료 요청 시 새 작업을 꺼내지 않고 처리 중 작업을 끝까지 마친다.
+#       처리 중에도 별도 태스크가 하트비트/reaper를 주기적으로 실행해, 긴 작업이 죽은 워커로 오인되지 않고
+#       죽은 워커의 작업은 다른 워커가 되돌린다.
 # 디자인 패턴: Template Method
-# 참조: secondsession/core/chat/worker/chat_worker.py
+# 참조: secondsession/core/chat/worker/chat_worker.py, secondsession/core/common/queue/chat_job_queue.py
 
 """비동기 워커 베이스 모듈."""
 
 from __future__ import annotations
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SlotUtilization:
+    """작업 슬롯 하나의 사용률 집계."""
+
+    slot: int
+    # 집계 구간 동안 작업을 처리한 시간(초)
+    busy_seconds: float
+    # 집계 구간 동안 끝낸 작업 수
+    jobs: int
+    # busy_seconds / 집계 구간 길이(0.0 ~ 1.0)
+    utilization: float
 
 
 class AsyncWorkerBase(ABC):
     """비동기 큐 기반 워커의 공통 실행 흐름을 제공하는 베이스 클래스."""
 
-    def __init__(self, poll_interval: float = 0.1) -> None:
+    def __init__(
+        self,
+        poll_interval: float = 0.1,
+        maintenance_interval: float = 5.0,
+        concurrency: int = 1,
+    ) -> None:
         """워커를 초기화한다.
 
         Args:
-            poll_interval: 큐 폴링 간격(초).
+            poll_interval: 큐 오류 시 재시도 전 대기 간격(초). 정상 대기는 블로킹 dequeue가 담당한다.
+            maintenance_interval: 하트비트/reaper 실행 간격(초). 가시성 타임아웃보다 충분히 짧아야 한다.
+            concurrency: 프로세스 하나가 동시에 처리할 최대 작업 수(슬롯 수).
+
+        Raises:
+            ValueError: concurrency가 1보다 작은 경우.
         """
+        if concurrency < 1:
+            raise ValueError("concurrency는 1 이상이어야 합니다.")
         self._poll_interval = poll_interval
+        self._maintenance_interval = maintenance_interval
+        self._concurrency = concurrency
+        self._stop_event = asyncio.Event()
+        self._slots = asyncio.Semaphore(concurrency)
+        self._free_slots = list(range(concurrency - 1, -1, -1))
+        self._in_flight: set[asyncio.Task] = set()
+        # 슬롯별 사용률 집계(현재 구간 기준)
+        self._window_started = time.monotonic()
+        self._slot_busy = [0.0] * concurrency
+        self._slot_jobs = [0] * concurrency
+        self._slot_started: list[float | None] = [None] * concurrency
+
+    @property
+    def concurrency(self) -> int:
+        """동시 처리 슬롯 수."""
+        return self._concurrency
+
+    @property
+    def in_flight(self) -> int:
+        """처리 중인 작업 수."""
+        return len(self._in_flight)
+
+    def stop(self) -> None:
+        """새 작업을 더 꺼내지 않도록 종료를 요청한다. 처리 중인 작업은 끝까지 처리한다."""
+        self._stop_event.set()
+
+    def slot_utilization(self, reset: bool = False) -> list[SlotUtilization]:
+        """현재 집계 구간의 슬롯별 사용률을 반환한다.
+
+        Args:
+            reset: True면 집계 구간을 지금부터 다시 시작한다.
+
+        Returns:
+            list[SlotUtilization]: 슬롯 번호 순서의 사용률.
+        """
+        now = time.monotonic()
+        window = now - self._window_started
+        report: list[SlotUtilization] = []
+        for slot in range(self._concurrency):
+            busy = self._slot_busy[slot]
+            started = self._slot_started[slot]
+            if started is not None:
+                busy += now - started
+            report.append(
+                SlotUtilization(
+                    slot=slot,
+                    busy_seconds=busy,
+                    jobs=self._slot_jobs[slot],
+                    utilization=min(1.0, busy / window) if window > 0 else 0.0,
+                )
+            )
+        if reset:
+            self._window_started = now
+            self._slot_busy = [0.0] * self._concurrency
+            self._slot_jobs = [0] * self._concurrency
+            # 처리 중인 슬롯은 새 구간에서 지금부터 다시 잰다.
+            self._slot_started = [now if started is not None else None for started in self._slot_started]
+        return report
 
     async def run_forever(self) -> None:
         """워커를 비동기 루프 형태로 실행한다.
 
-        TODO:
-            - 종료 신호를 위한 정책(예: stop 플래그)을 정의한다.
-            - 예외 발생 시 재시도/백오프 정책을 정의한다.
+        빈 슬롯이 있을 때만 작업을 꺼내며, dequeue가 작업이 들어올 때까지 블로킹하므로 빈 큐를 폴링하지 않는다.
+        처리 중 예외가 나도 ack해 같은 작업이 무한 재시도되지 않게 하고,
+        ack 전에 프로세스가 죽거나 작업이 취소된 경우만 reaper가 다시 대기 큐에 넣는다.
+        stop() 이후에는 처리 중인 작업이 모두 끝난 뒤 반환한다.
         """
-        _ = asyncio
-        raise NotImplementedError("비동기 워커 실행 루프를 구현해야 합니다.")
+        # 첫 작업을 꺼내기 전에 생존을 기록해야 그 사이 죽어도 reaper가 작업을 찾는다.
+        await self._run_maintenance()
+        maintenance = asyncio.create_task(self._maintain())
+        try:
+            while not self._stop_event.is_set():
+                await self._slots.acquire()
+                if self._stop_event.is_set():
+                    self._slots.release()
+                    break
+                try:
+                    job = await self._dequeue_job()
+                except Exception:
+                    # Redis 연결 오류 등: 잠시 쉬고 다시 시도한다.
+                    self._slots.release()
+                    await asyncio.sleep(self._poll_interval)
+                    continue
+                if job is None:
+                    self._slots.release()
+                    continue
+                task = asyncio.create_task(self._run_job(self._free_slots.pop(), job))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+            # 드레인: 처리 중인 작업이 끝날 때까지 하트비트를 유지한 채 기다린다.
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+        finally:
+            maintenance.cancel()
+            await asyncio.gather(maintenance, return_exceptions=True)
+
+    async def _run_job(self, slot: int, job: dict) -> None:
+        """슬롯 하나에서 작업을 처리하고 ack한 뒤 슬롯을 반납한다."""
+        self._slot_started[slot] = time.monotonic()
+        try:
+            try:
+                await self._process_job(job)
+            except Exception:
+                # 작업 단위 오류는 _process_job이 error/done 이벤트로 처리해야 한다. 루프는 계속 돈다.
+                pass
+            try:
+                await self._ack_job(job)
+            except Exception:
+                # ack 실패 시 작업은 처리 중 리스트에 남는다(워커가 죽으면 reaper가 되돌린다).
+                pass
+        finally:
+            started = self._slot_started[slot]
+            if started is not None:
+                self._slot_busy[slot] += time.monotonic() - started
+            self._slot_started[slot] = None
+            self._slot_jobs[slot] += 1
+            self._free_slots.append(slot)
+            self._slots.release()
+
+    async def _maintain(self) -> None:
+        """하트비트와 reaper를 주기적으로 실행한다."""
+        while True:
+            await asyncio.sleep(self._maintenance_interval)
+            await self._run_maintenance()
+
+    async def _run_maintenance(self) -> None:
+        """하트비트와 reaper를 한 번 실행한다."""
+        try:
+            await self._heartbeat()
+            await self._requeue_stale_jobs()
+        except Exception:
+            # Redis 일시 오류: 다음 주기에 다시 시도한다.
+            pass
 
     @abstractmethod
     async def _dequeue_job(self) -> dict | None:
-        """큐에서 작업을 꺼낸다.
+        """큐에서 작업을 꺼낸다. 작업이 없으면 일정 시간 블로킹한 뒤 None을 반환한다.
 
         Returns:
             작업 dict 또는 None.
@@ -42,8 +196,21 @@ class AsyncWorkerBase(ABC):
 
     @abstractmethod
     async def _process_job(self, job: dict) -> None:
-        """단일 작업을 처리한다.
+        """단일 작업을 처리한다. 여러 슬롯에서 동시에 호출될 수 있다.
 
         Args:
             job: 큐에서 꺼낸 작업 페이로드.
         """
+
+    async def _ack_job(self, job: dict) -> None:
+        """처리를 마친 작업을 확인 처리한다(기본: 아무것도 하지 않음).
+
+        Args:
+            job: 처리한 작업 페이로드.
+        """
+
+    async def _heartbeat(self) -> None:
+        """워커가 살아 있음을 기록한다(기본: 아무것도 하지 않음)."""
+
+    async def _requeue_stale_jobs(self) -> None:
+        """죽은 워커의 작업을 대기 큐로 되돌린다(기본: 아무것도 하지 않음)."""
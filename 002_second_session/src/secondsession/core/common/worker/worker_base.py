@@ -1,12 +1,14 @@
 # 목적: 워커 실행 루프의 공통 흐름을 정의한다.
-# 설명: 큐 폴링과 작업 처리 흐름을 템플릿 메서드로 제공한다.
+# 설명: 블로킹 dequeue → 처리 → ack 흐름을 템플릿 메서드로 제공한다.
+#       처리 중에도 별도 스레드가 하트비트/reaper를 주기적으로 실행한다.
 # 디자인 패턴: Template Method
-# 참조: secondsession/core/chat/worker/chat_worker.py
+# 참조: secondsession/core/chat/worker/chat_worker.py, secondsession/core/common/queue/chat_job_queue.py
 
 """워커 베이스 모듈."""
 
 from __future__ import annotations
 
+import threading
 import time
 from abc import ABC, abstractmethod
 
@@ -14,31 +16,75 @@ from abc import ABC, abstractmethod
 class WorkerBase(ABC):
     """큐 기반 워커의 공통 실행 흐름을 제공하는 베이스 클래스."""
 
-    def __init__(self, poll_interval: float = 0.1) -> None:
+    def __init__(self, poll_interval: float = 0.1, maintenance_interval: float = 5.0) -> None:
         """워커를 초기화한다.
 
         Args:
-            poll_interval: 큐 폴링 간격(초).
+            poll_interval: 큐 오류 시 재시도 전 대기 간격(초). 정상 대기는 블로킹 dequeue가 담당한다.
+            maintenance_interval: 하트비트/reaper 실행 간격(초). 가시성 타임아웃보다 충분히 짧아야 한다.
         """
         self._poll_interval = poll_interval
+        self._maintenance_interval = maintenance_interval
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """새 작업을 더 꺼내지 않도록 종료를 요청한다. 처리 중인 작업은 끝까지 처리한다."""
+        self._stop_event.set()
 
     def run_forever(self) -> None:
         """워커를 루프 형태로 실행한다.
 
-        TODO:
-            - 종료 신호를 위한 정책(예: stop 플래그)을 정의한다.
-            - 예외 발생 시 재시도/백오프 정책을 정의한다.
+        dequeue가 작업이 들어올 때까지 블로킹하므로 빈 큐를 폴링하지 않는다.
+        처리 중 예외가 나도 ack해 같은 작업이 무한 재시도되지 않게 하고,
+        ack 전에 프로세스가 죽거나 인터럽트로 중단된 작업만 reaper가 다시 대기 큐에 넣는다.
         """
-        while True:
-            job = self._dequeue_job()
-            if job is None:
-                time.sleep(self._poll_interval)
-                continue
-            self._process_job(job)
+        # 첫 작업을 꺼내기 전에 생존을 기록해야 그 사이 죽어도 reaper가 작업을 찾는다.
+        self._run_maintenance()
+        maintenance_stop = threading.Event()
+        maintenance = threading.Thread(target=self._maintain, args=(maintenance_stop,), daemon=True)
+        maintenance.start()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    job = self._dequeue_job()
+                except Exception:
+                    # Redis 연결 오류 등: 잠시 쉬고 다시 시도한다.
+                    time.sleep(self._poll_interval)
+                    continue
+                if job is None:
+                    continue
+                try:
+                    self._process_job(job)
+                except Exception:
+                    # 작업 단위 오류는 _process_job이 error/done 이벤트로 처리해야 한다. 루프는 계속 돈다.
+                    pass
+                # KeyboardInterrupt/SystemExit로 처리가 중단되면 ack하지 않는다(reaper가 작업을 되돌린다).
+                try:
+                    self._ack_job(job)
+                except Exception:
+                    # ack 실패 시 작업은 처리 중 리스트에 남는다(워커가 죽으면 reaper가 되돌린다).
+                    pass
+        finally:
+            maintenance_stop.set()
+            maintenance.join()
+
+    def _maintain(self, stop: threading.Event) -> None:
+        """하트비트와 reaper를 주기적으로 실행한다."""
+        while not stop.wait(self._maintenance_interval):
+            self._run_maintenance()
+
+    def _run_maintenance(self) -> None:
+        """하트비트와 reaper를 한 번 실행한다."""
+        try:
+            self._heartbeat()
+            self._requeue_stale_jobs()
+        except Exception:
+            # Redis 일시 오류: 다음 주기에 다시 시도한다.
+            pass
 
     @abstractmethod
     def _dequeue_job(self) -> dict | None:
-        """큐에서 작업을 꺼낸다.
+        """큐에서 작업을 꺼낸다. 작업이 없으면 일정 시간 블로킹한 뒤 None을 반환한다.
 
         Returns:
             작업 dict 또는 None.
@@ -53,3 +99,16 @@ class WorkerBase(ABC):
         """
         _ = job
         raise NotImplementedError("작업 처리 로직을 구현해야 합니다.")
+
+    def _ack_job(self, job: dict) -> None:
+        """처리를 마친 작업을 확인 처리한다(기본: 아무것도 하지 않음).
+
+        Args:
+            job: 처리한 작업 페이로드.
+        """
+
+    def _heartbeat(self) -> None:
+        """워커가 살아 있음을 기록한다(기본: 아무것도 하지 않음)."""
+
+    def _requeue_stale_jobs(self) -> None:
+        """죽은 워커의 작업을 대기 큐로 되돌린다(기본: 아무것도 하지 않음)."""
@@ -0,0 +1,99 @@
+# 목적: 워커 프로세스 여러 개를 실행/감독한다.
+# 설명: M개의 워커 프로세스를 띄우고, 비정상 종료한 프로세스는 다시 띄운다.
+#       SIGTERM/SIGINT를 받으면 자식에게 SIGTERM을 전달해 처리 중 작업을 끝내게(드레인) 하고,
+#       shutdown_timeout 안에 끝나지 않은 프로세스만 강제 종료한다(그 작업은 reaper가 되돌린다).
+# 디자인 패턴: Supervisor
+# 참조: secondsession/worker_main.py, secondsession/core/common/worker/async_worker_base.py
+
+"""워커 프로세스 감독자 모듈."""
+
+from __future__ import annotations
+
+import multiprocessing
+import signal
+import time
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from typing import Any
+
+
+class WorkerSupervisor:
+    """워커 프로세스 감독자."""
+
+    def __init__(
+        self,
+        target: Callable[[int], None],
+        processes: int = 1,
+        shutdown_timeout: float = 30.0,
+        restart_delay: float = 1.0,
+    ) -> None:
+        """감독자를 초기화한다.
+
+        Args:
+            target: 자식 프로세스에서 실행할 함수(프로세스 번호를 받는다). spawn 방식이므로 모듈 최상위 함수여야 한다.
+            processes: 실행할 워커 프로세스 수.
+            shutdown_timeout: 종료 요청 후 드레인을 기다리는 최대 시간(초).
+            restart_delay: 비정상 종료한 프로세스를 다시 띄우기 전 대기 시간(초).
+
+        Raises:
+            ValueError: processes가 1보다 작은 경우.
+        """
+        if processes < 1:
+            raise ValueError("processes는 1 이상이어야 합니다.")
+        self._target = target
+        self._processes = processes
+        self._shutdown_timeout = shutdown_timeout
+        self._restart_delay = restart_delay
+        # fork 상속 자원(이벤트 루프, Redis 연결) 공유를 피하기 위해 spawn을 사용한다.
+        self._context = multiprocessing.get_context("spawn")
+        self._children: list[Any] = []
+        self._stopping = False
+
+    def _spawn(self, index: int) -> Any:
+        process = self._context.Process(target=self._target, args=(index,), name=f"chat-worker-{index}")
+        process.start()
+        return process
+
+    def _request_stop(self, signum: int, frame: Any) -> None:
+        _ = signum
+        _ = frame
+        self._stopping = True
+
+    def run(self) -> None:
+        """워커 프로세스를 실행하고 종료 신호를 받을 때까지 감독한다."""
+        previous = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            self._children = [self._spawn(index) for index in range(self._processes)]
+            while not self._stopping:
+                wait([child.sentinel for child in self._children], timeout=0.5)
+                if self._stopping:
+                    break
+                for index, child in enumerate(self._children):
+                    if child.is_alive():
+                        continue
+                    child.join()
+                    # 크래시 루프가 CPU를 태우지 않도록 잠시 쉬고 다시 띄운다.
+                    time.sleep(self._restart_delay)
+                    if self._stopping:
+                        break
+                    self._children[index] = self._spawn(index)
+        finally:
+            self._shutdown()
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def _shutdown(self) -> None:
+        """자식에게 SIGTERM을 보내 드레인을 기다리고, 시간이 지나면 강제 종료한다."""
+        for child in self._children:
+            if child.is_alive():
+                child.terminate()
+        deadline = time.monotonic() + self._shutdown_timeout
+        for child in self._children:
+            child.join(max(0.0, deadline - time.monotonic()))
+        for child in self._children:
+            if child.is_alive():
+                child.kill()
+                child.join()
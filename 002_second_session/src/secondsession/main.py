@@ -12,6 +12,8 @@ from secondsession.api.chat.service.chat_service import ChatService
 from secondsession.core.chat.graphs.chat_graph import ChatGraph
 from secondsession.core.common.app_config import AppConfig
 from secondsession.core.common.llm_client import LlmClient
+from secondsession.core.common.queue import ChatJobQueue, ChatStreamEventQueue
+from secondsession.core.common.redis_client import build_async_redis
 
 
 def create_app() -> FastAPI:
@@ -30,7 +32,25 @@ def create_app() -> FastAPI:
     config = AppConfig.from_env()
     llm_client = LlmClient(config)
     graph = ChatGraph(llm_client=llm_client)
-    service = ChatService(graph)
+    event_queue = None
+    job_queue = None
+    if config.redis_url:
+        redis_client = build_async_redis(config.redis_url)
+        event_queue = ChatStreamEventQueue(
+            redis_client,
+            maxlen=config.stream_maxlen,
+            ttl_seconds=config.stream_ttl_seconds,
+        )
+        job_queue = ChatJobQueue(redis_client, visibility_timeout=config.job_visibility_timeout)
+    service = ChatService(
+        graph,
+        event_queue=event_queue,
+        stream_block_ms=config.stream_block_ms,
+        job_queue=job_queue,
+        heartbeat_interval=config.stream_heartbeat_seconds,
+        cancel_on_disconnect=config.stream_cancel_on_disconnect,
+        cancel_grace_seconds=config.stream_cancel_grace_seconds,
+    )
     app.state.chat_service = service
     register_chat_routes(app)
 
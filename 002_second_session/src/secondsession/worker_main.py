@@ -0,0 +1,74 @@
+# 목적: 대화 워커 실행 진입점을 제공한다.
+# 설명: 감독자가 WORKER_PROCESSES개의 워커 프로세스를 띄우고,
+#       각 프로세스는 WORKER_CONCURRENCY개 슬롯으로 작업을 동시에 처리한다.
+#       SIGTERM을 받으면 새 작업을 꺼내지 않고 처리 중 작업을 마친 뒤 종료한다.
+# 디자인 패턴: 팩토리 메서드 패턴(워커 생성 책임 분리)
+# 참조: secondsession/core/chat/worker/chat_worker.py,
+#       secondsession/core/common/worker/worker_supervisor.py
+
+"""대화 워커 실행 진입점 모듈."""
+
+import asyncio
+import signal
+
+from secondsession.core.chat.worker import ChatWorker
+from secondsession.core.common.app_config import AppConfig
+from secondsession.core.common.queue import ChatJobQueue, ChatStreamEventQueue
+from secondsession.core.common.redis_client import build_async_redis
+from secondsession.core.common.worker import WorkerSupervisor
+
+
+async def _run_worker(index: int) -> None:
+    """워커 하나를 만들어 종료 신호를 받을 때까지 실행한다.
+
+    Args:
+        index: 워커 프로세스 번호.
+    """
+    _ = index
+    config = AppConfig.from_env()
+    if not config.redis_url:
+        raise RuntimeError("워커 실행에는 REDIS_URL이 필요합니다.")
+    redis_client = build_async_redis(config.redis_url)
+    worker = ChatWorker(
+        job_queue=ChatJobQueue(redis_client, visibility_timeout=config.job_visibility_timeout),
+        event_queue=ChatStreamEventQueue(
+            redis_client,
+            maxlen=config.stream_maxlen,
+            ttl_seconds=config.stream_ttl_seconds,
+        ),
+        # TODO: build_redis_checkpointer 구현 후 체크포인터를 주입한다.
+        checkpointer=None,
+        concurrency=config.worker_concurrency,
+        event_flush_interval=config.stream_flush_interval_ms / 1000,
+        event_flush_max_events=config.stream_flush_max_events,
+    )
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run_forever()
+    finally:
+        await redis_client.aclose()
+
+
+def run_worker_process(index: int) -> None:
+    """워커 프로세스 본문(감독자가 spawn한 프로세스에서 실행된다).
+
+    Args:
+        index: 워커 프로세스 번호.
+    """
+    asyncio.run(_run_worker(index))
+
+
+def main() -> None:
+    """감독자를 통해 워커 프로세스를 실행한다."""
+    config = AppConfig.from_env()
+    WorkerSupervisor(
+        run_worker_process,
+        processes=config.worker_processes,
+        shutdown_timeout=config.worker_shutdown_timeout,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""ChatService.stream_events 구독자 lease/취소 테스트."""
+
+import asyncio
+
+import pytest
+
+from secondsession.api.chat.service.chat_service import ChatService
+
+GRACE = 0.2
+
+
+def _service(event_queue, job_queue) -> ChatService:
+    return ChatService(
+        graph=None,
+        event_queue=event_queue,
+        stream_block_ms=20,
+        job_queue=job_queue,
+        heartbeat_interval=0.05,
+        cancel_grace_seconds=GRACE,
+    )
+
+
+async def _first_line(stream) -> str:
+    return await stream.__anext__()
+
+
+async def _collect(stream) -> list[str]:
+    return [line async for line in stream]
+
+
+@pytest.mark.asyncio
+async def test_single_reader_leaving_before_done_cancels_after_grace(event_queue, job_queue):
+    service = _service(event_queue, job_queue)
+    await event_queue.push_event("job", {"type": "token", "trace_id": "t", "seq": 1})
+    stream = service.stream_events("job")
+    await _first_line(stream)
+    await stream.aclose()
+
+    assert not await job_queue.is_cancel_requested("job")
+    await asyncio.sleep(GRACE * 2)
+    assert await job_queue.is_cancel_requested("job")
+
+
+@pytest.mark.asyncio
+async def test_other_reader_keeps_job_alive(event_queue, job_queue):
+    service = _service(event_queue, job_queue)
+    await event_queue.push_event("job", {"type": "token", "trace_id": "t", "seq": 1})
+    tab_a = service.stream_events("job")
+    tab_b = service.stream_events("job")
+    await _first_line(tab_a)
+    await _first_line(tab_b)
+    await tab_a.aclose()
+
+    await asyncio.sleep(GRACE * 2)
+    assert not await job_queue.is_cancel_requested("job")
+    await tab_b.aclose()
+    await asyncio.sleep(GRACE * 2)
+    assert await job_queue.is_cancel_requested("job")
+
+
+@pytest.mark.asyncio
+async def test_reconnect_within_grace_does_not_cancel(event_queue, job_queue):
+    service = _service(event_queue, job_queue)
+    await event_queue.push_event("job", {"type": "token", "trace_id": "t", "seq": 1})
+    stream = service.stream_events("job")
+    await _first_line(stream)
+    await stream.aclose()
+
+    # EventSource 재연결: Last-Event-ID 이후부터 다시 구독한다.
+    resumed = asyncio.ensure_future(_collect(service.stream_events("job", last_seq=1)))
+    await asyncio.sleep(GRACE * 2)
+    assert not await job_queue.is_cancel_requested("job")
+
+    await event_queue.push_event("job", {"type": "done", "trace_id": "t", "seq": 2, "content": None})
+    lines = await asyncio.wait_for(resumed, 1)
+    assert lines[-1].startswith("id: 2\n")
+
+
+@pytest.mark.asyncio
+async def test_finished_stream_does_not_cancel(event_queue, job_queue):
+    service = _service(event_queue, job_queue)
+    await event_queue.push_event("job", {"type": "token", "trace_id": "t", "seq": 1})
+    await event_queue.push_event("job", {"type": "done", "trace_id": "t", "seq": 2, "content": None})
+
+    lines = [line async for line in service.stream_events("job")]
+
+    assert [line.split("\n", 1)[0] for line in lines] == ["id: 1", "id: 2"]
+    await asyncio.sleep(GRACE * 2)
+    assert not await job_queue.is_cancel_requested("job")
+    assert await event_queue.active_readers("job") == 0
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_sends_heartbeat_and_stops_on_disconnect(event_queue, job_queue):
+    service = _service(event_queue, job_queue)
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        return disconnected
+
+    lines = []
+
+    async def consume() -> None:
+        async for line in service.stream_events("job", is_disconnected=is_disconnected):
+            lines.append(line)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.15)
+    disconnected = True
+    await asyncio.wait_for(task, 1)
+
+    assert ": ping\n\n" in lines
+    await asyncio.sleep(GRACE * 2)
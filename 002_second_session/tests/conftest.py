@@ -0,0 +1,79 @@
+# 목적: 테스트 공용 더블(in-memory 큐)을 제공한다.
+# 설명: Redis 없이 서비스/writer 동작을 검증하도록 큐 인터페이스를 메모리로 흉내 낸다.
+# 디자인 패턴: Test Double(Fake)
+# 참조: secondsession/core/common/queue/chat_stream_event_queue.py,
+#       secondsession/core/common/queue/chat_job_queue.py
+
+"""테스트 공용 픽스처 모듈."""
+
+import asyncio
+import time
+
+import pytest
+
+
+class FakeEventQueue:
+    """ChatStreamEventQueue의 메모리 구현."""
+
+    def __init__(self) -> None:
+        self.events: dict[str, list[dict]] = {}
+        self.batches: list[tuple[str, list[dict]]] = []
+        self.readers: dict[str, dict[str, float]] = {}
+        self._appended = asyncio.Event()
+
+    async def push_events(self, job_id: str, events: list[dict]) -> None:
+        self.batches.append((job_id, list(events)))
+        self.events.setdefault(job_id, []).extend(events)
+        self._appended.set()
+
+    async def push_event(self, job_id: str, event: dict) -> None:
+        await self.push_events(job_id, [event])
+
+    async def last_seq(self, job_id: str) -> int:
+        events = self.events.get(job_id)
+        return events[-1]["seq"] if events else 0
+
+    async def read_events(self, job_id, after_seq=0, block_ms=None, count=100):
+        pending = [event for event in self.events.get(job_id, []) if event["seq"] > after_seq]
+        if not pending and block_ms:
+            self._appended.clear()
+            try:
+                await asyncio.wait_for(self._appended.wait(), block_ms / 1000)
+            except asyncio.TimeoutError:
+                pass
+            pending = [event for event in self.events.get(job_id, []) if event["seq"] > after_seq]
+        pending = pending[:count]
+        return pending, (pending[-1]["seq"] if pending else after_seq)
+
+    async def register_reader(self, job_id: str, reader_id: str, lease_seconds: float) -> None:
+        self.readers.setdefault(job_id, {})[reader_id] = time.time() + lease_seconds
+
+    async def unregister_reader(self, job_id: str, reader_id: str) -> None:
+        self.readers.get(job_id, {}).pop(reader_id, None)
+
+    async def active_readers(self, job_id: str) -> int:
+        now = time.time()
+        return sum(1 for expires in self.readers.get(job_id, {}).values() if expires > now)
+
+
+class FakeJobQueue:
+    """ChatJobQueue 취소 플래그의 메모리 구현."""
+
+    def __init__(self) -> None:
+        self.cancelled: set[str] = set()
+
+    async def request_cancel(self, job_id: str) -> None:
+        self.cancelled.add(job_id)
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return job_id in self.cancelled
+
+
+@pytest.fixture
+def event_queue() -> FakeEventQueue:
+    return FakeEventQueue()
+
+
+@pytest.fixture
+def job_queue() -> FakeJobQueue:
+    return FakeJobQueue()
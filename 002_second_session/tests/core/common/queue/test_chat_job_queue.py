@@ -0,0 +1,90 @@
+"""ChatJobQueue 처리 중 리스트/ack/reaper/데드레터 테스트."""
+
+import json
+
+import fakeredis
+import pytest
+
+from secondsession.core.common.queue import ChatJobQueue
+
+
+def _job(job_id: str) -> dict:
+    return {"job_id": job_id, "trace_id": f"t-{job_id}", "thread_id": "th", "query": "q"}
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def queue(redis_client) -> ChatJobQueue:
+    return ChatJobQueue(redis_client, visibility_timeout=30.0)
+
+
+async def _job_ids(redis_client, key: str) -> list[str]:
+    return [json.loads(raw)["job_id"] for raw in await redis_client.lrange(key, 0, -1)]
+
+
+@pytest.mark.asyncio
+async def test_dequeue_moves_job_to_processing_list(queue, redis_client):
+    await queue.enqueue(_job("a"))
+    await queue.enqueue(_job("b"))
+
+    job = await queue.dequeue("w1", timeout=0.1)
+
+    assert job["job_id"] == "a"
+    assert await _job_ids(redis_client, "chat:jobs") == ["b"]
+    assert await _job_ids(redis_client, "chat:jobs:processing:w1") == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_ack_removes_job_from_processing_list(queue, redis_client):
+    await queue.enqueue(_job("a"))
+    job = await queue.dequeue("w1", timeout=0.1)
+
+    await queue.ack("w1", job)
+
+    assert await redis_client.llen("chat:jobs:processing:w1") == 0
+    assert await redis_client.llen("chat:jobs") == 0
+
+
+@pytest.mark.asyncio
+async def test_requeue_stale_restores_order_for_dead_worker(queue, redis_client):
+    for job_id in ("a", "b", "c"):
+        await queue.enqueue(_job(job_id))
+    await queue.heartbeat("w1")
+    await queue.dequeue("w1", timeout=0.1)
+    await queue.dequeue("w1", timeout=0.1)
+    # 하트비트 만료를 흉내 낸다.
+    await redis_client.delete("chat:jobs:alive:w1")
+
+    requeued = await queue.requeue_stale()
+
+    assert requeued == 2
+    assert await _job_ids(redis_client, "chat:jobs") == ["a", "b", "c"]
+    assert await redis_client.llen("chat:jobs:processing:w1") == 0
+    assert await redis_client.smembers("chat:jobs:workers") == set()
+
+
+@pytest.mark.asyncio
+async def test_requeue_stale_skips_alive_worker(queue, redis_client):
+    await queue.enqueue(_job("a"))
+    await queue.heartbeat("w1")
+    await queue.dequeue("w1", timeout=0.1)
+
+    assert await queue.requeue_stale() == 0
+    assert await _job_ids(redis_client, "chat:jobs:processing:w1") == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_poison_payloads_go_to_dead_letter_list(queue, redis_client):
+    await redis_client.rpush("chat:jobs", "not-json")
+    await redis_client.rpush("chat:jobs", json.dumps({"job_id": "x"}))
+
+    assert await queue.dequeue("w1", timeout=0.1) is None
+    assert await queue.dequeue("w1", timeout=0.1) is None
+
+    assert await redis_client.lrange("chat:jobs:dead", 0, -1) == ["not-json", json.dumps({"job_id": "x"})]
+    assert await redis_client.llen("chat:jobs:processing:w1") == 0
+    assert await redis_client.llen("chat:jobs") == 0
@@ -0,0 +1,86 @@
+"""ChatStreamEventWriter 묶음 적재/seq 순서 테스트."""
+
+import asyncio
+
+import pytest
+
+from secondsession.core.common.queue import ChatStreamEventWriter
+
+
+def _token(content: str) -> dict:
+    return {"type": "token", "trace_id": "t", "content": content}
+
+
+class GatedEventQueue:
+    """첫 적재를 gate가 열릴 때까지 붙잡아 두는 큐(적재 중 겹침 재현용)."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[int]] = []
+        self.first_started = asyncio.Event()
+        self.gate = asyncio.Event()
+
+    async def push_events(self, job_id: str, events: list[dict]) -> None:
+        _ = job_id
+        if not self.first_started.is_set():
+            self.first_started.set()
+            await self.gate.wait()
+        self.batches.append([event["seq"] for event in events])
+
+
+@pytest.mark.asyncio
+async def test_explicit_flush_waits_for_in_flight_timer_flush():
+    queue = GatedEventQueue()
+    writer = ChatStreamEventWriter(queue, "job", flush_interval=0.01, max_batch=100)
+    for index in range(3):
+        await writer.write(_token(str(index)))
+
+    # 타이머 적재가 [1, 2, 3]을 들고 Redis 응답을 기다리는 동안 done이 즉시 적재를 요구한다.
+    await asyncio.wait_for(queue.first_started.wait(), 1)
+    await writer.write(_token("3"))
+    done = asyncio.create_task(writer.write({"type": "done", "trace_id": "t", "content": None}))
+    await asyncio.sleep(0.02)
+    assert queue.batches == []
+
+    queue.gate.set()
+    assert await asyncio.wait_for(done, 1) == 5
+    assert queue.batches == [[1, 2, 3], [4, 5]]
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_coalesced_until_interval(event_queue):
+    writer = ChatStreamEventWriter(event_queue, "job", flush_interval=0.05, max_batch=100)
+    for index in range(10):
+        await writer.write(_token(str(index)))
+    assert event_queue.batches == []
+
+    await asyncio.sleep(0.1)
+    assert [[event["seq"] for event in batch] for _, batch in event_queue.batches] == [list(range(1, 11))]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_flushes_without_waiting(event_queue):
+    writer = ChatStreamEventWriter(event_queue, "job", flush_interval=10, max_batch=4)
+    for index in range(9):
+        await writer.write(_token(str(index)))
+
+    assert [len(batch) for _, batch in event_queue.batches] == [4, 4]
+    await writer.aclose()
+    assert [event["seq"] for event in event_queue.events["job"]] == list(range(1, 10))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("event_type", ["error", "done"])
+async def test_error_and_done_flush_immediately(event_queue, event_type):
+    writer = ChatStreamEventWriter(event_queue, "job", flush_interval=10, max_batch=100)
+    await writer.write(_token("a"))
+    await writer.write({"type": event_type, "trace_id": "t", "content": None})
+
+    assert [event["type"] for event in event_queue.events["job"]] == ["token", event_type]
+
+
+@pytest.mark.asyncio
+async def test_start_seq_continues_existing_stream(event_queue):
+    async with ChatStreamEventWriter(event_queue, "job", start_seq=7) as writer:
+        assert await writer.write(_token("a")) == 8
+
+    assert event_queue.events["job"][0]["seq"] == 8
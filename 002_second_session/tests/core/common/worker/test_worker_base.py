@@ -0,0 +1,48 @@
+"""WorkerBase 실행 루프의 ack 시점 테스트."""
+
+import pytest
+
+from secondsession.core.common.worker import WorkerBase
+
+
+class _OneShotWorker(WorkerBase):
+    """작업 하나를 꺼내 주고 처리 후 종료하는 워커."""
+
+    def __init__(self, error: BaseException | None) -> None:
+        super().__init__(maintenance_interval=60.0)
+        self.error = error
+        self.jobs = [{"job_id": "a"}]
+        self.acked: list[dict] = []
+
+    def _dequeue_job(self) -> dict | None:
+        if not self.jobs:
+            self.stop()
+            return None
+        return self.jobs.pop(0)
+
+    def _process_job(self, job: dict) -> None:
+        _ = job
+        if self.error is not None:
+            raise self.error
+
+    def _ack_job(self, job: dict) -> None:
+        self.acked.append(job)
+
+
+def test_job_is_acked_after_completion():
+    worker = _OneShotWorker(None)
+    worker.run_forever()
+    assert worker.acked == [{"job_id": "a"}]
+
+
+def test_job_is_acked_after_exception():
+    worker = _OneShotWorker(RuntimeError("boom"))
+    worker.run_forever()
+    assert worker.acked == [{"job_id": "a"}]
+
+
+def test_interrupted_job_is_not_acked():
+    worker = _OneShotWorker(KeyboardInterrupt())
+    with pytest.raises(KeyboardInterrupt):
+        worker.run_forever()
+    assert worker.acked == []